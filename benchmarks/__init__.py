@@ -0,0 +1,10 @@
+"""
+Benchmark suite for the editor's hot paths.
+
+Synthetic scenes of a configurable size are generated and the scene,
+serializer, rendering, thumbnail, history and selection code is timed.
+Results are written as JSON and can be compared against a stored baseline:
+
+    python -m benchmarks.run --size medium --output results.json
+    python -m benchmarks.run --size medium --baseline results.json --threshold 0.2
+"""
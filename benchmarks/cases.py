@@ -0,0 +1,171 @@
+"""
+Benchmarks of the scene, serializer, rendering, thumbnail, history and
+selection hot paths.
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Tuple
+
+import pygame
+
+from src.assets.thumbnail_cache import ThumbnailCache
+from src.editor.history import History
+from src.editor.selection import Selection
+from src.scene.scene_serializer import SceneSerializer
+from src.scene.tilemap import Tilemap
+
+from .harness import benchmark
+from .scenes import TILE_SIZE, make_scene, make_tilemap, make_tileset, tile_positions
+
+# Size parameters of each preset
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": {
+        "map_size": 64,
+        "entities": 100,
+        "history": 1000,
+        "selection": 1000,
+        "thumbnails": 8,
+    },
+    "medium": {
+        "map_size": 256,
+        "entities": 1000,
+        "history": 10000,
+        "selection": 5000,
+        "thumbnails": 32,
+    },
+    "large": {
+        "map_size": 1024,
+        "entities": 10000,
+        "history": 100000,
+        "selection": 20000,
+        "thumbnails": 128,
+    },
+}
+
+# Size of the offscreen surface tilemaps are rendered to
+VIEWPORT_SIZE = (1280, 720)
+
+
+def _tile_positions(params: Dict[str, int]):
+    size = params["map_size"]
+    return size, tile_positions(size, size, 0.6)
+
+
+@benchmark("tilemap.add_tile", _tile_positions)
+def _run_add_tiles(state) -> None:
+    size, positions = state
+    tilemap = Tilemap(size, size, TILE_SIZE, TILE_SIZE)
+    for index, (x, y) in enumerate(positions):
+        tilemap.add_tile(x, y, index & 255)
+
+
+def _tilemap(params: Dict[str, int]) -> Tilemap:
+    return make_tilemap(params["map_size"], params["map_size"])
+
+
+@benchmark("tilemap.get_tile", _tilemap)
+def _run_get_tiles(tilemap: Tilemap) -> None:
+    get_tile = tilemap.get_tile
+    for y in range(tilemap.height):
+        for x in range(tilemap.width):
+            get_tile(x, y)
+
+
+def _render_target(params: Dict[str, int]) -> Tuple[Tilemap, pygame.Surface]:
+    return _tilemap(params), pygame.Surface(VIEWPORT_SIZE)
+
+
+@benchmark("tilemap.render", _render_target)
+def _run_render(state: Tuple[Tilemap, pygame.Surface]) -> None:
+    tilemap, surface = state
+    tilemap.render(surface, {"x": 0, "y": 0})
+
+
+def _scene_file(params: Dict[str, int], extension: str) -> Dict[str, Any]:
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, "scene" + extension)
+    scene = make_scene(params["map_size"], params["entities"])
+    return {"temp_dir": temp_dir, "path": path, "scene": scene}
+
+
+def _saved_scene_file(params: Dict[str, int], extension: str) -> Dict[str, Any]:
+    state = _scene_file(params, extension)
+    SceneSerializer.save_to_file(state["scene"], state["path"])
+    return state
+
+
+def _remove_temp_dir(state: Dict[str, Any]) -> None:
+    shutil.rmtree(state["temp_dir"], ignore_errors=True)
+
+
+def _run_save(state: Dict[str, Any]) -> None:
+    SceneSerializer.save_to_file(state["scene"], state["path"])
+
+
+def _run_load(state: Dict[str, Any]) -> None:
+    SceneSerializer.load_from_file(state["path"])
+
+
+for _format, _extension in (("json", ".json"), ("binary", ".bin")):
+    benchmark(
+        f"serializer.save_{_format}",
+        lambda params, extension=_extension: _scene_file(params, extension),
+        _remove_temp_dir,
+    )(_run_save)
+    benchmark(
+        f"serializer.load_{_format}",
+        lambda params, extension=_extension: _saved_scene_file(params, extension),
+        _remove_temp_dir,
+    )(_run_load)
+
+
+def _thumbnail_sources(params: Dict[str, int]) -> Dict[str, Any]:
+    temp_dir = tempfile.mkdtemp()
+    tileset = make_tileset()
+    paths = []
+    for index in range(params["thumbnails"]):
+        # Every image differs so no thumbnail is shared
+        tileset.set_at((0, 0), (index & 255, index >> 8, 0))
+        path = os.path.join(temp_dir, f"image{index}.png")
+        pygame.image.save(tileset, path)
+        paths.append(path)
+    cache = ThumbnailCache(os.path.join(temp_dir, "thumbnails"))
+    return {"temp_dir": temp_dir, "paths": paths, "cache": cache}
+
+
+@benchmark("thumbnails.generate", _thumbnail_sources, _remove_temp_dir)
+def _run_thumbnails(state: Dict[str, Any]) -> None:
+    state["cache"].generate_thumbnails(state["paths"], use_processes=False)
+    state["cache"].flush()
+
+
+def _history_size(params: Dict[str, int]) -> int:
+    return params["history"]
+
+
+@benchmark("history.push_undo", _history_size)
+def _run_history(count: int) -> None:
+    history = History(max_states=count // 2)
+    for action in range(count):
+        history.push(action)
+    while history.undo_stack:
+        history.undo()
+    while history.redo_stack:
+        history.redo()
+
+
+def _selection_size(params: Dict[str, int]) -> int:
+    return params["selection"]
+
+
+@benchmark("selection.bulk", _selection_size)
+def _run_selection(count: int) -> None:
+    selection = Selection()
+    for item in range(count):
+        selection.add_item(item)
+    for item in range(0, count, 2):
+        selection.remove_item(item)
+    selection.get_selected_items()
+    selection.clear_selection()
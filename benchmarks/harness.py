@@ -0,0 +1,201 @@
+"""
+Timing, result files and baseline comparison for the benchmark suite.
+"""
+
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+RESULTS_VERSION = 1
+
+
+class Case:
+    """
+    A benchmarked operation.
+
+    Attributes:
+        name (str): The name results are stored under.
+        setup (Callable[[Dict[str, int]], Any]): Builds the state for one run
+            from the size parameters. Not timed.
+        run (Callable[[Any], None]): The timed operation.
+        teardown (Optional[Callable[[Any], None]]): Cleans up after one run.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[Dict[str, int]], Any],
+        run: Callable[[Any], None],
+        teardown: Optional[Callable[[Any], None]] = None,
+    ):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.teardown = teardown
+
+
+# Every registered case, in registration order
+CASES: List[Case] = []
+
+
+def benchmark(
+    name: str,
+    setup: Callable[[Dict[str, int]], Any],
+    teardown: Optional[Callable[[Any], None]] = None,
+) -> Callable:
+    """
+    Register the decorated function as the timed part of a benchmark.
+
+    Args:
+        name (str): The name results are stored under.
+        setup (Callable[[Dict[str, int]], Any]): Builds the state passed to
+            the decorated function.
+        teardown (Optional[Callable[[Any], None]], optional): Cleans up the state.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def register(run: Callable[[Any], None]) -> Callable[[Any], None]:
+        CASES.append(Case(name, setup, run, teardown))
+        return run
+
+    return register
+
+
+def time_case(case: Case, params: Dict[str, int], repeat: int) -> Dict[str, float]:
+    """
+    Time a case, with a fresh setup before every run.
+
+    Args:
+        case (Case): The case to time.
+        params (Dict[str, int]): The size parameters.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        Dict[str, float]: The median and minimum time in seconds, and the repeat count.
+    """
+    timings = []
+    for _ in range(repeat):
+        state = case.setup(params)
+        try:
+            start = time.perf_counter()
+            case.run(state)
+            timings.append(time.perf_counter() - start)
+        finally:
+            if case.teardown is not None:
+                case.teardown(state)
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "repeat": repeat,
+    }
+
+
+def make_results(
+    timings: Dict[str, Dict[str, float]], size: str, params: Dict[str, int]
+) -> Dict[str, Any]:
+    """
+    Build the JSON document for a benchmark run.
+
+    Args:
+        timings (Dict[str, Dict[str, float]]): The timings by case name.
+        size (str): The name of the size preset.
+        params (Dict[str, int]): The size parameters.
+
+    Returns:
+        Dict[str, Any]: The results document.
+    """
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "size": size,
+        "params": params,
+        "results": timings,
+    }
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    """
+    Write a results document to a JSON file.
+
+    Args:
+        results (Dict[str, Any]): The results document.
+        path (str): The output file.
+    """
+    with open(path, "w") as file:
+        json.dump(results, file, indent=4, sort_keys=True)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Read a results document.
+
+    Args:
+        path (str): The results file.
+
+    Returns:
+        Dict[str, Any]: The results document.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a results document of this version.
+    """
+    with open(path, "r") as file:
+        results = json.load(file)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}")
+    return results
+
+
+class Comparison:
+    """
+    The change of one case against the baseline.
+
+    Attributes:
+        name (str): The case name.
+        baseline (float): The baseline median in seconds.
+        current (float): The current median in seconds.
+        ratio (float): current / baseline.
+        regressed (bool): Whether the slowdown exceeds the threshold.
+    """
+
+    def __init__(self, name: str, baseline: float, current: float, threshold: float):
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+        self.ratio = current / baseline if baseline > 0 else 1.0
+        self.regressed = self.ratio > 1.0 + threshold
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[Comparison]:
+    """
+    Compare the medians of a run against a baseline run.
+
+    Cases missing from either run are skipped.
+
+    Args:
+        results (Dict[str, Any]): The current results document.
+        baseline (Dict[str, Any]): The baseline results document.
+        threshold (float): The allowed slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        List[Comparison]: One comparison per case present in both runs.
+
+    Raises:
+        ValueError: If the runs used different size parameters.
+    """
+    if results["params"] != baseline["params"]:
+        raise ValueError("Baseline was recorded with different size parameters.")
+    return [
+        Comparison(
+            name, baseline["results"][name]["median"], timing["median"], threshold
+        )
+        for name, timing in results["results"].items()
+        if name in baseline["results"]
+    ]
@@ -0,0 +1,122 @@
+"""
+Run the benchmark suite.
+
+Usage:
+    python -m benchmarks.run --size medium --output results.json
+    python -m benchmarks.run --size medium --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --size medium --baseline benchmarks/baseline.json
+
+With --baseline the exit status is 1 if any case got slower than the
+baseline by more than --threshold.
+"""
+
+import argparse
+import fnmatch
+import os
+import sys
+from typing import Any, Dict, Optional, Sequence
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    from .cases import SIZES
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Time the editor's hot paths on synthetic scenes.",
+    )
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timed runs per case (default: 5)"
+    )
+    parser.add_argument(
+        "--filter", default="*", help="only run cases matching this glob pattern"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", help="write the results as a new baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown against the baseline (default: 0.2 = 20%%)",
+    )
+    return parser.parse_args(argv)
+
+
+def run(size: str, repeat: int = 5, pattern: str = "*") -> Dict[str, Any]:
+    """
+    Run the benchmarks matching a pattern.
+
+    Args:
+        size (str): The name of the size preset.
+        repeat (int, optional): Timed runs per case. Defaults to 5.
+        pattern (str, optional): Glob pattern of case names. Defaults to "*".
+
+    Returns:
+        Dict[str, Any]: The results document.
+    """
+    import pygame
+
+    from .cases import SIZES
+    from .harness import CASES, make_results, time_case
+
+    pygame.init()
+    try:
+        params = SIZES[size]
+        timings = {}
+        for case in CASES:
+            if fnmatch.fnmatch(case.name, pattern):
+                timings[case.name] = time_case(case, params, repeat)
+        return make_results(timings, size, params)
+    finally:
+        pygame.quit()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmark command-line interface.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        int: The exit status; 1 if any case regressed against the baseline.
+    """
+    # Render offscreen; must be set before pygame is initialized
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    from .harness import compare, load_results, save_results
+
+    args = _parse_args(argv)
+    baseline = load_results(args.baseline) if args.baseline else None
+    results = run(args.size, args.repeat, args.filter)
+
+    if args.output:
+        save_results(results, args.output)
+    if args.save_baseline:
+        save_results(results, args.save_baseline)
+
+    if baseline is None:
+        for name, timing in results["results"].items():
+            print(
+                f"{name:<24} {timing['median'] * 1000:10.2f} ms"
+                f"  (min {timing['min'] * 1000:.2f} ms)"
+            )
+        return 0
+
+    regressions = 0
+    for comparison in compare(results, baseline, args.threshold):
+        print(
+            f"{comparison.name:<24} {comparison.current * 1000:10.2f} ms"
+            f"  baseline {comparison.baseline * 1000:10.2f} ms"
+            f"  {comparison.ratio:6.2f}x"
+            + ("  REGRESSION" if comparison.regressed else "")
+        )
+        regressions += comparison.regressed
+    if regressions:
+        print(f"{regressions} cases regressed by more than {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Synthetic scenes for the benchmark suite.
+"""
+
+import random
+from typing import List, Tuple
+
+import pygame
+
+from src.scene.entity import Entity
+from src.scene.layer import Layer
+from src.scene.scene import Scene
+from src.scene.tilemap import Tilemap
+
+TILE_SIZE = 32
+TILESET_COLUMNS = 16
+
+
+def tile_positions(
+    width: int, height: int, fill: float, seed: int = 0
+) -> List[Tuple[int, int]]:
+    """
+    Pick a random subset of the cells of a map.
+
+    Args:
+        width (int): The map width in tiles.
+        height (int): The map height in tiles.
+        fill (float): The fraction of cells picked.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        List[Tuple[int, int]]: The picked (x, y) cells in random order.
+    """
+    rng = random.Random(seed)
+    cells = [(x, y) for y in range(height) for x in range(width)]
+    return rng.sample(cells, int(len(cells) * fill))
+
+
+def make_tileset(
+    tile_size: int = TILE_SIZE, columns: int = TILESET_COLUMNS
+) -> pygame.Surface:
+    """
+    Create a square tileset image with a different color for every tile.
+
+    Args:
+        tile_size (int, optional): The tile width and height in pixels.
+        columns (int, optional): The number of tiles along each side.
+
+    Returns:
+        pygame.Surface: The tileset.
+    """
+    tileset = pygame.Surface((tile_size * columns, tile_size * columns))
+    for row in range(columns):
+        for column in range(columns):
+            color = (column * 255 // columns, row * 255 // columns, 128)
+            tileset.fill(
+                color, (column * tile_size, row * tile_size, tile_size, tile_size)
+            )
+    return tileset
+
+
+def make_tilemap(width: int, height: int, fill: float = 0.6, seed: int = 0) -> Tilemap:
+    """
+    Create a tilemap with a random fraction of its cells filled.
+
+    Args:
+        width (int): The map width in tiles.
+        height (int): The map height in tiles.
+        fill (float, optional): The fraction of cells holding a tile. Defaults to 0.6.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        Tilemap: The tilemap, with a generated "default" tileset.
+    """
+    tilemap = Tilemap(width, height, TILE_SIZE, TILE_SIZE)
+    tile_count = TILESET_COLUMNS * TILESET_COLUMNS
+    for index, (x, y) in enumerate(tile_positions(width, height, fill, seed)):
+        tilemap.add_tile(x, y, index % tile_count)
+    tilemap.set_tileset("default", make_tileset())
+    tilemap.tileset_paths["default"] = "tiles.png"
+    return tilemap
+
+
+def make_scene(map_size: int, entities: int, seed: int = 0) -> Scene:
+    """
+    Create a scene with a few layers, a square tilemap and many entities.
+
+    Args:
+        map_size (int): The tilemap width and height in tiles.
+        entities (int): The number of entities.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        Scene: The scene.
+    """
+    rng = random.Random(seed)
+    scene = Scene("Benchmark Scene")
+    for name in ("Background", "Ground", "Foreground"):
+        scene.add_layer(Layer(name))
+    scene.add_tilemap(make_tilemap(map_size, map_size, seed=seed))
+    for entity_id in range(entities):
+        position = {
+            "x": rng.randrange(map_size * TILE_SIZE),
+            "y": rng.randrange(map_size * TILE_SIZE),
+        }
+        properties = {"health": rng.randrange(100), "team": rng.choice("ab")}
+        scene.add_entity(Entity(entity_id, f"Entity {entity_id}", position, properties))
+    return scene
@@ -4,8 +4,7 @@ Root package for the 2D game editor.
 This package contains all the core modules and utilities for the 2D game editor.
 """
 
-# Import core modules to make them available at the package level
-from . import assets, core, editor, rendering, scene, tools, ui, utils
+import importlib
 
 __all__ = [
     "assets",
@@ -17,3 +16,11 @@ __all__ = [
     "ui",
     "utils",
 ]
+
+
+def __getattr__(name):
+    # Subpackages are imported on first access, so importing one module does
+    # not load the whole editor
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,523 @@
+"""
+Asset Database Module
+
+This module keeps a persistent index of a project's assets in a SQLite file, so
+opening a project does not have to rediscover and re-stat every asset.
+
+Each asset is stored with its size, modification time, content hash, image
+dimensions, type, tags and thumbnail location. On startup, sync() walks the
+asset directories but only lists the directories whose modification time
+changed since the last sync, which is where files were added, removed or
+replaced; the subdirectories of unchanged directories are taken from the
+database. Files edited in place do not touch their directory, so those are
+picked up by update_file() (for example from the FileWatcher) or by a full sync.
+"""
+
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .asset_scanner import iter_asset_files
+from .content_store import hash_file
+
+SCHEMA_VERSION = 1
+
+# File extension -> asset type
+ASSET_TYPES = {
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".bmp": "image",
+    ".gif": "image",
+    ".tga": "image",
+    ".webp": "image",
+    ".wav": "audio",
+    ".ogg": "audio",
+    ".mp3": "audio",
+    ".ttf": "font",
+    ".otf": "font",
+    ".json": "data",
+}
+
+_SCHEMA = """
+CREATE TABLE assets (
+    path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT,
+    width INTEGER,
+    height INTEGER,
+    type TEXT NOT NULL,
+    thumbnail TEXT
+);
+CREATE INDEX assets_directory ON assets (directory);
+CREATE INDEX assets_type ON assets (type);
+CREATE INDEX assets_size ON assets (size);
+CREATE TABLE tags (
+    path TEXT NOT NULL REFERENCES assets (path) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (path, tag)
+);
+CREATE INDEX tags_tag ON tags (tag);
+CREATE TABLE directories (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX directories_parent ON directories (parent);
+"""
+
+# (path, directory, size, mtime_ns, hash, width, height, type)
+_Row = Tuple[str, str, int, int, Optional[str], Optional[int], Optional[int], str]
+
+
+class AssetRecord:
+    """
+    The indexed metadata of one asset file.
+
+    Attributes:
+        path (str): The path to the asset file.
+        size (int): The file size in bytes.
+        mtime_ns (int): The modification time in nanoseconds.
+        digest (Optional[str]): The content hash, or None if it could not be read.
+        width (Optional[int]): The image width, or None for non-image assets.
+        height (Optional[int]): The image height, or None for non-image assets.
+        asset_type (str): The asset type, such as "image" or "audio".
+        tags (List[str]): The tags of the asset, in sorted order.
+        thumbnail (Optional[str]): Where the thumbnail of the asset is stored.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        digest: Optional[str],
+        width: Optional[int],
+        height: Optional[int],
+        asset_type: str,
+        tags: List[str],
+        thumbnail: Optional[str],
+    ):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.digest = digest
+        self.width = width
+        self.height = height
+        self.asset_type = asset_type
+        self.tags = tags
+        self.thumbnail = thumbnail
+
+
+class SyncResult:
+    """
+    The changes found by AssetDatabase.sync().
+
+    Attributes:
+        added (List[str]): Paths of new assets.
+        updated (List[str]): Paths of assets that changed.
+        removed (List[str]): Paths of assets that no longer exist.
+        directories_listed (int): Number of directories whose contents were listed.
+    """
+
+    def __init__(self):
+        self.added: List[str] = []
+        self.updated: List[str] = []
+        self.removed: List[str] = []
+        self.directories_listed = 0
+
+
+class AssetDatabase:
+    """
+    A persistent SQLite index of the asset files of a project.
+
+    Attributes:
+        db_path (str): The path to the SQLite file.
+        extensions (Set[str]): The file extensions that are indexed.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        extensions: Iterable[str] = ASSET_TYPES,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Open the database, creating it if it does not exist.
+
+        A database written with an older schema is discarded and rebuilt by
+        the next sync().
+
+        Args:
+            db_path (str): The path to the SQLite file.
+            extensions (Iterable[str], optional): The file extensions to index,
+                including the leading dot. Defaults to every known asset type.
+            max_workers (Optional[int], optional): Number of threads hashing
+                and measuring new files.
+
+        Raises:
+            PermissionError: If the database cannot be created due to permission issues.
+        """
+        self.db_path = db_path
+        self.extensions = {extension.lower() for extension in extensions}
+        self.max_workers = max_workers
+        directory = os.path.dirname(db_path)
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(db_path)
+        except (PermissionError, sqlite3.OperationalError) as e:
+            raise PermissionError(
+                f"Permission denied while opening asset database: {e}"
+            )
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Create the tables, dropping those of an outdated schema."""
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return
+        with self._connection:
+            for table in ("tags", "assets", "directories"):
+                self._connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+    def __contains__(self, path: str) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM assets WHERE path = ?", (path,)
+        ).fetchone()
+        return row is not None
+
+    def sync(self, roots: Sequence[str], full: bool = False) -> SyncResult:
+        """
+        Bring the index up to date with the asset directories.
+
+        Only directories whose modification time changed are listed, unless
+        full is True, in which case every file is stat'ed again to catch files
+        edited in place.
+
+        Args:
+            roots (Sequence[str]): The asset directories.
+            full (bool, optional): Re-check every file. Defaults to False.
+
+        Returns:
+            SyncResult: The assets added, updated and removed.
+        """
+        result = SyncResult()
+        known_directories = {
+            path: (parent, mtime_ns)
+            for path, parent, mtime_ns in self._connection.execute(
+                "SELECT path, parent, mtime_ns FROM directories"
+            )
+        }
+        children: Dict[Optional[str], List[str]] = {}
+        for path, (parent, _) in known_directories.items():
+            children.setdefault(parent, []).append(path)
+
+        seen_directories: Set[str] = set()
+        directory_rows = []
+        stale_files: List[Tuple[str, str, int, int]] = []
+        removed_files: List[str] = []
+        stack: List[Tuple[str, Optional[str]]] = [
+            (os.path.normpath(root), None) for root in roots
+        ]
+        while stack:
+            directory, parent = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            seen_directories.add(directory)
+            known = known_directories.get(directory)
+            if not full and known is not None and known[1] == mtime_ns:
+                stack.extend(
+                    (child, directory) for child in children.get(directory, ())
+                )
+                continue
+
+            result.directories_listed += 1
+            directory_rows.append((directory, parent, mtime_ns))
+            subdirectories, files = self._list_directory(directory)
+            stack.extend((child, directory) for child in subdirectories)
+            indexed = {
+                path: (size, file_mtime_ns)
+                for path, size, file_mtime_ns in self._connection.execute(
+                    "SELECT path, size, mtime_ns FROM assets WHERE directory = ?",
+                    (directory,),
+                )
+            }
+            for path, signature in files.items():
+                old_signature = indexed.pop(path, None)
+                if old_signature is None:
+                    result.added.append(path)
+                elif old_signature != signature:
+                    result.updated.append(path)
+                else:
+                    continue
+                stale_files.append((path, directory, *signature))
+            removed_files.extend(indexed)
+
+        removed_directories = [
+            path for path in known_directories if path not in seen_directories
+        ]
+        if removed_directories:
+            placeholders = ",".join("?" * len(removed_directories))
+            removed_files.extend(
+                path
+                for (path,) in self._connection.execute(
+                    f"SELECT path FROM assets WHERE directory IN ({placeholders})",
+                    removed_directories,
+                )
+            )
+        result.removed = sorted(removed_files)
+
+        rows = self._describe_many(stale_files)
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM assets WHERE path = ?", ((path,) for path in removed_files)
+            )
+            self._connection.executemany(
+                "DELETE FROM directories WHERE path = ?",
+                ((path,) for path in removed_directories),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO directories (path, parent, mtime_ns)"
+                " VALUES (?, ?, ?)",
+                directory_rows,
+            )
+            self._write_rows(rows)
+        return result
+
+    def update_file(self, path: str) -> bool:
+        """
+        Re-index a single file, removing it if it no longer exists.
+
+        Args:
+            path (str): The path to the file.
+
+        Returns:
+            bool: True if the file is indexed after the update.
+        """
+        path = os.path.normpath(path)
+        extension = os.path.splitext(path)[1].lower()
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        with self._connection:
+            if stat is None or extension not in self.extensions:
+                self._connection.execute("DELETE FROM assets WHERE path = ?", (path,))
+                return False
+            entry = (path, os.path.dirname(path), stat.st_size, stat.st_mtime_ns)
+            self._write_rows(self._describe_many([entry]))
+        return True
+
+    def get(self, path: str) -> Optional[AssetRecord]:
+        """
+        Look up the indexed metadata of an asset.
+
+        Args:
+            path (str): The path to the asset file.
+
+        Returns:
+            Optional[AssetRecord]: The metadata, or None if the asset is not indexed.
+        """
+        records = self._select("WHERE path = ?", (os.path.normpath(path),))
+        return records[0] if records else None
+
+    def paths(self) -> List[str]:
+        """
+        List every indexed asset.
+
+        Returns:
+            List[str]: The asset paths in sorted order.
+        """
+        return [
+            path
+            for (path,) in self._connection.execute(
+                "SELECT path FROM assets ORDER BY path"
+            )
+        ]
+
+    def find(
+        self,
+        tag: Optional[str] = None,
+        asset_type: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ) -> List[AssetRecord]:
+        """
+        Query the index. Every given criterion must match.
+
+        Args:
+            tag (Optional[str], optional): A tag the asset must have.
+            asset_type (Optional[str], optional): The asset type, such as "image".
+            min_size (Optional[int], optional): The minimum file size in bytes.
+            max_size (Optional[int], optional): The maximum file size in bytes.
+
+        Returns:
+            List[AssetRecord]: The matching assets, sorted by path.
+        """
+        conditions = []
+        parameters: List = []
+        if tag is not None:
+            conditions.append("path IN (SELECT path FROM tags WHERE tag = ?)")
+            parameters.append(tag)
+        if asset_type is not None:
+            conditions.append("type = ?")
+            parameters.append(asset_type)
+        if min_size is not None:
+            conditions.append("size >= ?")
+            parameters.append(min_size)
+        if max_size is not None:
+            conditions.append("size <= ?")
+            parameters.append(max_size)
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return self._select(where, parameters)
+
+    def add_tags(self, path: str, tags: Iterable[str]) -> None:
+        """
+        Tag an asset.
+
+        Args:
+            path (str): The path to the asset file.
+            tags (Iterable[str]): The tags to add.
+
+        Raises:
+            KeyError: If the asset is not indexed.
+        """
+        path = os.path.normpath(path)
+        if path not in self:
+            raise KeyError(f"Asset '{path}' is not indexed.")
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO tags (path, tag) VALUES (?, ?)",
+                ((path, tag) for tag in tags),
+            )
+
+    def remove_tags(self, path: str, tags: Iterable[str]) -> None:
+        """
+        Remove tags from an asset.
+
+        Args:
+            path (str): The path to the asset file.
+            tags (Iterable[str]): The tags to remove.
+        """
+        path = os.path.normpath(path)
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM tags WHERE path = ? AND tag = ?",
+                ((path, tag) for tag in tags),
+            )
+
+    def record_thumbnails(self, thumbnail_cache) -> int:
+        """
+        Store the thumbnail location of every asset in a thumbnail cache.
+
+        Locations have the form ``sheet_<size>_<page>.png#<cell>``, relative to
+        the cache directory.
+
+        Args:
+            thumbnail_cache (ThumbnailCache): The cache to read locations from.
+
+        Returns:
+            int: The number of indexed assets whose location was stored.
+        """
+        rows = [
+            (
+                f"sheet_{entry['sheet']}_{entry['page']}.png#{entry['cell']}",
+                os.path.normpath(path),
+            )
+            for path, entry in thumbnail_cache.index.items()
+        ]
+        with self._connection:
+            cursor = self._connection.executemany(
+                "UPDATE assets SET thumbnail = ? WHERE path = ?", rows
+            )
+        return cursor.rowcount
+
+    def _list_directory(
+        self, directory: str
+    ) -> Tuple[List[str], Dict[str, Tuple[int, int]]]:
+        """Return the subdirectories and the (size, mtime_ns) of matching files."""
+        subdirectories: List[str] = []
+        files = {}
+        for entry in iter_asset_files([directory], self.extensions, subdirectories):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return subdirectories, files
+
+    def _describe_many(self, files: List[Tuple[str, str, int, int]]) -> List[_Row]:
+        """Hash and measure files on a thread pool."""
+        if not files:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(_describe, files))
+
+    def _write_rows(self, rows: List[_Row]) -> None:
+        """Insert or update asset rows, keeping their tags and thumbnails."""
+        self._connection.executemany(
+            "INSERT INTO assets"
+            " (path, directory, size, mtime_ns, hash, width, height, type)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (path) DO UPDATE SET"
+            " size = excluded.size, mtime_ns = excluded.mtime_ns,"
+            " hash = excluded.hash, width = excluded.width,"
+            " height = excluded.height, type = excluded.type",
+            rows,
+        )
+
+    def _select(self, where: str, parameters: Sequence) -> List[AssetRecord]:
+        """Load the assets matching a WHERE clause, with their tags."""
+        rows = self._connection.execute(
+            "SELECT path, size, mtime_ns, hash, width, height, type, thumbnail"
+            f" FROM assets {where} ORDER BY path",
+            parameters,
+        ).fetchall()
+        tags: Dict[str, List[str]] = {}
+        if rows:
+            for path, tag in self._connection.execute(
+                f"SELECT path, tag FROM tags WHERE path IN"
+                f" (SELECT path FROM assets {where}) ORDER BY tag",
+                parameters,
+            ):
+                tags.setdefault(path, []).append(tag)
+        return [AssetRecord(*row[:7], tags.get(row[0], []), row[7]) for row in rows]
+
+
+def _describe(file: Tuple[str, str, int, int]) -> _Row:
+    """Hash a file and read its image dimensions. Runs on a worker thread."""
+    path, directory, size, mtime_ns = file
+    asset_type = ASSET_TYPES.get(os.path.splitext(path)[1].lower(), "other")
+    try:
+        digest: Optional[str] = hash_file(path)
+    except OSError:
+        digest = None
+    width = height = None
+    if asset_type == "image":
+        from PIL import Image
+
+        try:
+            # Opening only reads the header, not the pixel data
+            with Image.open(path) as image:
+                width, height = image.size
+        except Exception:
+            pass
+    return path, directory, size, mtime_ns, digest, width, height, asset_type
@@ -2,27 +2,69 @@
 Asset Manager Module
 
 This module provides functionality for managing game assets such as sprites, textures, and other resources.
+
+Image assets are decoded into pygame surfaces and kept in an LRU cache with a
+configurable memory budget. Assets that are referenced through acquire() are
+never evicted; unreferenced assets are evicted, least recently used first,
+whenever the budget is exceeded, and are reloaded transparently on the next
+get_asset() call.
 """
 
 import os
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 
+import pygame
+
+from ..utils.frame_profiler import profiler
+from .async_loader import AsyncLoader, LoadHandle
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga", ".webp"}
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
 
 class AssetManager:
     """
     A class to manage game assets, including loading, storing, and retrieving assets.
+
+    Attributes:
+        memory_budget (int): The maximum number of bytes of decoded assets kept
+            in memory before unreferenced assets are evicted.
+        memory_used (int): The number of bytes of decoded assets in memory.
+        hits (int): Number of get_asset() calls served from memory.
+        misses (int): Number of get_asset() calls that had to reload the asset.
+        evictions (int): Number of assets evicted to stay within the budget.
     """
 
-    def __init__(self):
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET, content_store=None):
         """
         Initialize the AssetManager with an empty asset dictionary.
+
+        Args:
+            memory_budget (int, optional): The memory budget in bytes.
+                Defaults to 256 MiB.
+            content_store (ContentStore, optional): If given, image files with
+                identical contents share one decoded surface.
         """
-        self.assets: Dict[str, Any] = {}
+        self.assets: "OrderedDict[str, Any]" = OrderedDict()
+        self.asset_paths: Dict[str, str] = {}
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.content_store = content_store
+        self._sizes: Dict[str, int] = {}
+        self._refcounts: Dict[str, int] = {}
+        # Number of assets holding each surface, so shared surfaces count once
+        self._surface_users: Dict[int, int] = {}
 
     def load_asset(self, asset_id: str, asset_path: str) -> None:
         """
         Load an asset from the specified path and store it in the asset dictionary.
 
+        Image files are decoded into pygame surfaces; other files are stored by path.
+
         Args:
             asset_id (str): A unique identifier for the asset.
             asset_path (str): The path to the asset file.
@@ -35,26 +77,137 @@ class AssetManager:
         if not os.path.exists(asset_path):
             raise FileNotFoundError(f"Asset file not found: {asset_path}")
 
-        try:
-            # Placeholder for asset loading logic
-            self.assets[asset_id] = asset_path
-            print(f"Asset '{asset_id}' loaded from '{asset_path}'.")
-        except PermissionError as e:
-            raise PermissionError(f"Permission denied while loading asset: {e}")
-        except Exception as e:
-            raise Exception(f"Error loading asset: {e}")
+        if asset_id in self.assets:
+            self._drop(asset_id)
+        self.asset_paths[asset_id] = asset_path
+        self._refcounts.setdefault(asset_id, 0)
+        self._store(asset_id, self._decode(asset_path))
+        print(f"Asset '{asset_id}' loaded from '{asset_path}'.")
+
+    def load_asset_async(
+        self, asset_id: str, asset_path: str, loader: AsyncLoader
+    ) -> LoadHandle:
+        """
+        Start loading an image asset in the background.
+
+        The asset is registered right away; until the loader finalizes it,
+        get_asset() returns the loader's placeholder surface.
+
+        Args:
+            asset_id (str): A unique identifier for the asset.
+            asset_path (str): The path to the image file.
+            loader (AsyncLoader): The loader that decodes the image.
+
+        Returns:
+            LoadHandle: The load handle.
+
+        Raises:
+            FileNotFoundError: If the asset file does not exist.
+        """
+        if not os.path.exists(asset_path):
+            raise FileNotFoundError(f"Asset file not found: {asset_path}")
+
+        if asset_id in self.assets:
+            self._drop(asset_id)
+        self.asset_paths[asset_id] = asset_path
+        self._refcounts.setdefault(asset_id, 0)
+        handle = loader.load(asset_path)
+        self.assets[asset_id] = handle.surface
+        self._sizes[asset_id] = 0
+
+        def finish(handle: LoadHandle) -> None:
+            # Ignore loads superseded by a newer load or unloaded meanwhile
+            if self.asset_paths.get(asset_id) != asset_path:
+                return
+            current = self.assets.get(asset_id)
+            if current is not None and current is not loader.placeholder:
+                return
+            self._drop(asset_id)
+            if handle.error is None:
+                self._store(asset_id, handle.surface)
+
+        handle.on_loaded(finish)
+        return handle
+
+    def load_image(self, image_path: str) -> pygame.Surface:
+        """
+        Load an image, using its path as the asset identifier.
+
+        Args:
+            image_path (str): The path to the image file.
+
+        Returns:
+            pygame.Surface: The decoded image.
+
+        Raises:
+            FileNotFoundError: If the image file does not exist.
+        """
+        if image_path not in self.asset_paths:
+            self.load_asset(image_path, image_path)
+        return self.get_asset(image_path)
 
     def get_asset(self, asset_id: str) -> Optional[Any]:
         """
         Retrieve an asset by its unique identifier.
 
+        Assets that were evicted to stay within the memory budget are reloaded
+        from disk.
+
         Args:
             asset_id (str): The unique identifier of the asset to retrieve.
 
         Returns:
             The asset associated with the given ID, or None if the asset does not exist.
         """
-        return self.assets.get(asset_id)
+        if asset_id in self.assets:
+            self.hits += 1
+            profiler.count("asset_cache_hits")
+            self.assets.move_to_end(asset_id)
+            return self.assets[asset_id]
+
+        asset_path = self.asset_paths.get(asset_id)
+        if asset_path is None:
+            return None
+        self.misses += 1
+        profiler.count("asset_cache_misses")
+        asset = self._decode(asset_path)
+        self._store(asset_id, asset)
+        return asset
+
+    def acquire(self, asset_id: str) -> Optional[Any]:
+        """
+        Retrieve an asset and add a reference to it, protecting it from eviction.
+
+        Every acquire() must be paired with a release().
+
+        Args:
+            asset_id (str): The unique identifier of the asset.
+
+        Returns:
+            The asset, or None if the asset does not exist.
+        """
+        asset = self.get_asset(asset_id)
+        if asset is not None:
+            self._refcounts[asset_id] += 1
+        return asset
+
+    def release(self, asset_id: str) -> None:
+        """
+        Remove a reference added by acquire().
+
+        Args:
+            asset_id (str): The unique identifier of the asset.
+
+        Raises:
+            KeyError: If the asset ID does not exist.
+            ValueError: If the asset is not referenced.
+        """
+        if asset_id not in self.asset_paths:
+            raise KeyError(f"Asset '{asset_id}' not found.")
+        if self._refcounts[asset_id] <= 0:
+            raise ValueError(f"Asset '{asset_id}' is not referenced.")
+        self._refcounts[asset_id] -= 1
+        self._enforce_budget()
 
     def unload_asset(self, asset_id: str) -> None:
         """
@@ -66,10 +219,12 @@ class AssetManager:
         Raises:
             KeyError: If the asset ID does not exist.
         """
-        if asset_id not in self.assets:
+        if asset_id not in self.asset_paths:
             raise KeyError(f"Asset '{asset_id}' not found.")
 
-        del self.assets[asset_id]
+        self._drop(asset_id)
+        del self.asset_paths[asset_id]
+        del self._refcounts[asset_id]
         print(f"Asset '{asset_id}' unloaded.")
 
     def list_assets(self) -> list:
@@ -77,6 +232,86 @@ class AssetManager:
         List all loaded assets.
 
         Returns:
-            A list of all asset IDs currently loaded.
+            A list of all asset IDs currently loaded, including evicted assets
+            that will be reloaded on demand.
         """
-        return list(self.assets.keys())
+        return list(self.asset_paths.keys())
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict[str, int]: The hit, miss and eviction counts, the number of
+            resident assets and the memory used in bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "resident": len(self.assets),
+            "memory_used": self.memory_used,
+        }
+
+    def _decode(self, asset_path: str) -> Any:
+        """Decode an asset file, returning the path itself for non-image assets."""
+        if os.path.splitext(asset_path)[1].lower() not in IMAGE_EXTENSIONS:
+            return asset_path
+        try:
+            if self.content_store is not None:
+                return self.content_store.load_surface(asset_path, _load_surface)
+            return _load_surface(asset_path)
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied while loading asset: {e}")
+        except Exception as e:
+            raise Exception(f"Error loading asset: {e}")
+
+    def _store(self, asset_id: str, asset: Any) -> None:
+        """Add a decoded asset to the cache and evict others if over budget."""
+        size = 0
+        if isinstance(asset, pygame.Surface):
+            width, height = asset.get_size()
+            size = width * height * asset.get_bytesize()
+        self.assets[asset_id] = asset
+        self._sizes[asset_id] = size
+        if size:
+            users = self._surface_users.get(id(asset), 0)
+            if users == 0:
+                self.memory_used += size
+            self._surface_users[id(asset)] = users + 1
+        self._enforce_budget()
+
+    def _drop(self, asset_id: str) -> None:
+        """Remove a decoded asset from memory, keeping its registration."""
+        if asset_id in self.assets:
+            asset = self.assets.pop(asset_id)
+            size = self._sizes.pop(asset_id)
+            if size:
+                users = self._surface_users.pop(id(asset)) - 1
+                if users:
+                    self._surface_users[id(asset)] = users
+                else:
+                    self.memory_used -= size
+
+    def _enforce_budget(self) -> None:
+        """Evict unreferenced assets, least recently used first, until within budget."""
+        if self.memory_used <= self.memory_budget:
+            return
+        for asset_id in list(self.assets):
+            if self.memory_used <= self.memory_budget:
+                break
+            if self._refcounts.get(asset_id, 0) > 0:
+                continue
+            # Keep the most recently stored asset so the caller gets it back
+            if asset_id == next(reversed(self.assets)):
+                break
+            self._drop(asset_id)
+            self.evictions += 1
+
+
+def _load_surface(asset_path: str) -> pygame.Surface:
+    """Decode an image file into a surface."""
+    surface = pygame.image.load(asset_path)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
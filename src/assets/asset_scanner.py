@@ -0,0 +1,239 @@
+"""
+Asset Scanner Module
+
+This module discovers asset files under one or more root directories.
+iter_asset_files() walks directories with os.scandir and is shared by the
+scanner, the file watcher and the asset database. The AssetScanner runs it on a
+background thread and streams the paths it finds in batches; the main thread
+merges them into an AssetIndex, a sorted, searchable list of asset paths.
+"""
+
+import os
+import queue
+import threading
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional, Sequence, Set
+
+from .asset_manager import IMAGE_EXTENSIONS
+
+
+def iter_asset_files(
+    roots: Iterable[str],
+    extensions: Set[str],
+    subdirectories: Optional[List[str]] = None,
+) -> Iterator[os.DirEntry]:
+    """
+    Walk directories depth-first, yielding the files with a matching extension.
+
+    Unreadable or vanished directories are skipped.
+
+    Args:
+        roots (Iterable[str]): The directories to walk.
+        extensions (Set[str]): The lowercase file extensions to yield,
+            including the leading dot.
+        subdirectories (Optional[List[str]], optional): If given, the paths of
+            subdirectories are appended to it instead of being walked.
+
+    Yields:
+        os.DirEntry: The entry of each matching file.
+    """
+    stack = list(roots)
+    pending = stack if subdirectories is None else subdirectories
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() in extensions:
+                        yield entry
+        except OSError:
+            continue
+
+
+class AssetIndex:
+    """
+    A sorted, searchable collection of asset paths.
+
+    Attributes:
+        paths (List[str]): The asset paths in sorted order.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        """
+        Initialize the index.
+
+        Args:
+            paths (Iterable[str], optional): The initial asset paths.
+        """
+        self.paths: List[str] = []
+        self._names: List[str] = []
+        self._members = set()
+        self.add_many(paths)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._members
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def add_many(self, paths: Iterable[str]) -> int:
+        """
+        Add asset paths to the index, ignoring ones already present.
+
+        Args:
+            paths (Iterable[str]): The paths to add.
+
+        Returns:
+            int: The number of paths added.
+        """
+        new_paths = []
+        for path in paths:
+            if path not in self._members:
+                self._members.add(path)
+                new_paths.append(path)
+        if not new_paths:
+            return 0
+        new_paths.sort()
+        # Copy the runs of existing entries between the insertion points, so
+        # only the new paths have their names computed
+        merged_paths: List[str] = []
+        merged_names: List[str] = []
+        start = 0
+        for path in new_paths:
+            position = bisect_left(self.paths, path, start)
+            merged_paths += self.paths[start:position]
+            merged_names += self._names[start:position]
+            merged_paths.append(path)
+            merged_names.append(os.path.basename(path).lower())
+            start = position
+        merged_paths += self.paths[start:]
+        merged_names += self._names[start:]
+        self.paths[:] = merged_paths
+        self._names = merged_names
+        return len(new_paths)
+
+    def remove(self, path: str) -> bool:
+        """
+        Remove an asset path from the index.
+
+        Args:
+            path (str): The path to remove.
+
+        Returns:
+            bool: True if the path was removed, False if it was not indexed.
+        """
+        if path not in self._members:
+            return False
+        self._members.remove(path)
+        position = bisect_left(self.paths, path)
+        del self.paths[position]
+        del self._names[position]
+        return True
+
+    def search(self, query: str) -> List[str]:
+        """
+        Find the assets whose file name contains the query, ignoring case.
+
+        Args:
+            query (str): The text to search for. An empty query matches everything.
+
+        Returns:
+            List[str]: The matching paths in sorted order.
+        """
+        if not query:
+            return self.paths
+        query = query.lower()
+        return [path for path, name in zip(self.paths, self._names) if query in name]
+
+
+class AssetScanner:
+    """
+    Walks asset directories on a background thread and streams the files found.
+
+    Attributes:
+        roots (Sequence[str]): The directories to scan.
+        extensions (Iterable[str]): The file extensions to report.
+        files_found (int): Number of files reported so far.
+    """
+
+    def __init__(
+        self,
+        roots: Sequence[str],
+        extensions: Iterable[str] = IMAGE_EXTENSIONS,
+        batch_size: int = 512,
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            roots (Sequence[str]): The directories to scan.
+            extensions (Iterable[str], optional): The file extensions to report,
+                including the leading dot. Defaults to image extensions.
+            batch_size (int, optional): Number of paths sent per batch. Defaults to 512.
+        """
+        self.roots = roots
+        self.extensions = {extension.lower() for extension in extensions}
+        self.batch_size = batch_size
+        self.files_found = 0
+        self._batches: "queue.SimpleQueue[Optional[List[str]]]" = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the scan is complete and every batch has been drained."""
+        return self._finished
+
+    def start(self) -> None:
+        """Start scanning on a background thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="asset-scanner", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the background thread to stop and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def drain(self) -> List[str]:
+        """
+        Collect the paths found since the last call. Call from the main thread.
+
+        Returns:
+            List[str]: The new paths.
+        """
+        paths: List[str] = []
+        while True:
+            try:
+                batch = self._batches.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                self._finished = True
+                break
+            paths.extend(batch)
+        self.files_found += len(paths)
+        return paths
+
+    def _run(self) -> None:
+        """Walk the roots depth-first, sending batches of matching paths."""
+        batch: List[str] = []
+        for entry in iter_asset_files(self.roots, self.extensions):
+            if self._stop.is_set():
+                break
+            batch.append(entry.path)
+            if len(batch) >= self.batch_size:
+                self._batches.put(batch)
+                batch = []
+        if batch:
+            self._batches.put(batch)
+        self._batches.put(None)
@@ -0,0 +1,214 @@
+"""
+Asynchronous Asset Loader Module
+
+This module decodes image files on a pool of worker threads so opening a project
+with thousands of sprites does not freeze the editor. Pillow releases the GIL
+while decoding, so the workers run in parallel with the main loop.
+
+Each request returns a LoadHandle immediately, holding a shared placeholder
+surface. Decoded pixels are queued and turned into pygame surfaces on the main
+thread by process_completed(), which is called once per frame with a time
+budget so a burst of finished loads never stalls a frame.
+"""
+
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Set, Tuple
+
+import pygame
+
+# (handle, (size, rgba bytes) or None, error or None)
+_Completion = Tuple[
+    "LoadHandle", Optional[Tuple[Tuple[int, int], bytes]], Optional[BaseException]
+]
+
+PLACEHOLDER_SIZE = (16, 16)
+
+
+def _decode_image(path: str) -> Tuple[Tuple[int, int], bytes]:
+    """Decode an image file into RGBA bytes. Runs on a worker thread."""
+    # Pillow is imported on first use to keep it out of editor startup
+    from PIL import Image
+
+    with Image.open(path) as image:
+        rgba = image.convert("RGBA")
+        return rgba.size, rgba.tobytes()
+
+
+def make_placeholder(size: Tuple[int, int] = PLACEHOLDER_SIZE) -> pygame.Surface:
+    """
+    Create the checkerboard surface shown while an image is loading.
+
+    Args:
+        size (Tuple[int, int], optional): The size of the placeholder.
+
+    Returns:
+        pygame.Surface: The placeholder surface.
+    """
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((255, 0, 255, 255))
+    half_w, half_h = size[0] // 2, size[1] // 2
+    surface.fill((0, 0, 0, 255), pygame.Rect(0, 0, half_w, half_h))
+    surface.fill((0, 0, 0, 255), pygame.Rect(half_w, half_h, half_w, half_h))
+    return surface
+
+
+class LoadHandle:
+    """
+    A pending or finished asynchronous image load.
+
+    Attributes:
+        path (str): The path of the image being loaded.
+        surface (pygame.Surface): The placeholder until the load finishes, then
+            the decoded image.
+        done (bool): Whether the load has been finalized on the main thread.
+        error (Optional[BaseException]): The error raised while decoding, if any.
+    """
+
+    def __init__(self, path: str, placeholder: pygame.Surface):
+        self.path = path
+        self.surface = placeholder
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._callbacks: List[Callable[["LoadHandle"], None]] = []
+
+    def on_loaded(self, callback: Callable[["LoadHandle"], None]) -> None:
+        """
+        Register a callback run on the main thread when the load is finalized.
+
+        The callback also runs for failed loads; check the error attribute.
+        If the load is already finalized, the callback runs immediately.
+
+        Args:
+            callback (Callable[[LoadHandle], None]): The callback to run.
+        """
+        if self.done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def _finish(self) -> None:
+        """Mark the handle finished and run its callbacks."""
+        self.done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+class AsyncLoader:
+    """
+    Decodes images on a thread pool and finalizes them on the main thread.
+
+    Attributes:
+        placeholder (pygame.Surface): The surface handed out while loading.
+        pending (int): Number of loads not yet finalized.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the loader.
+
+        Args:
+            max_workers (Optional[int], optional): The number of worker threads.
+                Defaults to the ThreadPoolExecutor default.
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="asset-loader"
+        )
+        self._completed: "queue.SimpleQueue[_Completion]" = queue.SimpleQueue()
+        self.placeholder = make_placeholder()
+        self.pending = 0
+        # Submitted decodes that have not finished, so shutdown can cancel them
+        self._futures: Set[Future] = set()
+
+    def load(self, path: str) -> LoadHandle:
+        """
+        Start loading an image in the background.
+
+        Args:
+            path (str): The path to the image file.
+
+        Returns:
+            LoadHandle: A handle holding the placeholder until the image is ready.
+        """
+        handle = LoadHandle(path, self.placeholder)
+        self.pending += 1
+        future = self._executor.submit(_decode_image, path)
+        self._futures.add(future)
+        future.add_done_callback(lambda f: self._on_decoded(handle, f))
+        return handle
+
+    def process_completed(self, time_budget: float = 0.004) -> int:
+        """
+        Finalize decoded images on the main thread within a time budget.
+
+        Call this once per frame. At least one image is finalized per call when
+        any are ready, so loading always makes progress.
+
+        Args:
+            time_budget (float, optional): The maximum time to spend, in seconds.
+                Defaults to 4 ms.
+
+        Returns:
+            int: The number of loads finalized.
+        """
+        deadline = time.perf_counter() + time_budget
+        finalized = 0
+        while True:
+            try:
+                handle, result, error = self._completed.get_nowait()
+            except queue.Empty:
+                break
+            if error is None:
+                try:
+                    handle.surface = self._to_surface(*result)
+                except pygame.error as e:
+                    error = e
+            handle.error = error
+            self.pending -= 1
+            finalized += 1
+            handle._finish()
+            if time.perf_counter() >= deadline:
+                break
+        return finalized
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until every pending load has been finalized.
+
+        Intended for tests and command-line tools, not the editor main loop.
+
+        Args:
+            timeout (Optional[float], optional): The maximum time to wait, in seconds.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.pending:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            if not self.process_completed(time_budget=1.0):
+                time.sleep(0.001)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, cancelling loads that have not started."""
+        for future in list(self._futures):
+            if future.cancel():
+                self.pending -= 1
+        self._executor.shutdown(wait=False)
+
+    def _on_decoded(self, handle: LoadHandle, future: Future) -> None:
+        """Queue a decoded image for finalization. Runs on a worker thread."""
+        self._futures.discard(future)
+        if future.cancelled():
+            return
+        error = future.exception()
+        result = None if error is not None else future.result()
+        self._completed.put((handle, result, error))
+
+    @staticmethod
+    def _to_surface(size: Tuple[int, int], data: bytes) -> pygame.Surface:
+        """Build a pygame surface from decoded RGBA bytes."""
+        surface = pygame.image.frombuffer(data, size, "RGBA")
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface.copy()
@@ -0,0 +1,257 @@
+"""
+Content Store Module
+
+This module identifies asset files by the hash of their contents, so the same
+image stored under several names or paths is decoded, held in memory and
+thumbnailed only once.
+
+Hashes are computed with BLAKE2b, in a thread pool for batches (hashlib
+releases the GIL while hashing), and cached by (mtime, size) so unchanged files
+are never re-read. The cache can be saved to a JSON file between sessions.
+"""
+
+import hashlib
+import json
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+HASH_CHUNK_SIZE = 1024 * 1024
+CACHE_VERSION = 1
+
+
+def hash_file(path: str) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        str: The hex digest of the file contents.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DuplicateGroup:
+    """
+    A set of files with identical contents.
+
+    Attributes:
+        digest (str): The content hash shared by the files.
+        paths (List[str]): The files, in sorted order.
+        size (int): The size of one copy in bytes.
+    """
+
+    def __init__(self, digest: str, paths: List[str], size: int):
+        self.digest = digest
+        self.paths = paths
+        self.size = size
+
+    @property
+    def wasted_bytes(self) -> int:
+        """The bytes taken up by every copy but the first."""
+        return self.size * (len(self.paths) - 1)
+
+
+class DedupReport:
+    """
+    The duplicate files found among a set of assets.
+
+    Attributes:
+        groups (List[DuplicateGroup]): Groups of identical files, most wasteful first.
+    """
+
+    def __init__(self, groups: List[DuplicateGroup]):
+        self.groups = sorted(groups, key=lambda group: group.wasted_bytes, reverse=True)
+
+    @property
+    def wasted_bytes(self) -> int:
+        """The total bytes taken up by duplicate copies."""
+        return sum(group.wasted_bytes for group in self.groups)
+
+    def as_text(self) -> str:
+        """
+        Format the report for display.
+
+        Returns:
+            str: One line per duplicate group, followed by the total.
+        """
+        lines = []
+        for group in self.groups:
+            lines.append(
+                f"{len(group.paths)} copies, {group.wasted_bytes} bytes wasted: "
+                + ", ".join(group.paths)
+            )
+        lines.append(f"Total wasted: {self.wasted_bytes} bytes")
+        return "\n".join(lines)
+
+
+class ContentStore:
+    """
+    Maps asset files to content hashes and shares decoded surfaces between copies.
+
+    Attributes:
+        hashes (Dict[str, Tuple[int, int, str]]): Maps paths to the
+            (mtime_ns, size, digest) they were hashed at.
+    """
+
+    def __init__(
+        self, cache_path: Optional[str] = None, max_workers: Optional[int] = None
+    ):
+        """
+        Initialize the store, loading the hash cache if it exists.
+
+        Args:
+            cache_path (Optional[str], optional): JSON file the hash cache is
+                saved to. If None, hashes are only cached in memory.
+            max_workers (Optional[int], optional): Number of hashing threads.
+        """
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.hashes: Dict[str, Tuple[int, int, str]] = {}
+        # Decoded surfaces by digest; dropped once no loader holds them
+        self._surfaces: "weakref.WeakValueDictionary[str, pygame.Surface]" = (
+            weakref.WeakValueDictionary()
+        )
+        if cache_path is not None:
+            self._load()
+
+    def digest(self, path: str) -> str:
+        """
+        Return the content hash of a file, hashing it only if it changed.
+
+        Args:
+            path (str): The path to the file.
+
+        Returns:
+            str: The hex digest of the file contents.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        stat = os.stat(path)
+        cached = self.hashes.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        digest = hash_file(path)
+        self.hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def hash_many(self, paths: Iterable[str]) -> Dict[str, str]:
+        """
+        Hash many files in a thread pool, skipping files whose hash is cached.
+
+        Files that cannot be read are left out of the result.
+
+        Args:
+            paths (Iterable[str]): The paths to hash.
+
+        Returns:
+            Dict[str, str]: Maps each path to its digest.
+        """
+        results: Dict[str, str] = {}
+        stale: List[Tuple[str, int, int]] = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            cached = self.hashes.get(path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                results[path] = cached[2]
+            else:
+                stale.append((path, stat.st_mtime_ns, stat.st_size))
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    (entry, executor.submit(hash_file, entry[0])) for entry in stale
+                ]
+                for (path, mtime_ns, size), future in futures:
+                    try:
+                        digest = future.result()
+                    except OSError:
+                        continue
+                    self.hashes[path] = (mtime_ns, size, digest)
+                    results[path] = digest
+        return results
+
+    def load_surface(
+        self, path: str, decode: Callable[[str], pygame.Surface]
+    ) -> pygame.Surface:
+        """
+        Return the decoded surface of a file, shared with identical files.
+
+        Args:
+            path (str): The path to the file.
+            decode (Callable[[str], pygame.Surface]): Decodes a file when no
+                identical file has been decoded yet.
+
+        Returns:
+            pygame.Surface: The decoded surface.
+        """
+        digest = self.digest(path)
+        surface = self._surfaces.get(digest)
+        if surface is None:
+            surface = decode(path)
+            self._surfaces[digest] = surface
+        return surface
+
+    def find_duplicates(self, paths: Iterable[str]) -> DedupReport:
+        """
+        Group files with identical contents.
+
+        Args:
+            paths (Iterable[str]): The files to check.
+
+        Returns:
+            DedupReport: The groups of duplicates and the bytes they waste.
+        """
+        by_digest: Dict[str, List[str]] = {}
+        for path, digest in self.hash_many(paths).items():
+            by_digest.setdefault(digest, []).append(path)
+        groups = [
+            DuplicateGroup(digest, sorted(group), self.hashes[group[0]][1])
+            for digest, group in by_digest.items()
+            if len(group) > 1
+        ]
+        return DedupReport(groups)
+
+    def save(self) -> None:
+        """
+        Save the hash cache.
+
+        Raises:
+            PermissionError: If the cache cannot be written due to permission issues.
+        """
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, "w") as file:
+                json.dump({"version": CACHE_VERSION, "hashes": self.hashes}, file)
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied while saving hash cache: {e}")
+
+    def _load(self) -> None:
+        """Load the hash cache, starting empty if it is missing or outdated."""
+        try:
+            with open(self.cache_path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION:
+            self.hashes = {path: tuple(entry) for path, entry in data["hashes"].items()}
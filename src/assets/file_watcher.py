@@ -0,0 +1,311 @@
+"""
+File Watcher Module
+
+This module notices changes to asset files on disk so edits made in external
+tools show up in the editor without a restart.
+
+The FileWatcher polls the watched directories on a background thread, comparing
+(mtime, size) snapshots of every matching file. Bursts of changes, such as an
+image editor writing a file in several steps, are debounced into a single batch.
+Batches are dispatched on the main thread, where an AssetReloader reloads only
+the affected sprites, assets, tilesets and thumbnails and publishes an
+``asset_changed`` event on the EventBus for each changed file.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..core.events import Event, EventBus
+from .asset_manager import IMAGE_EXTENSIONS
+from .asset_scanner import iter_asset_files
+
+CREATED = "created"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+# path -> (mtime_ns, size)
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+class FileWatcher:
+    """
+    Polls directories for created, modified and deleted files.
+
+    Attributes:
+        roots (Sequence[str]): The directories to watch.
+        interval (float): Seconds between polls on the background thread.
+        debounce (float): Seconds without further changes before a batch is
+            released by the next poll.
+    """
+
+    def __init__(
+        self,
+        roots: Sequence[str],
+        interval: float = 1.0,
+        debounce: float = 0.3,
+        extensions: Iterable[str] = IMAGE_EXTENSIONS,
+    ):
+        """
+        Initialize the watcher and take the initial snapshot.
+
+        Args:
+            roots (Sequence[str]): The directories to watch.
+            interval (float, optional): Seconds between polls. Defaults to 1.0.
+            debounce (float, optional): Quiet period before a batch is released.
+                Defaults to 0.3.
+            extensions (Iterable[str], optional): The file extensions to watch,
+                including the leading dot. Defaults to image extensions.
+        """
+        self.roots = roots
+        self.interval = interval
+        self.debounce = debounce
+        self.extensions = {extension.lower() for extension in extensions}
+        self._snapshot = self._scan()
+        self._pending: Dict[str, str] = {}
+        self._last_change = 0.0
+        self._batches: "queue.SimpleQueue[Dict[str, str]]" = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start polling on a background thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="file-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def poll(self) -> Dict[str, str]:
+        """
+        Compare the directories against the last snapshot.
+
+        Returns:
+            Dict[str, str]: Maps each changed path to "created", "modified" or
+            "deleted".
+        """
+        snapshot = self._scan()
+        previous = self._snapshot
+        changes = {}
+        for path, signature in snapshot.items():
+            old_signature = previous.get(path)
+            if old_signature is None:
+                changes[path] = CREATED
+            elif old_signature != signature:
+                changes[path] = MODIFIED
+        for path in previous:
+            if path not in snapshot:
+                changes[path] = DELETED
+        self._snapshot = snapshot
+        return changes
+
+    def check(self, now: Optional[float] = None) -> None:
+        """
+        Poll once and release the pending batch if it has been quiet long enough.
+
+        Called by the background thread; tests may call it directly.
+
+        Args:
+            now (Optional[float], optional): The current time. Defaults to
+                time.monotonic().
+        """
+        now = time.monotonic() if now is None else now
+        changes = self.poll()
+        if changes:
+            for path, change in changes.items():
+                self._pending[path] = _merge_change(self._pending.get(path), change)
+            self._pending = {
+                path: change for path, change in self._pending.items() if change
+            }
+            self._last_change = now
+        elif self._pending and now - self._last_change >= self.debounce:
+            self._batches.put(self._pending)
+            self._pending = {}
+
+    def take_changes(self) -> Dict[str, str]:
+        """
+        Collect the debounced changes released since the last call.
+
+        Returns:
+            Dict[str, str]: Maps each changed path to its change kind.
+        """
+        changes: Dict[str, str] = {}
+        while True:
+            try:
+                batch = self._batches.get_nowait()
+            except queue.Empty:
+                break
+            for path, change in batch.items():
+                merged = _merge_change(changes.get(path), change)
+                if merged:
+                    changes[path] = merged
+                else:
+                    changes.pop(path, None)
+        return changes
+
+    def _run(self) -> None:
+        """Poll until stopped. Runs on the background thread."""
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def _scan(self) -> Snapshot:
+        """Stat every watched file under the roots."""
+        snapshot: Snapshot = {}
+        for entry in iter_asset_files(self.roots, self.extensions):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+def _merge_change(earlier: Optional[str], later: str) -> Optional[str]:
+    """Combine two successive changes to the same file into one."""
+    if earlier is None:
+        return later
+    if earlier == CREATED:
+        # A file created and deleted within one batch never existed for us
+        return None if later == DELETED else CREATED
+    if earlier == DELETED and later == CREATED:
+        return MODIFIED
+    return later
+
+
+class AssetReloader:
+    """
+    Reloads the assets affected by file changes and publishes asset_changed events.
+
+    Sprites, assets and tilesets are decoded in the background when an
+    AsyncLoader is given, and synchronously otherwise. Thumbnails are always
+    rendered on the thumbnail cache's worker threads.
+    """
+
+    def __init__(
+        self,
+        watcher: FileWatcher,
+        event_bus: EventBus,
+        sprite_loader=None,
+        asset_manager=None,
+        thumbnail_cache=None,
+        async_loader=None,
+    ):
+        """
+        Initialize the reloader.
+
+        Args:
+            watcher (FileWatcher): The watcher reporting changes.
+            event_bus (EventBus): The bus asset_changed events are published on.
+            sprite_loader (SpriteLoader, optional): Sprites to keep up to date.
+            asset_manager (AssetManager, optional): Assets to keep up to date.
+            thumbnail_cache (ThumbnailCache, optional): Thumbnails to regenerate.
+            async_loader (AsyncLoader, optional): Loader used to decode in the
+                background.
+        """
+        self.watcher = watcher
+        self.event_bus = event_bus
+        self.sprite_loader = sprite_loader
+        self.asset_manager = asset_manager
+        self.thumbnail_cache = thumbnail_cache
+        self.async_loader = async_loader
+        self.tilemaps: List = []
+
+    def watch_tilemap(self, tilemap) -> None:
+        """
+        Reload the tilesets of a tilemap when their image files change.
+
+        Args:
+            tilemap (Tilemap): The tilemap whose tilesets should be reloaded.
+        """
+        if tilemap not in self.tilemaps:
+            self.tilemaps.append(tilemap)
+
+    def update(self) -> Dict[str, str]:
+        """
+        Apply the debounced changes. Call once per frame on the main thread.
+
+        Returns:
+            Dict[str, str]: The changes that were applied.
+        """
+        changes = self.watcher.take_changes()
+        for path, change in changes.items():
+            if self.thumbnail_cache is not None:
+                self.thumbnail_cache.invalidate(path)
+            if change != DELETED:
+                self._reload(path)
+            self.event_bus.publish(
+                Event("asset_changed", {"path": path, "change": change})
+            )
+        if self.thumbnail_cache is not None:
+            for path, error in self.thumbnail_cache.process_completed():
+                if error is not None:
+                    print(f"Error regenerating thumbnail for {path}: {error}")
+            # Regenerated thumbnails are written out in batches
+            self.thumbnail_cache.flush_if_due()
+        return changes
+
+    def _reload(self, path: str) -> None:
+        """Reload everything loaded from a changed file."""
+        normalized = os.path.normpath(path)
+
+        if self.sprite_loader is not None:
+            for name, sprite_path in list(self.sprite_loader.sprite_paths.items()):
+                if os.path.normpath(str(sprite_path)) != normalized:
+                    continue
+                if self.async_loader is not None:
+                    # Keep showing the old sprite until the new one is decoded
+                    sprite = self.sprite_loader.sprites.get(name)
+                    self.sprite_loader.load_sprite_async(path, name, self.async_loader)
+                    if sprite is not None:
+                        self.sprite_loader.sprites[name] = sprite
+                else:
+                    self.sprite_loader.load_sprite(path, name)
+
+        handles = {}
+        if self.asset_manager is not None:
+            for asset_id, asset_path in list(self.asset_manager.asset_paths.items()):
+                if os.path.normpath(asset_path) != normalized:
+                    continue
+                if self.async_loader is not None:
+                    handles[asset_id] = self.asset_manager.load_asset_async(
+                        asset_id, asset_path, self.async_loader
+                    )
+                else:
+                    self.asset_manager.load_asset(asset_id, asset_path)
+
+        # Tilemap tilesets are loaded through the asset manager, keyed by path
+        for tilemap in self.tilemaps:
+            for name, tileset_path in list(tilemap.tileset_paths.items()):
+                if os.path.normpath(tileset_path) != normalized:
+                    continue
+                handle = handles.get(tileset_path)
+                if handle is not None:
+                    handle.on_loaded(_tileset_setter(tilemap, name))
+                elif self.asset_manager is not None:
+                    image = self.asset_manager.get_asset(tileset_path)
+                    if image is not None:
+                        tilemap.set_tileset(name, image)
+
+        if self.thumbnail_cache is not None and path in self.thumbnail_cache.index:
+            # Installed by a later update() once rendered in the background
+            try:
+                self.thumbnail_cache.request_thumbnail(path)
+            except OSError as e:
+                print(f"Error regenerating thumbnail for {path}: {e}")
+
+
+def _tileset_setter(tilemap, name: str):
+    """Return a load callback that swaps a reloaded tileset into a tilemap."""
+
+    def finish(handle) -> None:
+        if handle.error is None:
+            tilemap.set_tileset(name, handle.surface)
+
+    return finish
@@ -6,18 +6,27 @@ from typing import Dict, Optional
 
 import pygame
 
+from .async_loader import AsyncLoader, LoadHandle
+from .texture_atlas import TextureAtlas
+
 
 class SpriteLoader:
     """
     A class to load and manage sprite assets.
     """
 
-    def __init__(self):
+    def __init__(self, content_store=None):
         """
         Initialize the SpriteLoader.
+
+        Args:
+            content_store (ContentStore, optional): If given, sprite files with
+                identical contents share one decoded surface.
         """
         self.sprites: Dict[str, pygame.Surface] = {}
         self.sprite_paths: Dict[str, Path] = {}
+        self.atlas: Optional[TextureAtlas] = None
+        self.content_store = content_store
 
     def load_sprite(self, path: str, name: str) -> bool:
         """
@@ -36,7 +45,10 @@ class SpriteLoader:
                 print(f"Error: Sprite file not found at {path}")
                 return False
 
-            sprite = pygame.image.load(path).convert_alpha()
+            if self.content_store is not None:
+                sprite = self.content_store.load_surface(path, _load_sprite_surface)
+            else:
+                sprite = _load_sprite_surface(path)
             self.sprites[name] = sprite
             self.sprite_paths[name] = sprite_path
             return True
@@ -44,6 +56,117 @@ class SpriteLoader:
             print(f"Error loading sprite: {e}")
             return False
 
+    def load_sprite_async(
+        self, path: str, name: str, loader: AsyncLoader
+    ) -> Optional[LoadHandle]:
+        """
+        Start loading a sprite in the background.
+
+        The sprite is registered right away with the loader's placeholder surface
+        and replaced by the decoded image once the loader finalizes it.
+
+        Args:
+            path (str): The path to the sprite file.
+            name (str): The name to associate with the sprite.
+            loader (AsyncLoader): The loader that decodes the sprite.
+
+        Returns:
+            Optional[LoadHandle]: The load handle, or None if the file does not exist.
+        """
+        sprite_path = Path(path)
+        if not sprite_path.exists():
+            print(f"Error: Sprite file not found at {path}")
+            return None
+
+        handle = loader.load(path)
+        self.sprites[name] = handle.surface
+        self.sprite_paths[name] = sprite_path
+
+        def finish(handle: LoadHandle) -> None:
+            # Ignore loads superseded by a newer load or unloaded meanwhile
+            if self.sprite_paths.get(name) != sprite_path:
+                return
+            if handle.error is not None:
+                print(f"Error loading sprite: {handle.error}")
+                return
+            self.sprites[name] = handle.surface
+
+        handle.on_loaded(finish)
+        return handle
+
+    def load_sprites(
+        self, sprite_paths: Dict[str, str], atlas_dir: str
+    ) -> TextureAtlas:
+        """
+        Load sprites through a texture atlas cached on disk.
+
+        Sprites whose source file is unchanged since the atlas was saved are taken
+        from the atlas without decoding the file. New or modified sprites are
+        loaded and packed into the atlas incrementally, and the atlas is saved
+        back only when it changed.
+
+        Args:
+            sprite_paths (Dict[str, str]): Maps sprite names to sprite file paths.
+            atlas_dir (str): The directory the atlas is cached in.
+
+        Returns:
+            TextureAtlas: The atlas holding the sprites.
+        """
+        atlas = TextureAtlas.load(atlas_dir)
+        if atlas is None:
+            atlas = TextureAtlas()
+        packed = len(atlas)
+        atlas.remove_missing(sprite_paths)
+        changed = len(atlas) != packed
+
+        fresh: Dict[str, pygame.Surface] = {}
+        for name, path in sprite_paths.items():
+            if atlas.is_stale(name, path):
+                if self.load_sprite(path, name):
+                    fresh[name] = self.sprites[name]
+            else:
+                self.sprites[name] = atlas.get_surface(name)
+                self.sprite_paths[name] = Path(path)
+
+        if fresh:
+            atlas.add_many(fresh, {name: sprite_paths[name] for name in fresh})
+            for name in fresh:
+                self.sprites[name] = atlas.get_surface(name)
+            changed = True
+        if changed:
+            atlas.save(atlas_dir)
+        self.atlas = atlas
+        return atlas
+
+    def pack_atlas(self, atlas: Optional[TextureAtlas] = None) -> TextureAtlas:
+        """
+        Pack every loaded sprite into a texture atlas.
+
+        Sprites are replaced by subsurfaces of the atlas pages, so get_sprite()
+        keeps working while the individual surfaces can be freed.
+
+        Args:
+            atlas (Optional[TextureAtlas], optional): The atlas to add the sprites
+                to. A new atlas is created if None.
+
+        Returns:
+            TextureAtlas: The atlas holding the sprites.
+        """
+        if atlas is None:
+            atlas = self.atlas if self.atlas is not None else TextureAtlas()
+        pending = {
+            name: sprite
+            for name, sprite in self.sprites.items()
+            if name not in atlas or sprite.get_parent() is None
+        }
+        atlas.add_many(
+            pending, {name: str(self.sprite_paths[name]) for name in pending}
+        )
+        for name in pending:
+            self.sprites[name] = atlas.get_surface(name)
+        self.atlas = atlas
+        return atlas
+
     def get_sprite(self, name: str) -> Optional[pygame.Surface]:
         """
         Retrieve a sprite by its name.
@@ -78,3 +201,8 @@ class SpriteLoader:
         """
         self.sprites.clear()
         self.sprite_paths.clear()
+
+
+def _load_sprite_surface(path: str) -> pygame.Surface:
+    """Decode a sprite file into a surface with per-pixel alpha."""
+    return pygame.image.load(path).convert_alpha()
@@ -0,0 +1,411 @@
+"""
+Texture Atlas Module
+
+This module packs many small surfaces (sprites, tilesets) into a few large atlas
+pages using skyline bottom-left packing. Each packed image is looked up by name
+and drawn as a sub-rectangle of its page, which keeps the number of surfaces
+small and lets sprites that share a page be batched together.
+
+Atlases can be saved to and loaded from a directory (one PNG per page plus a
+JSON index), including the packer state, so new images can be added to a
+loaded atlas without repacking the existing ones.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+ATLAS_INDEX_FILE = "atlas.json"
+ATLAS_FORMAT_VERSION = 1
+
+
+class AtlasRegion:
+    """
+    The location of a packed image inside an atlas.
+
+    Attributes:
+        page (int): The index of the atlas page holding the image.
+        rect (pygame.Rect): The area of the page covered by the image.
+    """
+
+    __slots__ = ("page", "rect")
+
+    def __init__(self, page: int, rect: pygame.Rect):
+        self.page = page
+        self.rect = rect
+
+    def __repr__(self):
+        return f"AtlasRegion(page={self.page}, rect={tuple(self.rect)})"
+
+
+class SkylinePacker:
+    """
+    Allocates rectangles on a fixed-size page using the skyline bottom-left heuristic.
+
+    The skyline is a list of horizontal segments (x, y, width) describing the
+    lowest free height across the page. Each rectangle is placed where its top
+    edge ends up lowest, which keeps pages densely packed for sprite-sized input.
+    """
+
+    def __init__(self, width: int, height: int):
+        """
+        Initialize an empty page.
+
+        Args:
+            width (int): The width of the page.
+            height (int): The height of the page.
+        """
+        self.width = width
+        self.height = height
+        self.skyline: List[List[int]] = [[0, 0, width]]
+
+    def insert(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """
+        Allocate a rectangle on the page.
+
+        Args:
+            width (int): The width of the rectangle.
+            height (int): The height of the rectangle.
+
+        Returns:
+            Optional[Tuple[int, int]]: The (x, y) position of the rectangle, or
+            None if it does not fit on the page.
+        """
+        best_index = -1
+        best_x = best_y = 0
+        best_top = best_width = None
+        for index in range(len(self.skyline)):
+            y = self._fit(index, width, height)
+            if y is None:
+                continue
+            top = y + height
+            segment_width = self.skyline[index][2]
+            if (
+                best_top is None
+                or top < best_top
+                or (top == best_top and segment_width < best_width)
+            ):
+                best_index = index
+                best_x, best_y = self.skyline[index][0], y
+                best_top, best_width = top, segment_width
+
+        if best_index < 0:
+            return None
+        self._add_segment(best_index, best_x, best_y + height, width)
+        return best_x, best_y
+
+    def _fit(self, index: int, width: int, height: int) -> Optional[int]:
+        """Return the y position a rectangle would get at a skyline segment."""
+        x = self.skyline[index][0]
+        if x + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0:
+            if index >= len(self.skyline):
+                return None
+            y = max(y, self.skyline[index][1])
+            if y + height > self.height:
+                return None
+            remaining -= self.skyline[index][2]
+            index += 1
+        return y
+
+    def _add_segment(self, index: int, x: int, y: int, width: int) -> None:
+        """Insert a new skyline segment and trim the segments it covers."""
+        self.skyline.insert(index, [x, y, width])
+        right = x + width
+        i = index + 1
+        while i < len(self.skyline):
+            segment = self.skyline[i]
+            if segment[0] >= right:
+                break
+            shrink = right - segment[0]
+            if segment[2] <= shrink:
+                del self.skyline[i]
+                continue
+            segment[0] += shrink
+            segment[2] -= shrink
+            break
+
+        # Merge neighbouring segments of equal height
+        i = 0
+        while i < len(self.skyline) - 1:
+            if self.skyline[i][1] == self.skyline[i + 1][1]:
+                self.skyline[i][2] += self.skyline[i + 1][2]
+                del self.skyline[i + 1]
+            else:
+                i += 1
+
+
+class TextureAtlas:
+    """
+    Packs named surfaces into a few large atlas pages.
+
+    Attributes:
+        page_size (int): The width and height of each atlas page.
+        padding (int): Empty pixels kept around each image to avoid bleeding.
+        pages (List[pygame.Surface]): The atlas page surfaces.
+        regions (Dict[str, AtlasRegion]): Maps image names to their regions.
+        sources (Dict[str, Tuple[str, int, int]]): Maps image names to the
+            (path, mtime_ns, size) of the file they were loaded from, if known.
+    """
+
+    def __init__(self, page_size: int = 2048, padding: int = 1):
+        """
+        Initialize an empty atlas.
+
+        Args:
+            page_size (int, optional): The width and height of each page.
+                Defaults to 2048.
+            padding (int, optional): Padding around each image in pixels. Defaults to 1.
+
+        Raises:
+            ValueError: If page_size is not positive or padding is negative.
+        """
+        if page_size <= 0:
+            raise ValueError("Atlas page size must be a positive integer.")
+        if padding < 0:
+            raise ValueError("Atlas padding must not be negative.")
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: List[pygame.Surface] = []
+        self.regions: Dict[str, AtlasRegion] = {}
+        self.sources: Dict[str, Tuple[str, int, int]] = {}
+        self._packers: List[SkylinePacker] = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def add(
+        self, name: str, surface: pygame.Surface, source_path: Optional[str] = None
+    ) -> AtlasRegion:
+        """
+        Pack a surface into the atlas.
+
+        Re-adding an existing name with an image of the same size overwrites it
+        in place; a different size allocates a new region.
+
+        Args:
+            name (str): The name used to look up the image.
+            surface (pygame.Surface): The image to pack.
+            source_path (Optional[str], optional): The file the image was loaded
+                from, recorded so stale entries can be detected later.
+
+        Returns:
+            AtlasRegion: The region the image was packed into.
+
+        Raises:
+            ValueError: If the image is larger than an atlas page.
+        """
+        width, height = surface.get_size()
+        region = self.regions.get(name)
+        if region is None or region.rect.size != (width, height):
+            region = self._allocate(width, height)
+            self.regions[name] = region
+
+        page = self.pages[region.page]
+        page.fill((0, 0, 0, 0), region.rect)
+        page.blit(surface, region.rect.topleft)
+
+        if source_path is not None:
+            stat = os.stat(source_path)
+            self.sources[name] = (source_path, stat.st_mtime_ns, stat.st_size)
+        return region
+
+    def add_many(
+        self,
+        surfaces: Dict[str, pygame.Surface],
+        sources: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Pack several surfaces, tallest first for a denser packing.
+
+        Args:
+            surfaces (Dict[str, pygame.Surface]): Maps names to images.
+            sources (Optional[Dict[str, str]], optional): Maps names to the files
+                the images were loaded from.
+        """
+        sources = sources or {}
+        ordered = sorted(
+            surfaces.items(),
+            key=lambda item: (item[1].get_height(), item[1].get_width()),
+            reverse=True,
+        )
+        for name, surface in ordered:
+            self.add(name, surface, sources.get(name))
+
+    def get(self, name: str) -> Optional[AtlasRegion]:
+        """
+        Retrieve the region of a packed image.
+
+        Args:
+            name (str): The name of the image.
+
+        Returns:
+            Optional[AtlasRegion]: The region, or None if the image is not packed.
+        """
+        return self.regions.get(name)
+
+    def get_surface(self, name: str) -> Optional[pygame.Surface]:
+        """
+        Retrieve a packed image as a subsurface that shares the page's pixels.
+
+        Args:
+            name (str): The name of the image.
+
+        Returns:
+            Optional[pygame.Surface]: The subsurface, or None if the image is
+            not packed.
+        """
+        region = self.regions.get(name)
+        if region is None:
+            return None
+        return self.pages[region.page].subsurface(region.rect)
+
+    def is_stale(self, name: str, source_path: str) -> bool:
+        """
+        Check whether a packed image is missing or older than its source file.
+
+        Args:
+            name (str): The name of the image.
+            source_path (str): The file the image should be loaded from.
+
+        Returns:
+            bool: True if the image must be (re)packed from the file.
+        """
+        if name not in self.regions:
+            return True
+        recorded = self.sources.get(name)
+        if recorded is None or recorded[0] != source_path:
+            return True
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return True
+        return (stat.st_mtime_ns, stat.st_size) != recorded[1:]
+
+    def save(self, directory: str) -> None:
+        """
+        Save the atlas pages and index to a directory.
+
+        Args:
+            directory (str): The directory to write the atlas to.
+
+        Raises:
+            PermissionError: If the atlas cannot be written due to permission issues.
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for index, page in enumerate(self.pages):
+                pygame.image.save(page, os.path.join(directory, f"page_{index}.png"))
+            index_data = {
+                "version": ATLAS_FORMAT_VERSION,
+                "page_size": self.page_size,
+                "padding": self.padding,
+                "pages": len(self.pages),
+                "skylines": [packer.skyline for packer in self._packers],
+                "regions": {
+                    name: [region.page, *region.rect]
+                    for name, region in self.regions.items()
+                },
+                "sources": {
+                    name: list(source) for name, source in self.sources.items()
+                },
+            }
+            with open(os.path.join(directory, ATLAS_INDEX_FILE), "w") as file:
+                json.dump(index_data, file)
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied while saving atlas: {e}")
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["TextureAtlas"]:
+        """
+        Load an atlas saved with save().
+
+        Args:
+            directory (str): The directory the atlas was saved to.
+
+        Returns:
+            Optional[TextureAtlas]: The atlas, or None if no compatible atlas
+            exists in the directory.
+        """
+        index_path = os.path.join(directory, ATLAS_INDEX_FILE)
+        try:
+            with open(index_path, "r") as file:
+                index_data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if index_data.get("version") != ATLAS_FORMAT_VERSION:
+            return None
+
+        atlas = cls(index_data["page_size"], index_data["padding"])
+        try:
+            for index in range(index_data["pages"]):
+                page = pygame.image.load(os.path.join(directory, f"page_{index}.png"))
+                if pygame.display.get_surface() is not None:
+                    page = page.convert_alpha()
+                atlas.pages.append(page)
+        except (OSError, pygame.error):
+            return None
+
+        for skyline in index_data["skylines"]:
+            packer = SkylinePacker(atlas.page_size, atlas.page_size)
+            packer.skyline = [list(segment) for segment in skyline]
+            atlas._packers.append(packer)
+        for name, (page, x, y, width, height) in index_data["regions"].items():
+            atlas.regions[name] = AtlasRegion(page, pygame.Rect(x, y, width, height))
+        for name, (path, mtime_ns, size) in index_data["sources"].items():
+            atlas.sources[name] = (path, mtime_ns, size)
+        return atlas
+
+    def remove_missing(self, names: Iterable[str]) -> None:
+        """
+        Forget every packed image whose name is not in the given collection.
+
+        The pixels stay on their page until the atlas is rebuilt.
+
+        Args:
+            names (Iterable[str]): The names to keep.
+        """
+        keep = set(names)
+        for name in [name for name in self.regions if name not in keep]:
+            del self.regions[name]
+            self.sources.pop(name, None)
+
+    def _allocate(self, width: int, height: int) -> AtlasRegion:
+        """Find room for an image, opening a new page when all pages are full."""
+        padded_w = width + 2 * self.padding
+        padded_h = height + 2 * self.padding
+        if padded_w > self.page_size or padded_h > self.page_size:
+            raise ValueError(
+                f"Image of size {width}x{height} does not fit on an atlas page "
+                f"of size {self.page_size}."
+            )
+
+        for page_index, packer in enumerate(self._packers):
+            position = packer.insert(padded_w, padded_h)
+            if position is not None:
+                return self._region(page_index, position, width, height)
+
+        packer = SkylinePacker(self.page_size, self.page_size)
+        self._packers.append(packer)
+        self.pages.append(
+            pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        )
+        position = packer.insert(padded_w, padded_h)
+        return self._region(len(self._packers) - 1, position, width, height)
+
+    def _region(
+        self, page: int, position: Tuple[int, int], width: int, height: int
+    ) -> AtlasRegion:
+        """Build the region for an allocation, stripping the padding."""
+        x, y = position
+        return AtlasRegion(
+            page, pygame.Rect(x + self.padding, y + self.padding, width, height)
+        )
@@ -1,14 +1,93 @@
 """
 Thumbnail cache management for assets.
 Handles generating, storing, and retrieving thumbnails for sprites and tiles.
+Batches of thumbnails can be generated in parallel on a process or thread pool.
+
+Thumbnails are cached at two levels: decoded surfaces in an in-memory LRU bounded
+by count and bytes, and paged sprite sheets on disk. Each sheet page is a large
+PNG divided into cells of the thumbnail size, so a screenful of thumbnails is
+usually one file open and one surface. Disk entries are keyed by the asset path,
+its modification time and size, and the thumbnail size, so edited assets get
+fresh thumbnails. A single JSON index records the page and cell of every entry,
+so looking up a thumbnail never has to probe the cache directory. Thumbnails
+generated one at a time are written out together with the index once enough
+have piled up or enough time has passed; call flush() before exiting to write
+the rest. The key of each asset is remembered for a short time, so drawing
+thumbnails every frame does not stat their files every frame.
+
+Single thumbnails can also be requested in the background with
+request_thumbnail(); they are rendered on a thread pool and installed in the
+sheets on the main thread by process_completed(), once per frame.
+
+With a ContentStore, entries are keyed by the content hash of the asset instead
+of its path, so identical files under different names share one thumbnail cell.
 """
 
 import hashlib
+import json
 import os
-from typing import Dict, Optional, Tuple
+import queue
+import time
+from collections import OrderedDict
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import pygame
-from PIL import Image, ImageOps
+
+# (size, RGBA bytes) of a rendered thumbnail
+ThumbnailPixels = Tuple[Tuple[int, int], bytes]
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 2
+
+# (sheet name, page number) of a sprite sheet page
+PageId = Tuple[str, int]
+
+# (sheet name, page number, cell) of a thumbnail cell
+CellId = Tuple[str, int, int]
+
+
+def _render_thumbnail(asset_path: str, size: Tuple[int, int]) -> ThumbnailPixels:
+    """
+    Decode and resize a thumbnail. Runs in a worker process or thread.
+
+    Returns:
+        The size and RGBA pixels of the thumbnail.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(asset_path) as original_image:
+        thumbnail = ImageOps.fit(original_image, size, method=Image.LANCZOS)
+    thumbnail = thumbnail.convert("RGBA")
+    return thumbnail.size, thumbnail.tobytes()
+
+
+def _thumbnail_job(
+    job: Tuple[str, Tuple[int, int]],
+) -> Tuple[str, Optional[ThumbnailPixels], Optional[str]]:
+    """Run one batch job, reporting errors instead of raising them."""
+    asset_path = job[0]
+    try:
+        return asset_path, _render_thumbnail(*job), None
+    except Exception as e:
+        return asset_path, None, str(e)
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Return the number of bytes of pixel data held by a surface."""
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def _pixels_to_surface(pixels: ThumbnailPixels) -> pygame.Surface:
+    """Build a pygame surface from thumbnail pixels without touching the disk."""
+    size, data = pixels
+    return pygame.image.frombuffer(data, size, "RGBA")
 
 
 class ThumbnailCache:
@@ -17,20 +96,74 @@ class ThumbnailCache:
     Thumbnails are stored in a dedicated directory and referenced by a hash of their source.
     """
 
-    def __init__(self, cache_dir: str = "resources/cache/thumbnails"):
+    def __init__(
+        self,
+        cache_dir: str = "resources/cache/thumbnails",
+        max_memory_items: int = 1024,
+        max_memory_bytes: int = 32 * 1024 * 1024,
+        page_size: int = 1024,
+        max_loaded_pages: int = 8,
+        content_store=None,
+        key_ttl: float = 2.0,
+        flush_every: int = 32,
+        flush_interval: float = 5.0,
+    ):
         """
         Initialize the thumbnail cache.
 
         Args:
             cache_dir: Directory where thumbnails will be stored.
+            max_memory_items: Maximum number of thumbnails kept in memory.
+            max_memory_bytes: Maximum number of bytes of thumbnails kept in memory.
+            page_size: Width and height of each sprite sheet page.
+            max_loaded_pages: Maximum number of sheet pages kept in memory.
+            content_store: If given, assets with identical contents share a thumbnail.
+            key_ttl: Seconds a computed cache key is reused for lookups before
+                the asset file is checked again.
+            flush_every: Number of index changes after which the cache is
+                written to disk.
+            flush_interval: Seconds after which unwritten index changes are
+                written to disk.
 
         Raises:
             PermissionError: If the cache directory cannot be created due to permission issues.
         """
         self.cache_dir = cache_dir
         self.thumbnail_size = (64, 64)  # Default thumbnail size
-        self.cache: Dict[str, str] = {}  # Maps asset paths to thumbnail paths
+        self.max_memory_items = max_memory_items
+        self.max_memory_bytes = max_memory_bytes
+        self.page_size = page_size
+        self.max_loaded_pages = max_loaded_pages
+        self.content_store = content_store
+        # Maps cache keys to thumbnail surfaces, least recently used first
+        self.cache: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+        self.memory_used = 0
+        # Maps asset paths to their on-disk entries
+        self.index: Dict[str, Dict[str, Any]] = {}
+        # Number of pages of each sheet
+        self.sheet_pages: Dict[str, int] = {}
+        self._pages: "OrderedDict[PageId, pygame.Surface]" = OrderedDict()
+        self._dirty_pages: Set[PageId] = set()
+        self._free_cells: Dict[str, List[Tuple[int, int]]] = {}
+        # Number of index entries pointing at each cell, and the cell of each key
+        self._cell_refs: Dict[CellId, int] = {}
+        self._key_cells: Dict[str, CellId] = {}
+        # Maps asset paths to (time computed, cache key) for lookups
+        self.key_ttl = key_ttl
+        self._path_keys: Dict[str, Tuple[float, str]] = {}
+        # Index changes not yet written to disk, and when the cache was written
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        # Background requests: the pool is created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._requests: Dict[str, Future] = {}
+        self._completed: "queue.SimpleQueue[Tuple[str, str, Future]]" = (
+            queue.SimpleQueue()
+        )
         self._ensure_cache_dir_exists()
+        self._load_index()
 
     def _ensure_cache_dir_exists(self) -> None:
         """Ensure the cache directory exists.
@@ -45,25 +178,205 @@ class ThumbnailCache:
                 f"Permission denied while creating cache directory: {e}"
             )
 
-    def _generate_thumbnail_path(self, asset_path: str) -> str:
+    def _load_index(self) -> None:
+        """Load the on-disk index, starting empty if it is missing or outdated."""
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILE), "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if (
+            data.get("version") == INDEX_VERSION
+            and data.get("page_size") == self.page_size
+        ):
+            self.index = data["entries"]
+            self.sheet_pages = data["sheet_pages"]
+            for entry in self.index.values():
+                cell_id = _cell_id(entry)
+                self._cell_refs[cell_id] = self._cell_refs.get(cell_id, 0) + 1
+                self._key_cells[entry["key"]] = cell_id
+
+    def flush(self) -> None:
+        """Write modified sheet pages and the index to disk.
+
+        Raises:
+            PermissionError: If the cache cannot be written due to permission issues.
+        """
+        for page_id in list(self._dirty_pages):
+            self._save_page(page_id)
+        index_path = os.path.join(self.cache_dir, INDEX_FILE)
+        temp_path = index_path + ".tmp"
+        data = {
+            "version": INDEX_VERSION,
+            "page_size": self.page_size,
+            "sheet_pages": self.sheet_pages,
+            "entries": self.index,
+        }
+        try:
+            with open(temp_path, "w") as file:
+                json.dump(data, file)
+            os.replace(temp_path, index_path)
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied while saving index: {e}")
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def flush_if_due(self) -> bool:
+        """Flush if flush_every index changes or flush_interval seconds are pending.
+
+        Cheap enough to call every frame.
+
+        Returns:
+            True if the cache was written to disk.
+
+        Raises:
+            PermissionError: If the cache cannot be written due to permission issues.
+        """
+        if not self._unflushed:
+            return False
+        if (
+            self._unflushed < self.flush_every
+            and time.monotonic() - self._last_flush < self.flush_interval
+        ):
+            return False
+        self.flush()
+        return True
+
+    def _cache_key(self, asset_path: str) -> str:
+        """
+        Build the cache key of an asset from its path, modification time, file
+        size and the thumbnail size, or from its content hash and the thumbnail
+        size when a content store is used.
+
+        Args:
+            asset_path: Path to the source asset.
+
+        Returns:
+            The cache key.
+
+        Raises:
+            FileNotFoundError: If the asset file does not exist.
+        """
+        width, height = self.thumbnail_size
+        if self.content_store is not None:
+            digest = self.content_store.digest(asset_path)
+            signature = f"{digest}|{width}x{height}"
+        else:
+            stat = os.stat(asset_path)
+            signature = (
+                f"{asset_path}|{stat.st_mtime_ns}|{stat.st_size}|{width}x{height}"
+            )
+        key = hashlib.md5(signature.encode()).hexdigest()
+        self._path_keys[asset_path] = (time.monotonic(), key)
+        return key
+
+    def _current_key(self, asset_path: str) -> str:
+        """
+        Return the cache key of an asset, reusing a key computed less than
+        key_ttl seconds ago instead of checking the file again.
+
+        Raises:
+            FileNotFoundError: If the key must be computed and the asset file
+                does not exist.
+        """
+        known = self._path_keys.get(asset_path)
+        if known is not None and time.monotonic() - known[0] < self.key_ttl:
+            return known[1]
+        return self._cache_key(asset_path)
+
+    def invalidate(self, asset_path: str) -> None:
         """
-        Generate a unique thumbnail path based on the asset path.
+        Forget the remembered cache key of an asset, so the next lookup checks
+        its file again. Call this when the asset file changes.
+
+        Args:
+            asset_path: Path to the source asset.
+        """
+        self._path_keys.pop(asset_path, None)
+
+    def _sheet_name(self) -> str:
+        """Return the name of the sheet holding thumbnails of the current size."""
+        width, height = self.thumbnail_size
+        return f"{width}x{height}"
+
+    def _page_path(self, page_id: PageId) -> str:
+        """Return the path of a sheet page file."""
+        sheet, page = page_id
+        return os.path.join(self.cache_dir, f"sheet_{sheet}_{page}.png")
+
+    def _cell_rect(self, sheet: str, cell: int) -> pygame.Rect:
+        """Return the area of a page covered by a cell."""
+        width, height = (int(n) for n in sheet.split("x"))
+        columns = self.page_size // width
+        return pygame.Rect(
+            (cell % columns) * width, (cell // columns) * height, width, height
+        )
+
+    def _get_page(self, page_id: PageId) -> Optional[pygame.Surface]:
+        """Return a sheet page, loading it and evicting old pages as needed."""
+        page = self._pages.get(page_id)
+        if page is not None:
+            self._pages.move_to_end(page_id)
+            return page
+        if page_id[1] >= self.sheet_pages.get(page_id[0], 0):
+            return None
+        try:
+            page = pygame.image.load(self._page_path(page_id))
+        except FileNotFoundError:
+            # A page that was never flushed starts out empty
+            page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        except pygame.error as e:
+            raise pygame.error(f"Error loading thumbnail: {e}")
+        self._pages[page_id] = page
+        while len(self._pages) > self.max_loaded_pages:
+            evicted_id = next(iter(self._pages))
+            if evicted_id in self._dirty_pages:
+                # Write the index with the page so its cells are never orphaned
+                self.flush()
+            del self._pages[evicted_id]
+        return page
+
+    def _save_page(self, page_id: PageId) -> None:
+        """Write one sheet page to disk."""
+        try:
+            pygame.image.save(self._pages[page_id], self._page_path(page_id))
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied while saving thumbnail: {e}")
+        self._dirty_pages.discard(page_id)
+
+    def get_thumbnail_region(
+        self, asset_path: str
+    ) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Retrieve the sheet page and area holding the thumbnail of an asset.
+
+        Drawing several thumbnails from the same page can be submitted as a
+        single ``Surface.blits`` call.
 
         Args:
             asset_path: Path to the source asset.
 
         Returns:
-            Path where the thumbnail should be stored.
+            The page surface and the thumbnail area, or None if not found.
+
+        Raises:
+            pygame.error: If the sheet page is corrupted or cannot be loaded.
         """
-        # Create a hash of the asset path to use as the filename
-        hash_object = hashlib.md5(asset_path.encode())
-        hex_digest = hash_object.hexdigest()
-        return os.path.join(self.cache_dir, f"{hex_digest}.png")
+        if not self.is_cached(asset_path):
+            return None
+        entry = self.index[asset_path]
+        page = self._get_page((entry["sheet"], entry["page"]))
+        if page is None:
+            return None
+        return page, self._cell_rect(entry["sheet"], entry["cell"])
 
     def get_thumbnail(self, asset_path: str) -> Optional[pygame.Surface]:
         """
         Retrieve a thumbnail for the given asset.
 
+        Thumbnails are served from memory when possible, then from disk. An
+        asset edited since its thumbnail was generated has no thumbnail.
+
         Args:
             asset_path: Path to the source asset.
 
@@ -73,22 +386,166 @@ class ThumbnailCache:
         Raises:
             pygame.error: If the thumbnail file is corrupted or cannot be loaded.
         """
-        thumbnail_path = self._generate_thumbnail_path(asset_path)
+        try:
+            key = self._current_key(asset_path)
+        except OSError:
+            return None
+
+        thumbnail = self.cache.get(key)
+        if thumbnail is not None:
+            self.cache.move_to_end(key)
+            return thumbnail
+
+        region = self.get_thumbnail_region(asset_path)
+        if region is None:
+            return None
+        page, rect = region
+        thumbnail = page.subsurface(rect)
+        self._remember(key, thumbnail)
+        return thumbnail
+
+    def _remember(self, key: str, thumbnail: pygame.Surface) -> None:
+        """Add a thumbnail to the in-memory LRU and evict old ones over budget."""
+        previous = self.cache.pop(key, None)
+        if previous is not None:
+            self.memory_used -= _surface_bytes(previous)
+        self.cache[key] = thumbnail
+        self.memory_used += _surface_bytes(thumbnail)
+        while len(self.cache) > 1 and (
+            len(self.cache) > self.max_memory_items
+            or self.memory_used > self.max_memory_bytes
+        ):
+            _, evicted = self.cache.popitem(last=False)
+            self.memory_used -= _surface_bytes(evicted)
+
+    def _allocate_cell(self, sheet: str) -> Tuple[int, int]:
+        """Find a free cell on a sheet, opening a new page when all are full."""
+        free = self._free_cells.get(sheet)
+        if free is None:
+            # Collect the unused cells of the existing pages once per sheet
+            used = {
+                (entry["page"], entry["cell"])
+                for entry in self.index.values()
+                if entry["sheet"] == sheet
+            }
+            free = [
+                (page, cell)
+                for page in range(self.sheet_pages.get(sheet, 0))
+                for cell in range(self._cells_per_page(sheet))
+                if (page, cell) not in used
+            ]
+            free.reverse()
+            self._free_cells[sheet] = free
+        if not free:
+            page = self.sheet_pages.get(sheet, 0)
+            self.sheet_pages[sheet] = page + 1
+            self._pages[(sheet, page)] = pygame.Surface(
+                (self.page_size, self.page_size), pygame.SRCALPHA
+            )
+            free.extend(
+                (page, cell) for cell in reversed(range(self._cells_per_page(sheet)))
+            )
+        return free.pop()
+
+    def _cells_per_page(self, sheet: str) -> int:
+        """Return the number of cells on each page of a sheet."""
+        width, height = (int(n) for n in sheet.split("x"))
+        return (self.page_size // width) * (self.page_size // height)
+
+    def _record(
+        self, asset_path: str, key: str, thumbnail: pygame.Surface
+    ) -> pygame.Surface:
+        """
+        Write a thumbnail into a sheet cell and point the index entry of the
+        asset at it, reusing the cell of an outdated thumbnail of the same size
+        unless other assets share it.
 
-        # Check if thumbnail exists in cache
-        if os.path.exists(thumbnail_path):
-            try:
-                thumbnail = pygame.image.load(thumbnail_path)
-                return thumbnail
-            except pygame.error as e:
-                raise pygame.error(f"Error loading thumbnail: {e}")
+        Returns:
+            The thumbnail as a subsurface of its sheet page.
+        """
+        sheet = self._sheet_name()
+        old_entry = self.index.get(asset_path)
+        if (
+            old_entry is not None
+            and old_entry["sheet"] == sheet
+            and self._cell_refs[_cell_id(old_entry)] == 1
+        ):
+            page_number, cell = old_entry["page"], old_entry["cell"]
+            # The cell keeps its only user; _link records it under the new key
+            del self._cell_refs[_cell_id(old_entry)]
+            if self._key_cells.get(old_entry["key"]) == _cell_id(old_entry):
+                del self._key_cells[old_entry["key"]]
+        else:
+            self._unlink(asset_path)
+            page_number, cell = self._allocate_cell(sheet)
+
+        page_id = (sheet, page_number)
+        page = self._get_page(page_id)
+        rect = self._cell_rect(sheet, cell)
+        page.fill((0, 0, 0, 0), rect)
+        # Adding onto the cleared cell copies the pixels, alpha included
+        page.blit(thumbnail, rect, special_flags=pygame.BLEND_RGBA_ADD)
+        self._dirty_pages.add(page_id)
+        self._link(asset_path, key, (sheet, page_number, cell))
+        return page.subsurface(rect)
+
+    def _link(self, asset_path: str, key: str, cell_id: CellId) -> None:
+        """Point the index entry of an asset at a cell."""
+        sheet, page_number, cell = cell_id
+        self.index[asset_path] = {
+            "key": key,
+            "sheet": sheet,
+            "page": page_number,
+            "cell": cell,
+        }
+        self._cell_refs[cell_id] = self._cell_refs.get(cell_id, 0) + 1
+        self._key_cells[key] = cell_id
+        self._unflushed += 1
+
+    def _unlink(self, asset_path: str) -> None:
+        """Remove the index entry of an asset, freeing its cell if unshared."""
+        entry = self.index.pop(asset_path, None)
+        if entry is None:
+            return
+        cell_id = _cell_id(entry)
+        refs = self._cell_refs.pop(cell_id) - 1
+        if refs:
+            self._cell_refs[cell_id] = refs
+            return
+        if self._key_cells.get(entry["key"]) == cell_id:
+            del self._key_cells[entry["key"]]
+        if entry["sheet"] in self._free_cells:
+            self._free_cells[entry["sheet"]].append((entry["page"], entry["cell"]))
+
+    def _share(self, asset_path: str, key: str) -> Optional[pygame.Surface]:
+        """
+        Point an asset at the cell of an identical asset's thumbnail, if any.
 
-        return None
+        Returns:
+            The shared thumbnail, or None if no other asset has this key.
+        """
+        cell_id = self._key_cells.get(key)
+        entry = self.index.get(asset_path)
+        if cell_id is None or (entry is not None and _cell_id(entry) == cell_id):
+            return None
+        page = self._get_page(cell_id[:2])
+        if page is None:
+            return None
+        self._unlink(asset_path)
+        self._link(asset_path, key, cell_id)
+        thumbnail = self.cache.get(key)
+        if thumbnail is None:
+            thumbnail = page.subsurface(self._cell_rect(cell_id[0], cell_id[2]))
+        return thumbnail
 
     def generate_and_cache_thumbnail(self, asset_path: str) -> Optional[pygame.Surface]:
         """
         Generate a thumbnail for the given asset and cache it.
 
+        The sheet page and index are written to disk once flush_every
+        thumbnails or flush_interval seconds are pending, so generating
+        thumbnails one at a time does not re-encode the page every time.
+
         Args:
             asset_path: Path to the source asset.
 
@@ -101,21 +558,15 @@ class ThumbnailCache:
             Exception: For other errors during thumbnail generation.
         """
         try:
-            # Load the original image
-            original_image = Image.open(asset_path)
-
-            # Create thumbnail
-            thumbnail = ImageOps.fit(
-                original_image, self.thumbnail_size, method=Image.LANCZOS
-            )
-
-            # Save thumbnail to cache
-            thumbnail_path = self._generate_thumbnail_path(asset_path)
-            thumbnail.save(thumbnail_path)
-
-            # Convert to pygame Surface for immediate use
-            pygame_thumbnail = pygame.image.load(thumbnail_path)
-            return pygame_thumbnail
+            # Create the thumbnail and store it in the sheet, without a disk round-trip
+            key = self._cache_key(asset_path)
+            thumbnail = self._share(asset_path, key)
+            if thumbnail is None:
+                pixels = _render_thumbnail(asset_path, self.thumbnail_size)
+                thumbnail = self._record(asset_path, key, _pixels_to_surface(pixels))
+            self._remember(key, thumbnail)
+            self.flush_if_due()
+            return thumbnail
 
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Asset file not found: {e}")
@@ -124,6 +575,229 @@ class ThumbnailCache:
         except Exception as e:
             raise Exception(f"Error generating thumbnail: {e}")
 
+    @property
+    def pending(self) -> int:
+        """Number of background requests not yet installed."""
+        return len(self._requests)
+
+    def is_requested(self, asset_path: str) -> bool:
+        """Check whether a background request for an asset is in progress."""
+        return asset_path in self._requests
+
+    def request_thumbnail(self, asset_path: str, max_workers: int = 2) -> None:
+        """
+        Start generating the thumbnail of an asset in the background.
+
+        The thumbnail is rendered on a worker thread and installed by
+        process_completed(). Assets sharing the thumbnail of an identical,
+        already cached asset are linked to it at once.
+
+        Args:
+            asset_path: Path to the source asset.
+            max_workers: Number of worker threads, used when the pool is created.
+
+        Raises:
+            FileNotFoundError: If the asset file does not exist.
+        """
+        if asset_path in self._requests:
+            return
+        key = self._cache_key(asset_path)
+        thumbnail = self._share(asset_path, key)
+        if thumbnail is not None:
+            self._remember(key, thumbnail)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="thumbnail"
+            )
+        future = self._executor.submit(
+            _thumbnail_job, (asset_path, self.thumbnail_size)
+        )
+        self._requests[asset_path] = future
+        future.add_done_callback(lambda f: self._completed.put((asset_path, key, f)))
+
+    def process_completed(
+        self, time_budget: float = 0.004
+    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        Install finished background thumbnails within a time budget.
+
+        Call this once per frame on the main thread. At least one thumbnail is
+        installed per call when any are ready.
+
+        Args:
+            time_budget: The maximum time to spend, in seconds.
+
+        Returns:
+            The asset path and error message (None on success) of every
+            request that finished.
+        """
+        deadline = time.perf_counter() + time_budget
+        finished: List[Tuple[str, Optional[str]]] = []
+        while True:
+            try:
+                asset_path, key, future = self._completed.get_nowait()
+            except queue.Empty:
+                break
+            if self._requests.get(asset_path) is not future or future.cancelled():
+                continue
+            del self._requests[asset_path]
+            _, pixels, error = future.result()
+            if error is None and pixels[0] == self.thumbnail_size:
+                thumbnail = self._record(asset_path, key, _pixels_to_surface(pixels))
+                self._remember(key, thumbnail)
+            finished.append((asset_path, error))
+            if time.perf_counter() >= deadline:
+                break
+        return finished
+
+    def shutdown(self) -> None:
+        """Stop the background workers, cancelling requests not yet started."""
+        for future in self._requests.values():
+            future.cancel()
+        self._requests.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def generate_thumbnails(
+        self,
+        asset_paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+    ) -> Dict[str, pygame.Surface]:
+        """
+        Generate and cache thumbnails for many assets in parallel.
+
+        Assets that fail to load are reported and left out of the result
+        instead of aborting the whole batch.
+
+        Args:
+            asset_paths: Paths to the source assets.
+            max_workers: Number of workers. Defaults to the number of CPUs.
+            use_processes: Use a process pool (True) or a thread pool (False).
+
+        Returns:
+            Dictionary mapping asset paths to their thumbnails.
+        """
+        surfaces = {}
+        for asset_path, key, thumbnail in self._run_batch(
+            asset_paths, max_workers, use_processes
+        ):
+            surfaces[asset_path] = thumbnail
+            self._remember(key, thumbnail)
+        return surfaces
+
+    def warm_cache(
+        self,
+        asset_paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+    ) -> int:
+        """
+        Generate missing on-disk thumbnails for many assets using all cores.
+
+        Thumbnails that are already cached are skipped and new thumbnails are
+        not kept in memory, so whole asset folders can be warmed cheaply.
+
+        Args:
+            asset_paths: Paths to the source assets.
+            max_workers: Number of workers. Defaults to the number of CPUs.
+            use_processes: Use a process pool (True) or a thread pool (False).
+
+        Returns:
+            Number of thumbnails generated.
+        """
+        missing = [
+            asset_path for asset_path in asset_paths if not self.is_cached(asset_path)
+        ]
+        return len(self._run_batch(missing, max_workers, use_processes))
+
+    def _run_batch(
+        self,
+        asset_paths: Iterable[str],
+        max_workers: Optional[int],
+        use_processes: bool,
+    ) -> List[Tuple[str, str, pygame.Surface]]:
+        """Render thumbnails on a worker pool and store them in the sheets.
+
+        Assets sharing a key with an already cached or queued asset are linked
+        to its cell instead of being rendered again.
+        """
+        keys: Dict[str, str] = {}
+        queued: Set[str] = set()
+        jobs = []
+        duplicates = []
+        results = []
+        for asset_path in asset_paths:
+            try:
+                key = self._cache_key(asset_path)
+            except OSError as e:
+                print(f"Error generating thumbnail for {asset_path}: {e}")
+                continue
+            if key in queued:
+                duplicates.append((asset_path, key))
+                continue
+            thumbnail = self._share(asset_path, key)
+            if thumbnail is not None:
+                results.append((asset_path, key, thumbnail))
+                continue
+            keys[asset_path] = key
+            queued.add(key)
+            jobs.append((asset_path, self.thumbnail_size))
+        if not jobs:
+            self.flush()
+            return results
+
+        workers = max_workers or os.cpu_count() or 1
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            # Hand each process several jobs at a time to amortize IPC
+            chunksize = max(1, len(jobs) // (workers * 4))
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            chunksize = 1
+
+        with executor:
+            for asset_path, pixels, error in executor.map(
+                _thumbnail_job, jobs, chunksize=chunksize
+            ):
+                if error is not None:
+                    print(f"Error generating thumbnail for {asset_path}: {error}")
+                    continue
+                key = keys[asset_path]
+                thumbnail = self._record(asset_path, key, _pixels_to_surface(pixels))
+                results.append((asset_path, key, thumbnail))
+        for asset_path, key in duplicates:
+            thumbnail = self._share(asset_path, key)
+            if thumbnail is not None:
+                results.append((asset_path, key, thumbnail))
+        self.flush()
+        return results
+
+    def is_cached(self, asset_path: str) -> bool:
+        """
+        Check whether an up-to-date thumbnail of an asset is cached on disk.
+
+        Like lookups, this reuses a key computed less than key_ttl seconds ago,
+        so an edit is noticed after key_ttl seconds or once invalidate() is
+        called for the asset.
+
+        Args:
+            asset_path: Path to the source asset.
+
+        Returns:
+            True if the index holds a thumbnail for the current version of the asset.
+        """
+        entry = self.index.get(asset_path)
+        if entry is None:
+            return False
+        try:
+            return entry["key"] == self._current_key(asset_path)
+        except OSError:
+            return False
+
     def clear_cache(self) -> None:
         """Clear all cached thumbnails.
 
@@ -143,6 +817,16 @@ class ThumbnailCache:
                 print(f"Error deleting {file_path}: {e}")
 
         self.cache.clear()
+        self.memory_used = 0
+        self.index.clear()
+        self.sheet_pages.clear()
+        self._pages.clear()
+        self._dirty_pages.clear()
+        self._free_cells.clear()
+        self._cell_refs.clear()
+        self._key_cells.clear()
+        self._path_keys.clear()
+        self._unflushed = 0
         print("Thumbnail cache cleared.")
 
     def set_thumbnail_size(self, size: Tuple[int, int]) -> None:
@@ -157,4 +841,12 @@ class ThumbnailCache:
         """
         if size[0] <= 0 or size[1] <= 0:
             raise ValueError("Thumbnail size must have positive dimensions.")
+        if size[0] > self.page_size or size[1] > self.page_size:
+            raise ValueError("Thumbnail size must not exceed the sheet page size.")
         self.thumbnail_size = size
+        self._path_keys.clear()
+
+
+def _cell_id(entry: Dict[str, Any]) -> CellId:
+    """Return the cell an index entry points at."""
+    return entry["sheet"], entry["page"], entry["cell"]
@@ -0,0 +1,270 @@
+"""
+Headless command-line interface for batch processing scene files.
+
+Runs without a window: the SDL dummy video driver is selected and no
+EditorWindow is created, so scenes can be processed in build pipelines without
+a display. Scene files are processed in parallel on a process pool with --jobs.
+
+Usage:
+    python -m src.cli validate levels/*.json --jobs 8
+    python -m src.cli convert levels/*.json --to binary --output-dir build/levels
+    python -m src.cli bake levels/*.json --output-dir build/baked
+    python -m src.cli thumbnails levels/*.json --cache-dir resources/cache/thumbnails
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+# (scene path, succeeded, job result or error message)
+JobResult = Tuple[str, bool, Any]
+
+
+def _resolve(scene_path: str, path: str) -> str:
+    """Resolve a path stored in a scene, trying it relative to the scene file."""
+    if os.path.isabs(path) or os.path.exists(path):
+        return path
+    return os.path.join(os.path.dirname(scene_path), path)
+
+
+def _load(scene_path: str):
+    """Load a scene file in either format."""
+    from .scene.scene_serializer import SceneSerializer
+
+    return SceneSerializer.load_from_file(scene_path)
+
+
+def validate_scene(scene_path: str) -> List[str]:
+    """
+    Check a scene file for problems that would break it in the editor or game.
+
+    Args:
+        scene_path (str): The path to the scene file.
+
+    Returns:
+        List[str]: A description of each problem found; empty if the scene is valid.
+
+    Raises:
+        FileNotFoundError: If the scene file does not exist.
+        ValueError: If the scene file cannot be parsed.
+    """
+    scene = _load(scene_path)
+    problems = []
+    for index, tilemap in enumerate(scene.tilemaps):
+        outside = sum(
+            1
+            for x, y in tilemap.tiles
+            if not (0 <= x < tilemap.width and 0 <= y < tilemap.height)
+        )
+        if outside:
+            problems.append(f"tilemap {index}: {outside} tiles outside the map")
+        negative = sum(1 for tile in tilemap.tiles.values() if tile.tile_id < 0)
+        if negative:
+            problems.append(f"tilemap {index}: {negative} tiles with negative ids")
+        used = {tile.tileset for tile in tilemap.tiles.values()}
+        for name in sorted(used - set(tilemap.tileset_paths)):
+            problems.append(f"tilemap {index}: tileset '{name}' has no image")
+        for name, path in sorted(tilemap.tileset_paths.items()):
+            if not os.path.exists(_resolve(scene_path, path)):
+                problems.append(f"tilemap {index}: tileset '{name}' not found: {path}")
+
+    seen = set()
+    for entity in scene.entities:
+        if entity.entity_id is None:
+            continue
+        if entity.entity_id in seen:
+            problems.append(f"duplicate entity id: {entity.entity_id}")
+        seen.add(entity.entity_id)
+    return problems
+
+
+def _validate_job(scene_path: str) -> str:
+    problems = validate_scene(scene_path)
+    if problems:
+        raise ValueError("; ".join(problems))
+    return "valid"
+
+
+def _output_path(scene_path: str, output_dir: Optional[str], extension: str) -> str:
+    """Return where the output for a scene file is written."""
+    stem = os.path.splitext(os.path.basename(scene_path))[0]
+    directory = output_dir if output_dir is not None else os.path.dirname(scene_path)
+    return os.path.join(directory, stem + extension)
+
+
+def _convert_job(scene_path: str, to: str, output_dir: Optional[str]) -> str:
+    from .scene.scene_serializer import BINARY_EXTENSION, SceneSerializer
+
+    extension = BINARY_EXTENSION if to == "binary" else ".json"
+    output_path = _output_path(scene_path, output_dir, extension)
+    SceneSerializer.save_to_file(_load(scene_path), output_path)
+    return f"wrote {output_path}"
+
+
+def _bake_job(scene_path: str, output_dir: Optional[str]) -> str:
+    import pygame
+
+    scene = _load(scene_path)
+    written = []
+    for index, tilemap in enumerate(scene.tilemaps):
+        for name, path in tilemap.tileset_paths.items():
+            try:
+                tilemap.set_tileset(name, pygame.image.load(_resolve(scene_path, path)))
+            except (FileNotFoundError, pygame.error) as e:
+                raise FileNotFoundError(f"Tileset '{name}' could not be loaded: {e}")
+        surface = pygame.Surface(
+            (tilemap.width * tilemap.tile_width, tilemap.height * tilemap.tile_height),
+            pygame.SRCALPHA,
+        )
+        tilemap.render(surface, {"x": 0, "y": 0})
+        output_path = _output_path(scene_path, output_dir, f"_tilemap{index}.png")
+        pygame.image.save(surface, output_path)
+        written.append(output_path)
+    return f"baked {len(written)} tilemaps"
+
+
+def _tileset_images(scene_path: str) -> List[str]:
+    """Return the tileset images referenced by a scene file."""
+    return [
+        _resolve(scene_path, path)
+        for tilemap in _load(scene_path).tilemaps
+        for path in tilemap.tileset_paths.values()
+    ]
+
+
+def _run_job(job: Callable[[str], object], scene_path: str) -> JobResult:
+    """Run one job, reporting errors instead of raising them."""
+    try:
+        return scene_path, True, job(scene_path)
+    except Exception as e:
+        return scene_path, False, str(e)
+
+
+def run_jobs(
+    job: Callable[[str], object], scene_paths: Sequence[str], jobs: int = 1
+) -> List[JobResult]:
+    """
+    Run a job over many scene files, in parallel when jobs > 1.
+
+    Args:
+        job (Callable[[str], object]): A picklable function taking a scene
+            path. Its return value is reported as the result.
+        scene_paths (Sequence[str]): The scene files.
+        jobs (int, optional): Number of worker processes. Defaults to 1.
+
+    Returns:
+        List[JobResult]: The result for each scene file, in input order.
+    """
+    run = partial(_run_job, job)
+    if jobs <= 1 or len(scene_paths) <= 1:
+        return [run(scene_path) for scene_path in scene_paths]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Hand each process several files at a time to amortize IPC
+        chunksize = max(1, len(scene_paths) // (jobs * 4))
+        return list(executor.map(run, scene_paths, chunksize=chunksize))
+
+
+def _regenerate_thumbnails(
+    scene_paths: Sequence[str], cache_dir: str, jobs: int
+) -> List[JobResult]:
+    """Regenerate the thumbnails of every tileset used by the scenes."""
+    from .assets.thumbnail_cache import ThumbnailCache
+
+    results = []
+    images = set()
+    for scene_path, succeeded, found in run_jobs(_tileset_images, scene_paths, jobs):
+        if succeeded:
+            images.update(found)
+            found = f"{len(found)} tilesets"
+        results.append((scene_path, succeeded, found))
+
+    cache = ThumbnailCache(cache_dir)
+    thumbnails = cache.generate_thumbnails(sorted(images), max_workers=jobs)
+    failed = sorted(image for image in images if image not in thumbnails)
+    results.append(
+        (
+            cache_dir,
+            not failed,
+            f"{len(thumbnails)} thumbnails regenerated"
+            + (f", failed: {', '.join(failed)}" if failed else ""),
+        )
+    )
+    return results
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Process scene files without opening the editor.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_command(name: str, description: str) -> argparse.ArgumentParser:
+        command = subparsers.add_parser(name, help=description)
+        command.add_argument("scenes", nargs="+", help="scene files to process")
+        command.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=1,
+            help="number of worker processes (default: 1)",
+        )
+        return command
+
+    add_command("validate", "check scenes for errors")
+    convert = add_command("convert", "convert scenes between JSON and binary")
+    convert.add_argument("--to", choices=("json", "binary"), required=True)
+    convert.add_argument("--output-dir", help="defaults to next to each scene")
+    bake = add_command("bake", "render every tilemap of the scenes to PNG")
+    bake.add_argument("--output-dir", help="defaults to next to each scene")
+    thumbnails = add_command("thumbnails", "regenerate thumbnails of scene tilesets")
+    thumbnails.add_argument("--cache-dir", default="resources/cache/thumbnails")
+    return parser.parse_args(argv)
+
+
+def _report(results: Iterable[JobResult]) -> int:
+    """Print one line per result and return the number of failures."""
+    failures = 0
+    for path, succeeded, message in results:
+        print(f"{'ok' if succeeded else 'FAIL'}  {path}: {message}")
+        failures += not succeeded
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        int: The exit status; 1 if any file failed.
+    """
+    args = _parse_args(argv)
+    # Never open a window; worker processes inherit the setting
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+    if args.command == "validate":
+        results = run_jobs(_validate_job, args.scenes, args.jobs)
+    elif args.command == "convert":
+        job = partial(_convert_job, to=args.to, output_dir=args.output_dir)
+        results = run_jobs(job, args.scenes, args.jobs)
+    elif args.command == "bake":
+        job = partial(_bake_job, output_dir=args.output_dir)
+        results = run_jobs(job, args.scenes, args.jobs)
+    else:
+        results = _regenerate_thumbnails(args.scenes, args.cache_dir, args.jobs)
+
+    failures = _report(results)
+    if failures:
+        print(f"{failures} of {len(results)} failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,15 @@
 # Core module initialization
 # Import key components here for easy access
-from .app import App
 from .config import Config
 from .constants import *
 from .events import EventBus
 from .types import *
+
+
+def __getattr__(name):
+    # App pulls in pygame and the whole editor, so it is imported on first use
+    if name == "App":
+        from .app import App
+
+        return App
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,15 +3,25 @@ Core application class for the 2D Game Editor.
 Manages the main window, state, and high-level functionality.
 """
 
-from typing import Optional
+import os
+import time
+from typing import TYPE_CHECKING, Optional
 
 import pygame
 
+from ..assets.async_loader import AsyncLoader
+from ..assets.file_watcher import AssetReloader, FileWatcher
 from ..editor.editor_window import EditorWindow
+from ..utils.frame_profiler import profiler
 from .config import Config
 from .events import Event, EventBus
 from .types import AppState
 
+if TYPE_CHECKING:
+    from ..assets.asset_database import AssetDatabase
+    from ..utils.sampling_profiler import SamplingProfiler
+    from ..utils.startup_profiler import StartupProfiler
+
 
 class App:
     """
@@ -19,8 +29,30 @@ class App:
     window, and global state.
     """
 
-    def __init__(self):
-        """Initialize the application."""
+    def __init__(
+        self,
+        startup_profiler: Optional["StartupProfiler"] = None,
+        project_path: Optional[str] = None,
+    ):
+        """
+        Initialize the application.
+
+        Args:
+            startup_profiler (Optional[StartupProfiler], optional): If given,
+                its import report is printed once the first frame is shown.
+            project_path (Optional[str], optional): The project opened at
+                startup. Defaults to config.default_project_path, if that
+                directory exists.
+        """
+        self.startup_profiler = startup_profiler
+        self.project_path = project_path
+        self.started_at = (
+            startup_profiler.started_at
+            if startup_profiler is not None
+            else time.perf_counter()
+        )
+        # Seconds from start to the first rendered frame, once it is shown
+        self.time_to_first_frame: Optional[float] = None
         self.config = Config()
         self.event_bus = EventBus()
         self.state: AppState = {
@@ -31,6 +63,14 @@ class App:
         self.window: pygame.Surface | None = None
         self.clock = pygame.time.Clock()
         self.editor_window: Optional[EditorWindow] = None
+        self.asset_loader: Optional[AsyncLoader] = None
+        self.file_watcher: Optional[FileWatcher] = None
+        self.asset_reloader: Optional[AssetReloader] = None
+        self.asset_database: Optional["AssetDatabase"] = None
+        self.sampling_profiler: Optional["SamplingProfiler"] = None
+        self.event_bus.subscribe(
+            "toggle_sampling_profile", self._on_toggle_sampling_profile
+        )
 
     def initialize(self) -> bool:
         """
@@ -49,23 +89,151 @@ class App:
         # Initialize other systems
         self._initialize_subsystems()
 
+        project_path = self.project_path
+        if project_path is None and os.path.isdir(self.config.default_project_path):
+            project_path = self.config.default_project_path
+        if project_path is not None:
+            self.open_project(project_path)
+
         self.state["is_running"] = True
         return True
 
     def _initialize_subsystems(self):
         """Initialize all subsystems (e.g., renderer, asset manager, etc.)."""
+        self.asset_loader = AsyncLoader(self.config.asset_loader_workers)
         if self.window is not None:
             self.editor_window = EditorWindow(self.window, self.event_bus)
+        self._start_watching_assets()
+
+    def _start_watching_assets(self):
+        """Hot-reload assets edited in external tools while the editor runs."""
+        from ..editor.panels.assets_browser import AssetsBrowserPanel
+
+        thumbnail_cache = None
+        if self.editor_window:
+            for panel in self.editor_window.panels:
+                if isinstance(panel, AssetsBrowserPanel):
+                    thumbnail_cache = panel.thumbnail_cache
+        self.file_watcher = FileWatcher(
+            [self.config.default_assets_path], self.config.asset_watch_interval
+        )
+        self.asset_reloader = AssetReloader(
+            self.file_watcher,
+            self.event_bus,
+            thumbnail_cache=thumbnail_cache,
+            async_loader=self.asset_loader,
+        )
+        self.file_watcher.start()
+
+    def open_project(self, project_path: str) -> None:
+        """
+        Open a project and bring its asset index up to date.
+
+        The index is stored in the project directory, so only directories
+        changed since the project was last open are rescanned.
+
+        Args:
+            project_path (str): The project directory.
+        """
+        # Imported here so SQLite and Pillow are not loaded before the first frame
+        from ..assets.asset_database import AssetDatabase
+        from ..editor.panels.assets_browser import AssetsBrowserPanel
+
+        if self.asset_database is not None:
+            self.asset_database.close()
+        os.makedirs(project_path, exist_ok=True)
+        self.state["project_path"] = project_path
+        self.asset_database = AssetDatabase(
+            os.path.join(project_path, self.config.asset_database_file)
+        )
+        self.asset_database.sync([self.config.default_assets_path])
+        if self.editor_window:
+            for panel in self.editor_window.panels:
+                if isinstance(panel, AssetsBrowserPanel):
+                    panel.load_assets(self.asset_database.paths())
+
+    def start_sampling_profile(self, duration: Optional[float] = None) -> None:
+        """
+        Start sampling the main loop's call stacks on a background thread.
+
+        The profile is written to the project directory (or the working
+        directory without a project) when sampling stops.
+
+        Args:
+            duration (Optional[float], optional): Seconds to sample for.
+                Defaults to config.sampling_profile_duration.
+        """
+        from ..utils.sampling_profiler import SamplingProfiler
+
+        if self.sampling_profiler is not None and self.sampling_profiler.is_running:
+            return
+        if duration is None:
+            duration = self.config.sampling_profile_duration
+        self.sampling_profiler = SamplingProfiler(
+            self.config.sampling_profile_interval_ms / 1000.0
+        )
+        self.sampling_profiler.start(duration, self._save_sampling_profile)
+        print(f"Sampling profiler started for {duration} s")
+
+    def stop_sampling_profile(self) -> None:
+        """Stop the sampling profiler early; the profile is still written."""
+        if self.sampling_profiler is not None:
+            self.sampling_profiler.stop()
+
+    def _on_toggle_sampling_profile(self, event: Event) -> None:
+        """Start or stop the sampling profiler from the event bus."""
+        if self.sampling_profiler is not None and self.sampling_profiler.is_running:
+            self.stop_sampling_profile()
+        else:
+            self.start_sampling_profile((event.data or {}).get("duration"))
+
+    def _save_sampling_profile(self, profiler: "SamplingProfiler") -> None:
+        """Write a finished sampling profile; runs on the sampling thread."""
+        extension = (
+            ".speedscope.json"
+            if self.config.sampling_profile_format == "speedscope"
+            else ".collapsed.txt"
+        )
+        directory = self.state["project_path"] or os.getcwd()
+        file_path = os.path.join(
+            directory, time.strftime("profile-%Y%m%d-%H%M%S") + extension
+        )
+        try:
+            profiler.save(file_path)
+        except OSError as e:
+            print(f"Error writing sampling profile: {e}")
+            return
+        print(
+            f"Sampling profile with {profiler.sample_count} samples"
+            f" written to {file_path}"
+        )
 
     def run(self):
-        """Main application loop."""
+        """Main application loop. Shuts the application down when it ends."""
         if not self.initialize():
             return
-        while self.state["is_running"]:
-            self._handle_events()
-            self._update()
-            self._render()
-            self.clock.tick(self.config.target_fps)
+        try:
+            while self.state["is_running"]:
+                profiler.begin_frame()
+                with profiler.scope("handle_events"):
+                    self._handle_events()
+                with profiler.scope("update"):
+                    self._update()
+                with profiler.scope("render"):
+                    self._render()
+                profiler.end_frame()
+                if self.time_to_first_frame is None:
+                    self._first_frame_shown()
+                self.clock.tick(self.config.target_fps)
+        finally:
+            self.shutdown()
+
+    def _first_frame_shown(self):
+        """Record the time to first frame and print the startup report."""
+        self.time_to_first_frame = time.perf_counter() - self.started_at
+        if self.startup_profiler is not None:
+            self.startup_profiler.stop()
+            print(self.startup_profiler.report(self.time_to_first_frame))
 
     def _handle_events(self):
         """Process all pending events."""
@@ -76,6 +244,14 @@ class App:
 
     def _update(self):
         """Update the application state."""
+        # Deliver the events queued during this frame, coalesced
+        self.event_bus.dispatch_queued()
+        if self.asset_reloader:
+            self.asset_reloader.update()
+        if self.asset_loader:
+            self.asset_loader.process_completed(
+                self.config.asset_finalize_budget_ms / 1000.0
+            )
         if self.editor_window:
             self.editor_window.update(self.clock.get_time() / 1000.0)
 
@@ -85,6 +261,28 @@ class App:
             self.editor_window.render()
 
     def shutdown(self):
-        """Clean up resources and shut down the application."""
+        """
+        Clean up resources and shut down the application.
+
+        Called by run() when the main loop ends; calling it again does nothing
+        harmful.
+        """
         self.state["is_running"] = False
+        self.stop_sampling_profile()
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
+            self.asset_reloader = None
+        if self.editor_window:
+            from ..editor.panels.assets_browser import AssetsBrowserPanel
+
+            for panel in self.editor_window.panels:
+                if isinstance(panel, AssetsBrowserPanel):
+                    panel.close()
+        if self.asset_loader:
+            self.asset_loader.shutdown()
+            self.asset_loader = None
+        if self.asset_database is not None:
+            self.asset_database.close()
+            self.asset_database = None
         pygame.quit()
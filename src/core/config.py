@@ -18,11 +18,23 @@ class Config:
         # Default paths
         self.default_project_path = "projects/"
         self.default_assets_path = "resources/"
+        self.asset_database_file = "assets.db"  # Inside the project directory
 
         # Editor settings
         self.max_undo_steps = 50
         self.auto_save_interval = 300  # 5 minutes in seconds
         self.target_fps = 60
+        self.frame_trace_file = "frame_trace.json"  # Written with F4
+
+        # Sampling profiler settings (toggled with F9)
+        self.sampling_profile_duration = 30  # Seconds
+        self.sampling_profile_interval_ms = 5
+        self.sampling_profile_format = "speedscope"  # Or "collapsed"
+
+        # Asset loading settings
+        self.asset_loader_workers = 4
+        self.asset_finalize_budget_ms = 4  # Main-thread time per frame
+        self.asset_watch_interval = 1.0  # Seconds between asset change polls
 
 
 # Global configuration instance
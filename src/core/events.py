@@ -1,4 +1,7 @@
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+# Event types of which only the last posted event is kept per frame
+COALESCED_EVENT_TYPES = ("mouse_motion", "window_resized", "camera_changed")
 
 
 class Event:
@@ -22,38 +25,133 @@ class Event:
         self.data = data
 
 
+class Subscription:
+    """
+    A handle to a listener subscribed to an event bus.
+
+    Attributes:
+        event_type (str): The type of event the listener receives.
+        callback (Callable[[Event], Optional[bool]]): The listener.
+        priority (int): Listeners with a higher priority are called first.
+        active (bool): False once the listener has been unsubscribed.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        event_type: str,
+        callback: Callable[[Event], Optional[bool]],
+        priority: int,
+    ):
+        self._bus = bus
+        self.event_type = event_type
+        self.callback = callback
+        self.priority = priority
+        self.active = True
+
+    def unsubscribe(self) -> None:
+        """Remove the listener from the bus. Does nothing if already removed."""
+        self._bus.unsubscribe(self)
+
+
 class EventBus:
     """
-    A simple event bus for publishing and subscribing to events.
+    An event bus for publishing and subscribing to events.
+
+    Events can be published immediately with publish() or posted with post(),
+    which queues them until dispatch_queued() is called once per frame. For
+    the types in ``coalesced_types`` only the last posted event is kept per
+    frame, so a heavy mouse drag produces one update per frame.
+
+    Listeners are called in order of decreasing priority, then in
+    subscription order. A listener that returns True consumes the event and
+    stops it from reaching lower-priority listeners.
 
     Attributes:
-        listeners (Dict[str, List[Callable]]): A dictionary mapping event types to their listeners.
+        listeners (Dict[str, List[Callable]]): A dictionary mapping event types
+            to their listeners, in call order.
+        coalesced_types (Set[str]): Event types of which only the last posted
+            event is kept per frame.
     """
 
-    def __init__(self):
-        """Initialize the event bus with an empty dictionary of listeners."""
-        self.listeners: Dict[str, List[Callable[[Event], None]]] = {}
+    def __init__(self, coalesced_types: Optional[Iterable[str]] = None):
+        """
+        Initialize the event bus with an empty dictionary of listeners.
+
+        Args:
+            coalesced_types (Optional[Iterable[str]], optional): Event types to
+                coalesce in the queue. Defaults to COALESCED_EVENT_TYPES.
+        """
+        self.listeners: Dict[str, List[Callable[[Event], Optional[bool]]]] = {}
+        self.coalesced_types: Set[str] = set(
+            COALESCED_EVENT_TYPES if coalesced_types is None else coalesced_types
+        )
+        self._subscriptions: Dict[str, List[Subscription]] = {}
+        self._queue: List[Optional[Event]] = []
+        # Queue position of the pending event of each coalesced type
+        self._pending: Dict[str, int] = {}
 
-    def subscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
+    def subscribe(
+        self,
+        event_type: str,
+        callback: Callable[[Event], Optional[bool]],
+        priority: int = 0,
+    ) -> Subscription:
         """
         Subscribe a callback function to an event type.
 
         Args:
             event_type (str): The type of the event to subscribe to.
-            callback (Callable[[Event], None]): The function to call when the event is published.
+            callback (Callable[[Event], Optional[bool]]): The function to call when the
+                event is published. Returning True stops lower-priority listeners.
+            priority (int, optional): Listeners with a higher priority are called
+                first. Defaults to 0.
+
+        Returns:
+            Subscription: A handle that unsubscribes the callback.
 
         Example:
             >>> def handle_event(event):
             ...     print(f"Event received: {event.type}")
-            >>> event_bus.subscribe("test_event", handle_event)
+            >>> subscription = event_bus.subscribe("test_event", handle_event)
+            >>> subscription.unsubscribe()
+        """
+        subscription = Subscription(self, event_type, callback, priority)
+        subscriptions = self._subscriptions.setdefault(event_type, [])
+        # Insert after every listener of the same or a higher priority
+        index = len(subscriptions)
+        while index > 0 and subscriptions[index - 1].priority < priority:
+            index -= 1
+        subscriptions.insert(index, subscription)
+        self._update_listeners(event_type)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
         """
-        if event_type not in self.listeners:
-            self.listeners[event_type] = []
-        self.listeners[event_type].append(callback)
+        Remove a listener added with subscribe().
+
+        Args:
+            subscription (Subscription): The handle returned by subscribe().
+        """
+        if not subscription.active:
+            return
+        subscription.active = False
+        subscriptions = self._subscriptions.get(subscription.event_type, [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+            self._update_listeners(subscription.event_type)
+
+    def _update_listeners(self, event_type: str) -> None:
+        subscriptions = self._subscriptions.get(event_type)
+        if subscriptions:
+            self.listeners[event_type] = [s.callback for s in subscriptions]
+        else:
+            self._subscriptions.pop(event_type, None)
+            self.listeners.pop(event_type, None)
 
     def publish(self, event: Event) -> None:
         """
-        Publish an event to all subscribed listeners.
+        Publish an event to all subscribed listeners immediately.
 
         Args:
             event (Event): The event to publish.
@@ -62,6 +160,53 @@ class EventBus:
             >>> event = Event("test_event", {"key": "value"})
             >>> event_bus.publish(event)
         """
-        if event.type in self.listeners:
-            for callback in self.listeners[event.type]:
-                callback(event)
+        subscriptions = self._subscriptions.get(event.type)
+        if not subscriptions:
+            return
+        # Iterate over a copy so listeners can unsubscribe while being called
+        for subscription in tuple(subscriptions):
+            if subscription.active and subscription.callback(event) is True:
+                break
+
+    def post(self, event: Event) -> None:
+        """
+        Queue an event until the next dispatch_queued() call.
+
+        If the type is coalesced, an event of the same type that is still
+        queued is dropped and the new one takes its place at the end.
+
+        Args:
+            event (Event): The event to queue.
+        """
+        if event.type in self.coalesced_types:
+            index = self._pending.get(event.type)
+            if index is not None:
+                self._queue[index] = None
+            self._pending[event.type] = len(self._queue)
+        self._queue.append(event)
+
+    def dispatch_queued(self) -> int:
+        """
+        Publish every queued event, in the order they were posted.
+
+        Events posted by listeners during dispatch are queued for the next call.
+
+        Returns:
+            int: The number of events published.
+        """
+        queue = self._queue
+        if not queue:
+            return 0
+        self._queue = []
+        self._pending = {}
+        dispatched = 0
+        for event in queue:
+            if event is not None:
+                self.publish(event)
+                dispatched += 1
+        return dispatched
+
+    @property
+    def pending_count(self) -> int:
+        """The number of queued events."""
+        return len(self._queue) - self._queue.count(None)
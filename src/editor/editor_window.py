@@ -4,13 +4,68 @@ Main editor window composition and management.
 This module handles the main window layout, panels, and user interactions.
 """
 
+from typing import List
+
 import pygame
 from pygame.locals import *
 
+from ..core.config import config
 from ..core.events import Event, EventBus
 from ..rendering.camera import Camera
 from ..scene.scene import Scene
+from ..ui.layout import HitTestGrid
+from ..ui.perf_overlay import PerformanceOverlay
 from ..ui.widgets import Button
+from ..utils.frame_profiler import profiler
+
+# Events delivered only to the panel under the pointer (or the captured panel)
+POINTER_EVENTS = {
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+}
+# Events delivered only to the panel that was clicked last
+KEYBOARD_EVENTS = {pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING}
+
+
+def coalesce_events(events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+    """
+    Merge runs of mouse motion events and drop all but the last resize.
+
+    A merged motion event has the position and buttons of the last event of
+    the run and the summed relative motion, so a drag produces one motion
+    event per frame while clicks in between keep their order.
+
+    Args:
+        events (List[pygame.event.Event]): The events of one frame.
+
+    Returns:
+        List[pygame.event.Event]: The coalesced events.
+    """
+    last_resize = None
+    for index, event in enumerate(events):
+        if event.type == pygame.VIDEORESIZE:
+            last_resize = index
+    coalesced = []
+    for index, event in enumerate(events):
+        if event.type == pygame.VIDEORESIZE and index != last_resize:
+            continue
+        if (
+            event.type == pygame.MOUSEMOTION
+            and coalesced
+            and coalesced[-1].type == pygame.MOUSEMOTION
+        ):
+            previous_rel = coalesced[-1].rel
+            attributes = dict(event.dict)
+            attributes["rel"] = (
+                previous_rel[0] + event.rel[0],
+                previous_rel[1] + event.rel[1],
+            )
+            coalesced[-1] = pygame.event.Event(pygame.MOUSEMOTION, attributes)
+            continue
+        coalesced.append(event)
+    return coalesced
 
 
 class EditorWindow:
@@ -28,14 +83,21 @@ class EditorWindow:
         """
         self.window = window
         self.event_bus = event_bus
-        self.event_bus = EventBus()
-        self.camera = Camera()
+        self.camera = Camera(event_bus=event_bus)
         self.scene = Scene()
         self.panels = []
         self.is_running = True
+        self.performance_overlay = PerformanceOverlay(profiler, config.target_fps)
+        # Pointer events are routed through a hit-test grid of the panel rects
+        self.hit_test = HitTestGrid()
+        self.captured_panel = None
+        self.focused_panel = None
+        self.hovered_panel = None
+        self.pointer_pos = (0, 0)
 
         # Initialize UI panels
         self._initialize_panels()
+        self.rebuild_layout()
 
     def _initialize_panels(self):
         """
@@ -49,19 +111,75 @@ class EditorWindow:
         from ..editor.panels.toolbar import ToolbarPanel
 
         self.panels = [
-            HierarchyPanel(),
-            InspectorPanel(),
+            HierarchyPanel(self.scene, self.event_bus),
+            InspectorPanel(self.event_bus),
             AssetsBrowserPanel(),
             TilePalettePanel(),
             LayerPanel(),
             ToolbarPanel(),
         ]
 
+    def rebuild_layout(self):
+        """
+        Rebuild the hit-test grid from the panel rectangles.
+
+        Call this after panels are added, moved or resized. Panels without a
+        get_rect() method receive no pointer events.
+        """
+        self.hit_test.clear()
+        for panel in self.panels:
+            get_rect = getattr(panel, "get_rect", None)
+            if get_rect is not None:
+                self.hit_test.add(get_rect(), panel)
+
+    def _update_hover(self):
+        """Tell the panel the pointer left, for panels that track hovering."""
+        hovered = self.hit_test.hit_test(*self.pointer_pos)
+        if hovered is not self.hovered_panel:
+            on_pointer_leave = getattr(self.hovered_panel, "on_pointer_leave", None)
+            if on_pointer_leave is not None:
+                on_pointer_leave()
+            self.hovered_panel = hovered
+
+    def _route_event(self, event):
+        """
+        Deliver an event to the panels that should see it.
+
+        Pointer events go to the panel holding the pointer capture, otherwise
+        to the topmost panel under the pointer; a button press captures the
+        pointer until the button is released. Keyboard events go to the panel
+        clicked last, and all other events to every panel.
+
+        Args:
+            event (pygame.event.Event): The pygame event.
+        """
+        if event.type in POINTER_EVENTS:
+            if hasattr(event, "pos"):
+                self.pointer_pos = event.pos
+            if event.type == pygame.MOUSEMOTION:
+                self._update_hover()
+            target = self.captured_panel
+            if target is None:
+                target = self.hit_test.hit_test(*self.pointer_pos)
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.captured_panel = target
+                self.focused_panel = target
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self.captured_panel = None
+            if target is not None:
+                target.handle_event(event)
+        elif event.type in KEYBOARD_EVENTS:
+            if self.focused_panel is not None:
+                self.focused_panel.handle_event(event)
+        else:
+            for panel in self.panels:
+                panel.handle_event(event)
+
     def handle_events(self):
         """
         Handle all pygame events for the editor window.
         """
-        for event in pygame.event.get():
+        for event in coalesce_events(pygame.event.get()):
             if event.type == QUIT:
                 self.is_running = False
             elif event.type == KEYDOWN:
@@ -72,10 +190,11 @@ class EditorWindow:
                 self._handle_mouse_up(event)
             elif event.type == MOUSEMOTION:
                 self._handle_mouse_motion(event)
+            elif event.type == pygame.VIDEORESIZE:
+                self.event_bus.post(Event("window_resized", {"size": event.size}))
+                self.rebuild_layout()
 
-            # Pass events to all panels
-            for panel in self.panels:
-                panel.handle_event(event)
+            self._route_event(event)
 
     def _handle_key_down(self, event):
         """
@@ -88,6 +207,13 @@ class EditorWindow:
             self.is_running = False
         elif event.key == K_s and event.mod & KMOD_CTRL:
             self.event_bus.publish(Event("save_scene", {}))
+        elif event.key == pygame.K_F3:
+            self.performance_overlay.toggle()
+        elif event.key == pygame.K_F4 and profiler.frames:
+            profiler.export_chrome_trace(config.frame_trace_file)
+            print(f"Frame trace written to {config.frame_trace_file}")
+        elif event.key == pygame.K_F9:
+            self.event_bus.publish(Event("toggle_sampling_profile", {}))
 
     def _handle_mouse_down(self, event):
         """
@@ -114,7 +240,12 @@ class EditorWindow:
         Args:
             event (pygame.event.Event): The pygame event.
         """
-        pass
+        self.event_bus.post(
+            Event(
+                "mouse_motion",
+                {"pos": event.pos, "rel": event.rel, "buttons": event.buttons},
+            )
+        )
 
     def update(self, delta_time: float):
         """
@@ -124,7 +255,8 @@ class EditorWindow:
             delta_time (float): Time elapsed since the last frame.
         """
         for panel in self.panels:
-            panel.update(delta_time)
+            with profiler.scope(type(panel).__name__ + ".update"):
+                panel.update(delta_time)
 
     def render(self):
         """
@@ -135,7 +267,11 @@ class EditorWindow:
 
         # Render all panels
         for panel in self.panels:
-            panel.render(self.window)
+            with profiler.scope(type(panel).__name__ + ".render"):
+                panel.render(self.window)
+
+        self.performance_overlay.render(self.window)
 
         # Flip the display
-        pygame.display.flip()
+        with profiler.scope("flip"):
+            pygame.display.flip()
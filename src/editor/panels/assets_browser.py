@@ -4,24 +4,56 @@ Assets Browser Panel
 This module provides the AssetsBrowser class, which is responsible for displaying
 and managing assets in the editor's UI. It allows users to browse, select, and
 manage assets such as sprites, tiles, and other resources.
+
+Asset roots are scanned on a background thread and streamed into a sorted,
+searchable index. Only the rows inside the scroll viewport are drawn, and
+missing thumbnails of the visible assets are requested a few per frame and
+rendered on worker threads; finished ones are installed on the main thread.
 """
 
+import pygame
+
+from ...assets.asset_scanner import AssetIndex, AssetScanner
+from ...ui.layout import GridLayout
+
 
 class AssetsBrowserPanel:
     """
     A panel for browsing and managing assets in the editor.
 
     Attributes:
-        assets (list): A list of available assets.
+        assets (list): The assets shown, in sorted order, matching the filter.
+        index (AssetIndex): Every known asset.
+        filter_text (str): Only assets whose file name contains this text are shown.
         selected_asset (str): The currently selected asset.
+        thumbnail_cache (ThumbnailCache): The cache thumbnails are drawn from, if any.
+        scroll_offset (int): The vertical scroll position of the grid in pixels.
     """
 
-    def __init__(self):
+    def __init__(self, thumbnail_cache=None):
         """
         Initializes the AssetsBrowserPanel with default values.
+
+        Args:
+            thumbnail_cache (ThumbnailCache, optional): The cache thumbnails are
+                drawn from. If None, assets are drawn as placeholders.
         """
         self.assets = []
+        self.index = AssetIndex()
+        self.scanner = None
+        self.filter_text = ""
         self.selected_asset = None
+        self.thumbnail_cache = thumbnail_cache
+        self.thumbnails_per_frame = 4
+        self.max_pending_thumbnails = 16
+        self._failed_thumbnails = set()
+        self.cell_size = 64
+        self.padding = 4
+        self.panel_x = 0
+        self.panel_y = 0
+        self.panel_width = 300
+        self.panel_height = 400
+        self.scroll_offset = 0
 
     def load_assets(self, asset_paths):
         """
@@ -30,9 +62,41 @@ class AssetsBrowserPanel:
         Args:
             asset_paths (list): A list of paths to asset files.
         """
-        self.assets = asset_paths
+        self.index = AssetIndex(asset_paths)
+        self._refresh()
         print(f"Loaded {len(asset_paths)} assets.")
 
+    def scan(self, roots):
+        """
+        Starts scanning asset directories in the background.
+
+        Assets appear in the browser as they are found; call update() every frame.
+
+        Args:
+            roots (list): The directories to scan.
+        """
+        if self.scanner is not None:
+            self.scanner.stop()
+        self.index = AssetIndex()
+        self._refresh()
+        self.scanner = AssetScanner(roots)
+        self.scanner.start()
+
+    def set_filter(self, text):
+        """
+        Shows only the assets whose file name contains the given text.
+
+        Args:
+            text (str): The text to search for, ignoring case.
+        """
+        self.filter_text = text
+        self.scroll_offset = 0
+        self._refresh()
+
+    def _refresh(self):
+        """Recomputes the shown assets from the index and the filter."""
+        self.assets = self.index.search(self.filter_text)
+
     def select_asset(self, asset_name):
         """
         Selects an asset for use in the editor.
@@ -40,7 +104,7 @@ class AssetsBrowserPanel:
         Args:
             asset_name (str): The name of the asset to select.
         """
-        if asset_name in self.assets:
+        if asset_name in self.index:
             self.selected_asset = asset_name
             print(f"Selected asset: {asset_name}")
         else:
@@ -54,14 +118,75 @@ class AssetsBrowserPanel:
         print(f"Available Assets: {self.assets}")
         print(f"Selected Asset: {self.selected_asset}")
 
+    def get_rect(self):
+        """Return the panel's screen rectangle, used to route pointer events."""
+        return pygame.Rect(
+            self.panel_x, self.panel_y, self.panel_width, self.panel_height
+        )
+
+    def _cell_layout(self):
+        """Return the grid the assets are laid out in at the scroll position."""
+        pitch = self.cell_size + self.padding
+        return GridLayout(
+            self.panel_x,
+            self.panel_y - self.scroll_offset,
+            self.cell_size,
+            self.cell_size,
+            self.panel_width // pitch,
+            len(self.assets),
+            spacing_x=self.padding,
+            spacing_y=self.padding,
+        )
+
+    def visible_range(self):
+        """
+        Returns the range of asset indices visible at the current scroll position.
+
+        Returns:
+            range: The indices of the visible assets.
+        """
+        pitch = self.cell_size + self.padding
+        columns = max(1, self.panel_width // pitch)
+        first_row = max(0, self.scroll_offset // pitch)
+        last_row = (self.scroll_offset + self.panel_height) // pitch
+        start = first_row * columns
+        end = min(len(self.assets), (last_row + 1) * columns)
+        return range(start, max(start, end))
+
     def render(self, screen):
         """
-        Renders the assets browser panel.
+        Renders the visible asset thumbnails.
+
+        Thumbnails are blitted as areas of the thumbnail cache's sheet pages,
+        so a screenful of thumbnails usually comes from a single page and is
+        drawn with one blits call.
 
         Args:
             screen (pygame.Surface): The screen surface to render to.
         """
-        pass
+        pitch = self.cell_size + self.padding
+        columns = max(1, self.panel_width // pitch)
+        clip = screen.get_clip()
+        screen.set_clip(
+            pygame.Rect(self.panel_x, self.panel_y, self.panel_width, self.panel_height)
+        )
+        blits = []
+        for index in self.visible_range():
+            x = self.panel_x + (index % columns) * pitch
+            y = self.panel_y + (index // columns) * pitch - self.scroll_offset
+            region = None
+            if self.thumbnail_cache is not None:
+                region = self.thumbnail_cache.get_thumbnail_region(self.assets[index])
+            if region is None:
+                pygame.draw.rect(
+                    screen, (80, 80, 80), (x, y, self.cell_size, self.cell_size)
+                )
+            else:
+                page, area = region
+                blits.append((page, (x, y), area))
+        if blits:
+            screen.blits(blits, doreturn=False)
+        screen.set_clip(clip)
 
     def handle_event(self, event):
         """
@@ -70,13 +195,74 @@ class AssetsBrowserPanel:
         Args:
             event (pygame.event.Event): The pygame event.
         """
-        pass
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.get_rect().collidepoint(event.pos):
+                index = self._cell_layout().index_at(*event.pos)
+                if index is not None:
+                    self.select_asset(self.assets[index])
+        elif event.type == pygame.MOUSEWHEEL:
+            pitch = self.cell_size + self.padding
+            columns = max(1, self.panel_width // pitch)
+            rows = (len(self.assets) + columns - 1) // columns
+            max_offset = max(0, rows * pitch - self.panel_height)
+            self.scroll_offset = min(
+                max_offset, max(0, self.scroll_offset - event.y * pitch)
+            )
 
     def update(self, delta_time):
         """
         Updates the assets browser panel.
 
+        Merges newly scanned assets into the index, requests a few missing
+        thumbnails of the visible assets and installs finished ones.
+
         Args:
             delta_time (float): Time elapsed since the last frame.
         """
-        pass
+        if self.scanner is not None:
+            found = self.scanner.drain()
+            if found and self.index.add_many(found):
+                self._refresh()
+            if self.scanner.finished:
+                self.scanner = None
+
+        if self.thumbnail_cache is None:
+            return
+        cache = self.thumbnail_cache
+        budget = min(
+            self.thumbnails_per_frame, self.max_pending_thumbnails - cache.pending
+        )
+        for index in self.visible_range():
+            if budget <= 0:
+                break
+            asset = self.assets[index]
+            if (
+                asset in self._failed_thumbnails
+                or cache.is_requested(asset)
+                or cache.is_cached(asset)
+            ):
+                continue
+            budget -= 1
+            try:
+                cache.request_thumbnail(asset)
+            except OSError as e:
+                print(f"Error generating thumbnail for {asset}: {e}")
+                self._failed_thumbnails.add(asset)
+        for asset, error in cache.process_completed():
+            if error is not None:
+                print(f"Error generating thumbnail for {asset}: {error}")
+                self._failed_thumbnails.add(asset)
+        cache.flush_if_due()
+
+    def close(self):
+        """
+        Stops scanning and writes the generated thumbnails to disk.
+
+        Call this before the editor exits.
+        """
+        if self.scanner is not None:
+            self.scanner.stop()
+            self.scanner = None
+        if self.thumbnail_cache is not None:
+            self.thumbnail_cache.shutdown()
+            self.thumbnail_cache.flush()
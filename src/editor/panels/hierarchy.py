@@ -2,34 +2,297 @@
 """
 Hierarchy Panel Module
 This module defines the hierarchy panel for the 2D game editor.
+
+The panel shows the scene's layers and entities as collapsible groups. It is
+backed by a flattened tree model (see ``editor/tree_model.py``) that scene
+listeners update one item at a time, so adding or removing an entity never
+rebuilds the row list. Only the rows inside the viewport are drawn, and the
+name filter is a prefix search over sorted names, so scrolling and filtering
+stay fast with 100,000 entities.
 """
 
+from collections import OrderedDict
+
+import pygame
+
+from ...core.events import Event
+from ...ui.theme import Theme
+from ...utils.color import hex_to_rgb
+from ..tree_model import TreeGroup, TreeModel
+
 
 class HierarchyPanel:
     """
     A panel for displaying and managing the hierarchy of game objects.
+
+    Attributes:
+        scene (Scene): The scene shown, if any.
+        model (TreeModel): The rows of the layer and entity groups.
+        selected_item: The selected layer or entity.
+        filter_text (str): Only items whose name starts with this text are shown.
+        scroll_offset (int): The vertical scroll position in pixels.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, scene=None, event_bus=None):
+        """
+        Initialize the hierarchy panel.
+
+        Args:
+            scene (Scene, optional): The scene to show.
+            event_bus (EventBus, optional): The bus "entity_selected" events are
+                published on when an entity is clicked.
+        """
+        self.theme = Theme()
+        self.event_bus = event_bus
+        self.scene = None
+        self.selected_item = None
+        self.scroll_offset = 0
+        self.row_height = 20
+        self.indent = 16
+        self.padding = 8
+        self.header_height = 30
+        self.panel_x = 1030
+        self.panel_y = 10
+        self.panel_width = 240
+        self.panel_height = 350
+        self.max_cached_labels = 256
+        self._labels = OrderedDict()
+        self.layers = TreeGroup("Layers")
+        self.entities = TreeGroup("Entities")
+        self.model = TreeModel([self.layers, self.entities])
+        self.set_scene(scene)
+
+    @property
+    def filter_text(self):
+        return self.model.filter_text
+
+    def set_scene(self, scene):
+        """
+        Show a scene, replacing the one shown before.
+
+        Args:
+            scene (Scene): The scene, or None to show nothing.
+        """
+        if self.scene is not None:
+            self.scene.remove_listener(self._on_scene_changed)
+        self.scene = scene
+        self._rebuild()
+        if scene is not None:
+            scene.add_listener(self._on_scene_changed)
+
+    def _rebuild(self):
+        """Rebuild the groups from the scene's lists."""
+        self.layers = TreeGroup("Layers", self.layers.expanded)
+        self.entities = TreeGroup("Entities", self.entities.expanded)
+        self.model.groups = [self.layers, self.entities]
+        if self.scene is not None:
+            self.layers.extend([(layer, layer.name) for layer in self.scene.layers])
+            self.entities.extend(
+                [(entity, str(entity.name)) for entity in self.scene.entities]
+            )
+        self.selected_item = None
+        self.scroll_to(self.scroll_offset)
+
+    def _on_scene_changed(self, change, item):
+        """Apply one scene change to the tree model."""
+        if change == "layer_added":
+            self.layers.add(item, item.name)
+        elif change == "layer_removed":
+            self.layers.remove(item)
+        elif change == "entity_added":
+            self.entities.add(item, str(item.name))
+        elif change == "entity_removed":
+            self.entities.remove(item)
+        elif change == "entity_renamed":
+            self.entities.rename(item, str(item.name))
+        elif change == "cleared":
+            self._rebuild()
+            return
+        if change.endswith("_removed") and item is self.selected_item:
+            self.select(None)
+        self.scroll_to(self.scroll_offset)
+
+    def set_filter(self, text):
+        """
+        Show only the items whose name starts with the given text.
+
+        Args:
+            text (str): The prefix to search for, ignoring case.
+        """
+        self.model.filter_text = text
+        self.scroll_offset = 0
+
+    def toggle_group(self, group):
+        """
+        Collapse an expanded group, or expand a collapsed one.
+
+        Args:
+            group (TreeGroup): The group.
+        """
+        group.expanded = not group.expanded
+        self.scroll_to(self.scroll_offset)
+
+    def select(self, item):
+        """
+        Select a layer or entity, publishing "entity_selected" for entities.
+
+        Args:
+            item: The layer or entity, or None to clear the selection.
+        """
+        self.selected_item = item
+        if self.event_bus is not None and (item is None or item in self.entities.items):
+            self.event_bus.publish(Event("entity_selected", {"entity": item}))
+
+    def get_rect(self):
+        """Return the panel's screen rectangle, used to route pointer events."""
+        return pygame.Rect(
+            self.panel_x, self.panel_y, self.panel_width, self.panel_height
+        )
+
+    def _viewport(self):
+        """Return the screen rectangle the rows scroll in."""
+        return pygame.Rect(
+            self.panel_x + self.padding,
+            self.panel_y + self.padding + self.header_height,
+            self.panel_width - 2 * self.padding,
+            max(0, self.panel_height - 2 * self.padding - self.header_height),
+        )
+
+    def max_scroll(self):
+        """Return the largest scroll offset, in pixels."""
+        return max(0, len(self.model) * self.row_height - self._viewport().height)
+
+    def scroll_to(self, offset):
+        """
+        Scroll the rows.
+
+        Args:
+            offset (int): The scroll offset in pixels, clamped to the content.
+        """
+        self.scroll_offset = min(self.max_scroll(), max(0, int(offset)))
+
+    def scroll_to_item(self, group, item):
+        """
+        Scroll just far enough for an item's row to be in view.
+
+        Args:
+            group (TreeGroup): The item's group.
+            item: The item.
+        """
+        row = self.model.row_of(group, item)
+        if row is None:
+            return
+        top = row * self.row_height
+        bottom = top + self.row_height - self._viewport().height
+        self.scroll_to(min(max(self.scroll_offset, bottom), top))
+
+    def row_at(self, x, y):
+        """
+        Return the index of the row under a point.
+
+        Args:
+            x (int): The x-coordinate of the point.
+            y (int): The y-coordinate of the point.
+
+        Returns:
+            Optional[int]: The row, or None if the point is not on a row.
+        """
+        viewport = self._viewport()
+        if not viewport.collidepoint(x, y):
+            return None
+        row = (y - viewport.y + self.scroll_offset) // self.row_height
+        return row if row < len(self.model) else None
+
+    def _label(self, text, color):
+        """Return the rendered text of a row, from a small LRU cache."""
+        key = (text, color)
+        label = self._labels.get(key)
+        if label is not None:
+            self._labels.move_to_end(key)
+            return label
+        label = self.theme.get_font(20).render(text, True, color)
+        self._labels[key] = label
+        while len(self._labels) > self.max_cached_labels:
+            self._labels.popitem(last=False)
+        return label
+
+    def _row_text(self, group, item):
+        if item is None:
+            marker = "-" if group.expanded else "+"
+            return f"{marker} {group.name} ({len(group.items)})"
+        return str(item.name)
 
     def render(self, screen):
         """
         Renders the hierarchy panel.
 
+        Only the rows inside the viewport are looked up and drawn.
+
         Args:
             screen (pygame.Surface): The screen surface to render to.
         """
-        pass
+        rect = self.get_rect()
+        pygame.draw.rect(screen, hex_to_rgb(self.theme.get_color("panel_bg")), rect)
+        pygame.draw.rect(screen, hex_to_rgb(self.theme.get_color("border")), rect, 2)
+
+        text_color = hex_to_rgb(self.theme.get_color("text"))
+        filter_text = self.filter_text
+        title = f"Find: {filter_text}" if filter_text else "Hierarchy"
+        screen.blit(
+            self.theme.get_font(24).render(title, True, text_color),
+            (self.panel_x + self.padding, self.panel_y + self.padding),
+        )
+
+        viewport = self._viewport()
+        if viewport.height == 0:
+            return
+        clip = screen.get_clip()
+        screen.set_clip(viewport.clip(clip))
+        highlight_color = hex_to_rgb(self.theme.get_color("primary"))
+        first_row = self.scroll_offset // self.row_height
+        last_row = (self.scroll_offset + viewport.height - 1) // self.row_height
+        for row in range(first_row, min(last_row + 1, len(self.model))):
+            group, item = self.model.row_at(row)
+            row_y = viewport.y + row * self.row_height - self.scroll_offset
+            if item is not None and item is self.selected_item:
+                pygame.draw.rect(
+                    screen,
+                    highlight_color,
+                    (viewport.x, row_y, viewport.width, self.row_height),
+                )
+            x = viewport.x + (self.indent if item is not None else 0)
+            label = self._label(self._row_text(group, item), text_color)
+            screen.blit(label, (x, row_y + 2))
+        screen.set_clip(clip)
 
     def handle_event(self, event):
         """
         Handles events for the hierarchy panel.
 
+        Clicking a group header collapses or expands it, clicking an item
+        selects it, the wheel scrolls and typing edits the filter while the
+        panel has focus.
+
         Args:
             event (pygame.event.Event): The pygame event.
         """
-        pass
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left mouse button
+                # The clicked row is computed from the scroll offset, not searched for
+                row = self.row_at(*event.pos)
+                if row is not None:
+                    group, item = self.model.row_at(row)
+                    if item is None:
+                        self.toggle_group(group)
+                    else:
+                        self.select(item)
+        elif event.type == pygame.MOUSEWHEEL:
+            self.scroll_to(self.scroll_offset - event.y * 3 * self.row_height)
+        elif event.type == pygame.TEXTINPUT:
+            self.set_filter(self.filter_text + event.text)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_BACKSPACE:
+            if self.filter_text:
+                self.set_filter(self.filter_text[:-1])
 
     def update(self, delta_time):
         """
@@ -1,16 +1,369 @@
 # inspector.py
+"""
+Inspector Panel Module
+This module defines the inspector panel, which shows the properties of the
+selected entities.
+
+With several entities selected, the panel shows the property keys they all
+share, and a value only where every entity agrees. The aggregate is kept as a
+count of keys and values across the selection: it is updated per entity when
+the selection changes and per property when one is edited, so neither
+rendering nor editing scans every selected entity's properties. An edit is
+applied to all selected entities as one PropertyEdit and published as a single
+"entity_properties_changed" event.
+"""
+
+import copy
+from collections import Counter
+
+import pygame
+
+from ...core.events import Event
+from ...ui.theme import Theme
+from ...utils.color import hex_to_rgb
+
+# Shown in place of a value the selected entities disagree on
+MIXED = object()
+
+
+def _value_key(value):
+    """Return a hashable stand-in for a property value, to count it by."""
+    # Keyed by type too, so that 1, 1.0 and True do not count as equal
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    return (type(value), value)
+
+
+def _snapshot(entity):
+    """Return an entity's properties as {key: (value key, value)}."""
+    return {key: (_value_key(value), value) for key, value in entity.properties.items()}
+
+
+class PropertyEdit:
+    """
+    A property change applied to several entities at once.
+
+    Every entity gets its own deep copy of a value, so mutating one entity's
+    list or dict property leaves the others and the edit itself untouched.
+
+    Attributes:
+        entities (list): The edited entities.
+        key (str): The property key.
+        value: The new value.
+        old_values (list): Each entity's previous value, or MISSING if it did
+            not have the property.
+    """
+
+    MISSING = object()
+
+    def __init__(self, entities, key, value):
+        self.entities = list(entities)
+        self.key = key
+        self.value = value
+        self.old_values = [
+            entity.properties.get(key, self.MISSING) for entity in self.entities
+        ]
+
+    def apply(self):
+        """Set the property on every entity."""
+        for entity in self.entities:
+            entity.properties[self.key] = copy.deepcopy(self.value)
+
+    def revert(self):
+        """Restore every entity's previous value."""
+        for entity, old_value in zip(self.entities, self.old_values):
+            if old_value is self.MISSING:
+                entity.properties.pop(self.key, None)
+            else:
+                entity.properties[self.key] = copy.deepcopy(old_value)
+
+
 class InspectorPanel:
-    def __init__(self):
-        pass
+    """
+    A panel for inspecting and editing the properties of the selected entities.
+
+    Attributes:
+        entities (list): The selected entities.
+        event_bus (EventBus): The bus edits are published on, if any.
+        scroll_offset (int): The vertical scroll position in pixels.
+    """
+
+    def __init__(self, event_bus=None):
+        """
+        Initialize the inspector panel.
+
+        Args:
+            event_bus (EventBus, optional): The bus edits are published on. The
+                panel also follows "entity_selected" events on it.
+        """
+        self.theme = Theme()
+        self.event_bus = event_bus
+        self.entities = []
+        self.scroll_offset = 0
+        self.row_height = 20
+        self.padding = 8
+        self.header_height = 30
+        self.panel_x = 1030
+        self.panel_y = 370
+        self.panel_width = 240
+        self.panel_height = 340
+        # Number of selected entities having each key, and each value per key
+        self._key_counts = Counter()
+        self._value_counts = {}
+        # The (value key, value) pairs counted for each selected entity, keyed
+        # by id(entity); values are read from here, so they always match counts
+        self._snapshots = {}
+        self._rows = None
+        self._surface = None
+        if event_bus is not None:
+            event_bus.subscribe("entity_selected", self._on_entity_selected)
+            event_bus.subscribe(
+                "entity_properties_changed", self._on_properties_changed
+            )
+
+    def _on_entity_selected(self, event):
+        entity = event.data.get("entity")
+        self.set_selection([entity] if entity is not None else [])
+
+    def _on_properties_changed(self, event):
+        if event.data.get("source") is self:
+            return
+        for entity in event.data.get("entities", ()):
+            self.refresh_entity(entity)
+
+    def _count(self, entity, sign):
+        """Add (sign 1) or remove (sign -1) an entity's counted values."""
+        snapshot = self._snapshots.get(id(entity)) if sign < 0 else None
+        if snapshot is None:
+            snapshot = _snapshot(entity)
+        for key, (value_key, _) in snapshot.items():
+            self._count_value(key, value_key, sign)
+        if sign > 0:
+            self._snapshots[id(entity)] = snapshot
+        else:
+            self._snapshots.pop(id(entity), None)
+        self._rows = None
+
+    def _count_value(self, key, value, sign):
+        self._key_counts[key] += sign
+        values = self._value_counts.setdefault(key, Counter())
+        values[value] += sign
+        if values[value] <= 0:
+            del values[value]
+        if self._key_counts[key] <= 0:
+            del self._key_counts[key]
+            del self._value_counts[key]
+
+    def set_selection(self, entities):
+        """
+        Inspect a new selection, aggregating its properties once.
+
+        Args:
+            entities (list): The selected entities.
+        """
+        self.entities = []
+        self._snapshots = {}
+        for entity in entities:
+            if id(entity) not in self._snapshots:
+                self.entities.append(entity)
+                self._snapshots[id(entity)] = _snapshot(entity)
+        # Count the whole selection in bulk rather than value by value
+        self._key_counts = Counter()
+        pair_counts = Counter()
+        for snapshot in self._snapshots.values():
+            self._key_counts.update(snapshot.keys())
+            pair_counts.update(
+                (key, value_key) for key, (value_key, _) in snapshot.items()
+            )
+        self._value_counts = {key: Counter() for key in self._key_counts}
+        for (key, value), count in pair_counts.items():
+            self._value_counts[key][value] = count
+        self.scroll_offset = 0
+        self._rows = None
+
+    def add_to_selection(self, entity):
+        """
+        Add an entity to the selection, counting only its own properties.
+
+        Args:
+            entity: The entity.
+        """
+        if id(entity) in self._snapshots:
+            return
+        self.entities.append(entity)
+        self._count(entity, 1)
+
+    def remove_from_selection(self, entity):
+        """
+        Remove an entity from the selection, counting only its own properties.
+
+        Args:
+            entity: The entity.
+        """
+        if id(entity) not in self._snapshots:
+            return
+        self.entities.remove(entity)
+        self._count(entity, -1)
+
+    def refresh_entity(self, entity):
+        """
+        Recount a selected entity whose properties were changed elsewhere.
+
+        Args:
+            entity: The entity. Entities that are not selected are ignored.
+        """
+        snapshot = self._snapshots.get(id(entity))
+        if snapshot is None:
+            return
+        current = _snapshot(entity)
+        for key in snapshot.keys() | current.keys():
+            old = snapshot.get(key)
+            new = current.get(key)
+            if old is not None and new is not None and old[0] == new[0]:
+                continue
+            if old is not None:
+                self._count_value(key, old[0], -1)
+            if new is not None:
+                self._count_value(key, new[0], 1)
+        self._snapshots[id(entity)] = current
+        self._rows = None
+
+    def get_properties(self):
+        """
+        Return the aggregated properties of the selection.
+
+        Returns:
+            dict: The keys every selected entity has, mapped to their shared
+            value, or to MIXED where the entities disagree. Values are the
+            ones counted, so changes not yet refreshed are not shown.
+        """
+        count = len(self.entities)
+        properties = {}
+        if not count:
+            return properties
+        first = self._snapshots[id(self.entities[0])]
+        for key, key_count in self._key_counts.items():
+            if key_count != count:
+                continue
+            values = self._value_counts[key]
+            if len(values) > 1:
+                properties[key] = MIXED
+            else:
+                properties[key] = first[key][1]
+        return properties
+
+    def set_property(self, key, value):
+        """
+        Set a property on every selected entity as one batched edit.
+
+        Args:
+            key (str): The property key.
+            value: The new value.
+
+        Returns:
+            PropertyEdit: The edit, which can be reverted to undo it.
+        """
+        edit = PropertyEdit(self.entities, key, value)
+        if not self.entities:
+            return edit
+        edit.apply()
+        # Only this key's counts change, and every entity now agrees on it
+        value_key = _value_key(value)
+        self._key_counts[key] = len(self.entities)
+        self._value_counts[key] = Counter({value_key: len(self.entities)})
+        for entity in self.entities:
+            self._snapshots[id(entity)][key] = (value_key, entity.properties[key])
+        self._rows = None
+        if self.event_bus is not None:
+            self.event_bus.publish(
+                Event(
+                    "entity_properties_changed",
+                    {"entities": edit.entities, "edit": edit, "source": self},
+                )
+            )
+        return edit
+
+    def get_rect(self):
+        """Return the panel's screen rectangle, used to route pointer events."""
+        return pygame.Rect(
+            self.panel_x, self.panel_y, self.panel_width, self.panel_height
+        )
+
+    def _get_rows(self):
+        """Return the sorted (key, text, mixed) rows, rebuilt after a change."""
+        if self._rows is None:
+            self._rows = [
+                (str(key), "(mixed)" if value is MIXED else str(value), value is MIXED)
+                for key, value in sorted(
+                    self.get_properties().items(), key=lambda item: str(item[0])
+                )
+            ]
+            self._surface = None
+        return self._rows
+
+    def max_scroll(self):
+        """Return the largest scroll offset, in pixels."""
+        visible_height = self.panel_height - 2 * self.padding - self.header_height
+        return max(0, len(self._get_rows()) * self.row_height - visible_height)
+
+    def _render_rows(self):
+        """Pre-render the property rows onto one surface."""
+        rows = self._get_rows()
+        width = self.panel_width - 2 * self.padding
+        surface = pygame.Surface(
+            (width, max(1, len(rows) * self.row_height)), pygame.SRCALPHA
+        )
+        font = self.theme.get_font(20)
+        text_color = hex_to_rgb(self.theme.get_color("text"))
+        mixed_color = hex_to_rgb(self.theme.get_color("text_disabled"))
+        for row, (key, text, mixed) in enumerate(rows):
+            y = row * self.row_height + 2
+            surface.blit(font.render(key, True, text_color), (0, y))
+            color = mixed_color if mixed else text_color
+            surface.blit(font.render(text, True, color), (width // 2, y))
+        return surface
 
     def render(self, screen):
         """
         Renders the inspector panel.
 
+        The property rows are drawn from a surface rendered once per change.
+
         Args:
             screen (pygame.Surface): The screen surface to render to.
         """
-        pass
+        rect = self.get_rect()
+        pygame.draw.rect(screen, hex_to_rgb(self.theme.get_color("panel_bg")), rect)
+        pygame.draw.rect(screen, hex_to_rgb(self.theme.get_color("border")), rect, 2)
+
+        count = len(self.entities)
+        if count == 0:
+            title = "Inspector"
+        elif count == 1:
+            title = str(self.entities[0].name)
+        else:
+            title = f"{count} entities"
+        text_color = hex_to_rgb(self.theme.get_color("text"))
+        screen.blit(
+            self.theme.get_font(24).render(title, True, text_color),
+            (self.panel_x + self.padding, self.panel_y + self.padding),
+        )
+
+        self._get_rows()
+        if self._surface is None:
+            self._surface = self._render_rows()
+        viewport = pygame.Rect(
+            self.panel_x + self.padding,
+            self.panel_y + self.padding + self.header_height,
+            self.panel_width - 2 * self.padding,
+            max(0, self.panel_height - 2 * self.padding - self.header_height),
+        )
+        clip = screen.get_clip()
+        screen.set_clip(viewport.clip(clip))
+        screen.blit(self._surface, (viewport.x, viewport.y - self.scroll_offset))
+        screen.set_clip(clip)
 
     def handle_event(self, event):
         """
@@ -19,7 +372,9 @@ class InspectorPanel:
         Args:
             event (pygame.event.Event): The pygame event.
         """
-        pass
+        if event.type == pygame.MOUSEWHEEL:
+            offset = self.scroll_offset - event.y * 3 * self.row_height
+            self.scroll_offset = min(self.max_scroll(), max(0, offset))
 
     def update(self, delta_time):
         """
@@ -1,5 +1,9 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
 import pygame
 
+from ...ui.layout import GridLayout
 from ...ui.theme import Theme
 from ...utils.color import hex_to_rgb
 
@@ -8,31 +12,135 @@ Tile Palette Panel
 ==================
 
 A panel for managing and selecting tiles in the editor.
+
+The palette scrolls, filters tiles by name and zooms. Tiles are pre-rendered
+into cached page surfaces a few rows tall, so each frame blits at most two
+pages no matter how large the tileset is, and the clicked tile is computed
+from the grid instead of searched for.
 """
 
 
 class TilePalettePanel:
     def __init__(self):
         """Initialize the tile palette panel."""
-        self.tiles = []
         self.selected_tile = None
         self.theme = Theme()
         self.tile_size = 32
         self.padding = 10
         self.margin = 10
+        self.header_height = 30
         self.panel_width = 200
         self.panel_height = 300
         self.panel_x = 10
         self.panel_y = 10
+        self.zoom = 1.0
+        self.min_zoom = 0.25
+        self.max_zoom = 4.0
+        self.filter_text = ""
+        self.scroll_offset = 0
+        self.max_cached_pages = 4
+        # Tiles in insertion order; removed tiles leave None until compacted
+        self._slots: List[Any] = []
+        self._names: List[str] = []
+        self._slots_by_id: Dict[int, List[int]] = {}
+        self._removed = 0
+        # Slots of the tiles matching the filter, or None when out of date
+        self._visible: Optional[List[int]] = None
+        self._visible_positions: Dict[int, int] = {}
+        self._pages: "OrderedDict[int, pygame.Surface]" = OrderedDict()
+
+    @property
+    def tiles(self):
+        """The tiles in the palette, in insertion order. Treat as read-only."""
+        self._compact()
+        return self._slots
 
-    def add_tile(self, tile):
-        """Add a tile to the palette."""
-        self.tiles.append(tile)
+    def add_tile(self, tile, name=None):
+        """
+        Add a tile to the palette.
+
+        Args:
+            tile: The tile, usually a pygame.Surface.
+            name (str, optional): The name the filter matches. Defaults to the
+                tile's position in the palette.
+        """
+        slot = len(self._slots)
+        self._slots.append(tile)
+        self._names.append((name if name is not None else str(slot)).lower())
+        self._slots_by_id.setdefault(id(tile), []).append(slot)
+        self._invalidate()
 
     def remove_tile(self, tile):
         """Remove a tile from the palette."""
-        if tile in self.tiles:
-            self.tiles.remove(tile)
+        slots = self._slots_by_id.get(id(tile))
+        if not slots:
+            return
+        slot = slots.pop(0)
+        if not slots:
+            del self._slots_by_id[id(tile)]
+        self._slots[slot] = None
+        self._removed += 1
+        if tile is self.selected_tile:
+            self.selected_tile = None
+        self._invalidate()
+
+    def _compact(self):
+        """Drop the slots of removed tiles, once per batch of removals."""
+        if not self._removed:
+            return
+        kept = [slot for slot, tile in enumerate(self._slots) if tile is not None]
+        self._slots = [self._slots[slot] for slot in kept]
+        self._names = [self._names[slot] for slot in kept]
+        self._slots_by_id = {}
+        for slot, tile in enumerate(self._slots):
+            self._slots_by_id.setdefault(id(tile), []).append(slot)
+        self._removed = 0
+
+    def _invalidate(self):
+        """Forget the filtered tiles and the pre-rendered pages."""
+        self._visible = None
+        self._pages.clear()
+
+    def _visible_slots(self):
+        """Return the slots of the tiles matching the filter, in order."""
+        if self._visible is None:
+            self._compact()
+            text = self.filter_text.lower()
+            if text:
+                self._visible = [
+                    slot for slot, name in enumerate(self._names) if text in name
+                ]
+            else:
+                self._visible = list(range(len(self._slots)))
+            self._visible_positions = {
+                id(self._slots[slot]): position
+                for position, slot in reversed(list(enumerate(self._visible)))
+            }
+        return self._visible
+
+    def set_filter(self, text):
+        """
+        Show only the tiles whose name contains the given text.
+
+        Args:
+            text (str): The text to search for, ignoring case.
+        """
+        self.filter_text = text
+        self.scroll_offset = 0
+        self._invalidate()
+
+    def set_zoom(self, zoom):
+        """
+        Set the size tiles are shown at, relative to tile_size.
+
+        Args:
+            zoom (float): The zoom, clamped to min_zoom and max_zoom.
+        """
+        zoom = min(self.max_zoom, max(self.min_zoom, zoom))
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self._invalidate()
+            self.scroll_to(self.scroll_offset)
 
     def select_tile(self, tile):
         """Select a tile from the palette."""
@@ -42,10 +150,93 @@ class TilePalettePanel:
         """Clear the selected tile."""
         self.selected_tile = None
 
+    def get_rect(self):
+        """Return the panel's screen rectangle, used to route pointer events."""
+        return pygame.Rect(
+            self.panel_x, self.panel_y, self.panel_width, self.panel_height
+        )
+
+    def _viewport(self):
+        """Return the screen rectangle the tiles scroll in."""
+        return pygame.Rect(
+            self.panel_x + self.padding,
+            self.panel_y + self.padding + self.header_height,
+            self.panel_width - 2 * self.padding,
+            max(0, self.panel_height - 2 * self.padding - self.header_height),
+        )
+
+    def _cell_size(self):
+        return max(1, int(self.tile_size * self.zoom))
+
+    def _columns(self):
+        return max(1, (self.panel_width - 2 * self.padding) // self._cell_size())
+
+    def _rows_per_page(self):
+        # A page taller than the viewport means at most two pages are visible
+        return self._viewport().height // self._cell_size() + 1
+
+    def _tile_layout(self):
+        """Return the grid the filtered tiles are laid out in when scrolled."""
+        viewport = self._viewport()
+        cell = self._cell_size()
+        return GridLayout(
+            viewport.x,
+            viewport.y - self.scroll_offset,
+            cell,
+            cell,
+            self._columns(),
+            len(self._visible_slots()),
+        )
+
+    def max_scroll(self):
+        """Return the largest scroll offset, in pixels."""
+        rows = -(-len(self._visible_slots()) // self._columns())
+        return max(0, rows * self._cell_size() - self._viewport().height)
+
+    def scroll_to(self, offset):
+        """
+        Scroll the tiles.
+
+        Args:
+            offset (int): The scroll offset in pixels, clamped to the content.
+        """
+        self.scroll_offset = min(self.max_scroll(), max(0, int(offset)))
+
+    def _get_page(self, page):
+        """Return the surface of a page of tiles, rendering it if needed."""
+        surface = self._pages.get(page)
+        if surface is not None:
+            self._pages.move_to_end(page)
+            return surface
+
+        cell = self._cell_size()
+        columns = self._columns()
+        rows = self._rows_per_page()
+        visible = self._visible_slots()
+        surface = pygame.Surface((columns * cell, rows * cell), pygame.SRCALPHA)
+        first = page * rows * columns
+        for position in range(first, min(len(visible), first + rows * columns)):
+            tile = self._slots[visible[position]]
+            row, column = divmod(position - first, columns)
+            dest = (column * cell, row * cell)
+            if isinstance(tile, pygame.Surface):
+                if tile.get_size() != (cell, cell):
+                    tile = pygame.transform.scale(tile, (cell, cell))
+                surface.blit(tile, dest)
+            else:
+                surface.fill((200, 200, 200), (*dest, cell, cell))
+
+        self._pages[page] = surface
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+        return surface
+
     def render(self, screen):
         """
         Render the tile palette.
 
+        Only the one or two cached pages overlapping the viewport are blitted.
+
         Args:
             screen (pygame.Surface): The screen surface to render to.
         """
@@ -66,69 +257,64 @@ class TilePalettePanel:
             2,
         )
 
-        # Draw the panel label
-        font = pygame.font.SysFont(None, 24)
+        # Draw the panel label, or the filter while one is set
+        font = self.theme.get_font(24)
         text_color = hex_to_rgb(self.theme.get_color("text"))
-        label = font.render("Tile Palette", True, text_color)
+        title = f"Find: {self.filter_text}" if self.filter_text else "Tile Palette"
+        label = font.render(title, True, text_color)
         screen.blit(label, (self.panel_x + self.padding, self.panel_y + self.padding))
 
-        # Draw the tiles
-        tiles_per_row = (self.panel_width - 2 * self.padding) // self.tile_size
-        for i, tile in enumerate(self.tiles):
-            row = i // tiles_per_row
-            col = i % tiles_per_row
-            tile_x = self.panel_x + self.padding + col * self.tile_size
-            tile_y = self.panel_y + self.padding + 30 + row * self.tile_size
+        visible = self._visible_slots()
+        viewport = self._viewport()
+        if not visible or viewport.height == 0:
+            return
 
-            # Draw the tile
-            if isinstance(tile, pygame.Surface):
-                screen.blit(tile, (tile_x, tile_y))
-            else:
-                pygame.draw.rect(
-                    screen,
-                    (200, 200, 200),
-                    (tile_x, tile_y, self.tile_size, self.tile_size),
-                )
-
-            # Highlight the selected tile
-            if tile == self.selected_tile:
-                highlight_color = hex_to_rgb(self.theme.get_color("primary"))
-                pygame.draw.rect(
-                    screen,
-                    highlight_color,
-                    (tile_x, tile_y, self.tile_size, self.tile_size),
-                    2,
-                )
+        # Draw the pages overlapping the viewport
+        page_height = self._rows_per_page() * self._cell_size()
+        first_page = self.scroll_offset // page_height
+        last_page = (self.scroll_offset + viewport.height - 1) // page_height
+        clip = screen.get_clip()
+        screen.set_clip(viewport.clip(clip))
+        for page in range(first_page, last_page + 1):
+            page_y = viewport.y + page * page_height - self.scroll_offset
+            screen.blit(self._get_page(page), (viewport.x, page_y))
+
+        # Highlight the selected tile
+        position = self._visible_positions.get(id(self.selected_tile))
+        if self.selected_tile is not None and position is not None:
+            highlight_color = hex_to_rgb(self.theme.get_color("primary"))
+            pygame.draw.rect(
+                screen, highlight_color, self._tile_layout().cell_rect(position), 2
+            )
+        screen.set_clip(clip)
 
     def handle_event(self, event):
         """
         Handles events for the tile palette panel.
 
+        Clicks select the tile under the cursor, the wheel scrolls (or zooms
+        with Ctrl held) and typing edits the filter while the panel has focus.
+
         Args:
             event (pygame.event.Event): The pygame event.
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left mouse button
-                mouse_x, mouse_y = pygame.mouse.get_pos()
-                if (
-                    self.panel_x <= mouse_x <= self.panel_x + self.panel_width
-                    and self.panel_y <= mouse_y <= self.panel_y + self.panel_height
-                ):
-                    # Check if a tile was clicked
-                    tiles_per_row = (
-                        self.panel_width - 2 * self.padding
-                    ) // self.tile_size
-                    for i, tile in enumerate(self.tiles):
-                        row = i // tiles_per_row
-                        col = i % tiles_per_row
-                        tile_x = self.panel_x + self.padding + col * self.tile_size
-                        tile_y = self.panel_y + self.padding + 30 + row * self.tile_size
-                        if (
-                            tile_x <= mouse_x <= tile_x + self.tile_size
-                            and tile_y <= mouse_y <= tile_y + self.tile_size
-                        ):
-                            self.selected_tile = tile
-                            break
+                if self._viewport().collidepoint(event.pos):
+                    # The clicked tile is computed from the grid, not searched for
+                    index = self._tile_layout().index_at(*event.pos)
+                    if index is not None:
+                        self.selected_tile = self._slots[self._visible[index]]
+        elif event.type == pygame.MOUSEWHEEL:
+            if pygame.key.get_mods() & pygame.KMOD_CTRL:
+                self.set_zoom(self.zoom * 1.25**event.y)
+            else:
+                self.scroll_to(self.scroll_offset - event.y * self._cell_size())
+        elif event.type == pygame.TEXTINPUT:
+            self.set_filter(self.filter_text + event.text)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_BACKSPACE:
+            if self.filter_text:
+                self.set_filter(self.filter_text[:-1])
 
     def update(self, delta_time):
         """
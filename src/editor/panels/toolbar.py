@@ -1,5 +1,8 @@
+import importlib
+
 import pygame
 
+from ...ui.layout import GridLayout
 from ...ui.theme import Theme
 from ...utils.color import hex_to_rgb
 
@@ -8,6 +11,24 @@ Toolbar panel for the 2D game editor.
 This module provides the toolbar UI for the editor.
 """
 
+# Button states with the theme color of their background
+BUTTON_STATES = (
+    ("normal", "button_bg"),
+    ("hover", "button_hover"),
+    ("active", "primary"),
+)
+
+# The default tools as (name, module in src.tools, class name). Each module is
+# imported the first time its tool is activated, not at startup.
+DEFAULT_TOOLS = (
+    ("Brush", "brush_tool", "BrushTool"),
+    ("Eraser", "eraser_tool", "EraserTool"),
+    ("Select", "select_tool", "SelectTool"),
+    ("Move", "move_tool", "MoveTool"),
+    ("Fill", "fill_tool", "FillTool"),
+    ("Entity Placer", "entity_placer", "EntityPlacerTool"),
+)
+
 
 class ToolbarPanel:
     """
@@ -20,7 +41,7 @@ class ToolbarPanel:
         Initialize the toolbar panel.
         """
         self.tools = []
-        self.active_tool = None
+        self._active_index = None
         self.theme = Theme()
         self.button_width = 50
         self.button_height = 50
@@ -30,6 +51,11 @@ class ToolbarPanel:
         self.panel_height = 80
         self.panel_x = 10
         self.panel_y = 320
+        self.hovered_index = None
+        # Pre-rendered panel background and button states, one dict per tool
+        self._background = None
+        self._button_surfaces = []
+        self._theme_version = None
 
         # Initialize tools
         self._initialize_tools()
@@ -37,27 +63,33 @@ class ToolbarPanel:
     def _initialize_tools(self):
         """
         Initialize the default tools for the toolbar.
-        """
-        # Import tools dynamically to avoid circular imports
-        from ...tools.brush_tool import BrushTool
-        from ...tools.entity_placer import EntityPlacerTool
-        from ...tools.eraser_tool import EraserTool
-        from ...tools.fill_tool import FillTool
-        from ...tools.move_tool import MoveTool
-        from ...tools.select_tool import SelectTool
 
+        Only their names and factories are recorded; see _load_tool().
+        """
         self.tools = [
-            {"name": "Brush", "tool": BrushTool(), "icon": None},
-            {"name": "Eraser", "tool": EraserTool(), "icon": None},
-            {"name": "Select", "tool": SelectTool(), "icon": None},
-            {"name": "Move", "tool": MoveTool(), "icon": None},
-            {"name": "Fill", "tool": FillTool(), "icon": None},
-            {"name": "Entity Placer", "tool": EntityPlacerTool(), "icon": None},
+            {"name": name, "tool": None, "factory": (module, class_name), "icon": None}
+            for name, module, class_name in DEFAULT_TOOLS
         ]
 
         # Set the default active tool
         if self.tools:
-            self.active_tool = self.tools[0]["tool"]
+            self._active_index = 0
+
+    @property
+    def active_tool(self):
+        """The active tool instance, created the first time it is used."""
+        if self._active_index is None:
+            return None
+        return self._load_tool(self._active_index)
+
+    def _load_tool(self, index):
+        """Import and instantiate a tool, unless that was already done."""
+        tool = self.tools[index]
+        if tool["tool"] is None:
+            module_name, class_name = tool["factory"]
+            module = importlib.import_module(f"...tools.{module_name}", __package__)
+            tool["tool"] = getattr(module, class_name)()
+        return tool["tool"]
 
     def add_tool(self, tool_name, tool_instance):
         """
@@ -67,7 +99,9 @@ class ToolbarPanel:
             tool_name (str): The name of the tool.
             tool_instance: The tool instance to add to the toolbar.
         """
-        self.tools.append({"name": tool_name, "tool": tool_instance, "icon": None})
+        self.tools.append(
+            {"name": tool_name, "tool": tool_instance, "factory": None, "icon": None}
+        )
 
     def set_active_tool(self, tool_name):
         """
@@ -76,79 +110,95 @@ class ToolbarPanel:
         Args:
             tool_name (str): The name of the tool to set as active.
         """
-        for tool in self.tools:
+        for index, tool in enumerate(self.tools):
             if tool["name"] == tool_name:
-                self.active_tool = tool["tool"]
+                self._activate(index)
                 break
 
-    def render(self, screen):
-        """
-        Render the toolbar UI.
+    def _activate(self, index):
+        """Make the tool at an index active, creating it if needed."""
+        self._load_tool(index)
+        self._active_index = index
 
-        Args:
-            screen (pygame.Surface): The screen surface to render to.
-        """
-        # Draw the panel background
-        panel_bg_color = hex_to_rgb(self.theme.get_color("panel_bg"))
-        pygame.draw.rect(
-            screen,
-            panel_bg_color,
-            (self.panel_x, self.panel_y, self.panel_width, self.panel_height),
+    def get_rect(self):
+        """Return the panel's screen rectangle, used to route pointer events."""
+        return pygame.Rect(
+            self.panel_x, self.panel_y, self.panel_width, self.panel_height
         )
 
-        # Draw the panel border
-        border_color = hex_to_rgb(self.theme.get_color("border"))
-        pygame.draw.rect(
-            screen,
-            border_color,
-            (self.panel_x, self.panel_y, self.panel_width, self.panel_height),
-            2,
+    def _button_layout(self):
+        """Return the grid the tool buttons are laid out in, as a single row."""
+        return GridLayout(
+            self.panel_x + self.padding,
+            self.panel_y + 40,
+            self.button_width,
+            self.button_height,
+            len(self.tools),
+            len(self.tools),
+            spacing_x=self.padding,
         )
 
-        # Draw the panel label
-        font = pygame.font.SysFont(None, 24)
+    def _render_background(self):
+        """Pre-render the panel background, border and label."""
+        background = pygame.Surface((self.panel_width, self.panel_height))
+        background.fill(hex_to_rgb(self.theme.get_color("panel_bg")))
+        border_color = hex_to_rgb(self.theme.get_color("border"))
+        pygame.draw.rect(background, border_color, background.get_rect(), 2)
+        font = self.theme.get_font(24)
         text_color = hex_to_rgb(self.theme.get_color("text"))
         label = font.render("Toolbar", True, text_color)
-        screen.blit(label, (self.panel_x + self.padding, self.panel_y + self.padding))
+        background.blit(label, (self.padding, self.padding))
+        return background
+
+    def _render_button(self, name):
+        """Pre-render a tool button in each of its states."""
+        font = self.theme.get_font(12)
+        text_color = hex_to_rgb(self.theme.get_color("text"))
+        border_color = hex_to_rgb(self.theme.get_color("border"))
+        label = font.render(name, True, text_color)
+        states = {}
+        for state, color_key in BUTTON_STATES:
+            button = pygame.Surface((self.button_width, self.button_height))
+            button.fill(hex_to_rgb(self.theme.get_color(color_key)))
+            pygame.draw.rect(button, border_color, button.get_rect(), 1)
+            button.blit(label, label.get_rect(center=button.get_rect().center))
+            states[state] = button
+        return states
+
+    def _update_cache(self):
+        """Rebuild the cached surfaces after theme changes and for new tools."""
+        if self._theme_version != self.theme.version:
+            self._theme_version = self.theme.version
+            self._background = None
+            self._button_surfaces = []
+        if self._background is None:
+            self._background = self._render_background()
+        del self._button_surfaces[len(self.tools) :]
+        for tool in self.tools[len(self._button_surfaces) :]:
+            self._button_surfaces.append(self._render_button(tool["name"]))
+
+    def render(self, screen):
+        """
+        Render the toolbar UI.
+
+        The background and every button state are pre-rendered, so drawing
+        the toolbar is a single blits call.
 
-        # Draw the tool buttons
+        Args:
+            screen (pygame.Surface): The screen surface to render to.
+        """
+        self._update_cache()
+        layout = self._button_layout()
+        blits = [(self._background, (self.panel_x, self.panel_y))]
         for i, tool in enumerate(self.tools):
-            button_x = (
-                self.panel_x + self.padding + i * (self.button_width + self.padding)
-            )
-            button_y = self.panel_y + 40
-
-            # Draw the button background
-            button_bg_color = hex_to_rgb(self.theme.get_color("button_bg"))
-            if tool["tool"] == self.active_tool:
-                button_bg_color = hex_to_rgb(self.theme.get_color("primary"))
-
-            pygame.draw.rect(
-                screen,
-                button_bg_color,
-                (button_x, button_y, self.button_width, self.button_height),
-            )
-
-            # Draw the button border
-            button_border_color = hex_to_rgb(self.theme.get_color("border"))
-            pygame.draw.rect(
-                screen,
-                button_border_color,
-                (button_x, button_y, self.button_width, self.button_height),
-                1,
-            )
-
-            # Draw the tool name (or icon if available)
-            tool_font = pygame.font.SysFont(None, 12)
-            tool_text_color = hex_to_rgb(self.theme.get_color("text"))
-            tool_label = tool_font.render(tool["name"], True, tool_text_color)
-            text_rect = tool_label.get_rect(
-                center=(
-                    button_x + self.button_width // 2,
-                    button_y + self.button_height // 2,
-                )
-            )
-            screen.blit(tool_label, text_rect)
+            if i == self._active_index:
+                state = "active"
+            elif i == self.hovered_index:
+                state = "hover"
+            else:
+                state = "normal"
+            blits.append((self._button_surfaces[i][state], layout.cell_rect(i)))
+        screen.blits(blits, doreturn=False)
 
     def handle_event(self, event):
         """
@@ -159,25 +209,19 @@ class ToolbarPanel:
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left mouse button
-                mouse_x, mouse_y = pygame.mouse.get_pos()
-                if (
-                    self.panel_x <= mouse_x <= self.panel_x + self.panel_width
-                    and self.panel_y <= mouse_y <= self.panel_y + self.panel_height
-                ):
-                    # Check if a tool button was clicked
-                    for i, tool in enumerate(self.tools):
-                        button_x = (
-                            self.panel_x
-                            + self.padding
-                            + i * (self.button_width + self.padding)
-                        )
-                        button_y = self.panel_y + 40
-                        if (
-                            button_x <= mouse_x <= button_x + self.button_width
-                            and button_y <= mouse_y <= button_y + self.button_height
-                        ):
-                            self.active_tool = tool["tool"]
-                            break
+                if self.get_rect().collidepoint(event.pos):
+                    index = self._button_layout().index_at(*event.pos)
+                    if index is not None:
+                        self._activate(index)
+        elif event.type == pygame.MOUSEMOTION:
+            if self.get_rect().collidepoint(event.pos):
+                self.hovered_index = self._button_layout().index_at(*event.pos)
+            else:
+                self.hovered_index = None
+
+    def on_pointer_leave(self):
+        """Clear the hovered button when the pointer leaves the panel."""
+        self.hovered_index = None
 
     def update(self, delta_time):
         """
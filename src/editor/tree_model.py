@@ -0,0 +1,326 @@
+# tree_model.py
+"""
+Flattened tree model for the hierarchy panel.
+
+The scene hierarchy is shown as collapsible groups (layers, entities) of
+items. Rows are never materialized: the item on a given row is found by
+counting, using a Fenwick tree over each group's items, so looking up a row
+takes O(log n) time. Each group also keeps its items' names sorted, so a
+prefix filter is a binary search whose matches form a contiguous range.
+Adding, removing or renaming an item updates the Fenwick tree in O(log n) time,
+but inserting into or deleting from the sorted names shifts the entries after
+it, which is linear (a memmove, fast in practice).
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class IndexedList:
+    """
+    An ordered list with O(log n) append, remove, position and index lookup.
+
+    Removed items leave a hole that a Fenwick tree of live counts skips;
+    holes are compacted once they make up most of the list. Items are
+    identified by identity, and each item can be in the list only once.
+    """
+
+    def __init__(self, items=()):
+        self._items: List[Any] = []
+        self._tree: List[int] = [0]
+        self._slots: Dict[int, int] = {}
+        self._holes = 0
+        self.extend(items)
+
+    def __len__(self):
+        return len(self._items) - self._holes
+
+    def __contains__(self, item):
+        return id(item) in self._slots
+
+    def __iter__(self) -> Iterator[Any]:
+        return (item for item in self._items if item is not None)
+
+    def _prefix(self, slot: int) -> int:
+        """Return the number of live items in slots [0, slot)."""
+        total = 0
+        while slot > 0:
+            total += self._tree[slot]
+            slot -= slot & -slot
+        return total
+
+    def append(self, item: Any) -> None:
+        """
+        Add an item at the end.
+
+        Args:
+            item (Any): The item.
+
+        Raises:
+            ValueError: If the item is already in the list.
+        """
+        if id(item) in self._slots:
+            raise ValueError("Item is already in the list")
+        self._items.append(item)
+        node = len(self._items)
+        # A new Fenwick node covers the live items in (node - lowbit, node]
+        low = node - (node & -node)
+        self._tree.append(1 + self._prefix(node - 1) - self._prefix(low))
+        self._slots[id(item)] = node - 1
+
+    def extend(self, items) -> None:
+        """
+        Add items at the end, rebuilding the Fenwick tree once in linear time.
+
+        Args:
+            items: The items.
+
+        Raises:
+            ValueError: If an item is already in the list.
+        """
+        for item in items:
+            if id(item) in self._slots:
+                raise ValueError("Item is already in the list")
+            self._slots[id(item)] = len(self._items)
+            self._items.append(item)
+        self._build_tree()
+
+    def _build_tree(self) -> None:
+        """Recompute every Fenwick node from the live items."""
+        tree = [0] + [int(item is not None) for item in self._items]
+        size = len(tree)
+        for node in range(1, size):
+            parent = node + (node & -node)
+            if parent < size:
+                tree[parent] += tree[node]
+        self._tree = tree
+
+    def remove(self, item: Any) -> None:
+        """
+        Remove an item.
+
+        Args:
+            item (Any): The item.
+
+        Raises:
+            ValueError: If the item is not in the list.
+        """
+        slot = self._slots.pop(id(item), None)
+        if slot is None:
+            raise ValueError("Item not found in the list")
+        self._items[slot] = None
+        self._holes += 1
+        node = slot + 1
+        while node < len(self._tree):
+            self._tree[node] -= 1
+            node += node & -node
+        if self._holes > 1024 and self._holes * 2 > len(self._items):
+            self._compact()
+
+    def _compact(self) -> None:
+        self._items = [item for item in self._items if item is not None]
+        self._slots = {id(item): slot for slot, item in enumerate(self._items)}
+        self._holes = 0
+        self._build_tree()
+
+    def index(self, item: Any) -> int:
+        """
+        Return the position of an item.
+
+        Args:
+            item (Any): The item.
+
+        Returns:
+            int: The item's position.
+
+        Raises:
+            ValueError: If the item is not in the list.
+        """
+        slot = self._slots.get(id(item))
+        if slot is None:
+            raise ValueError("Item not found in the list")
+        return self._prefix(slot)
+
+    def __getitem__(self, position: int) -> Any:
+        """Return the item at a position, found by descending the Fenwick tree."""
+        if not 0 <= position < len(self):
+            raise IndexError("IndexedList index out of range")
+        node = 0
+        remaining = position + 1
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            next_node = node + step
+            if next_node < len(self._tree) and self._tree[next_node] < remaining:
+                node = next_node
+                remaining -= self._tree[node]
+            step >>= 1
+        return self._items[node]
+
+
+class TreeGroup:
+    """
+    A collapsible group of items in the hierarchy.
+
+    Attributes:
+        name (str): The group name shown on its header row.
+        expanded (bool): Whether the group's items are shown.
+        items (IndexedList): The items, in scene order.
+    """
+
+    def __init__(self, name: str, expanded: bool = True):
+        self.name = name
+        self.expanded = expanded
+        self.items = IndexedList()
+        # (lowercase name, serial) pairs in sorted order, for prefix filtering
+        self._sorted_names: List[Tuple[str, int]] = []
+        self._by_serial: Dict[int, Any] = {}
+        self._keys: Dict[int, Tuple[str, int]] = {}
+        self._serial = 0
+
+    def add(self, item: Any, name: str) -> None:
+        """Add an item at the end of the group, ignoring items already in it."""
+        if item in self.items:
+            return
+        self.items.append(item)
+        key = (name.lower(), self._serial)
+        self._serial += 1
+        insort(self._sorted_names, key)
+        self._by_serial[key[1]] = item
+        self._keys[id(item)] = key
+
+    def extend(self, items: List[Tuple[Any, str]]) -> None:
+        """
+        Add items at the end of the group, sorting their names once.
+
+        Items already in the group, or repeated in items, are ignored.
+
+        Args:
+            items (List[Tuple[Any, str]]): (item, name) pairs, in order.
+        """
+        unique = {}
+        for item, name in items:
+            if item not in self.items and id(item) not in unique:
+                unique[id(item)] = (item, name)
+        items = list(unique.values())
+        self.items.extend([item for item, _ in items])
+        keys = []
+        for item, name in items:
+            key = (name.lower(), self._serial)
+            self._serial += 1
+            self._by_serial[key[1]] = item
+            self._keys[id(item)] = key
+            keys.append(key)
+        self._sorted_names.extend(keys)
+        self._sorted_names.sort()
+
+    def remove(self, item: Any) -> None:
+        """Remove an item from the group."""
+        self.items.remove(item)
+        key = self._keys.pop(id(item))
+        del self._sorted_names[bisect_left(self._sorted_names, key)]
+        del self._by_serial[key[1]]
+
+    def rename(self, item: Any, name: str) -> None:
+        """Update the name an item is filtered by."""
+        key = self._keys[id(item)]
+        del self._sorted_names[bisect_left(self._sorted_names, key)]
+        new_key = (name.lower(), key[1])
+        insort(self._sorted_names, new_key)
+        self._keys[id(item)] = new_key
+
+    def match_range(self, prefix: str) -> Tuple[int, int]:
+        """Return the range of sorted-name positions starting with a prefix."""
+        prefix = prefix.lower()
+        start = bisect_left(self._sorted_names, (prefix, -1))
+        # Every name starting with the prefix sorts below prefix + U+10FFFF
+        end = bisect_right(self._sorted_names, (prefix + "\U0010ffff", -1))
+        return start, end
+
+    def match_at(self, position: int) -> Any:
+        """Return the item at a position of the sorted names."""
+        return self._by_serial[self._sorted_names[position][1]]
+
+
+class TreeModel:
+    """
+    The flattened rows of a list of groups, optionally filtered by name prefix.
+
+    Each group takes one header row, followed by one row per item while it is
+    expanded. While a filter is set, a group's rows are its items whose names
+    start with the filter, in name order.
+
+    Attributes:
+        groups (List[TreeGroup]): The groups, in display order.
+        filter_text (str): The name prefix items must start with.
+    """
+
+    def __init__(self, groups: List[TreeGroup]):
+        self.groups = groups
+        self.filter_text = ""
+
+    def _group_rows(self, group: TreeGroup) -> int:
+        """Return the number of item rows of a group."""
+        if not group.expanded:
+            return 0
+        if self.filter_text:
+            start, end = group.match_range(self.filter_text)
+            return end - start
+        return len(group.items)
+
+    def __len__(self):
+        """Return the number of rows."""
+        return sum(1 + self._group_rows(group) for group in self.groups)
+
+    def row_at(self, row: int) -> Optional[Tuple[TreeGroup, Optional[Any]]]:
+        """
+        Return what is shown on a row.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            Optional[Tuple[TreeGroup, Optional[Any]]]: The group and the item,
+            with None as the item for the group's header row, or None if the
+            row is past the end.
+        """
+        if row < 0:
+            return None
+        for group in self.groups:
+            if row == 0:
+                return group, None
+            row -= 1
+            count = self._group_rows(group)
+            if row < count:
+                if self.filter_text:
+                    start, _ = group.match_range(self.filter_text)
+                    return group, group.match_at(start + row)
+                return group, group.items[row]
+            row -= count
+        return None
+
+    def row_of(self, group: TreeGroup, item: Any) -> Optional[int]:
+        """
+        Return the row an item is shown on.
+
+        Args:
+            group (TreeGroup): The item's group.
+            item (Any): The item.
+
+        Returns:
+            Optional[int]: The row, or None if the item is hidden.
+        """
+        row = 0
+        for other in self.groups:
+            if other is group:
+                break
+            row += 1 + self._group_rows(other)
+        if not group.expanded or item not in group.items:
+            return None
+        if self.filter_text:
+            key = group._keys[id(item)]
+            start, end = group.match_range(self.filter_text)
+            position = bisect_left(group._sorted_names, key)
+            if not start <= position < end:
+                return None
+            return row + 1 + position - start
+        return row + 1 + group.items.index(item)
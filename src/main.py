@@ -1,10 +1,30 @@
-import pygame
+import argparse
 
-from src.core.app import App
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="2D Game Editor")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print module import times and the time to first frame",
+    )
+    parser.add_argument(
+        "--project",
+        help="the project directory to open (default: projects/, if it exists)",
+    )
+    args = parser.parse_args(argv)
 
-def main():
-    app = App()
+    profiler = None
+    if args.profile_startup:
+        from src.utils.startup_profiler import StartupProfiler
+
+        profiler = StartupProfiler()
+        profiler.start()
+
+    # Imported after the profiler starts so the editor's imports are timed
+    from src.core.app import App
+
+    app = App(profiler, args.project)
     app.run()
 
 
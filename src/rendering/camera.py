@@ -6,7 +6,29 @@ This module provides a 2D camera that handles view transformations, zooming, and
 The camera can be used to navigate and view different parts of a scene.
 """
 
-from typing import Optional, Tuple
+from array import array
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch transforms fall back to array("d")
+    np = None
+
+from ..core.events import Event, EventBus
+
+
+def _as_coordinate_array(values: Sequence[float]) -> Any:
+    """
+    Normalize a column of coordinates for a batch transform.
+
+    NumPy arrays are converted to float64 arrays (without copying when they
+    already are), anything else is copied into an ``array("d")`` buffer.
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        return np.asarray(values, dtype=np.float64)
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    return array("d", values)
 
 
 class Camera:
@@ -20,6 +42,8 @@ class Camera:
         min_zoom (float): The minimum zoom level of the camera.
         max_zoom (float): The maximum zoom level of the camera.
         bounds (Optional[Tuple[float, float, float, float]]): The bounds of the camera's movement.
+        event_bus (Optional[EventBus]): If set, a ``camera_changed`` event is
+            posted whenever the camera moves or zooms.
     """
 
     def __init__(
@@ -30,6 +54,7 @@ class Camera:
         min_zoom: float = 0.1,
         max_zoom: float = 5.0,
         bounds: Optional[Tuple[float, float, float, float]] = None,
+        event_bus: Optional[EventBus] = None,
     ):
         """
         Initialize the camera with a position, zoom level, and optional bounds.
@@ -41,6 +66,7 @@ class Camera:
             min_zoom (float): The minimum zoom level of the camera.
             max_zoom (float): The maximum zoom level of the camera.
             bounds (Optional[Tuple[float, float, float, float]]): The bounds of the camera's movement.
+            event_bus (Optional[EventBus]): The bus camera_changed events are posted on.
 
         Raises:
             ValueError: If min_zoom is greater than max_zoom.
@@ -53,6 +79,14 @@ class Camera:
         self.min_zoom = min_zoom
         self.max_zoom = max_zoom
         self.bounds = bounds
+        self.event_bus = event_bus
+
+    def _changed(self) -> None:
+        """Post a camera_changed event; only the last one per frame is dispatched."""
+        if self.event_bus is not None:
+            self.event_bus.post(
+                Event("camera_changed", {"x": self.x, "y": self.y, "zoom": self.zoom})
+            )
 
     def translate(self, dx: float, dy: float) -> None:
         """
@@ -77,6 +111,7 @@ class Camera:
                 )
         self.x = new_x
         self.y = new_y
+        self._changed()
 
     def set_position(self, x: float, y: float) -> None:
         """
@@ -99,6 +134,7 @@ class Camera:
                 )
         self.x = x
         self.y = y
+        self._changed()
 
     def set_zoom(self, zoom: float) -> None:
         """
@@ -115,6 +151,7 @@ class Camera:
                 f"Zoom level must be between {self.min_zoom} and {self.max_zoom}."
             )
         self.zoom = zoom
+        self._changed()
 
     def apply_transform(self, x: float, y: float) -> Tuple[float, float]:
         """
@@ -146,6 +183,104 @@ class Camera:
         world_y = (screen_y / self.zoom) + self.y
         return world_x, world_y
 
+    def apply_transform_batch(
+        self, xs: Sequence[float], ys: Sequence[float]
+    ) -> Tuple[Any, Any]:
+        """
+        Apply the camera's transformation to columns of coordinates in one call.
+
+        Args:
+            xs (Sequence[float]): The x-coordinates to transform, as a NumPy array,
+                an ``array("d")`` buffer or any sequence of numbers.
+            ys (Sequence[float]): The y-coordinates to transform.
+
+        Returns:
+            Tuple[Any, Any]: The transformed x and y columns. NumPy input yields
+            NumPy arrays, any other input yields ``array("d")`` buffers.
+
+        Raises:
+            ValueError: If xs and ys have different lengths.
+
+        Example:
+            >>> camera = Camera(x=10.0, zoom=2.0)
+            >>> camera.apply_transform_batch(array("d", [10, 20]), array("d", [0, 5]))
+            (array('d', [0.0, 20.0]), array('d', [0.0, 10.0]))
+        """
+        xs = _as_coordinate_array(xs)
+        ys = _as_coordinate_array(ys)
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length.")
+
+        offset_x, offset_y, zoom = self.x, self.y, self.zoom
+        if np is not None and isinstance(xs, np.ndarray):
+            return (xs - offset_x) * zoom, (np.asarray(ys) - offset_y) * zoom
+        return (
+            array("d", [(x - offset_x) * zoom for x in xs]),
+            array("d", [(y - offset_y) * zoom for y in ys]),
+        )
+
+    def screen_to_world_batch(
+        self, screen_xs: Sequence[float], screen_ys: Sequence[float]
+    ) -> Tuple[Any, Any]:
+        """
+        Convert columns of screen coordinates to world coordinates in one call.
+
+        Args:
+            screen_xs (Sequence[float]): The x-coordinates in screen space.
+            screen_ys (Sequence[float]): The y-coordinates in screen space.
+
+        Returns:
+            Tuple[Any, Any]: The world x and y columns, in the same container
+            type as the input (see apply_transform_batch).
+
+        Raises:
+            ValueError: If screen_xs and screen_ys have different lengths.
+        """
+        xs = _as_coordinate_array(screen_xs)
+        ys = _as_coordinate_array(screen_ys)
+        if len(xs) != len(ys):
+            raise ValueError("screen_xs and screen_ys must have the same length.")
+
+        offset_x, offset_y, zoom = self.x, self.y, self.zoom
+        if np is not None and isinstance(xs, np.ndarray):
+            return xs / zoom + offset_x, np.asarray(ys) / zoom + offset_y
+        return (
+            array("d", [x / zoom + offset_x for x in xs]),
+            array("d", [y / zoom + offset_y for y in ys]),
+        )
+
+    def hit_test_points(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        screen_x: float,
+        screen_y: float,
+        radius: float,
+    ) -> List[int]:
+        """
+        Find the world points that lie within a screen-space radius of a position.
+
+        Args:
+            xs (Sequence[float]): The world x-coordinates of the points.
+            ys (Sequence[float]): The world y-coordinates of the points.
+            screen_x (float): The x-coordinate of the probe in screen space.
+            screen_y (float): The y-coordinate of the probe in screen space.
+            radius (float): The hit radius in screen pixels.
+
+        Returns:
+            List[int]: The indices of the points that were hit, in input order.
+        """
+        screen_xs, screen_ys = self.apply_transform_batch(xs, ys)
+        radius_sq = radius * radius
+        if np is not None and isinstance(screen_xs, np.ndarray):
+            dist_sq = (screen_xs - screen_x) ** 2 + (screen_ys - screen_y) ** 2
+            return np.nonzero(dist_sq <= radius_sq)[0].tolist()
+        return [
+            index
+            for index, (x, y) in enumerate(zip(screen_xs, screen_ys))
+            if (x - screen_x) ** 2 + (y - screen_y) ** 2 <= radius_sq
+        ]
+
     def set_bounds(self, bounds: Optional[Tuple[float, float, float, float]]) -> None:
         """
         Set the bounds of the camera's movement.
@@ -0,0 +1,142 @@
+# layer_compositor.py
+"""
+Per-layer compositing cache for the 2D game editor.
+
+Each layer is rendered into its own off-screen surface, which is kept until
+the layer's content key or the surface size changes. The renderer keys layers on
+their content revision, the revisions of the tilemaps drawn on them, the zoom
+and the world-space region the surface covers. Every frame the cached
+surface is blitted once with the layer opacity applied through ``set_alpha``,
+so hiding a layer or dragging its opacity slider never re-renders its tiles.
+"""
+
+import weakref
+from typing import Callable, Hashable, Optional, Tuple
+
+import pygame
+
+from ..scene.layer import Layer
+
+
+class _LayerCache:
+    """The cached surface of a single layer."""
+
+    __slots__ = ("surface", "key")
+
+    def __init__(self):
+        self.surface: Optional[pygame.Surface] = None
+        self.key: Optional[Hashable] = None
+
+
+class LayerCompositor:
+    """
+    Caches one rendered surface per layer and composites it with opacity.
+
+    Attributes:
+        rebuilds (int): Number of layer surfaces re-rendered since creation.
+    """
+
+    def __init__(self):
+        """Initialize an empty compositor."""
+        self._caches = weakref.WeakKeyDictionary()
+        self.rebuilds = 0
+
+    def get_surface(
+        self,
+        layer: Layer,
+        size: Tuple[int, int],
+        content_key: Hashable,
+        draw: Callable[[pygame.Surface], None],
+    ) -> pygame.Surface:
+        """
+        Return the cached surface of a layer, re-rendering it if its content changed.
+
+        Args:
+            layer (Layer): The layer to get the surface for.
+            size (Tuple[int, int]): The size of the layer surface.
+            content_key (Hashable): A key that changes whenever the layer's
+                rendered content changes.
+            draw (Callable[[pygame.Surface], None]): Draws the layer content onto
+                a cleared, transparent surface.
+
+        Returns:
+            pygame.Surface: The layer surface.
+        """
+        cache = self._caches.get(layer)
+        if cache is None:
+            cache = _LayerCache()
+            self._caches[layer] = cache
+
+        key = (size, content_key)
+        if cache.surface is None or cache.surface.get_size() != size:
+            cache.surface = pygame.Surface(size, pygame.SRCALPHA)
+            cache.key = None
+        if cache.key != key:
+            cache.surface.fill((0, 0, 0, 0))
+            draw(cache.surface)
+            cache.key = key
+            self.rebuilds += 1
+        return cache.surface
+
+    def prepare(
+        self,
+        layer: Layer,
+        size: Tuple[int, int],
+        content_key: Hashable,
+        draw: Callable[[pygame.Surface], None],
+    ) -> Optional[pygame.Surface]:
+        """
+        Return the layer surface with the layer opacity applied, ready to blit.
+
+        Hidden and fully transparent layers return None without touching the cache.
+
+        Args:
+            layer (Layer): The layer to prepare.
+            size (Tuple[int, int]): The size of the layer surface.
+            content_key (Hashable): A key that changes whenever the layer's
+                rendered content changes.
+            draw (Callable[[pygame.Surface], None]): Draws the layer content.
+
+        Returns:
+            Optional[pygame.Surface]: The layer surface, or None if nothing
+            should be drawn.
+        """
+        if not layer.visible or layer.opacity <= 0.0:
+            return None
+        surface = self.get_surface(layer, size, content_key, draw)
+        surface.set_alpha(round(layer.opacity * 255))
+        return surface
+
+    def composite(
+        self,
+        target: pygame.Surface,
+        layer: Layer,
+        content_key: Hashable,
+        draw: Callable[[pygame.Surface], None],
+    ) -> None:
+        """
+        Blit a layer onto the target surface with its opacity applied.
+
+        Args:
+            target (pygame.Surface): The surface to composite onto.
+            layer (Layer): The layer to composite.
+            content_key (Hashable): A key that changes whenever the layer's
+                rendered content changes.
+            draw (Callable[[pygame.Surface], None]): Draws the layer content.
+        """
+        surface = self.prepare(layer, target.get_size(), content_key, draw)
+        if surface is not None:
+            target.blit(surface, (0, 0))
+
+    def invalidate(self, layer: Optional[Layer] = None) -> None:
+        """
+        Drop cached layer surfaces.
+
+        Args:
+            layer (Optional[Layer], optional): The layer to invalidate. If None,
+                every cached layer is dropped.
+        """
+        if layer is None:
+            self._caches.clear()
+        else:
+            self._caches.pop(layer, None)
@@ -4,14 +4,29 @@ This module provides utilities for drawing scenes, layers, and other visual elem
 
 This module includes functions for rendering scenes, layers, and grids, as well as
 clearing the screen and managing camera offsets.
+
+Sprites and tilemap chunks are not blitted directly; they are queued on a
+SpriteBatch and submitted in a few ``Surface.blits`` calls when the frame ends.
+Fully opaque layers queue their tilemap chunks directly. Translucent layers are
+rendered into a cached surface by the LayerCompositor and queued as a single
+blit with the layer opacity applied. That surface covers the viewport plus a
+margin and is anchored to a grid in world space, so panning only moves the blit
+until the view crosses into the next grid cell.
 """
 
-from typing import Tuple
+import math
+import weakref
+from typing import Iterable, List, Optional, Tuple
 
 import pygame
 
 from ..scene.layer import Layer
 from ..scene.scene import Scene
+from ..scene.tilemap import Tilemap
+from .camera import Camera
+from .layer_compositor import LayerCompositor
+from .sprite_batch import BatchStats, SpriteBatch
+from .tilemap_renderer import TilemapRenderer
 
 
 class Renderer:
@@ -21,6 +36,12 @@ class Renderer:
     Attributes:
         surface (pygame.Surface): The target surface to render to.
         camera_offset (Tuple[int, int]): The camera offset for scrolling.
+        camera (Camera): The camera used to draw tilemaps.
+        sprite_batch (SpriteBatch): The batch that collects draw commands.
+        compositor (LayerCompositor): The cache of rendered layer surfaces.
+        layer_margin (int): The extra size, in screen pixels, of cached layer
+            surfaces beyond the viewport. A layer is re-rendered when the view
+            pans by about this much.
     """
 
     def __init__(self, surface: pygame.Surface):
@@ -37,6 +58,14 @@ class Renderer:
             raise ValueError("Invalid surface provided for renderer.")
         self.surface = surface
         self.camera_offset = (0, 0)
+        self.camera = Camera()
+        self.sprite_batch = SpriteBatch()
+        self.compositor = LayerCompositor()
+        self.layer_margin = 256
+        self._layer_batch = SpriteBatch()
+        self._frame_open = False
+        # Maps each Tilemap to its TilemapRenderer (and chunk cache)
+        self._tilemap_renderers = weakref.WeakKeyDictionary()
 
     def set_camera_offset(self, offset: Tuple[int, int]) -> None:
         """
@@ -52,10 +81,75 @@ class Renderer:
             raise ValueError("Offset must be a tuple of two integers.")
         self.camera_offset = offset
 
+    def set_camera(self, camera: Camera) -> None:
+        """
+        Set the camera used to draw tilemaps.
+
+        Args:
+            camera (Camera): The camera to use.
+
+        Raises:
+            ValueError: If the camera is not a valid Camera object.
+        """
+        if not isinstance(camera, Camera):
+            raise ValueError("Invalid camera provided for renderer.")
+        self.camera = camera
+
+    @property
+    def frame_stats(self) -> BatchStats:
+        """The draw-call and blit statistics of the current or last frame."""
+        stats = BatchStats()
+        stats.add(self.sprite_batch.stats)
+        stats.add(self._layer_batch.stats)
+        return stats
+
+    def begin_frame(self) -> None:
+        """
+        Start collecting draw commands for a new frame.
+        """
+        self.sprite_batch.begin()
+        self._layer_batch.begin()
+        self._frame_open = True
+
+    def end_frame(self) -> BatchStats:
+        """
+        Submit all draw commands collected since begin_frame.
+
+        Returns:
+            BatchStats: The statistics of the submitted frame.
+        """
+        self.sprite_batch.flush(self.surface)
+        self._frame_open = False
+        return self.frame_stats
+
+    def draw_sprite(
+        self,
+        sprite: pygame.Surface,
+        dest: Tuple[float, float],
+        area: Optional[pygame.Rect] = None,
+        layer: int = 0,
+        z: float = 0,
+    ) -> None:
+        """
+        Queue a sprite to be drawn when the frame ends.
+
+        Args:
+            sprite (pygame.Surface): The sprite surface to draw.
+            dest (Tuple[float, float]): The screen position to draw it at.
+            area (Optional[pygame.Rect], optional): The area of the sprite to draw.
+            layer (int, optional): The layer index to draw on. Defaults to 0.
+            z (float, optional): The draw order within the layer. Defaults to 0.
+        """
+        if not self._frame_open:
+            self.begin_frame()
+        self.sprite_batch.draw(sprite, dest, area, layer, z)
+
     def render_scene(self, scene: Scene) -> None:
         """
         Render the entire scene, including all layers.
 
+        Tilemaps that are not assigned to any layer are drawn beneath all layers.
+
         Args:
             scene (Scene): The scene to render.
 
@@ -64,26 +158,120 @@ class Renderer:
         """
         if not isinstance(scene, Scene):
             raise ValueError("Invalid scene provided for rendering.")
-        for layer in scene.layers:
-            self.render_layer(layer)
+        owns_frame = not self._frame_open
+        if owns_frame:
+            self.begin_frame()
+
+        unlayered = [tilemap for tilemap in scene.tilemaps if not tilemap.layers]
+        self._submit_tilemaps(unlayered, -1)
+        for index, layer in enumerate(scene.layers):
+            tilemaps = [
+                tilemap for tilemap in scene.tilemaps if layer in tilemap.layers
+            ]
+            self.render_layer(layer, tilemaps, index)
 
-    def render_layer(self, layer: Layer) -> None:
+        if owns_frame:
+            self.end_frame()
+
+    def render_layer(
+        self, layer: Layer, tilemaps: Iterable[Tilemap] = (), layer_index: int = 0
+    ) -> None:
         """
         Render a single layer.
 
+        Fully opaque layers queue their tilemap chunks directly. Other layers
+        are rendered into a cached surface that is only re-rendered when the
+        layer revision, the revision of one of its tilemaps, the zoom or the
+        viewport size changes, or when the view pans out of the surface. The
+        cached surface is then drawn with one blit using the layer opacity.
+
         Args:
             layer (Layer): The layer to render.
+            tilemaps (Iterable[Tilemap], optional): The tilemaps drawn on this layer.
+            layer_index (int, optional): The draw order of the layer. Defaults to 0.
 
         Raises:
             ValueError: If the layer is not a valid Layer object.
         """
         if not isinstance(layer, Layer):
             raise ValueError("Invalid layer provided for rendering.")
-        if not layer.visible:
+        if not layer.visible or layer.opacity <= 0.0:
             return
 
-        # Apply camera offset
-        offset_x, offset_y = self.camera_offset
+        # Open the frame first, so the stats of a layer rebuild are kept
+        owns_frame = not self._frame_open
+        if owns_frame:
+            self.begin_frame()
+
+        tilemaps = list(tilemaps)
+        if layer.opacity >= 1.0:
+            self._submit_tilemaps(tilemaps, layer_index)
+        else:
+            self._composite_layer(layer, tilemaps, layer_index)
+
+        if owns_frame:
+            self.end_frame()
+
+    def _composite_layer(
+        self, layer: Layer, tilemaps: List[Tilemap], layer_index: int
+    ) -> None:
+        """Queue a translucent layer as one blit of its cached surface."""
+        camera = self.camera
+        width, height = self.surface.get_size()
+        margin = self.layer_margin
+        # The surface starts at a multiple of the margin in zoomed world space
+        # and is one margin larger than the viewport, so it covers the view
+        # until the camera crosses into the next multiple
+        pixel_x = camera.x * camera.zoom
+        pixel_y = camera.y * camera.zoom
+        anchor = (math.floor(pixel_x / margin), math.floor(pixel_y / margin))
+        size = (width + margin, height + margin)
+        content_key = (
+            layer.revision,
+            tuple((id(tilemap), tilemap.revision) for tilemap in tilemaps),
+            camera.zoom,
+            anchor,
+        )
+
+        def draw(layer_surface: pygame.Surface) -> None:
+            region_camera = Camera(
+                anchor[0] * margin / camera.zoom,
+                anchor[1] * margin / camera.zoom,
+                camera.zoom,
+                min_zoom=camera.zoom,
+                max_zoom=camera.zoom,
+            )
+            self._submit_tilemaps(tilemaps, 0, self._layer_batch, region_camera, size)
+            self._layer_batch.flush(layer_surface)
+
+        layer_surface = self.compositor.prepare(layer, size, content_key, draw)
+        dest = (
+            round(anchor[0] * margin - pixel_x),
+            round(anchor[1] * margin - pixel_y),
+        )
+        self.sprite_batch.draw(layer_surface, dest, layer=layer_index)
+
+    def _submit_tilemaps(
+        self,
+        tilemaps: Iterable[Tilemap],
+        layer_index: int,
+        batch: Optional[SpriteBatch] = None,
+        camera: Optional[Camera] = None,
+        viewport_size: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """Queue the visible chunks of the given tilemaps on a sprite batch."""
+        if batch is None:
+            batch = self.sprite_batch
+        if camera is None:
+            camera = self.camera
+        if viewport_size is None:
+            viewport_size = self.surface.get_size()
+        for tilemap in tilemaps:
+            tilemap_renderer = self._tilemap_renderers.get(tilemap)
+            if tilemap_renderer is None:
+                tilemap_renderer = TilemapRenderer(tilemap)
+                self._tilemap_renderers[tilemap] = tilemap_renderer
+            tilemap_renderer.submit(batch, camera, viewport_size, layer=layer_index)
 
     def draw_grid(
         self, tile_size: int, grid_color: Tuple[int, int, int] = (50, 50, 50)
@@ -0,0 +1,179 @@
+# sprite_batch.py
+"""
+Sprite batching for the 2D game editor.
+
+Draw commands are collected during a frame instead of being blitted one at a
+time. When the batch is flushed, the commands are sorted by layer, then by z
+order, then by source surface (texture), and submitted with a single
+``pygame.Surface.blits`` call per layer. Per-frame statistics are kept so the
+number of draw calls and blits can be inspected while profiling.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from ..utils.frame_profiler import profiler
+
+# (layer, z, texture key, surface, dest, area)
+DrawCommand = Tuple[
+    int, float, int, pygame.Surface, Tuple[float, float], Optional[pygame.Rect]
+]
+
+
+class BatchStats:
+    """
+    Statistics for the draw commands submitted during one frame.
+
+    Attributes:
+        draw_calls (int): Number of ``Surface.blits`` calls issued.
+        blits (int): Number of individual blits submitted.
+        texture_switches (int): Number of times the source surface changed
+            between consecutive blits.
+        layer_blits (Dict[int, int]): Number of blits submitted per layer.
+    """
+
+    def __init__(self):
+        """Initialize the statistics with zero counts."""
+        self.draw_calls = 0
+        self.blits = 0
+        self.texture_switches = 0
+        self.layer_blits: Dict[int, int] = {}
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.draw_calls = 0
+        self.blits = 0
+        self.texture_switches = 0
+        self.layer_blits.clear()
+
+    def add(self, other: "BatchStats") -> None:
+        """
+        Add the counters of another statistics object to this one.
+
+        Args:
+            other (BatchStats): The statistics to add.
+        """
+        self.draw_calls += other.draw_calls
+        self.blits += other.blits
+        self.texture_switches += other.texture_switches
+        for layer, count in other.layer_blits.items():
+            self.layer_blits[layer] = self.layer_blits.get(layer, 0) + count
+
+    def as_dict(self) -> Dict[str, int]:
+        """
+        Return the counters as a dictionary.
+
+        Returns:
+            Dict[str, int]: The draw call, blit and texture switch counts.
+        """
+        return {
+            "draw_calls": self.draw_calls,
+            "blits": self.blits,
+            "texture_switches": self.texture_switches,
+        }
+
+    def __repr__(self):
+        return (
+            f"BatchStats(draw_calls={self.draw_calls}, blits={self.blits}, "
+            f"texture_switches={self.texture_switches})"
+        )
+
+
+class SpriteBatch:
+    """
+    Collects sprite draw commands and submits them in a few large blit calls.
+
+    Commands that share a layer and z value are grouped by source surface,
+    so their relative order is not preserved; use distinct z values when
+    overlapping sprites must be drawn in a specific order.
+
+    Attributes:
+        stats (BatchStats): Statistics for the current frame.
+    """
+
+    def __init__(self):
+        """Initialize an empty sprite batch."""
+        self._commands: List[DrawCommand] = []
+        self.stats = BatchStats()
+
+    def __len__(self):
+        """Return the number of pending draw commands."""
+        return len(self._commands)
+
+    def begin(self) -> None:
+        """
+        Start a new frame, discarding pending commands and resetting statistics.
+        """
+        self._commands.clear()
+        self.stats.reset()
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        dest: Tuple[float, float],
+        area: Optional[pygame.Rect] = None,
+        layer: int = 0,
+        z: float = 0,
+    ) -> None:
+        """
+        Queue a draw command.
+
+        Args:
+            surface (pygame.Surface): The source surface (texture) to draw.
+            dest (Tuple[float, float]): The destination position on the target.
+            area (Optional[pygame.Rect], optional): The area of the source surface
+                to draw. Defaults to the whole surface.
+            layer (int, optional): The layer the sprite belongs to. Lower layers
+                are drawn first. Defaults to 0.
+            z (float, optional): The draw order within the layer. Defaults to 0.
+        """
+        self._commands.append((layer, z, id(surface), surface, dest, area))
+
+    def flush(self, target: pygame.Surface) -> None:
+        """
+        Sort the pending commands and blit them onto the target surface.
+
+        Args:
+            target (pygame.Surface): The surface to draw onto.
+        """
+        if not self._commands:
+            return
+
+        commands = self._commands
+        commands.sort(key=lambda command: command[:3])
+        self._commands = []
+
+        stats = self.stats
+        current_layer = commands[0][0]
+        last_texture = None
+        sequence = []
+        for layer, _, texture, surface, dest, area in commands:
+            if layer != current_layer:
+                self._submit(target, current_layer, sequence)
+                current_layer = layer
+                sequence = []
+            if texture != last_texture:
+                if last_texture is not None:
+                    stats.texture_switches += 1
+                last_texture = texture
+            sequence.append((surface, dest, area))
+        self._submit(target, current_layer, sequence)
+
+    def _submit(
+        self,
+        target: pygame.Surface,
+        layer: int,
+        sequence: List[
+            Tuple[pygame.Surface, Tuple[float, float], Optional[pygame.Rect]]
+        ],
+    ) -> None:
+        """Blit one layer's commands with a single Surface.blits call."""
+        target.blits(sequence, doreturn=False)
+        count = len(sequence)
+        stats = self.stats
+        stats.draw_calls += 1
+        stats.blits += count
+        stats.layer_blits[layer] = stats.layer_blits.get(layer, 0) + count
+        profiler.count("draw_calls")
+        profiler.count("blits", count)
@@ -0,0 +1,389 @@
+# tilemap_renderer.py
+"""
+Zoom-aware tilemap rendering for the 2D game editor.
+
+The tilemap is split into square chunks of ``Tilemap.chunk_size`` tiles. Each
+chunk is rendered once into an off-screen surface and downsampled into a chain
+of mip levels (1, 1/2, 1/4 and 1/8 of full resolution). When drawing, the
+renderer picks the smallest mip level that still has at least one texel per
+screen pixel, so a zoomed-out view blits a handful of small chunk surfaces
+instead of every individual tile.
+
+Below ``overview_threshold`` screen pixels per tile even the 1/8 level is
+wasted detail, so chunks are drawn from an overview surface that holds a
+single pixel per tile, coloured with the average colour of the tile image.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pygame
+
+from ..scene.tilemap import Tile, Tilemap
+from ..utils.frame_profiler import profiler
+from .camera import Camera
+from .sprite_batch import SpriteBatch
+
+# Scale factors of the precomputed mip levels, from full resolution down.
+MIP_SCALES = (1.0, 0.5, 0.25, 0.125)
+
+# Pseudo level used for the average-colour-per-tile overview.
+OVERVIEW_LEVEL = len(MIP_SCALES)
+
+
+class _ChunkCache:
+    """Cached surfaces for a single tilemap chunk."""
+
+    __slots__ = ("revision", "empty", "levels", "overview", "scaled", "scaled_key")
+
+    def __init__(self, revision: int):
+        self.revision = revision
+        self.empty = False
+        self.levels: List[Optional[pygame.Surface]] = [None] * len(MIP_SCALES)
+        self.overview: Optional[pygame.Surface] = None
+        self.scaled: Optional[pygame.Surface] = None
+        self.scaled_key: Optional[Tuple[int, int, int]] = None
+
+
+class TilemapRenderer:
+    """
+    Renders a tilemap through a chunk cache with zoom-dependent level of detail.
+
+    Attributes:
+        tilemap (Tilemap): The tilemap being rendered.
+        overview_threshold (float): On-screen tile size (in pixels) below which
+            the average-colour overview is used instead of a mip level.
+        max_cached_chunks (int): Number of chunks kept in the cache. The cache
+            grows beyond this to twice the number of visible chunks, so a frame
+            never evicts chunks it draws, and panning keeps the previous frame's.
+        chunks_drawn (int): Number of chunks drawn by the last render call.
+        chunks_built (int): Number of chunk levels (re)built by the last render call.
+        last_level (int): The level of detail used by the last render call.
+    """
+
+    def __init__(
+        self,
+        tilemap: Tilemap,
+        overview_threshold: float = 4.0,
+        max_cached_chunks: int = 512,
+    ):
+        """
+        Initialize the renderer for a tilemap.
+
+        Args:
+            tilemap (Tilemap): The tilemap to render.
+            overview_threshold (float, optional): On-screen tile size in pixels
+                below which the overview level is used. Defaults to 4.0.
+            max_cached_chunks (int, optional): Number of cached chunks when few
+                are visible. Defaults to 512.
+
+        Raises:
+            ValueError: If max_cached_chunks is not positive.
+        """
+        if max_cached_chunks <= 0:
+            raise ValueError("max_cached_chunks must be a positive integer.")
+        self.tilemap = tilemap
+        self.overview_threshold = overview_threshold
+        self.max_cached_chunks = max_cached_chunks
+        self._capacity = max_cached_chunks
+        self._chunks: "OrderedDict[Tuple[int, int], _ChunkCache]" = OrderedDict()
+        self._tile_colors: Dict[Tuple[str, int], Tuple[int, int, int, int]] = {}
+        self._tileset_refs: Dict[str, pygame.Surface] = {}
+        self.chunks_drawn = 0
+        self.chunks_built = 0
+        self.last_level = 0
+
+    def select_level(self, zoom: float) -> int:
+        """
+        Select the level of detail for a camera zoom.
+
+        Args:
+            zoom (float): The camera zoom level.
+
+        Returns:
+            int: An index into MIP_SCALES, or OVERVIEW_LEVEL.
+        """
+        tile_size = min(self.tilemap.tile_width, self.tilemap.tile_height)
+        if tile_size * zoom < self.overview_threshold:
+            return OVERVIEW_LEVEL
+        level = 0
+        for index, scale in enumerate(MIP_SCALES):
+            if scale >= zoom:
+                level = index
+        return level
+
+    def visible_chunks(
+        self, camera: Camera, viewport_size: Tuple[int, int]
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Yield the chunks that intersect the viewport.
+
+        Args:
+            camera (Camera): The camera used for the view.
+            viewport_size (Tuple[int, int]): The (width, height) of the viewport.
+
+        Yields:
+            Tuple[int, int]: The (column, row) of each visible chunk.
+        """
+        tilemap = self.tilemap
+        chunk_w = tilemap.chunk_size * tilemap.tile_width
+        chunk_h = tilemap.chunk_size * tilemap.tile_height
+        chunks_x = math.ceil(tilemap.width / tilemap.chunk_size)
+        chunks_y = math.ceil(tilemap.height / tilemap.chunk_size)
+
+        left, top = camera.screen_to_world(0, 0)
+        right, bottom = camera.screen_to_world(viewport_size[0], viewport_size[1])
+        first_x = max(0, int(left // chunk_w))
+        first_y = max(0, int(top // chunk_h))
+        last_x = min(chunks_x - 1, int(right // chunk_w))
+        last_y = min(chunks_y - 1, int(bottom // chunk_h))
+
+        for cy in range(first_y, last_y + 1):
+            for cx in range(first_x, last_x + 1):
+                yield cx, cy
+
+    def collect(
+        self, camera: Camera, viewport_size: Tuple[int, int]
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Build the blit list for the visible part of the tilemap.
+
+        Args:
+            camera (Camera): The camera used for the view.
+            viewport_size (Tuple[int, int]): The (width, height) of the viewport.
+
+        Returns:
+            List[Tuple[pygame.Surface, Tuple[int, int]]]: (surface, dest) pairs,
+            one per visible non-empty chunk.
+        """
+        zoom = camera.zoom
+        level = self.select_level(zoom)
+        self.last_level = level
+        self.chunks_built = 0
+
+        chunks = list(self.visible_chunks(camera, viewport_size))
+        # Far zoom levels can show more chunks than max_cached_chunks
+        self._capacity = max(self.max_cached_chunks, 2 * len(chunks))
+
+        blits = []
+        for chunk in chunks:
+            entry = self._scaled_chunk(chunk, level, zoom)
+            if entry is None:
+                continue
+            dest_x, dest_y = camera.apply_transform(*self._chunk_origin(chunk))
+            blits.append((entry, (math.floor(dest_x), math.floor(dest_y))))
+
+        self.chunks_drawn = len(blits)
+        profiler.count("chunks_drawn", self.chunks_drawn)
+        profiler.count("chunks_built", self.chunks_built)
+        return blits
+
+    def render(self, surface: pygame.Surface, camera: Camera) -> None:
+        """
+        Render the visible part of the tilemap to a surface.
+
+        Args:
+            surface (pygame.Surface): The surface to render to.
+            camera (Camera): The camera used for the view.
+        """
+        blits = self.collect(camera, surface.get_size())
+        if blits:
+            surface.blits(blits, doreturn=False)
+            profiler.count("draw_calls")
+            profiler.count("blits", len(blits))
+
+    def submit(
+        self,
+        batch: SpriteBatch,
+        camera: Camera,
+        viewport_size: Tuple[int, int],
+        layer: int = 0,
+        z: float = 0,
+    ) -> None:
+        """
+        Queue the visible part of the tilemap on a sprite batch.
+
+        Args:
+            batch (SpriteBatch): The batch to queue the chunk blits on.
+            camera (Camera): The camera used for the view.
+            viewport_size (Tuple[int, int]): The (width, height) of the viewport.
+            layer (int, optional): The batch layer to draw on. Defaults to 0.
+            z (float, optional): The draw order within the layer. Defaults to 0.
+        """
+        for surface, dest in self.collect(camera, viewport_size):
+            batch.draw(surface, dest, layer=layer, z=z)
+
+    def invalidate(self) -> None:
+        """Drop every cached chunk surface and tile colour."""
+        self._chunks.clear()
+        self._tile_colors.clear()
+        self._tileset_refs.clear()
+
+    def _chunk_origin(self, chunk: Tuple[int, int]) -> Tuple[int, int]:
+        """Return the world position of the top-left corner of a chunk."""
+        tilemap = self.tilemap
+        return (
+            chunk[0] * tilemap.chunk_size * tilemap.tile_width,
+            chunk[1] * tilemap.chunk_size * tilemap.tile_height,
+        )
+
+    def _chunk_tiles(self, chunk: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """Return the first tile column/row and the tile count of a chunk."""
+        tilemap = self.tilemap
+        x0 = chunk[0] * tilemap.chunk_size
+        y0 = chunk[1] * tilemap.chunk_size
+        columns = min(tilemap.chunk_size, tilemap.width - x0)
+        rows = min(tilemap.chunk_size, tilemap.height - y0)
+        return x0, y0, columns, rows
+
+    def _get_chunk(self, chunk: Tuple[int, int]) -> _ChunkCache:
+        """Return the cache entry of a chunk, resetting it if the chunk changed."""
+        revision = self.tilemap.chunk_revision(chunk)
+        entry = self._chunks.get(chunk)
+        if entry is None or entry.revision != revision:
+            entry = _ChunkCache(revision)
+            self._chunks[chunk] = entry
+            while len(self._chunks) > self._capacity:
+                self._chunks.popitem(last=False)
+        else:
+            self._chunks.move_to_end(chunk)
+        return entry
+
+    def _scaled_chunk(
+        self, chunk: Tuple[int, int], level: int, zoom: float
+    ) -> Optional[pygame.Surface]:
+        """Return the chunk surface scaled for the current zoom."""
+        entry = self._get_chunk(chunk)
+        if entry.empty:
+            return None
+
+        _, _, columns, rows = self._chunk_tiles(chunk)
+        target = (
+            max(1, math.ceil(columns * self.tilemap.tile_width * zoom)),
+            max(1, math.ceil(rows * self.tilemap.tile_height * zoom)),
+        )
+        key = (level, target[0], target[1])
+        if entry.scaled_key == key:
+            return entry.scaled
+
+        if level == OVERVIEW_LEVEL:
+            source = self._get_overview(chunk, entry)
+        else:
+            source = self._get_level(chunk, entry, level)
+        if source is None:
+            return None
+
+        if source.get_size() == target:
+            entry.scaled = source
+        else:
+            entry.scaled = pygame.transform.scale(source, target)
+        entry.scaled_key = key
+        return entry.scaled
+
+    def _get_level(
+        self, chunk: Tuple[int, int], entry: _ChunkCache, level: int
+    ) -> Optional[pygame.Surface]:
+        """Return a mip level of a chunk, building the chain if needed."""
+        if entry.levels[level] is not None:
+            return entry.levels[level]
+
+        surface = self._render_full_chunk(chunk)
+        if surface is None:
+            entry.empty = True
+            return None
+        self.chunks_built += 1
+
+        # Only keep the requested level and the smaller ones; full resolution
+        # is the expensive one and is only retained when actually used.
+        for index in range(len(MIP_SCALES)):
+            if index > 0:
+                surface = pygame.transform.smoothscale(
+                    surface,
+                    (
+                        max(1, surface.get_width() // 2),
+                        max(1, surface.get_height() // 2),
+                    ),
+                )
+            if index >= level and entry.levels[index] is None:
+                entry.levels[index] = surface
+        return entry.levels[level]
+
+    def _render_full_chunk(self, chunk: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Render every tile of a chunk at full resolution."""
+        tilemap = self.tilemap
+        x0, y0, columns, rows = self._chunk_tiles(chunk)
+        blits = []
+        for ty in range(y0, y0 + rows):
+            for tx in range(x0, x0 + columns):
+                tile = tilemap.tiles.get((tx, ty))
+                if tile is None:
+                    continue
+                tileset = tilemap.tilesets.get(tile.tileset)
+                if tileset is None:
+                    continue
+                src_rect = tilemap.get_tile_source_rect(tile, tileset)
+                if src_rect is None:
+                    continue
+                dest = ((tx - x0) * tilemap.tile_width, (ty - y0) * tilemap.tile_height)
+                blits.append((tileset, dest, src_rect))
+
+        if not blits:
+            return None
+        surface = pygame.Surface(
+            (columns * tilemap.tile_width, rows * tilemap.tile_height), pygame.SRCALPHA
+        )
+        surface.blits(blits, doreturn=False)
+        return surface
+
+    def _get_overview(
+        self, chunk: Tuple[int, int], entry: _ChunkCache
+    ) -> Optional[pygame.Surface]:
+        """Return the one-pixel-per-tile overview surface of a chunk."""
+        if entry.overview is not None:
+            return entry.overview
+
+        tilemap = self.tilemap
+        x0, y0, columns, rows = self._chunk_tiles(chunk)
+        overview = pygame.Surface((columns, rows), pygame.SRCALPHA)
+        has_tiles = False
+        for ty in range(y0, y0 + rows):
+            for tx in range(x0, x0 + columns):
+                tile = tilemap.tiles.get((tx, ty))
+                if tile is None:
+                    continue
+                color = self._tile_color(tile)
+                if color is not None:
+                    overview.set_at((tx - x0, ty - y0), color)
+                    has_tiles = True
+
+        if not has_tiles:
+            entry.empty = True
+            return None
+        self.chunks_built += 1
+        entry.overview = overview
+        return overview
+
+    def _tile_color(self, tile: Tile) -> Optional[Tuple[int, int, int, int]]:
+        """Return the average colour of a tile image, caching the result."""
+        tileset = self.tilemap.tilesets.get(tile.tileset)
+        if tileset is None:
+            return None
+        if self._tileset_refs.get(tile.tileset) is not tileset:
+            # The tileset image was replaced; forget colours sampled from the old one
+            self._tile_colors = {
+                k: v for k, v in self._tile_colors.items() if k[0] != tile.tileset
+            }
+            self._tileset_refs[tile.tileset] = tileset
+        key = (tile.tileset, tile.tile_id)
+        color = self._tile_colors.get(key)
+        if color is None:
+            src_rect = self.tilemap.get_tile_source_rect(tile, tileset)
+            if src_rect is None:
+                return None
+            src_rect = src_rect.clip(tileset.get_rect())
+            if src_rect.width == 0 or src_rect.height == 0:
+                return None
+            color = tuple(pygame.transform.average_color(tileset, src_rect))
+            self._tile_colors[key] = color
+        return color
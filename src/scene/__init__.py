@@ -10,7 +10,6 @@ layers, entities, and tilemaps in the 2D game editor.
 from .entity import Entity
 from .layer import Layer
 from .scene import Scene
-from .scene_serializer import SceneSerializer
 from .tilemap import Tilemap
 
 __all__ = [
@@ -20,3 +19,13 @@ __all__ = [
     "Tilemap",
     "SceneSerializer",
 ]
+
+
+def __getattr__(name):
+    # The serializer is only needed when saving or loading, so it is imported
+    # on first use
+    if name == "SceneSerializer":
+        from .scene_serializer import SceneSerializer
+
+        return SceneSerializer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,7 @@ class Layer:
         visible (bool): Whether the layer is visible.
         locked (bool): Whether the layer is locked.
         opacity (float): The opacity of the layer (0.0 to 1.0).
+        revision (int): Incremented whenever the layer's content changes.
     """
 
     def __init__(
@@ -36,6 +37,15 @@ class Layer:
         self.visible = visible
         self.locked = locked
         self.opacity = opacity
+        self.revision = 0
+
+    def mark_dirty(self):
+        """
+        Marks the layer's content as changed so cached renderings are rebuilt.
+
+        Visibility and opacity are applied when compositing and do not need this.
+        """
+        self.revision += 1
 
     def toggle_visibility(self):
         """
@@ -61,6 +71,38 @@ class Layer:
         else:
             raise ValueError("Opacity must be between 0.0 and 1.0.")
 
+    def to_dict(self):
+        """
+        Serializes the layer to a dictionary for saving.
+
+        Returns:
+            dict: The layer's name, visibility, lock status and opacity.
+        """
+        return {
+            "name": self.name,
+            "visible": self.visible,
+            "locked": self.locked,
+            "opacity": self.opacity,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Deserializes a layer from a dictionary.
+
+        Args:
+            data (dict): The dictionary produced by to_dict().
+
+        Returns:
+            Layer: The layer.
+        """
+        return cls(
+            name=data.get("name", "Unnamed Layer"),
+            visible=data.get("visible", True),
+            locked=data.get("locked", False),
+            opacity=data.get("opacity", 1.0),
+        )
+
     def __repr__(self):
         """
         Returns a string representation of the Layer instance.
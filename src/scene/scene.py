@@ -1,8 +1,22 @@
 # scene.py
 """
 Module for managing the game scene, including layers, entities, and tilemaps.
+
+Views of the scene, such as the hierarchy panel, register a listener to be told
+about added, removed and renamed layers and entities, so they can update
+incrementally instead of rescanning the scene.
 """
 
+# The changes passed to scene listeners, with the layer or entity involved
+SCENE_CHANGES = (
+    "layer_added",
+    "layer_removed",
+    "entity_added",
+    "entity_removed",
+    "entity_renamed",
+    "cleared",
+)
+
 
 class Scene:
     """
@@ -20,6 +34,33 @@ class Scene:
         self.layers = []
         self.entities = []
         self.tilemaps = []
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """
+        Register a function to be called when the scene changes.
+
+        Args:
+            listener: Called as ``listener(change, item)``, where change is one
+                of SCENE_CHANGES and item the layer or entity involved, or None
+                for "cleared". Changes made by mutating the scene's lists
+                directly are not reported.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Unregister a listener added with add_listener().
+
+        Args:
+            listener: The listener to remove.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, change, item=None):
+        for listener in list(self._listeners):
+            listener(change, item)
 
     def add_layer(self, layer):
         """
@@ -29,6 +70,7 @@ class Scene:
             layer: The layer to add.
         """
         self.layers.append(layer)
+        self._notify("layer_added", layer)
 
     def remove_layer(self, layer):
         """
@@ -43,6 +85,7 @@ class Scene:
         if layer not in self.layers:
             raise ValueError("Layer not found in scene")
         self.layers.remove(layer)
+        self._notify("layer_removed", layer)
 
     def add_entity(self, entity):
         """
@@ -52,6 +95,7 @@ class Scene:
             entity: The entity to add.
         """
         self.entities.append(entity)
+        self._notify("entity_added", entity)
 
     def remove_entity(self, entity):
         """
@@ -62,6 +106,19 @@ class Scene:
         """
         if entity in self.entities:
             self.entities.remove(entity)
+            self._notify("entity_removed", entity)
+
+    def rename_entity(self, entity, name):
+        """
+        Rename an entity, telling the listeners about it.
+
+        Args:
+            entity: The entity to rename.
+            name (str): The new name.
+        """
+        entity.name = name
+        if entity in self.entities:
+            self._notify("entity_renamed", entity)
 
     def add_tilemap(self, tilemap):
         """
@@ -89,12 +146,16 @@ class Scene:
         self.layers.clear()
         self.entities.clear()
         self.tilemaps.clear()
+        self._notify("cleared")
 
     def clear_layers(self):
         """
         Clear all layers from the scene.
         """
+        layers = list(self.layers)
         self.layers.clear()
+        for layer in layers:
+            self._notify("layer_removed", layer)
 
     def get_layer_by_name(self, name: str):
         """
@@ -1,4 +1,8 @@
 import json
+import struct
+import sys
+import zlib
+from array import array
 from typing import Any, Dict, List, Optional
 
 from .entity import Entity
@@ -6,11 +10,20 @@ from .layer import Layer
 from .scene import Scene
 from .tilemap import Tilemap
 
+BINARY_MAGIC = b"G2DS"
+BINARY_VERSION = 1
+BINARY_EXTENSION = ".bin"
+
+# Magic, format version
+_BINARY_HEADER = struct.Struct("<4sH")
+_LENGTH = struct.Struct("<I")
+
 
 class SceneSerializer:
     """
     Handles serialization and deserialization of Scene objects.
-    Supports saving and loading scenes to/from JSON files.
+    Supports saving and loading scenes to/from JSON files and a compact
+    binary format, in which tiles are stored as packed integer arrays.
     """
 
     @staticmethod
@@ -53,11 +66,9 @@ class SceneSerializer:
             if not isinstance(entity, Entity):
                 raise ValueError("Invalid entity object in scene.")
             entity_data = {
+                "entity_id": entity.entity_id,
                 "name": entity.name,
-                "x": entity.x,
-                "y": entity.y,
-                "width": entity.width,
-                "height": entity.height,
+                "position": entity.position,
                 "properties": entity.properties,
             }
             scene_data["entities"].append(entity_data)
@@ -66,15 +77,7 @@ class SceneSerializer:
         for tilemap in scene.tilemaps:
             if not isinstance(tilemap, Tilemap):
                 raise ValueError("Invalid tilemap object in scene.")
-            tilemap_data = {
-                "name": tilemap.name,
-                "tile_width": tilemap.tile_width,
-                "tile_height": tilemap.tile_height,
-                "rows": tilemap.rows,
-                "columns": tilemap.columns,
-                "tiles": tilemap.tiles,
-            }
-            scene_data["tilemaps"].append(tilemap_data)
+            scene_data["tilemaps"].append(tilemap.to_dict())
 
         return scene_data
 
@@ -114,12 +117,13 @@ class SceneSerializer:
         for entity_data in scene_data.get("entities", []):
             if not isinstance(entity_data, dict):
                 raise ValueError("Invalid entity data in scene.")
+            position = entity_data.get(
+                "position", {"x": entity_data.get("x", 0), "y": entity_data.get("y", 0)}
+            )
             entity = Entity(
+                entity_id=entity_data.get("entity_id"),
                 name=entity_data.get("name", "Unnamed Entity"),
-                x=entity_data.get("x", 0),
-                y=entity_data.get("y", 0),
-                width=entity_data.get("width", 1),
-                height=entity_data.get("height", 1),
+                position=position,
                 properties=entity_data.get("properties", {}),
             )
             scene.entities.append(entity)
@@ -128,50 +132,151 @@ class SceneSerializer:
         for tilemap_data in scene_data.get("tilemaps", []):
             if not isinstance(tilemap_data, dict):
                 raise ValueError("Invalid tilemap data in scene.")
-            tilemap = Tilemap(
-                name=tilemap_data.get("name", "Unnamed Tilemap"),
-                tile_width=tilemap_data.get("tile_width", 32),
-                tile_height=tilemap_data.get("tile_height", 32),
-                rows=tilemap_data.get("rows", 0),
-                columns=tilemap_data.get("columns", 0),
-                tiles=tilemap_data.get("tiles", {}),
-            )
+            try:
+                tilemap = Tilemap.from_dict(tilemap_data)
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Invalid tilemap data in scene: {e}")
             scene.tilemaps.append(tilemap)
 
         return scene
 
+    @staticmethod
+    def to_binary(scene: Scene) -> bytes:
+        """
+        Convert a Scene object into the binary format.
+
+        Everything but the tiles is stored as JSON; the tiles of each tilemap
+        are stored as a packed array of (x, y, tile_id, tileset) integers.
+        The whole payload is zlib-compressed.
+
+        Args:
+            scene: The Scene object to serialize.
+
+        Returns:
+            The binary scene data.
+
+        Raises:
+            ValueError: If the scene object is invalid or cannot be serialized.
+        """
+        scene_data = SceneSerializer.serialize(scene)
+        tile_arrays = []
+        for tilemap_data in scene_data["tilemaps"]:
+            tilesets: List[str] = []
+            tileset_indices: Dict[str, int] = {}
+            values = array("i")
+            for tile in tilemap_data.pop("tiles"):
+                index = tileset_indices.get(tile["tileset"])
+                if index is None:
+                    index = tileset_indices[tile["tileset"]] = len(tilesets)
+                    tilesets.append(tile["tileset"])
+                values.extend((tile["x"], tile["y"], tile["tile_id"], index))
+            if sys.byteorder == "big":
+                values.byteswap()
+            tilemap_data["tile_tilesets"] = tilesets
+            tile_arrays.append(values.tobytes())
+
+        try:
+            metadata = json.dumps(scene_data).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Error encoding scene data: {e}")
+        chunks = [_LENGTH.pack(len(metadata)), metadata]
+        for data in tile_arrays:
+            chunks.append(_LENGTH.pack(len(data)))
+            chunks.append(data)
+        payload = zlib.compress(b"".join(chunks))
+        return _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION) + payload
+
+    @staticmethod
+    def from_binary(data: bytes) -> Scene:
+        """
+        Convert binary scene data back into a Scene object.
+
+        Args:
+            data: The binary scene data.
+
+        Returns:
+            A Scene object.
+
+        Raises:
+            ValueError: If the data is not a valid binary scene.
+        """
+        if len(data) < _BINARY_HEADER.size:
+            raise ValueError("Invalid binary scene data: file is too short.")
+        magic, version = _BINARY_HEADER.unpack_from(data)
+        if magic != BINARY_MAGIC:
+            raise ValueError("Invalid binary scene data: bad magic number.")
+        if version != BINARY_VERSION:
+            raise ValueError(f"Unsupported binary scene version: {version}")
+        try:
+            payload = zlib.decompress(data[_BINARY_HEADER.size :])
+            (length,) = _LENGTH.unpack_from(payload)
+            offset = _LENGTH.size
+            scene_data = json.loads(payload[offset : offset + length])
+            offset += length
+            for tilemap_data in scene_data.get("tilemaps", []):
+                (length,) = _LENGTH.unpack_from(payload, offset)
+                offset += _LENGTH.size
+                values = array("i")
+                values.frombytes(payload[offset : offset + length])
+                offset += length
+                if sys.byteorder == "big":
+                    values.byteswap()
+                tilesets = tilemap_data.pop("tile_tilesets")
+                tilemap_data["tiles"] = [
+                    {
+                        "x": values[i],
+                        "y": values[i + 1],
+                        "tile_id": values[i + 2],
+                        "tileset": tilesets[values[i + 3]],
+                    }
+                    for i in range(0, len(values), 4)
+                ]
+        except (zlib.error, struct.error, KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"Invalid binary scene data: {e}")
+        return SceneSerializer.deserialize(scene_data)
+
     @staticmethod
     def save_to_file(scene: Scene, file_path: str) -> None:
         """
-        Save a Scene object to a JSON file.
+        Save a Scene object to a file.
+
+        Files ending in ``.bin`` are written in the binary format, all other
+        files as JSON.
 
         Args:
             scene: The Scene object to save.
-            file_path: The path to the JSON file.
+            file_path: The path to the file.
 
         Raises:
             FileNotFoundError: If the directory for the file does not exist.
             PermissionError: If the file cannot be written due to permission issues.
-            json.JSONEncodeError: If the scene data cannot be serialized to JSON.
+            ValueError: If the scene data cannot be serialized.
         """
-        scene_data = SceneSerializer.serialize(scene)
+        if file_path.lower().endswith(BINARY_EXTENSION):
+            data = SceneSerializer.to_binary(scene)
+        else:
+            try:
+                text = json.dumps(SceneSerializer.serialize(scene), indent=4)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Error encoding scene data: {e}")
+            data = text.encode("utf-8")
         try:
-            with open(file_path, "w") as file:
-                json.dump(scene_data, file, indent=4)
+            with open(file_path, "wb") as file:
+                file.write(data)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Directory not found: {e}")
         except PermissionError as e:
             raise PermissionError(f"Permission denied while saving scene: {e}")
-        except json.JSONEncodeError as e:
-            raise json.JSONEncodeError(f"Error encoding scene data: {e}")
 
     @staticmethod
     def load_from_file(file_path: str) -> Optional[Scene]:
         """
-        Load a Scene object from a JSON file.
+        Load a Scene object from a JSON or binary file.
+
+        The format is detected from the contents of the file.
 
         Args:
-            file_path: The path to the JSON file.
+            file_path: The path to the file.
 
         Returns:
             A Scene object if successful, None otherwise.
@@ -180,14 +285,21 @@ class SceneSerializer:
             FileNotFoundError: If the file does not exist.
             PermissionError: If the file cannot be read due to permission issues.
             json.JSONDecodeError: If the file contains invalid JSON data.
+            ValueError: If the file contains invalid binary scene data.
         """
         try:
-            with open(file_path, "r") as file:
-                scene_data = json.load(file)
-            return SceneSerializer.deserialize(scene_data)
+            with open(file_path, "rb") as file:
+                data = file.read()
         except FileNotFoundError as e:
             raise FileNotFoundError(f"File not found: {e}")
         except PermissionError as e:
             raise PermissionError(f"Permission denied while loading scene: {e}")
+        if data.startswith(BINARY_MAGIC):
+            return SceneSerializer.from_binary(data)
+        try:
+            scene_data = json.loads(data)
         except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Error decoding scene data: {e}")
+            raise json.JSONDecodeError(
+                f"Error decoding scene data: {e.msg}", e.doc, e.pos
+            )
+        return SceneSerializer.deserialize(scene_data)
@@ -1,6 +1,11 @@
 """
 Tilemap module for the 2D game editor.
 Handles tilemap data, rendering, and manipulation.
+
+Tilesets can be packed into a TextureAtlas. Each tileset is then stored as a
+subsurface of an atlas page, so the tilesets of a scene share a few large
+surfaces. With an atlas saved to disk, unchanged tilesets are taken from it
+without decoding their image files.
 """
 
 from typing import Dict, List, Optional, Tuple
@@ -8,7 +13,9 @@ from typing import Dict, List, Optional, Tuple
 import pygame
 
 from src.assets.asset_manager import AssetManager
+from src.assets.texture_atlas import TextureAtlas
 from src.core.types import Point
+from src.utils.frame_profiler import profiler
 
 from .layer import Layer
 
@@ -28,6 +35,9 @@ class Tile:
 class Tilemap:
     """Manages a grid of tiles for a 2D game level."""
 
+    # Number of tiles along each side of a render chunk.
+    chunk_size = 16
+
     def __init__(
         self, width: int, height: int, tile_width: int = 32, tile_height: int = 32
     ):
@@ -38,16 +48,45 @@ class Tilemap:
         self.tiles: Dict[Tuple[int, int], Tile] = {}
         self.layers: List[Layer] = []
         self.tilesets: Dict[str, pygame.Surface] = {}
+        # Image files the tilesets were loaded from, used for hot-reloading
+        self.tileset_paths: Dict[str, str] = {}
+        # The atlas tilesets are packed into, if any
+        self.atlas: Optional[TextureAtlas] = None
+        # Bumped on every change; renderers compare it to their cached copy
+        self.revision = 0
+        self.chunk_revisions: Dict[Tuple[int, int], int] = {}
+        self._base_revision = 0
+
+    def chunk_of(self, x: int, y: int) -> Tuple[int, int]:
+        """Return the (column, row) of the render chunk containing a tile."""
+        return x // self.chunk_size, y // self.chunk_size
+
+    def chunk_revision(self, chunk: Tuple[int, int]) -> int:
+        """Return the revision of the last change that affected a render chunk."""
+        return self.chunk_revisions.get(chunk, self._base_revision)
+
+    def _mark_dirty(self, x: int, y: int):
+        """Record a content change of the tile at (x, y)."""
+        self.revision += 1
+        self.chunk_revisions[self.chunk_of(x, y)] = self.revision
+
+    def _mark_all_dirty(self):
+        """Record a change that affects every chunk (e.g. a tileset swap)."""
+        self.revision += 1
+        self._base_revision = self.revision
+        self.chunk_revisions.clear()
 
     def add_tile(self, x: int, y: int, tile_id: int, tileset: str = "default"):
         """Add or update a tile at the specified position."""
         position = {"x": x, "y": y}
         self.tiles[(x, y)] = Tile(tile_id, position, tileset)
+        self._mark_dirty(x, y)
 
     def remove_tile(self, x: int, y: int):
         """Remove a tile at the specified position."""
         if (x, y) in self.tiles:
             del self.tiles[(x, y)]
+            self._mark_dirty(x, y)
 
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         """Get the tile at the specified position."""
@@ -58,39 +97,102 @@ class Tilemap:
     def clear(self):
         """Clear all tiles from the tilemap."""
         self.tiles.clear()
+        self._mark_all_dirty()
+
+    @staticmethod
+    def atlas_name(name: str) -> str:
+        """Return the name a tileset is packed under in a texture atlas."""
+        return f"tileset/{name}"
 
     def load_tileset(self, name: str, image_path: str, asset_manager: AssetManager):
-        """Load a tileset image and store it for rendering."""
-        tileset_image = asset_manager.load_image(image_path)
+        """Load a tileset image and store it for rendering.
+
+        If the tileset is packed in the atlas and its file is unchanged, the
+        packed image is used without decoding the file.
+        """
+        atlas = self.atlas
+        if atlas is not None and not atlas.is_stale(self.atlas_name(name), image_path):
+            self.tilesets[name] = atlas.get_surface(self.atlas_name(name))
+            self._mark_all_dirty()
+        else:
+            tileset_image = asset_manager.load_image(image_path)
+            self.set_tileset(name, tileset_image, image_path)
+        self.tileset_paths[name] = image_path
+
+    def set_tileset(
+        self,
+        name: str,
+        tileset_image: pygame.Surface,
+        source_path: Optional[str] = None,
+    ):
+        """Store a tileset surface for rendering, packing it into the atlas if set.
+
+        Tilesets too large for an atlas page are stored unpacked.
+        """
+        if self.atlas is not None:
+            try:
+                self.atlas.add(self.atlas_name(name), tileset_image, source_path)
+            except ValueError:
+                pass
+            else:
+                tileset_image = self.atlas.get_surface(self.atlas_name(name))
         self.tilesets[name] = tileset_image
+        self._mark_all_dirty()
+
+    def pack_tilesets(self, atlas: TextureAtlas) -> None:
+        """Pack every tileset into a texture atlas and draw from it from now on.
+
+        Tilesets are replaced by subsurfaces of the atlas pages, and tilesets
+        set later are packed as they are set.
+
+        Args:
+            atlas (TextureAtlas): The atlas to pack the tilesets into.
+        """
+        self.atlas = atlas
+        for name, tileset in list(self.tilesets.items()):
+            self.set_tileset(name, tileset, self.tileset_paths.get(name))
+
+    def get_tile_source_rect(
+        self, tile: Tile, tileset: pygame.Surface
+    ) -> Optional[pygame.Rect]:
+        """Return the area of the tileset image that holds the given tile."""
+        columns = tileset.get_width() // self.tile_width
+        if columns <= 0:
+            return None
+        return pygame.Rect(
+            (tile.tile_id % columns) * self.tile_width,
+            (tile.tile_id // columns) * self.tile_height,
+            self.tile_width,
+            self.tile_height,
+        )
 
     def render(self, surface: pygame.Surface, camera_offset: Point):
         """Render the tilemap to the given surface with camera offset."""
+        drawn = 0
         for (x, y), tile in self.tiles.items():
             tileset = self.tilesets.get(tile.tileset)
             if tileset:
-                # Calculate source rectangle for the tile in the tileset
-                tile_x = (
-                    tile.tile_id % (tileset.get_width() // self.tile_size)
-                ) * self.tile_size
-                tile_y = (
-                    tile.tile_id // (tileset.get_width() // self.tile_size)
-                ) * self.tile_size
-                src_rect = pygame.Rect(tile_x, tile_y, self.tile_size, self.tile_size)
-
-                # Calculate destination rectangle with camera offset
-                dest_x = x * self.tile_size - camera_offset.x
-                dest_y = y * self.tile_size - camera_offset.y
-                dest_rect = pygame.Rect(dest_x, dest_y, self.tile_size, self.tile_size)
-
-                surface.blit(tileset, dest_rect, src_rect)
+                src_rect = self.get_tile_source_rect(tile, tileset)
+                if src_rect is None:
+                    continue
+
+                # Calculate destination position with camera offset
+                dest_x = x * self.tile_width - camera_offset["x"]
+                dest_y = y * self.tile_height - camera_offset["y"]
+
+                surface.blit(tileset, (dest_x, dest_y), src_rect)
+                drawn += 1
+        profiler.count("tiles_drawn", drawn)
+        profiler.count("blits", drawn)
 
     def to_dict(self) -> Dict:
         """Serialize the tilemap to a dictionary for saving."""
         return {
             "width": self.width,
             "height": self.height,
-            "tile_size": self.tile_size,
+            "tile_width": self.tile_width,
+            "tile_height": self.tile_height,
+            "tilesets": dict(self.tileset_paths),
             "tiles": [
                 {"x": x, "y": y, "tile_id": tile.tile_id, "tileset": tile.tileset}
                 for (x, y), tile in self.tiles.items()
@@ -100,8 +202,17 @@ class Tilemap:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Tilemap":
-        """Deserialize a tilemap from a dictionary."""
-        tilemap = cls(data["width"], data["height"], data["tile_size"])
+        """Deserialize a tilemap from a dictionary.
+
+        Tileset images are not loaded; their paths are restored into
+        tileset_paths so callers can load them with load_tileset().
+        """
+        # Older files stored a single square tile size
+        tile_width = data.get("tile_width", data.get("tile_size", 32))
+        tile_height = data.get("tile_height", data.get("tile_size", 32))
+        tilemap = cls(data["width"], data["height"], tile_width, tile_height)
+        tilemap.tileset_paths.update(data.get("tilesets", {}))
+        tilemap.layers = [Layer.from_dict(layer) for layer in data.get("layers", [])]
         for tile_data in data["tiles"]:
             tilemap.add_tile(
                 tile_data["x"],
@@ -0,0 +1,160 @@
+"""
+Layout and hit-testing helpers for the editor UI.
+
+GridLayout maps a point to the cell of a uniform grid arithmetically, so grid
+widgets such as the tile palette and the toolbar find the clicked item without
+scanning their items. HitTestGrid finds the topmost rectangle under a point by
+bucketing rectangles into a coarse screen grid, so routing a pointer event does
+not scan every panel.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+
+class GridLayout:
+    """
+    A uniform grid of cells laid out row by row.
+
+    Attributes:
+        x (int): The x-coordinate of the first cell.
+        y (int): The y-coordinate of the first cell.
+        cell_width (int): The width of each cell.
+        cell_height (int): The height of each cell.
+        columns (int): The number of cells per row.
+        count (int): The number of cells.
+        spacing_x (int): The horizontal gap between cells.
+        spacing_y (int): The vertical gap between cells.
+    """
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        cell_width: int,
+        cell_height: int,
+        columns: int,
+        count: int,
+        spacing_x: int = 0,
+        spacing_y: int = 0,
+    ):
+        self.x = x
+        self.y = y
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.columns = max(1, columns)
+        self.count = count
+        self.spacing_x = spacing_x
+        self.spacing_y = spacing_y
+
+    def cell_rect(self, index: int) -> pygame.Rect:
+        """
+        Return the rectangle of a cell.
+
+        Args:
+            index (int): The cell index.
+
+        Returns:
+            pygame.Rect: The cell's rectangle.
+        """
+        row, column = divmod(index, self.columns)
+        return pygame.Rect(
+            self.x + column * (self.cell_width + self.spacing_x),
+            self.y + row * (self.cell_height + self.spacing_y),
+            self.cell_width,
+            self.cell_height,
+        )
+
+    def index_at(self, x: int, y: int) -> Optional[int]:
+        """
+        Return the index of the cell containing a point.
+
+        Args:
+            x (int): The x-coordinate of the point.
+            y (int): The y-coordinate of the point.
+
+        Returns:
+            Optional[int]: The cell index, or None if the point is outside every
+            cell, including the gaps between cells.
+        """
+        local_x = x - self.x
+        local_y = y - self.y
+        if local_x < 0 or local_y < 0:
+            return None
+        column, offset_x = divmod(local_x, self.cell_width + self.spacing_x)
+        row, offset_y = divmod(local_y, self.cell_height + self.spacing_y)
+        if offset_x >= self.cell_width or offset_y >= self.cell_height:
+            return None
+        if column >= self.columns:
+            return None
+        index = int(row * self.columns + column)
+        return index if index < self.count else None
+
+
+class HitTestGrid:
+    """
+    Finds the topmost rectangle containing a point.
+
+    Rectangles are bucketed into square screen cells, so a lookup only tests
+    the few rectangles overlapping the cell under the point. Rectangles added
+    later are on top.
+    """
+
+    def __init__(self, bucket_size: int = 128):
+        """
+        Initialize an empty hit-test grid.
+
+        Args:
+            bucket_size (int, optional): The size of the screen cells in pixels.
+                Defaults to 128.
+        """
+        self.bucket_size = bucket_size
+        self._buckets: Dict[Tuple[int, int], List[Tuple[pygame.Rect, Any]]] = {}
+        self._count = 0
+
+    def __len__(self):
+        """Return the number of rectangles."""
+        return self._count
+
+    def clear(self) -> None:
+        """Remove every rectangle."""
+        self._buckets.clear()
+        self._count = 0
+
+    def add(self, rect: pygame.Rect, target: Any) -> None:
+        """
+        Add a rectangle on top of the rectangles added so far.
+
+        Args:
+            rect (pygame.Rect): The rectangle.
+            target (Any): The value returned when the rectangle is hit.
+        """
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        size = self.bucket_size
+        for bucket_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for bucket_x in range(rect.left // size, (rect.right - 1) // size + 1):
+                # Topmost first, so lookups can stop at the first hit
+                self._buckets.setdefault((bucket_x, bucket_y), []).insert(
+                    0, (rect, target)
+                )
+        self._count += 1
+
+    def hit_test(self, x: int, y: int) -> Optional[Any]:
+        """
+        Return the target of the topmost rectangle containing a point.
+
+        Args:
+            x (int): The x-coordinate of the point.
+            y (int): The y-coordinate of the point.
+
+        Returns:
+            Optional[Any]: The target, or None if no rectangle contains the point.
+        """
+        size = self.bucket_size
+        for rect, target in self._buckets.get((x // size, y // size), ()):
+            if rect.collidepoint(x, y):
+                return target
+        return None
@@ -0,0 +1,136 @@
+"""
+On-screen performance overlay for the 2D game editor.
+This module draws the frame profiler's frame-time graph, slowest scopes and
+counters on top of the editor.
+"""
+
+from typing import Optional, Tuple
+
+import pygame
+
+from ..utils.color import hex_to_rgb
+from ..utils.frame_profiler import FrameProfiler
+from .theme import Theme
+
+
+class PerformanceOverlay:
+    """
+    A toggleable panel showing where frame time goes.
+
+    Showing the overlay enables the profiler and hiding it disables it, so the
+    instrumentation costs nothing while the overlay is hidden.
+    """
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        target_fps: int = 60,
+        position: Tuple[int, int] = (10, 10),
+        width: int = 320,
+        graph_height: int = 60,
+        theme: Optional[Theme] = None,
+    ):
+        """
+        Initialize the overlay.
+
+        Args:
+            profiler (FrameProfiler): The profiler whose samples are shown.
+            target_fps (int, optional): The frame rate whose budget is marked
+                on the graph. Defaults to 60.
+            position (Tuple[int, int], optional): The top-left corner.
+            width (int, optional): The width in pixels. Defaults to 320.
+            graph_height (int, optional): The graph height in pixels. Defaults to 60.
+            theme (Optional[Theme], optional): The theme. Defaults to a new Theme.
+        """
+        self.profiler = profiler
+        self.frame_budget = 1.0 / target_fps
+        self.position = position
+        self.width = width
+        self.graph_height = graph_height
+        self.theme = theme or Theme()
+        self.visible = False
+        self.font_size = 16
+        self.line_height = 14
+        self.padding = 6
+        self.max_scopes = 8
+
+    def toggle(self) -> None:
+        """Show or hide the overlay, enabling the profiler while it is shown."""
+        self.visible = not self.visible
+        self.profiler.enabled = self.visible
+        if not self.visible:
+            self.profiler.clear()
+
+    def _lines(self):
+        """Return the text lines shown below the graph."""
+        frames = self.profiler.frames
+        if not frames:
+            return ["Collecting frames..."]
+        recent = list(frames)[-60:]
+        average = sum(frame.duration for frame in recent) / len(recent)
+        worst = max(frame.duration for frame in recent)
+        lines = [f"Frame {average * 1000:.2f} ms avg, {worst * 1000:.2f} ms max"]
+        for name, seconds in self.profiler.top_scopes(60, self.max_scopes):
+            lines.append(f"{name:<24}{seconds * 1000:8.2f} ms")
+        for name, value in self.profiler.average_counters(60).items():
+            lines.append(f"{name:<24}{value:8.0f}")
+        return lines
+
+    def _render_graph(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """Draw one bar per recorded frame, scaled to twice the frame budget."""
+        frames = list(self.profiler.frames)[-rect.width :]
+        scale = rect.height / (2 * self.frame_budget)
+        ok = hex_to_rgb(self.theme.get_color("success"))
+        slow = hex_to_rgb(self.theme.get_color("accent"))
+        over = hex_to_rgb(self.theme.get_color("error"))
+        x = rect.right - len(frames)
+        for frame in frames:
+            height = min(rect.height, max(1, int(frame.duration * scale)))
+            if frame.duration > self.frame_budget:
+                color = over
+            elif frame.duration > self.frame_budget / 2:
+                color = slow
+            else:
+                color = ok
+            pygame.draw.line(
+                surface, color, (x, rect.bottom - 1), (x, rect.bottom - height)
+            )
+            x += 1
+        budget_y = rect.bottom - int(self.frame_budget * scale)
+        pygame.draw.line(
+            surface,
+            hex_to_rgb(self.theme.get_color("text_disabled")),
+            (rect.left, budget_y),
+            (rect.right - 1, budget_y),
+        )
+
+    def render(self, surface: pygame.Surface) -> None:
+        """
+        Draw the overlay if it is visible.
+
+        Args:
+            surface (pygame.Surface): The surface to draw onto.
+        """
+        if not self.visible:
+            return
+        lines = self._lines()
+        x, y = self.position
+        height = self.padding * 3 + self.graph_height + len(lines) * self.line_height
+        background = pygame.Surface((self.width, height), pygame.SRCALPHA)
+        background.fill((*hex_to_rgb(self.theme.get_color("background")), 220))
+        surface.blit(background, (x, y))
+
+        graph = pygame.Rect(
+            x + self.padding,
+            y + self.padding,
+            self.width - 2 * self.padding,
+            self.graph_height,
+        )
+        self._render_graph(surface, graph)
+
+        font = self.theme.get_font(self.font_size)
+        color = hex_to_rgb(self.theme.get_color("text"))
+        text_y = graph.bottom + self.padding
+        for line in lines:
+            surface.blit(font.render(line, True, color), (graph.left, text_y))
+            text_y += self.line_height
@@ -3,6 +3,8 @@ Theme management for the 2D game editor UI.
 This module handles color schemes, styles, and theming for the editor.
 """
 
+import pygame
+
 
 class Theme:
     """
@@ -25,6 +27,10 @@ class Theme:
             "text": "#ffffff",
             "text_disabled": "#888888",
         }
+        # Fonts by size, so panels do not reload the font file every frame
+        self.fonts = {}
+        # Bumped on every change, so panels know when to redraw cached surfaces
+        self.version = 0
 
     def get_color(self, key):
         """
@@ -38,6 +44,22 @@ class Theme:
         """
         return self.colors.get(key, "#ffffff")
 
+    def get_font(self, size):
+        """
+        Retrieve the default font at the given size, loading it once.
+
+        Args:
+            size (int): The font size.
+
+        Returns:
+            pygame.font.Font: The font.
+        """
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont(None, size)
+            self.fonts[size] = font
+        return font
+
     def set_color(self, key, value):
         """
         Set a color in the theme.
@@ -47,6 +69,7 @@ class Theme:
             value (str): The hexadecimal color value.
         """
         self.colors[key] = value
+        self.version += 1
 
     def apply_theme(self):
         """
@@ -1,8 +1,10 @@
-import tkinter as tk
-from tkinter import filedialog
+# tkinter is imported on first use; loading Tk slows down editor startup
 
 
 def open_file_dialog():
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()  # Hide the main window
     file_path = filedialog.askopenfilename()
@@ -10,6 +12,9 @@ def open_file_dialog():
 
 
 def save_file_dialog():
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()  # Hide the main window
     file_path = filedialog.asksaveasfilename()
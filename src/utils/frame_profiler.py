@@ -0,0 +1,292 @@
+"""
+Frame Profiler Module
+
+This module measures where frame time goes while the editor is running. Code
+is wrapped in named, nestable timing scopes and hot paths bump per-frame
+counters (blits, draw calls, tiles drawn, cache hits). The samples of the most
+recent frames are kept in a ring buffer, which the performance overlay draws
+and which can be exported as Chrome trace-event JSON for chrome://tracing or
+Perfetto.
+
+Profiling is off until enabled, and a disabled profiler costs one attribute
+check per scope or counter.
+"""
+
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class ScopeSample:
+    """
+    One timed run of a scope.
+
+    Attributes:
+        name (str): The scope name.
+        depth (int): How deeply the scope was nested; 0 for top-level scopes.
+        start (float): The ``time.perf_counter()`` value the scope was entered at.
+        duration (float): Seconds spent inside the scope.
+    """
+
+    def __init__(self, name: str, depth: int, start: float, duration: float):
+        self.name = name
+        self.depth = depth
+        self.start = start
+        self.duration = duration
+
+
+class FrameSample:
+    """
+    The scopes and counters recorded during one frame.
+
+    Attributes:
+        index (int): The frame number.
+        start (float): The ``time.perf_counter()`` value the frame began at.
+        duration (float): Seconds from the start to the end of the frame.
+        scopes (List[ScopeSample]): The scopes, in the order they finished.
+        counters (Dict[str, int]): The counter totals.
+    """
+
+    def __init__(self, index: int, start: float):
+        self.index = index
+        self.start = start
+        self.duration = 0.0
+        self.scopes: List[ScopeSample] = []
+        self.counters: Dict[str, int] = {}
+
+
+class _Scope:
+    """Context manager timing one run of a scope."""
+
+    __slots__ = ("profiler", "name", "start", "depth")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> "_Scope":
+        profiler = self.profiler
+        self.depth = profiler._depth
+        profiler._depth += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        duration = time.perf_counter() - self.start
+        profiler = self.profiler
+        profiler._depth -= 1
+        frame = profiler._frame
+        if frame is not None:
+            frame.scopes.append(
+                ScopeSample(self.name, self.depth, self.start, duration)
+            )
+
+
+class _NullScope:
+    """Context manager used while profiling is disabled."""
+
+    def __enter__(self) -> "_NullScope":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class FrameProfiler:
+    """
+    Records nested timing scopes and counters for each frame.
+
+    Attributes:
+        enabled (bool): Whether scopes and counters are recorded.
+        frames (Deque[FrameSample]): The most recent completed frames, oldest first.
+    """
+
+    def __init__(self, history: int = 240, enabled: bool = False):
+        """
+        Initialize the frame profiler.
+
+        Args:
+            history (int, optional): Number of frames kept. Defaults to 240.
+            enabled (bool, optional): Whether to start recording. Defaults to False.
+        """
+        self.enabled = enabled
+        self.frames: Deque[FrameSample] = deque(maxlen=history)
+        self._frame: Optional[FrameSample] = None
+        self._frame_count = 0
+        self._depth = 0
+
+    def begin_frame(self) -> None:
+        """Start recording a frame."""
+        if not self.enabled:
+            self._frame = None
+            return
+        self._frame = FrameSample(self._frame_count, time.perf_counter())
+        self._frame_count += 1
+        self._depth = 0
+
+    def end_frame(self) -> None:
+        """Finish the current frame and add it to the ring buffer."""
+        frame = self._frame
+        if frame is None:
+            return
+        frame.duration = time.perf_counter() - frame.start
+        self.frames.append(frame)
+        self._frame = None
+
+    def scope(self, name: str):
+        """
+        Time a block of code as part of the current frame.
+
+        Usage:
+            with profiler.scope("render"):
+                ...
+
+        Args:
+            name (str): The scope name.
+
+        Returns:
+            A context manager timing the block.
+        """
+        if self._frame is None:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Add to a counter of the current frame.
+
+        Args:
+            name (str): The counter name.
+            value (int, optional): The amount to add. Defaults to 1.
+        """
+        frame = self._frame
+        if frame is not None:
+            frame.counters[name] = frame.counters.get(name, 0) + value
+
+    def clear(self) -> None:
+        """Discard all recorded frames."""
+        self.frames.clear()
+
+    def _recent(self, frames: Optional[int]) -> List[FrameSample]:
+        samples = list(self.frames)
+        return samples[-frames:] if frames else samples
+
+    def top_scopes(
+        self, frames: Optional[int] = None, limit: int = 10
+    ) -> List[Tuple[str, float]]:
+        """
+        Return the scopes that took the most time per frame.
+
+        Args:
+            frames (Optional[int], optional): Number of recent frames to
+                average over. Defaults to all recorded frames.
+            limit (int, optional): Maximum number of scopes. Defaults to 10.
+
+        Returns:
+            List[Tuple[str, float]]: Scope names with their average seconds
+            per frame, slowest first.
+        """
+        samples = self._recent(frames)
+        if not samples:
+            return []
+        totals: Dict[str, float] = {}
+        for frame in samples:
+            for scope in frame.scopes:
+                totals[scope.name] = totals.get(scope.name, 0.0) + scope.duration
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        return [(name, total / len(samples)) for name, total in ranked[:limit]]
+
+    def average_counters(self, frames: Optional[int] = None) -> Dict[str, float]:
+        """
+        Return the average value of every counter per frame.
+
+        Args:
+            frames (Optional[int], optional): Number of recent frames to
+                average over. Defaults to all recorded frames.
+
+        Returns:
+            Dict[str, float]: The average of each counter, by name.
+        """
+        samples = self._recent(frames)
+        totals: Dict[str, float] = {}
+        for frame in samples:
+            for name, value in frame.counters.items():
+                totals[name] = totals.get(name, 0) + value
+        return {name: total / len(samples) for name, total in sorted(totals.items())}
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Convert the recorded frames to the Chrome trace-event format.
+
+        Frames and scopes become complete ("X") events and counters become
+        counter ("C") events, with timestamps in microseconds since the
+        first recorded frame.
+
+        Returns:
+            Dict[str, Any]: The trace, ready to be written as JSON.
+        """
+        events: List[Dict[str, Any]] = []
+        if self.frames:
+            origin = self.frames[0].start
+
+            def micros(seconds: float) -> float:
+                return round(seconds * 1e6, 3)
+
+            for frame in self.frames:
+                events.append(
+                    {
+                        "name": "frame",
+                        "cat": "frame",
+                        "ph": "X",
+                        "ts": micros(frame.start - origin),
+                        "dur": micros(frame.duration),
+                        "pid": 1,
+                        "tid": 1,
+                        "args": {"index": frame.index},
+                    }
+                )
+                for scope in frame.scopes:
+                    events.append(
+                        {
+                            "name": scope.name,
+                            "cat": "scope",
+                            "ph": "X",
+                            "ts": micros(scope.start - origin),
+                            "dur": micros(scope.duration),
+                            "pid": 1,
+                            "tid": 1,
+                        }
+                    )
+                if frame.counters:
+                    events.append(
+                        {
+                            "name": "counters",
+                            "ph": "C",
+                            "ts": micros(frame.start - origin),
+                            "pid": 1,
+                            "args": dict(frame.counters),
+                        }
+                    )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, file_path: str) -> None:
+        """
+        Write the recorded frames to a Chrome trace-event JSON file.
+
+        Args:
+            file_path (str): The output file.
+
+        Raises:
+            FileNotFoundError: If the directory for the file does not exist.
+            PermissionError: If the file cannot be written due to permission issues.
+        """
+        with open(file_path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
+# Global profiler instance used by the editor and its renderers
+profiler = FrameProfiler()
@@ -0,0 +1,216 @@
+"""
+Sampling Profiler Module
+
+This module profiles the running editor without outside tools. A background
+thread periodically reads the main thread's stack from
+``sys._current_frames()`` and counts how often each call stack is seen, so
+stalls that only show up in long sessions can be captured in place. Profiles
+are written as collapsed stacks (for flamegraph.pl and similar tools) or in the
+speedscope file format (https://www.speedscope.app).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType
+from typing import Callable, Dict, List, Optional, Tuple
+
+# (function name, file name, first line number)
+FrameKey = Tuple[str, str, int]
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class SamplingProfiler:
+    """
+    Samples the call stack of one thread at a fixed interval.
+
+    Attributes:
+        interval (float): Seconds between samples.
+        thread_id (int): The identifier of the sampled thread.
+        stacks (Counter): Number of samples per stack, as tuples of frame
+            indices from the outermost to the innermost call.
+        frames (List[FrameKey]): The frames the stack indices refer to.
+        sample_count (int): Number of samples taken.
+        elapsed (float): Seconds the profiler has been running.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        """
+        Initialize the sampling profiler.
+
+        Args:
+            interval (float, optional): Seconds between samples. Defaults to 0.005.
+            thread_id (Optional[int], optional): The thread to sample. Defaults
+                to the main thread.
+        """
+        self.interval = interval
+        self.thread_id = (
+            thread_id if thread_id is not None else threading.main_thread().ident
+        )
+        self.stacks: Counter = Counter()
+        self.frames: List[FrameKey] = []
+        self.sample_count = 0
+        self.elapsed = 0.0
+        self._frame_indices: Dict[CodeType, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the profiler is sampling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+        self,
+        duration: Optional[float] = None,
+        on_finished: Optional[Callable[["SamplingProfiler"], None]] = None,
+    ) -> None:
+        """
+        Start sampling on a background thread.
+
+        Args:
+            duration (Optional[float], optional): Seconds after which sampling
+                stops by itself. Defaults to sampling until stop() is called.
+            on_finished (Optional[Callable[[SamplingProfiler], None]], optional):
+                Called on the sampling thread when sampling stops.
+
+        Raises:
+            RuntimeError: If the profiler is already running.
+        """
+        if self.is_running:
+            raise RuntimeError("The sampling profiler is already running.")
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop,
+            args=(duration, on_finished),
+            name="SamplingProfiler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampling thread to finish."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def _sample_loop(
+        self,
+        duration: Optional[float],
+        on_finished: Optional[Callable[["SamplingProfiler"], None]],
+    ) -> None:
+        started = time.perf_counter()
+        deadline = started + duration if duration is not None else None
+        next_sample = started
+        while not self._stop_event.is_set():
+            self.sample()
+            now = time.perf_counter()
+            if deadline is not None and now >= deadline:
+                break
+            # Keep a steady rate even when taking a sample is slow
+            next_sample = max(next_sample + self.interval, now)
+            self._stop_event.wait(next_sample - now)
+        self.elapsed += time.perf_counter() - started
+        if on_finished is not None:
+            on_finished(self)
+
+    def sample(self) -> None:
+        """Record the current stack of the sampled thread once."""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        indices = self._frame_indices
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            index = indices.get(code)
+            if index is None:
+                index = indices[code] = len(self.frames)
+                self.frames.append(
+                    (code.co_name, code.co_filename, code.co_firstlineno)
+                )
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()
+        self.stacks[tuple(stack)] += 1
+        self.sample_count += 1
+
+    def _label(self, index: int) -> str:
+        name, file_name, line = self.frames[index]
+        return f"{name} ({os.path.basename(file_name)}:{line})"
+
+    def to_collapsed(self) -> str:
+        """
+        Return the profile as collapsed stacks.
+
+        Returns:
+            str: One ``outer;inner;leaf count`` line per distinct stack.
+        """
+        labels = [self._label(index) for index in range(len(self.frames))]
+        lines = [
+            ";".join(labels[index] for index in stack) + f" {count}"
+            for stack, count in sorted(self.stacks.items())
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, name: str = "Editor main thread") -> Dict:
+        """
+        Return the profile in the speedscope file format.
+
+        Args:
+            name (str, optional): The profile name shown in speedscope.
+
+        Returns:
+            Dict: The profile, ready to be written as JSON.
+        """
+        stacks = sorted(self.stacks.items())
+        weight = self.elapsed / self.sample_count if self.sample_count else 0.0
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "shared": {
+                "frames": [
+                    {"name": function, "file": file_name, "line": line}
+                    for function, file_name, line in self.frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.elapsed,
+                    "samples": [list(stack) for stack, _ in stacks],
+                    "weights": [count * weight for _, count in stacks],
+                }
+            ],
+            "exporter": "2D Game Editor sampling profiler",
+        }
+
+    def save(self, file_path: str) -> None:
+        """
+        Write the profile to a file.
+
+        Files ending in ``.json`` are written in the speedscope format, all
+        other files as collapsed stacks.
+
+        Args:
+            file_path (str): The output file.
+
+        Raises:
+            FileNotFoundError: If the directory for the file does not exist.
+            PermissionError: If the file cannot be written due to permission issues.
+        """
+        with open(file_path, "w") as file:
+            if file_path.lower().endswith(".json"):
+                json.dump(self.to_speedscope(), file)
+            else:
+                file.write(self.to_collapsed())
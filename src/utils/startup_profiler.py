@@ -0,0 +1,143 @@
+"""
+Startup Profiler Module
+
+This module measures where the editor spends its time before the first frame
+is shown. Every module imported while the profiler is running is timed, in the
+style of ``python -X importtime``, and the report lists the slowest imports
+together with the time to first frame.
+"""
+
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+from typing import Callable, List, Optional
+
+
+class ImportTiming:
+    """
+    The time taken to import one module.
+
+    Attributes:
+        name (str): The module name.
+        self_time (float): Seconds spent executing the module itself.
+        cumulative_time (float): Seconds including the modules it imported.
+        depth (int): How deeply the import was nested.
+    """
+
+    def __init__(self, name: str, self_time: float, cumulative_time: float, depth: int):
+        self.name = name
+        self.self_time = self_time
+        self.cumulative_time = cumulative_time
+        self.depth = depth
+
+
+class StartupProfiler(MetaPathFinder):
+    """
+    Times module imports on the main thread until stopped.
+
+    The profiler sits first on ``sys.meta_path``, lets the regular finders
+    locate each module and wraps the loader's ``exec_module`` with a timer.
+
+    Attributes:
+        started_at (float): The ``time.perf_counter()`` value the profiler was
+            created at.
+        imports (List[ImportTiming]): The imports timed so far, in completion order.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.imports: List[ImportTiming] = []
+        self._nested: List[float] = []
+        self._thread_id = threading.get_ident()
+
+    def start(self) -> None:
+        """Start timing imports."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def stop(self) -> None:
+        """Stop timing imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        """Find a module with the other finders and time its loading."""
+        if threading.get_ident() != self._thread_id:
+            return None
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # Built-in and frozen importers are classes shared by many modules, and
+        # loaders without an instance dict cannot be wrapped
+        attributes = getattr(loader, "__dict__", None)
+        if (
+            attributes is not None
+            and not isinstance(loader, type)
+            and "exec_module" not in attributes
+            and hasattr(loader, "exec_module")
+        ):
+            loader.exec_module = self._timed(loader, loader.exec_module)
+        return spec
+
+    def _timed(self, loader, exec_module: Callable) -> Callable:
+        """Wrap a loader's exec_module so it records an ImportTiming."""
+
+        def timed_exec_module(module) -> None:
+            # Restore the loader so later reloads are not timed twice
+            del loader.exec_module
+            self._nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = self._nested.pop()
+                if self._nested:
+                    self._nested[-1] += elapsed
+                self.imports.append(
+                    ImportTiming(
+                        module.__name__, elapsed - nested, elapsed, len(self._nested)
+                    )
+                )
+
+        return timed_exec_module
+
+    def report(
+        self, time_to_first_frame: Optional[float] = None, limit: int = 20
+    ) -> str:
+        """
+        Format the slowest imports for display.
+
+        Args:
+            time_to_first_frame (Optional[float], optional): Seconds from start
+                to the first frame, included in the report if given.
+            limit (int, optional): Number of imports listed. Defaults to 20.
+
+        Returns:
+            str: The report, one import per line, slowest self time first.
+        """
+        total = sum(timing.self_time for timing in self.imports)
+        lines = [
+            f"Imported {len(self.imports)} modules in {total * 1000:.1f} ms",
+            "   self [ms] | cumulative [ms] | module",
+        ]
+        slowest = sorted(
+            self.imports, key=lambda timing: timing.self_time, reverse=True
+        )
+        for timing in slowest[:limit]:
+            lines.append(
+                f"{timing.self_time * 1000:12.1f}"
+                f" | {timing.cumulative_time * 1000:15.1f}"
+                f" | {'  ' * timing.depth}{timing.name}"
+            )
+        if time_to_first_frame is not None:
+            lines.append(f"Time to first frame: {time_to_first_frame * 1000:.1f} ms")
+        return "\n".join(lines)
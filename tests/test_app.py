@@ -0,0 +1,97 @@
+"""
+Test cases for the app.py module.
+This module tests the startup and shutdown of the App class.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from src.assets.thumbnail_cache import ThumbnailCache
+from src.core.app import App
+from src.editor.panels.assets_browser import AssetsBrowserPanel
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+class TestApp(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.asset_path = os.path.join(self.temp_dir, "grass.png")
+        pygame.image.save(pygame.Surface((8, 8)), self.asset_path)
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_leaving_the_loop_flushes_thumbnails(self):
+        """Test that thumbnails pending a flush are written when run() ends."""
+        app = App()
+        update = app._update
+
+        def update_once():
+            update()
+            for panel in app.editor_window.panels:
+                if isinstance(panel, AssetsBrowserPanel):
+                    panel.thumbnail_cache = ThumbnailCache(self.cache_dir)
+                    panel.thumbnail_cache.generate_and_cache_thumbnail(self.asset_path)
+            app.state["is_running"] = False
+
+        app._update = update_once
+        app.run()
+
+        self.assertIsNone(app.asset_loader)
+        self.assertTrue(ThumbnailCache(self.cache_dir).is_cached(self.asset_path))
+
+    def test_asset_changes_are_polled(self):
+        """Test that the main loop applies the changes the file watcher found."""
+        app = App()
+        app.config.default_assets_path = self.temp_dir
+        # Polled by hand below instead of on the watcher's thread
+        app.config.asset_watch_interval = 60.0
+        app.initialize()
+        events = []
+        app.event_bus.subscribe("asset_changed", events.append)
+        try:
+            pygame.image.save(pygame.Surface((16, 16)), self.asset_path)
+            app.file_watcher.debounce = 0.0
+            app.file_watcher.check(now=1.0)
+            app.file_watcher.check(now=2.0)
+            app._update()
+        finally:
+            app.shutdown()
+
+        self.assertEqual(
+            [event.data for event in events],
+            [{"path": self.asset_path, "change": "modified"}],
+        )
+        self.assertIsNone(app.file_watcher)
+
+    def test_startup_opens_project(self):
+        """Test that the project given at startup has its asset index synced."""
+        project_path = os.path.join(self.temp_dir, "project")
+        app = App(project_path=project_path)
+        app.config.default_assets_path = self.temp_dir
+        app.config.asset_watch_interval = 60.0
+        app.initialize()
+        try:
+            browser = next(
+                panel
+                for panel in app.editor_window.panels
+                if isinstance(panel, AssetsBrowserPanel)
+            )
+            self.assertEqual(app.state["project_path"], project_path)
+            self.assertEqual(browser.assets, [self.asset_path])
+        finally:
+            app.shutdown()
+        self.assertTrue(
+            os.path.exists(os.path.join(project_path, app.config.asset_database_file))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Test cases for the asset_database.py module.
+This module tests incremental syncing, metadata, tags and queries of the
+persistent asset index.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from src.assets.asset_database import AssetDatabase
+from src.assets.content_store import hash_file
+from src.assets.thumbnail_cache import ThumbnailCache
+
+
+def _save_image(path, color, size=(8, 8)):
+    image = pygame.Surface(size)
+    image.fill(color)
+    pygame.image.save(image, path)
+
+
+class TestAssetDatabase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.assets_dir = os.path.join(self.temp_dir, "assets")
+        self.sprites_dir = os.path.join(self.assets_dir, "sprites")
+        os.makedirs(self.sprites_dir)
+        self.hero_path = os.path.join(self.sprites_dir, "hero.png")
+        self.tiles_path = os.path.join(self.assets_dir, "tiles.png")
+        _save_image(self.hero_path, (255, 0, 0), size=(16, 24))
+        _save_image(self.tiles_path, (0, 255, 0), size=(64, 32))
+        self.sound_path = os.path.join(self.assets_dir, "jump.wav")
+        with open(self.sound_path, "wb") as f:
+            f.write(b"RIFF" + bytes(100))
+        self.db_path = os.path.join(self.temp_dir, "project", "assets.db")
+        self.database = AssetDatabase(self.db_path)
+
+    def tearDown(self):
+        self.database.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_sync_indexes_metadata(self):
+        """Test that a first sync records every asset with its metadata."""
+        result = self.database.sync([self.assets_dir])
+        self.assertEqual(
+            sorted(result.added),
+            sorted([self.hero_path, self.tiles_path, self.sound_path]),
+        )
+        record = self.database.get(self.hero_path)
+        self.assertEqual((record.width, record.height), (16, 24))
+        self.assertEqual(record.asset_type, "image")
+        self.assertEqual(record.size, os.path.getsize(self.hero_path))
+        self.assertEqual(record.digest, hash_file(self.hero_path))
+        sound = self.database.get(self.sound_path)
+        self.assertEqual(sound.asset_type, "audio")
+        self.assertIsNone(sound.width)
+
+    def test_sync_is_incremental(self):
+        """Test that unchanged directories are not listed again."""
+        self.database.sync([self.assets_dir])
+        self.database.close()
+
+        self.database = AssetDatabase(self.db_path)
+        result = self.database.sync([self.assets_dir])
+        self.assertEqual(result.directories_listed, 0)
+        self.assertEqual((result.added, result.updated, result.removed), ([], [], []))
+        self.assertEqual(len(self.database), 3)
+
+        new_path = os.path.join(self.sprites_dir, "enemy.png")
+        _save_image(new_path, (0, 0, 255))
+        os.remove(self.tiles_path)
+        result = self.database.sync([self.assets_dir])
+        self.assertEqual(result.directories_listed, 2)
+        self.assertEqual(result.added, [new_path])
+        self.assertEqual(result.removed, [self.tiles_path])
+        self.assertNotIn(self.tiles_path, self.database)
+
+    def test_removed_directory(self):
+        """Test that assets of a deleted directory are removed."""
+        self.database.sync([self.assets_dir])
+        shutil.rmtree(self.sprites_dir)
+        result = self.database.sync([self.assets_dir])
+        self.assertEqual(result.removed, [self.hero_path])
+        self.assertEqual(
+            self.database.paths(), sorted([self.tiles_path, self.sound_path])
+        )
+
+    def test_update_file(self):
+        """Test that a file edited in place is re-indexed and keeps its tags."""
+        self.database.sync([self.assets_dir])
+        self.database.add_tags(self.hero_path, ["player"])
+        _save_image(self.hero_path, (255, 0, 0), size=(32, 32))
+        self.assertTrue(self.database.update_file(self.hero_path))
+        record = self.database.get(self.hero_path)
+        self.assertEqual((record.width, record.height), (32, 32))
+        self.assertEqual(record.tags, ["player"])
+
+        os.remove(self.hero_path)
+        self.assertFalse(self.database.update_file(self.hero_path))
+        self.assertIsNone(self.database.get(self.hero_path))
+
+    def test_find(self):
+        """Test queries by tag, type and size."""
+        self.database.sync([self.assets_dir])
+        self.database.add_tags(self.hero_path, ["player", "character"])
+        self.database.add_tags(self.tiles_path, ["level"])
+        self.database.remove_tags(self.hero_path, ["character"])
+
+        self.assertEqual(
+            [record.path for record in self.database.find(tag="player")],
+            [self.hero_path],
+        )
+        self.assertEqual(self.database.find(tag="character"), [])
+        self.assertEqual(
+            [record.path for record in self.database.find(asset_type="audio")],
+            [self.sound_path],
+        )
+        smallest = min(
+            os.path.getsize(self.hero_path), os.path.getsize(self.tiles_path)
+        )
+        found = self.database.find(asset_type="image", max_size=smallest)
+        self.assertEqual(len(found), 1)
+        self.assertEqual(len(self.database.find(min_size=0)), 3)
+        with self.assertRaises(KeyError):
+            self.database.add_tags("missing.png", ["tag"])
+
+    def test_record_thumbnails(self):
+        """Test that thumbnail locations are stored with the assets."""
+        pygame.init()
+        self.database.sync([self.assets_dir])
+        cache = ThumbnailCache(os.path.join(self.temp_dir, "thumbnails"))
+        cache.generate_and_cache_thumbnail(self.hero_path)
+        self.assertEqual(self.database.record_thumbnails(cache), 1)
+        self.assertEqual(
+            self.database.get(self.hero_path).thumbnail, "sheet_64x64_0.png#0"
+        )
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,8 @@ import os
 import tempfile
 import unittest
 
+import pygame
+
 from src.assets.asset_manager import AssetManager
 
 
@@ -69,5 +71,61 @@ class TestAssetManager(unittest.TestCase):
         self.assertIn("test_asset2", assets)
 
 
+class TestAssetManagerImageCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, f"image_{i}.png")
+            pygame.image.save(pygame.Surface((16, 16)), path)
+            self.paths.append(path)
+        # A single 16x16 image decodes to at most 16 * 16 * 4 bytes
+        self.asset_manager = AssetManager(memory_budget=2 * 16 * 16 * 4)
+
+    def tearDown(self):
+        pygame.quit()
+        for file in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, file))
+        os.rmdir(self.temp_dir)
+
+    def test_images_are_decoded(self):
+        """Test that image assets are decoded into surfaces."""
+        self.asset_manager.load_asset("image", self.paths[0])
+        asset = self.asset_manager.get_asset("image")
+        self.assertIsInstance(asset, pygame.Surface)
+        self.assertEqual(asset.get_size(), (16, 16))
+        self.assertEqual(self.asset_manager.load_image(self.paths[1]).get_width(), 16)
+
+    def test_lru_eviction_and_reload(self):
+        """Test that unreferenced assets are evicted and reloaded on demand."""
+        for i, path in enumerate(self.paths):
+            self.asset_manager.load_asset(f"image_{i}", path)
+        self.assertEqual(self.asset_manager.evictions, 1)
+        self.assertNotIn("image_0", self.asset_manager.assets)
+        self.assertLessEqual(
+            self.asset_manager.memory_used, self.asset_manager.memory_budget
+        )
+
+        self.assertIsNotNone(self.asset_manager.get_asset("image_0"))
+        self.assertEqual(self.asset_manager.misses, 1)
+        self.asset_manager.get_asset("image_0")
+        self.assertEqual(self.asset_manager.hits, 1)
+        self.assertEqual(len(self.asset_manager.list_assets()), 3)
+
+    def test_referenced_assets_are_not_evicted(self):
+        """Test that acquired assets stay in memory until released."""
+        self.asset_manager.load_asset("image_0", self.paths[0])
+        self.asset_manager.acquire("image_0")
+        self.asset_manager.load_asset("image_1", self.paths[1])
+        self.asset_manager.load_asset("image_2", self.paths[2])
+        self.assertIn("image_0", self.asset_manager.assets)
+        self.assertNotIn("image_1", self.asset_manager.assets)
+
+        self.asset_manager.release("image_0")
+        with self.assertRaises(ValueError):
+            self.asset_manager.release("image_0")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+"""
+Test cases for the asset_scanner.py module.
+This module tests background directory scanning and the sorted AssetIndex.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from src.assets.asset_scanner import AssetIndex, AssetScanner, iter_asset_files
+
+
+class TestAssetIndex(unittest.TestCase):
+    def test_sorted_and_deduplicated(self):
+        """Test that paths are kept sorted and added only once."""
+        index = AssetIndex(["b/tree.png", "a/rock.png"])
+        self.assertEqual(index.add_many(["c/Grass.png", "a/rock.png"]), 1)
+        self.assertEqual(index.paths, ["a/rock.png", "b/tree.png", "c/Grass.png"])
+        self.assertIn("b/tree.png", index)
+        self.assertTrue(index.remove("b/tree.png"))
+        self.assertFalse(index.remove("b/tree.png"))
+        self.assertEqual(len(index), 2)
+
+    def test_batches_merged_in_order(self):
+        """Test that batches interleaving with indexed paths stay sorted."""
+        index = AssetIndex(["b.png", "d.png", "f.png"])
+        self.assertEqual(index.add_many(["g.png", "a.png", "e.png", "c.png"]), 4)
+        expected = ["a.png", "b.png", "c.png", "d.png", "e.png", "f.png", "g.png"]
+        self.assertEqual(index.paths, expected)
+        self.assertEqual(index.search("E"), ["e.png"])
+        self.assertTrue(index.remove("c.png"))
+        self.assertEqual(index.search("png"), [p for p in expected if p != "c.png"])
+
+    def test_search(self):
+        """Test case-insensitive search on file names."""
+        index = AssetIndex(["grass/dirt.png", "tiles/Grass_1.png", "tiles/grass_2.png"])
+        self.assertEqual(
+            index.search("GRASS"), ["tiles/Grass_1.png", "tiles/grass_2.png"]
+        )
+        self.assertEqual(len(index.search("")), 3)
+
+
+class TestAssetScanner(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, "sprites", "enemies"))
+        for relative in [
+            "a.png",
+            "notes.txt",
+            "sprites/b.PNG",
+            "sprites/enemies/c.jpg",
+        ]:
+            with open(os.path.join(self.temp_dir, relative), "wb") as f:
+                f.write(b"")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_scan_streams_matching_files(self):
+        """Test that nested image files are found and other files ignored."""
+        scanner = AssetScanner([self.temp_dir], batch_size=1)
+        scanner.start()
+        found = []
+        deadline = time.time() + 5.0
+        while not scanner.finished and time.time() < deadline:
+            found.extend(scanner.drain())
+            time.sleep(0.001)
+        names = sorted(os.path.basename(path) for path in found)
+        self.assertEqual(names, ["a.png", "b.PNG", "c.jpg"])
+        self.assertEqual(scanner.files_found, 3)
+
+    def test_iter_asset_files_without_descending(self):
+        """Test that subdirectories can be collected instead of walked."""
+        subdirectories = []
+        entries = iter_asset_files([self.temp_dir], {".png"}, subdirectories)
+        self.assertEqual([entry.name for entry in entries], ["a.png"])
+        self.assertEqual(subdirectories, [os.path.join(self.temp_dir, "sprites")])
+        missing = os.path.join(self.temp_dir, "missing")
+        self.assertEqual(list(iter_asset_files([missing], {".png"})), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Test cases for the async_loader.py module.
+This module tests background decoding and main-thread finalization of the
+AsyncLoader class.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import pygame
+
+from src.assets.asset_manager import AssetManager
+from src.assets.async_loader import AsyncLoader
+from src.assets.sprite_loader import SpriteLoader
+
+
+class TestAsyncLoader(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_path = os.path.join(self.temp_dir, "image.png")
+        image = pygame.Surface((12, 8), pygame.SRCALPHA)
+        image.fill((0, 255, 0, 255))
+        pygame.image.save(image, self.image_path)
+        self.loader = AsyncLoader(max_workers=2)
+
+    def tearDown(self):
+        self.loader.shutdown()
+        pygame.quit()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_placeholder_until_finalized(self):
+        """Test that a handle holds the placeholder until finalized."""
+        handle = self.loader.load(self.image_path)
+        self.assertIs(handle.surface, self.loader.placeholder)
+        self.assertFalse(handle.done)
+
+        self.loader.wait(timeout=5.0)
+        self.assertTrue(handle.done)
+        self.assertIsNone(handle.error)
+        self.assertEqual(handle.surface.get_size(), (12, 8))
+        self.assertEqual(handle.surface.get_at((0, 0)), (0, 255, 0, 255))
+        self.assertEqual(self.loader.pending, 0)
+
+    def test_decode_error_reported(self):
+        """Test that decode failures are reported on the handle."""
+        bad_path = os.path.join(self.temp_dir, "bad.png")
+        with open(bad_path, "w") as f:
+            f.write("not an image")
+        handle = self.loader.load(bad_path)
+        results = []
+        handle.on_loaded(results.append)
+        self.loader.wait(timeout=5.0)
+        self.assertEqual(results, [handle])
+        self.assertIsNotNone(handle.error)
+        self.assertIs(handle.surface, self.loader.placeholder)
+
+    def test_shutdown_cancels_queued_loads(self):
+        """Test that shutdown cancels loads that have not started."""
+        loader = AsyncLoader(max_workers=1)
+        release = threading.Event()
+        loader._executor.submit(release.wait, 5.0)
+        for _ in range(3):
+            loader.load(self.image_path)
+        loader.shutdown()
+        release.set()
+        self.assertEqual(loader.pending, 0)
+
+    def test_sprite_loader_and_asset_manager(self):
+        """Test that async loads replace placeholders in the loaders."""
+        sprites = SpriteLoader()
+        assets = AssetManager()
+        sprites.load_sprite_async(self.image_path, "sprite", self.loader)
+        assets.load_asset_async("asset", self.image_path, self.loader)
+        self.assertIs(sprites.get_sprite("sprite"), self.loader.placeholder)
+        self.assertIs(assets.get_asset("asset"), self.loader.placeholder)
+
+        self.loader.wait(timeout=5.0)
+        self.assertEqual(sprites.get_sprite("sprite").get_size(), (12, 8))
+        self.assertEqual(assets.get_asset("asset").get_size(), (12, 8))
+        self.assertGreater(assets.memory_used, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Test cases for the benchmark suite.
+This module tests case timing, result files and baseline comparison.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks.harness import (
+    Case,
+    compare,
+    load_results,
+    make_results,
+    save_results,
+    time_case,
+)
+from benchmarks.run import run
+
+
+class TestBenchmarks(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_time_case(self):
+        """Test that every timed run gets a fresh setup and a teardown."""
+        calls = []
+        case = Case(
+            "counting",
+            lambda params: calls.append("setup") or params["n"],
+            lambda n: calls.append(f"run {n}"),
+            lambda n: calls.append("teardown"),
+        )
+        timing = time_case(case, {"n": 3}, repeat=2)
+        self.assertEqual(calls, ["setup", "run 3", "teardown"] * 2)
+        self.assertEqual(timing["repeat"], 2)
+        self.assertLessEqual(timing["min"], timing["median"])
+
+    def test_compare_with_baseline(self):
+        """Test that only slowdowns beyond the threshold are regressions."""
+        params = {"n": 1}
+        baseline = make_results(
+            {"a": {"median": 1.0}, "b": {"median": 1.0}, "old": {"median": 1.0}},
+            "small",
+            params,
+        )
+        results = make_results(
+            {"a": {"median": 1.1}, "b": {"median": 1.5}, "new": {"median": 1.0}},
+            "small",
+            params,
+        )
+        path = os.path.join(self.temp_dir, "baseline.json")
+        save_results(baseline, path)
+        comparisons = compare(results, load_results(path), threshold=0.2)
+        self.assertEqual(
+            [(c.name, c.regressed) for c in comparisons], [("a", False), ("b", True)]
+        )
+        self.assertAlmostEqual(comparisons[1].ratio, 1.5)
+
+        with self.assertRaises(ValueError):
+            compare(results, make_results({}, "large", {"n": 2}), threshold=0.2)
+
+    def test_run_filtered(self):
+        """Test running a subset of the suite."""
+        results = run("small", repeat=1, pattern="history.*")
+        self.assertEqual(list(results["results"]), ["history.push_undo"])
+        self.assertEqual(results["size"], "small")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Test cases for the camera.py module.
+This module tests single-point and batch coordinate transforms of the Camera class.
+"""
+
+import unittest
+from array import array
+
+from src.rendering.camera import Camera
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestCameraBatchTransforms(unittest.TestCase):
+    def setUp(self):
+        self.camera = Camera(x=10.0, y=-5.0, zoom=2.0)
+        self.xs = [0.0, 10.0, 25.5, -3.0]
+        self.ys = [0.0, -5.0, 7.25, 100.0]
+
+    def test_apply_transform_batch_matches_single_point(self):
+        """Test that the batch transform matches apply_transform point by point."""
+        out_xs, out_ys = self.camera.apply_transform_batch(self.xs, self.ys)
+        self.assertIsInstance(out_xs, array)
+        for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+            self.assertEqual((out_xs[i], out_ys[i]), self.camera.apply_transform(x, y))
+
+    def test_screen_to_world_batch_matches_single_point(self):
+        """Test that the batch inverse matches screen_to_world point by point."""
+        out_xs, out_ys = self.camera.screen_to_world_batch(self.xs, self.ys)
+        for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+            self.assertEqual((out_xs[i], out_ys[i]), self.camera.screen_to_world(x, y))
+
+    def test_batch_length_mismatch(self):
+        """Test that columns of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            self.camera.apply_transform_batch([1.0, 2.0], [1.0])
+        with self.assertRaises(ValueError):
+            self.camera.screen_to_world_batch([1.0], [])
+
+    def test_hit_test_points(self):
+        """Test hit-testing world points against a screen position."""
+        # World (10, -5) maps to screen (0, 0); world (12, -5) maps to (4, 0)
+        hits = self.camera.hit_test_points(
+            [10.0, 12.0, 50.0], [-5.0, -5.0, 0.0], 0, 0, 5
+        )
+        self.assertEqual(hits, [0, 1])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_batch(self):
+        """Test that NumPy input produces NumPy output with the same values."""
+        out_xs, out_ys = self.camera.apply_transform_batch(
+            np.array(self.xs), np.array(self.ys)
+        )
+        self.assertIsInstance(out_xs, np.ndarray)
+        ref_xs, ref_ys = self.camera.apply_transform_batch(self.xs, self.ys)
+        self.assertEqual(out_xs.tolist(), list(ref_xs))
+        self.assertEqual(out_ys.tolist(), list(ref_ys))
+        hits = self.camera.hit_test_points(
+            np.array([10.0, 50.0]), np.array([-5.0, 0.0]), 0, 0, 1
+        )
+        self.assertEqual(hits, [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
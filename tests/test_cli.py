@@ -0,0 +1,119 @@
+"""
+Test cases for the cli.py module.
+This module tests the headless validate, convert, bake and thumbnails commands.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from src.cli import main, validate_scene
+from src.scene.entity import Entity
+from src.scene.scene import Scene
+from src.scene.scene_serializer import SceneSerializer
+from src.scene.tilemap import Tilemap
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.temp_dir = tempfile.mkdtemp()
+        tileset = pygame.Surface((16, 8))
+        tileset.fill((255, 0, 0), (0, 0, 8, 8))
+        tileset.fill((0, 0, 255), (8, 0, 8, 8))
+        pygame.image.save(tileset, os.path.join(self.temp_dir, "tiles.png"))
+
+        self.scene_paths = []
+        for i in range(3):
+            scene = Scene(f"Level {i}")
+            tilemap = Tilemap(4, 2, 8, 8)
+            tilemap.tileset_paths["default"] = "tiles.png"
+            tilemap.add_tile(0, 0, 0)
+            tilemap.add_tile(3, 1, 1)
+            scene.add_tilemap(tilemap)
+            scene.add_entity(Entity(1, "Player", {"x": 8, "y": 8}))
+            scene_path = os.path.join(self.temp_dir, f"level{i}.json")
+            SceneSerializer.save_to_file(scene, scene_path)
+            self.scene_paths.append(scene_path)
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, *args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = main(list(args))
+        return status, output.getvalue()
+
+    def test_validate(self):
+        """Test that valid scenes pass and broken scenes are reported."""
+        status, output = self._run("validate", *self.scene_paths, "--jobs", "2")
+        self.assertEqual(status, 0)
+        self.assertEqual(output.count("ok  "), 3)
+
+        scene = SceneSerializer.load_from_file(self.scene_paths[0])
+        scene.tilemaps[0].add_tile(9, 9, 0, "missing")
+        scene.add_entity(Entity(1, "Copy", {"x": 0, "y": 0}))
+        SceneSerializer.save_to_file(scene, self.scene_paths[0])
+        problems = validate_scene(self.scene_paths[0])
+        self.assertEqual(len(problems), 3)
+
+        broken_path = os.path.join(self.temp_dir, "broken.json")
+        with open(broken_path, "w") as f:
+            f.write("not json")
+        status, output = self._run("validate", self.scene_paths[0], broken_path)
+        self.assertEqual(status, 1)
+        self.assertIn("2 of 2 failed", output)
+
+    def test_convert_round_trip(self):
+        """Test converting scenes to binary and back to JSON."""
+        output_dir = os.path.join(self.temp_dir, "binary")
+        os.makedirs(output_dir)
+        status, _ = self._run(
+            "convert", *self.scene_paths, "--to", "binary", "--output-dir", output_dir
+        )
+        self.assertEqual(status, 0)
+        binary_path = os.path.join(output_dir, "level1.bin")
+        scene = SceneSerializer.load_from_file(binary_path)
+        self.assertEqual(scene.name, "Level 1")
+        self.assertEqual(scene.tilemaps[0].get_tile(3, 1).tile_id, 1)
+
+        status, _ = self._run("convert", binary_path, "--to", "json")
+        self.assertEqual(status, 0)
+        with open(self.scene_paths[1]) as original:
+            with open(os.path.join(output_dir, "level1.json")) as converted:
+                self.assertEqual(original.read(), converted.read())
+
+    def test_bake(self):
+        """Test that tilemaps are rendered to PNG files."""
+        output_dir = os.path.join(self.temp_dir, "baked")
+        os.makedirs(output_dir)
+        status, _ = self._run(
+            "bake", *self.scene_paths, "--output-dir", output_dir, "-j", "2"
+        )
+        self.assertEqual(status, 0)
+        image = pygame.image.load(os.path.join(output_dir, "level2_tilemap0.png"))
+        self.assertEqual(image.get_size(), (32, 16))
+        self.assertEqual(image.get_at((0, 0))[:3], (255, 0, 0))
+        self.assertEqual(image.get_at((31, 15))[:3], (0, 0, 255))
+        self.assertEqual(image.get_at((16, 0)).a, 0)
+
+    def test_thumbnails(self):
+        """Test that thumbnails of the scene tilesets are regenerated."""
+        cache_dir = os.path.join(self.temp_dir, "thumbnails")
+        status, output = self._run(
+            "thumbnails", *self.scene_paths, "--cache-dir", cache_dir
+        )
+        self.assertEqual(status, 0)
+        self.assertIn("1 thumbnails regenerated", output)
+        self.assertTrue(os.path.exists(os.path.join(cache_dir, "index.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
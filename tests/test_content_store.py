@@ -0,0 +1,120 @@
+"""
+Test cases for the content_store.py module.
+This module tests content hashing, duplicate detection and sharing of decoded
+surfaces and thumbnails between identical files.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from src.assets.asset_manager import AssetManager
+from src.assets.content_store import ContentStore, hash_file
+from src.assets.sprite_loader import SpriteLoader
+from src.assets.thumbnail_cache import ThumbnailCache
+
+
+def _save_image(path, color, size=(8, 8)):
+    image = pygame.Surface(size)
+    image.fill(color)
+    pygame.image.save(image, path)
+
+
+class TestContentStore(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.temp_dir = tempfile.mkdtemp()
+        self.red_path = os.path.join(self.temp_dir, "red.png")
+        self.copy_path = os.path.join(self.temp_dir, "sub", "red_copy.png")
+        self.blue_path = os.path.join(self.temp_dir, "blue.png")
+        os.makedirs(os.path.dirname(self.copy_path))
+        _save_image(self.red_path, (255, 0, 0))
+        shutil.copyfile(self.red_path, self.copy_path)
+        _save_image(self.blue_path, (0, 0, 255))
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_identical_files_have_same_digest(self):
+        """Test that digests depend on contents only."""
+        store = ContentStore()
+        self.assertEqual(store.digest(self.red_path), store.digest(self.copy_path))
+        self.assertNotEqual(store.digest(self.red_path), store.digest(self.blue_path))
+        self.assertEqual(store.digest(self.red_path), hash_file(self.red_path))
+
+    def test_hash_cache_persisted(self):
+        """Test that saved hashes are reused while files are unchanged."""
+        cache_path = os.path.join(self.temp_dir, "hashes.json")
+        store = ContentStore(cache_path)
+        digests = store.hash_many([self.red_path, self.blue_path, "missing.png"])
+        self.assertEqual(set(digests), {self.red_path, self.blue_path})
+        store.save()
+
+        reloaded = ContentStore(cache_path)
+        self.assertEqual(reloaded.hashes[self.red_path][2], digests[self.red_path])
+
+        _save_image(self.red_path, (0, 255, 0), size=(16, 16))
+        self.assertNotEqual(reloaded.digest(self.red_path), digests[self.red_path])
+
+    def test_find_duplicates(self):
+        """Test that the report groups copies and totals the wasted bytes."""
+        store = ContentStore()
+        report = store.find_duplicates([self.red_path, self.copy_path, self.blue_path])
+        self.assertEqual(len(report.groups), 1)
+        group = report.groups[0]
+        self.assertEqual(group.paths, sorted([self.red_path, self.copy_path]))
+        self.assertEqual(report.wasted_bytes, os.path.getsize(self.red_path))
+        self.assertIn("2 copies", report.as_text())
+
+    def test_loaders_share_surfaces(self):
+        """Test that identical files are decoded into a single surface."""
+        store = ContentStore()
+        loader = SpriteLoader(content_store=store)
+        for name, path in (
+            ("red", self.red_path),
+            ("copy", self.copy_path),
+            ("blue", self.blue_path),
+        ):
+            self.assertTrue(loader.load_sprite(path, name))
+        red = loader.sprites["red"]
+        self.assertIs(loader.sprites["copy"], red)
+        self.assertIsNot(loader.sprites["blue"], red)
+
+        manager = AssetManager(content_store=store)
+        manager.load_asset("red", self.red_path)
+        manager.load_asset("copy", self.copy_path)
+        self.assertIs(manager.get_asset("copy"), red)
+        # The shared surface only counts once against the memory budget
+        self.assertEqual(manager.memory_used, 8 * 8 * red.get_bytesize())
+
+    def test_thumbnails_shared(self):
+        """Test that identical files share one thumbnail cell."""
+        cache = ThumbnailCache(
+            os.path.join(self.temp_dir, "thumbnails"), content_store=ContentStore()
+        )
+        red = cache.generate_and_cache_thumbnail(self.red_path)
+        self.assertIs(cache.generate_and_cache_thumbnail(self.copy_path), red)
+        cache.generate_thumbnails([self.blue_path], use_processes=False)
+        regions = [
+            cache.get_thumbnail_region(path)
+            for path in (self.red_path, self.copy_path, self.blue_path)
+        ]
+        self.assertEqual(regions[0][1], regions[1][1])
+        self.assertNotEqual(regions[0][1], regions[2][1])
+
+        # Editing one copy gives it its own cell and leaves the other intact
+        _save_image(self.copy_path, (0, 255, 0), size=(16, 16))
+        cache.generate_and_cache_thumbnail(self.copy_path)
+        red_rect = cache.get_thumbnail_region(self.red_path)[1]
+        copy_region = cache.get_thumbnail_region(self.copy_path)
+        self.assertNotEqual(copy_region[1], red_rect)
+        self.assertEqual(cache.get_thumbnail(self.red_path).get_at((0, 0)).r, 255)
+
+
+if __name__ == "__main__":
+    unittest.main()
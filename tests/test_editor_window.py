@@ -0,0 +1,117 @@
+"""
+Test cases for the editor_window.py module.
+This module tests routing of input events to the panels.
+"""
+
+import unittest
+
+import pygame
+
+from src.core.events import EventBus
+from src.editor.editor_window import EditorWindow
+
+
+class RecordingPanel:
+    def __init__(self, rect=None):
+        self.rect = rect
+        self.events = []
+
+    def handle_event(self, event):
+        self.events.append(event.type)
+
+
+class RectPanel(RecordingPanel):
+    def get_rect(self):
+        return pygame.Rect(self.rect)
+
+
+class TestEditorWindowRouting(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.window = EditorWindow(pygame.Surface((800, 600)), EventBus())
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _use_panels(self, *panels):
+        self.window.panels = list(panels)
+        self.window.rebuild_layout()
+
+    def _pointer(self, event_type, pos, **attributes):
+        self.window._route_event(pygame.event.Event(event_type, pos=pos, **attributes))
+
+    def test_pointer_events_go_to_panel_under_cursor(self):
+        """Test that pointer events reach only the topmost panel under the cursor."""
+        back = RectPanel((0, 0, 300, 400))
+        front = RectPanel((10, 10, 100, 100))
+        stub = RecordingPanel()
+        self._use_panels(back, front, stub)
+
+        self._pointer(pygame.MOUSEBUTTONDOWN, (50, 50), button=1)
+        self._pointer(pygame.MOUSEBUTTONUP, (50, 50), button=1)
+        self._pointer(pygame.MOUSEMOTION, (200, 50), rel=(150, 0), buttons=(0, 0, 0))
+        self._pointer(pygame.MOUSEMOTION, (700, 500), rel=(500, 450), buttons=(0, 0, 0))
+        self.assertEqual(front.events, [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP])
+        self.assertEqual(back.events, [pygame.MOUSEMOTION])
+        self.assertEqual(stub.events, [])
+
+        # Non-pointer events still reach every panel
+        self.window._route_event(pygame.event.Event(pygame.USEREVENT))
+        self.assertEqual(stub.events, [pygame.USEREVENT])
+
+    def test_capture_and_keyboard_focus(self):
+        """Test that a pressed panel keeps the pointer and the keyboard focus."""
+        left = RectPanel((0, 0, 100, 100))
+        right = RectPanel((200, 0, 100, 100))
+        self._use_panels(left, right)
+
+        self._pointer(pygame.MOUSEBUTTONDOWN, (50, 50), button=1)
+        self._pointer(pygame.MOUSEMOTION, (250, 50), rel=(200, 0), buttons=(1, 0, 0))
+        self._pointer(pygame.MOUSEBUTTONUP, (250, 50), button=1)
+        self._pointer(pygame.MOUSEMOTION, (251, 50), rel=(1, 0), buttons=(0, 0, 0))
+        self.assertEqual(
+            left.events,
+            [pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP],
+        )
+        self.assertEqual(right.events, [pygame.MOUSEMOTION])
+
+        self.window._route_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        self.assertEqual(left.events[-1], pygame.KEYDOWN)
+        self.assertNotIn(pygame.KEYDOWN, right.events)
+
+    def test_pointer_leave(self):
+        """Test that a panel is told when the pointer leaves it."""
+        left = RectPanel((0, 0, 100, 100))
+        left.left = 0
+        left.on_pointer_leave = lambda: setattr(left, "left", left.left + 1)
+        self._use_panels(left)
+        self._pointer(pygame.MOUSEMOTION, (50, 50), rel=(0, 0), buttons=(0, 0, 0))
+        self._pointer(pygame.MOUSEMOTION, (60, 50), rel=(10, 0), buttons=(0, 0, 0))
+        self.assertEqual(left.left, 0)
+        self._pointer(pygame.MOUSEMOTION, (150, 50), rel=(90, 0), buttons=(0, 0, 0))
+        self.assertEqual(left.left, 1)
+
+    def test_click_selects_tile_and_tool(self):
+        """Test that clicks on the real panels select the item under the cursor."""
+        palette = next(
+            p for p in self.window.panels if type(p).__name__ == "TilePalettePanel"
+        )
+        toolbar = next(
+            p for p in self.window.panels if type(p).__name__ == "ToolbarPanel"
+        )
+        tiles = [pygame.Surface((32, 32)) for _ in range(10)]
+        for tile in tiles:
+            palette.add_tile(tile)
+
+        # Second row, second column of the 5-column palette
+        self._pointer(pygame.MOUSEBUTTONDOWN, (20 + 32 + 5, 50 + 32 + 5), button=1)
+        self.assertIs(palette.selected_tile, tiles[6])
+
+        # Third tool button
+        self._pointer(pygame.MOUSEBUTTONUP, (0, 0), button=1)
+        self._pointer(pygame.MOUSEBUTTONDOWN, (20 + 2 * 60 + 5, 365), button=1)
+        self.assertIs(toolbar.active_tool, toolbar.tools[2]["tool"])
+
+
+if __name__ == "__main__":
+    unittest.main()
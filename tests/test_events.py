@@ -0,0 +1,128 @@
+"""
+Test cases for the events.py module and editor event coalescing.
+This module tests listener priorities, unsubscribing and queued dispatch.
+"""
+
+import unittest
+
+import pygame
+
+from src.core.events import Event, EventBus
+from src.editor.editor_window import coalesce_events
+from src.rendering.camera import Camera
+
+
+class TestEventBus(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+        self.calls = []
+
+    def _listener(self, name, consume=False):
+        def listener(event):
+            self.calls.append((name, event.data))
+            return consume
+
+        return listener
+
+    def test_priorities_and_consuming(self):
+        """Test that listeners run by priority and can stop propagation."""
+        self.bus.subscribe("click", self._listener("low"), priority=-1)
+        self.bus.subscribe("click", self._listener("first"))
+        self.bus.subscribe("click", self._listener("high"), priority=5)
+        self.bus.subscribe("click", self._listener("second"))
+        self.bus.publish(Event("click", 1))
+        self.assertEqual(
+            [name for name, _ in self.calls], ["high", "first", "second", "low"]
+        )
+
+        self.calls.clear()
+        self.bus.subscribe("click", self._listener("modal", consume=True), 10)
+        self.bus.publish(Event("click", 2))
+        self.assertEqual(self.calls, [("modal", 2)])
+
+    def test_unsubscribe(self):
+        """Test that unsubscribed listeners are no longer called."""
+        first = self.bus.subscribe("click", self._listener("first"))
+        second = self.bus.subscribe("click", lambda event: second.unsubscribe())
+        self.bus.subscribe("click", self._listener("third"))
+        self.bus.publish(Event("click"))
+        first.unsubscribe()
+        first.unsubscribe()
+        self.bus.publish(Event("click"))
+        self.assertEqual([name for name, _ in self.calls], ["first", "third", "third"])
+        self.assertEqual(len(self.bus.listeners["click"]), 1)
+
+    def test_queued_dispatch_and_coalescing(self):
+        """Test that queued events are delivered once per frame, coalesced."""
+        for name in ("mouse_motion", "click"):
+            self.bus.subscribe(name, self._listener(name))
+        self.bus.post(Event("mouse_motion", 1))
+        self.bus.post(Event("click", "a"))
+        for position in range(2, 50):
+            self.bus.post(Event("mouse_motion", position))
+        self.bus.post(Event("click", "b"))
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.bus.pending_count, 3)
+
+        self.assertEqual(self.bus.dispatch_queued(), 3)
+        self.assertEqual(
+            self.calls, [("click", "a"), ("mouse_motion", 49), ("click", "b")]
+        )
+        self.assertEqual(self.bus.dispatch_queued(), 0)
+
+    def test_events_posted_during_dispatch_wait(self):
+        """Test that events posted by listeners are dispatched next frame."""
+        self.bus.subscribe("ping", lambda event: self.bus.post(Event("pong")))
+        self.bus.subscribe("pong", self._listener("pong"))
+        self.bus.post(Event("ping"))
+        self.bus.dispatch_queued()
+        self.assertEqual(self.calls, [])
+        self.bus.dispatch_queued()
+        self.assertEqual(self.calls, [("pong", None)])
+
+    def test_camera_changes_coalesce(self):
+        """Test that camera moves produce one camera_changed per frame."""
+        self.bus.subscribe("camera_changed", self._listener("camera"))
+        camera = Camera(event_bus=self.bus)
+        for _ in range(10):
+            camera.translate(1, 0)
+        camera.set_zoom(2.0)
+        self.bus.dispatch_queued()
+        self.assertEqual(self.calls, [("camera", {"x": 10, "y": 0, "zoom": 2.0})])
+
+
+class TestCoalesceEvents(unittest.TestCase):
+    def test_motion_runs_and_resizes(self):
+        """Test that motion runs merge and only the last resize is kept."""
+
+        def motion(x, rel):
+            return pygame.event.Event(
+                pygame.MOUSEMOTION, pos=(x, 0), rel=(rel, 0), buttons=(1, 0, 0)
+            )
+
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(3, 0), button=1)
+        events = [
+            pygame.event.Event(pygame.VIDEORESIZE, size=(100, 100), w=100, h=100),
+            motion(1, 1),
+            motion(2, 1),
+            motion(3, 1),
+            click,
+            motion(5, 2),
+            pygame.event.Event(pygame.VIDEORESIZE, size=(200, 100), w=200, h=100),
+        ]
+        coalesced = coalesce_events(events)
+        self.assertEqual(
+            [event.type for event in coalesced],
+            [
+                pygame.MOUSEMOTION,
+                pygame.MOUSEBUTTONDOWN,
+                pygame.MOUSEMOTION,
+                pygame.VIDEORESIZE,
+            ],
+        )
+        self.assertEqual((coalesced[0].pos, coalesced[0].rel), ((3, 0), (3, 0)))
+        self.assertEqual(coalesced[3].size, (200, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Test cases for the file_watcher.py module.
+This module tests change detection, debouncing and hot-reloading of assets.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import pygame
+
+from src.assets.asset_manager import AssetManager
+from src.assets.file_watcher import AssetReloader, FileWatcher
+from src.assets.sprite_loader import SpriteLoader
+from src.assets.thumbnail_cache import ThumbnailCache
+from src.core.events import EventBus
+from src.scene.tilemap import Tilemap
+
+
+def _save_image(path, color, size=(8, 8)):
+    image = pygame.Surface(size)
+    image.fill(color)
+    pygame.image.save(image, path)
+
+
+class TestFileWatcher(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_path = os.path.join(self.temp_dir, "hero.png")
+        _save_image(self.image_path, (255, 0, 0))
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_poll_detects_changes(self):
+        """Test that created, modified and deleted files are reported."""
+        watcher = FileWatcher([self.temp_dir])
+        self.assertEqual(watcher.poll(), {})
+
+        new_path = os.path.join(self.temp_dir, "new.png")
+        _save_image(new_path, (0, 255, 0))
+        _save_image(self.image_path, (0, 0, 255), size=(16, 16))
+        with open(os.path.join(self.temp_dir, "notes.txt"), "w") as f:
+            f.write("ignored")
+        self.assertEqual(
+            watcher.poll(), {new_path: "created", self.image_path: "modified"}
+        )
+
+        os.remove(new_path)
+        self.assertEqual(watcher.poll(), {new_path: "deleted"})
+
+    def test_changes_are_debounced(self):
+        """Test that a burst of changes is released once it has settled."""
+        watcher = FileWatcher([self.temp_dir], debounce=0.5)
+        new_path = os.path.join(self.temp_dir, "new.png")
+        _save_image(new_path, (0, 255, 0))
+        watcher.check(now=10.0)
+        _save_image(new_path, (0, 0, 255), size=(16, 16))
+        watcher.check(now=10.2)
+        watcher.check(now=10.4)
+        self.assertEqual(watcher.take_changes(), {})
+        watcher.check(now=10.8)
+        # Created and then modified within the burst is still a creation
+        self.assertEqual(watcher.take_changes(), {new_path: "created"})
+
+    def test_reloader_updates_sprites_and_tilesets(self):
+        """Test that only assets loaded from the changed file are reloaded."""
+        pygame.display.set_mode((1, 1))
+        other_path = os.path.join(self.temp_dir, "other.png")
+        _save_image(other_path, (255, 255, 255))
+        sprites = SpriteLoader()
+        sprites.load_sprite(self.image_path, "hero")
+        sprites.load_sprite(other_path, "other")
+        other_sprite = sprites.get_sprite("other")
+        assets = AssetManager()
+        tilemap = Tilemap(4, 4, 8, 8)
+        tilemap.load_tileset("default", self.image_path, assets)
+
+        event_bus = EventBus()
+        events = []
+        event_bus.subscribe("asset_changed", events.append)
+        watcher = FileWatcher([self.temp_dir], debounce=0.0)
+        reloader = AssetReloader(watcher, event_bus, sprites, assets)
+        reloader.watch_tilemap(tilemap)
+
+        _save_image(self.image_path, (0, 0, 255), size=(16, 16))
+        watcher.check(now=1.0)
+        watcher.check(now=2.0)
+        reloader.update()
+
+        self.assertEqual(sprites.get_sprite("hero").get_size(), (16, 16))
+        self.assertIs(sprites.get_sprite("other"), other_sprite)
+        self.assertEqual(tilemap.tilesets["default"].get_at((0, 0))[:3], (0, 0, 255))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(
+            events[0].data, {"path": self.image_path, "change": "modified"}
+        )
+
+    def test_reloader_regenerates_thumbnails_in_background(self):
+        """Test that a changed asset's thumbnail is rendered off the main thread."""
+        thumbnail_cache = ThumbnailCache(os.path.join(self.temp_dir, "cache"))
+        thumbnail_cache.generate_and_cache_thumbnail(self.image_path)
+        watcher = FileWatcher([self.temp_dir], debounce=0.0)
+        reloader = AssetReloader(watcher, EventBus(), thumbnail_cache=thumbnail_cache)
+
+        _save_image(self.image_path, (0, 0, 255), size=(16, 16))
+        watcher.check(now=1.0)
+        watcher.check(now=2.0)
+        reloader.update()
+        self.assertTrue(thumbnail_cache.is_requested(self.image_path))
+
+        deadline = time.perf_counter() + 5.0
+        while thumbnail_cache.pending and time.perf_counter() < deadline:
+            time.sleep(0.001)
+            reloader.update()
+        thumbnail_cache.shutdown()
+
+        thumbnail = thumbnail_cache.get_thumbnail(self.image_path)
+        self.assertEqual(thumbnail.get_at((32, 32))[:3], (0, 0, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Test cases for the frame_profiler.py module and the performance overlay.
+This module tests timing scopes, counters, the ring buffer and trace export.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import pygame
+
+from src.rendering.sprite_batch import SpriteBatch
+from src.ui.perf_overlay import PerformanceOverlay
+from src.utils.frame_profiler import FrameProfiler, profiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = FrameProfiler(history=3, enabled=True)
+
+    def _record_frame(self, sleep=0.0):
+        self.profiler.begin_frame()
+        with self.profiler.scope("render"):
+            with self.profiler.scope("tiles"):
+                time.sleep(sleep)
+                self.profiler.count("blits", 5)
+            self.profiler.count("blits", 2)
+        self.profiler.count("draw_calls")
+        self.profiler.end_frame()
+
+    def test_nested_scopes_and_counters(self):
+        """Test that scopes are nested and counters summed per frame."""
+        self._record_frame(sleep=0.002)
+        frame = self.profiler.frames[-1]
+        scopes = {scope.name: scope for scope in frame.scopes}
+        self.assertEqual((scopes["render"].depth, scopes["tiles"].depth), (0, 1))
+        self.assertGreaterEqual(scopes["tiles"].duration, 0.002)
+        self.assertGreaterEqual(scopes["render"].duration, scopes["tiles"].duration)
+        self.assertGreaterEqual(frame.duration, scopes["render"].duration)
+        self.assertEqual(frame.counters, {"blits": 7, "draw_calls": 1})
+
+        top = self.profiler.top_scopes()
+        self.assertEqual([name for name, _ in top], ["render", "tiles"])
+        self.assertEqual(self.profiler.average_counters()["blits"], 7)
+
+    def test_ring_buffer(self):
+        """Test that only the most recent frames are kept."""
+        for _ in range(5):
+            self._record_frame()
+        self.assertEqual([frame.index for frame in self.profiler.frames], [2, 3, 4])
+
+    def test_disabled(self):
+        """Test that nothing is recorded while the profiler is disabled."""
+        self.profiler.enabled = False
+        self._record_frame()
+        self.assertEqual(len(self.profiler.frames), 0)
+
+    def test_chrome_trace_export(self):
+        """Test that frames, scopes and counters are exported as trace events."""
+        self._record_frame()
+        self._record_frame()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "trace.json")
+            self.profiler.export_chrome_trace(path)
+            with open(path) as f:
+                trace = json.load(f)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        events = trace["traceEvents"]
+        self.assertEqual(
+            [e["name"] for e in events if e["ph"] == "X"].count("frame"), 2
+        )
+        self.assertEqual(events[0]["ts"], 0)
+        tiles = next(e for e in events if e["name"] == "tiles")
+        self.assertGreaterEqual(tiles["ts"], 0)
+        counters = [e for e in events if e["ph"] == "C"]
+        self.assertEqual(counters[0]["args"], {"blits": 7, "draw_calls": 1})
+
+
+class TestPerformanceOverlay(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        profiler.enabled = False
+        profiler.clear()
+        pygame.quit()
+
+    def test_toggle_and_render(self):
+        """Test that the overlay enables the profiler and draws its samples."""
+        overlay = PerformanceOverlay(profiler)
+        overlay.toggle()
+        self.assertTrue(profiler.enabled)
+
+        target = pygame.Surface((64, 64))
+        batch = SpriteBatch()
+        profiler.begin_frame()
+        with profiler.scope("render"):
+            batch.draw(pygame.Surface((8, 8)), (0, 0))
+            batch.flush(target)
+        profiler.end_frame()
+        self.assertEqual(profiler.frames[-1].counters, {"draw_calls": 1, "blits": 1})
+
+        surface = pygame.Surface((400, 300))
+        overlay.render(surface)
+        self.assertNotEqual(surface.get_at((12, 12)), surface.get_at((399, 299)))
+
+        overlay.toggle()
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(len(profiler.frames), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
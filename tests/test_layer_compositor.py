@@ -0,0 +1,143 @@
+"""
+Test cases for the layer_compositor.py module.
+This module tests that cached layer surfaces are only re-rendered when the
+layer content changes, not when its visibility or opacity changes.
+"""
+
+import unittest
+
+import pygame
+
+from src.rendering.layer_compositor import LayerCompositor
+from src.rendering.renderer import Renderer
+from src.scene.layer import Layer
+from src.scene.scene import Scene
+from src.scene.tilemap import Tilemap
+
+
+class TestLayerCompositor(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.target = pygame.Surface((32, 32))
+        self.compositor = LayerCompositor()
+        self.layer = Layer("Test Layer")
+        self.draw_count = 0
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _draw(self, surface):
+        self.draw_count += 1
+        surface.fill((200, 100, 50, 255))
+
+    def test_cached_until_content_key_changes(self):
+        """Test that the layer is only drawn again when its content key changes."""
+        self.compositor.composite(self.target, self.layer, 1, self._draw)
+        self.compositor.composite(self.target, self.layer, 1, self._draw)
+        self.assertEqual(self.draw_count, 1)
+        self.compositor.composite(self.target, self.layer, 2, self._draw)
+        self.assertEqual(self.draw_count, 2)
+
+    def test_opacity_and_visibility_do_not_redraw(self):
+        """Test that opacity and visibility changes reuse the cached surface."""
+        self.compositor.composite(self.target, self.layer, 1, self._draw)
+        self.layer.set_opacity(0.5)
+        self.layer.toggle_visibility()
+        self.compositor.composite(self.target, self.layer, 1, self._draw)
+        self.layer.toggle_visibility()
+        self.target.fill((0, 0, 0))
+        self.compositor.composite(self.target, self.layer, 1, self._draw)
+        self.assertEqual(self.draw_count, 1)
+        # Half of (200, 100, 50) blended over black
+        r, g, b, _ = self.target.get_at((0, 0))
+        self.assertAlmostEqual(r, 100, delta=2)
+        self.assertAlmostEqual(g, 50, delta=2)
+        self.assertAlmostEqual(b, 25, delta=2)
+
+    def test_hidden_layer_is_skipped(self):
+        """Test that a hidden layer is neither drawn nor composited."""
+        self.layer.visible = False
+        self.compositor.composite(self.target, self.layer, 1, self._draw)
+        self.assertEqual(self.draw_count, 0)
+        self.assertEqual(self.target.get_at((0, 0)), (0, 0, 0, 255))
+
+
+class TestRendererLayerCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.Surface((64, 64))
+        self.renderer = Renderer(self.screen)
+        self.scene = Scene()
+        self.layer = Layer("Ground")
+        self.layer.set_opacity(0.5)
+        self.scene.add_layer(self.layer)
+        self.tilemap = Tilemap(4, 4, 8, 8)
+        tileset = pygame.Surface((8, 8))
+        tileset.fill((255, 255, 255))
+        self.tilemap.set_tileset("default", tileset)
+        self.tilemap.add_tile(0, 0, 0)
+        self.tilemap.layers.append(self.layer)
+        self.scene.add_tilemap(self.tilemap)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_layer_rerendered_only_on_content_change(self):
+        """Test that the renderer reuses layer surfaces across frames."""
+        self.renderer.render_scene(self.scene)
+        self.layer.set_opacity(0.25)
+        self.renderer.render_scene(self.scene)
+        self.assertEqual(self.renderer.compositor.rebuilds, 1)
+
+        self.tilemap.add_tile(1, 0, 0)
+        self.renderer.render_scene(self.scene)
+        self.assertEqual(self.renderer.compositor.rebuilds, 2)
+
+        self.layer.mark_dirty()
+        self.renderer.render_scene(self.scene)
+        self.assertEqual(self.renderer.compositor.rebuilds, 3)
+
+    def test_panning_moves_the_cached_surface(self):
+        """Test that panning within the layer margin only offsets the blit."""
+        self.renderer.layer_margin = 64
+        self.layer.set_opacity(0.999)
+        self.renderer.render_scene(self.scene)
+        self.assertEqual(self.screen.get_at((0, 0))[:3], (255, 255, 255))
+
+        self.renderer.camera.set_position(4, 2)
+        self.screen.fill((0, 0, 0))
+        self.renderer.render_scene(self.scene)
+        self.assertEqual(self.renderer.compositor.rebuilds, 1)
+        # The 8px tile at the origin now ends 4px from the left edge
+        self.assertEqual(self.screen.get_at((3, 5))[:3], (255, 255, 255))
+        self.assertEqual(self.screen.get_at((4, 5))[:3], (0, 0, 0))
+
+        # Crossing into the next margin cell re-renders the layer
+        self.renderer.camera.set_position(70, 0)
+        self.renderer.render_scene(self.scene)
+        self.assertEqual(self.renderer.compositor.rebuilds, 2)
+        self.renderer.camera.set_zoom(2.0)
+        self.renderer.render_scene(self.scene)
+        self.assertEqual(self.renderer.compositor.rebuilds, 3)
+
+    def test_opaque_layers_are_drawn_directly(self):
+        """Test that fully opaque layers bypass the layer surface."""
+        self.layer.set_opacity(1.0)
+        self.renderer.render_scene(self.scene)
+        self.renderer.camera.set_position(3, 0)
+        self.screen.fill((0, 0, 0))
+        self.renderer.render_scene(self.scene)
+        self.assertEqual(self.renderer.compositor.rebuilds, 0)
+        self.assertEqual(self.screen.get_at((4, 0))[:3], (255, 255, 255))
+        self.assertEqual(self.screen.get_at((5, 0))[:3], (0, 0, 0))
+
+    def test_standalone_render_layer_keeps_rebuild_stats(self):
+        """Test that a layer rendered outside a frame reports its rebuild."""
+        self.renderer.render_layer(self.layer, [self.tilemap])
+        self.assertEqual(self.renderer.compositor.rebuilds, 1)
+        # One blit into the layer surface and one of the layer surface itself
+        self.assertEqual(self.renderer.frame_stats.blits, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Test cases for the layout.py module.
+This module tests grid cell lookup and hit-testing of rectangles.
+"""
+
+import unittest
+
+import pygame
+
+from src.ui.layout import GridLayout, HitTestGrid
+
+
+class TestGridLayout(unittest.TestCase):
+    def test_index_at(self):
+        """Test that points map to cells and gaps map to no cell."""
+        layout = GridLayout(10, 20, 30, 30, columns=4, count=10, spacing_x=5)
+        self.assertEqual(layout.index_at(10, 20), 0)
+        self.assertEqual(layout.index_at(39, 49), 0)
+        self.assertIsNone(layout.index_at(42, 20))  # In the gap
+        self.assertEqual(layout.index_at(45, 20), 1)
+        self.assertEqual(layout.index_at(10 + 3 * 35, 20 + 30), 7)
+        self.assertIsNone(layout.index_at(10 + 3 * 35, 20 + 60))  # Past count
+        self.assertIsNone(layout.index_at(10 + 4 * 35, 20))  # Past columns
+        self.assertIsNone(layout.index_at(5, 25))
+
+    def test_cell_rect_round_trip(self):
+        """Test that every cell's rectangle maps back to the cell."""
+        layout = GridLayout(0, 0, 16, 8, columns=7, count=50, spacing_x=2, spacing_y=3)
+        for index in range(50):
+            rect = layout.cell_rect(index)
+            self.assertEqual(layout.index_at(rect.left, rect.top), index)
+            self.assertEqual(layout.index_at(rect.right - 1, rect.bottom - 1), index)
+
+
+class TestHitTestGrid(unittest.TestCase):
+    def test_topmost_rect_wins(self):
+        """Test that later rectangles are on top and misses return None."""
+        grid = HitTestGrid(bucket_size=64)
+        grid.add(pygame.Rect(0, 0, 300, 400), "browser")
+        grid.add(pygame.Rect(10, 10, 200, 300), "palette")
+        grid.add(pygame.Rect(0, 0, 0, 10), "empty")
+        self.assertEqual(len(grid), 2)
+        self.assertEqual(grid.hit_test(50, 50), "palette")
+        self.assertEqual(grid.hit_test(250, 50), "browser")
+        self.assertEqual(grid.hit_test(5, 5), "browser")
+        self.assertIsNone(grid.hit_test(300, 50))
+        self.assertIsNone(grid.hit_test(1000, 1000))
+        grid.clear()
+        self.assertIsNone(grid.hit_test(50, 50))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,28 @@
 """
-Test cases for the TilePalettePanel and ToolbarPanel.
+Test cases for the TilePalettePanel, ToolbarPanel, AssetsBrowserPanel,
+HierarchyPanel and InspectorPanel.
 This module tests the functionality and rendering of the panels.
 """
 
+import os
+import shutil
+import tempfile
+import time
 import unittest
+from unittest import mock
 
 import pygame
 
+from src.assets.thumbnail_cache import ThumbnailCache
+from src.core.events import Event, EventBus
+from src.editor.panels.assets_browser import AssetsBrowserPanel
+from src.editor.panels.hierarchy import HierarchyPanel
+from src.editor.panels.inspector import MIXED, InspectorPanel
 from src.editor.panels.tile_palette import TilePalettePanel
 from src.editor.panels.toolbar import ToolbarPanel
+from src.scene.entity import Entity
+from src.scene.layer import Layer
+from src.scene.scene import Scene
 
 
 class TestTilePalettePanel(unittest.TestCase):
@@ -72,6 +86,70 @@ class TestTilePalettePanel(unittest.TestCase):
         self.panel.handle_event(event)
         # No assertion needed, just ensure no errors occur
 
+    def _add_colored_tiles(self, count):
+        tiles = []
+        for i in range(count):
+            tile = pygame.Surface((32, 32))
+            tile.fill((i % 256, (i // 256) % 256, 100))
+            self.panel.add_tile(tile, f"tile_{i}")
+            tiles.append(tile)
+        return tiles
+
+    def test_large_tileset_renders_visible_pages(self):
+        """Test that only the pages in view are rendered and scrolling works."""
+        tiles = self._add_colored_tiles(5000)
+        self.panel.render(self.screen)
+        self.assertLessEqual(len(self.panel._pages), 2)
+        self.assertEqual(self.screen.get_at((25, 55))[:3], (0, 0, 100))
+
+        # 5 columns of 32px; scroll down by 100 rows
+        self.panel.scroll_to(100 * 32)
+        self.panel.render(self.screen)
+        self.assertEqual(self.screen.get_at((25, 55))[:3], (500 % 256, 1, 100))
+        self.assertLessEqual(self.panel.scroll_offset, self.panel.max_scroll())
+        self.panel.scroll_to(10**9)
+        self.assertEqual(self.panel.scroll_offset, self.panel.max_scroll())
+
+        # Click the second tile of the first visible row
+        self.panel.scroll_to(100 * 32)
+        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(60, 55))
+        self.panel.handle_event(event)
+        self.assertIs(self.panel.selected_tile, tiles[501])
+
+    def test_filter_zoom_and_remove(self):
+        """Test filtering by name, zooming and removing tiles in bulk."""
+        tiles = self._add_colored_tiles(300)
+        self.panel.set_filter("TILE_29")
+        # tile_29 and tile_290 to tile_299
+        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(25, 55))
+        self.panel.handle_event(event)
+        self.assertIs(self.panel.selected_tile, tiles[29])
+        self.panel.handle_event(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(60, 55))
+        )
+        self.assertIs(self.panel.selected_tile, tiles[290])
+        self.assertEqual(self.panel.max_scroll(), 0)
+
+        self.panel.set_zoom(2.0)
+        self.panel.handle_event(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(60, 55))
+        )
+        self.assertIs(self.panel.selected_tile, tiles[29])
+        self.panel.set_zoom(100)
+        self.assertEqual(self.panel.zoom, self.panel.max_zoom)
+
+        for tile in tiles[:150]:
+            self.panel.remove_tile(tile)
+        self.assertIsNone(self.panel.selected_tile)
+        self.assertEqual(len(self.panel.tiles), 150)
+        self.assertIs(self.panel.tiles[0], tiles[150])
+        self.panel.set_filter("")
+        self.panel.set_zoom(1.0)
+        self.panel.handle_event(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(25, 55))
+        )
+        self.assertIs(self.panel.selected_tile, tiles[150])
+
 
 class TestToolbarPanel(unittest.TestCase):
     def setUp(self):
@@ -116,6 +194,311 @@ class TestToolbarPanel(unittest.TestCase):
         self.panel.handle_event(event)
         # No assertion needed, just ensure no errors occur
 
+    def test_button_cache(self):
+        """Test that buttons are pre-rendered once and drawn by state."""
+        self.panel.render(self.screen)
+        surfaces = self.panel._button_surfaces
+        background = self.panel._background
+        self.assertEqual(len(surfaces), 6)
+
+        # Hovering the second button draws its hover surface
+        self.panel.handle_event(
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(85, 365), rel=(0, 0))
+        )
+        self.assertEqual(self.panel.hovered_index, 1)
+        self.panel.render(self.screen)
+        hover = pygame.Color(self.panel.theme.get_color("button_hover"))
+        self.assertEqual(self.screen.get_at((85, 365))[:3], tuple(hover)[:3])
+        self.panel.on_pointer_leave()
+        self.assertIsNone(self.panel.hovered_index)
+
+        # Changing the active tool and rendering again reuses the cache
+        self.panel.set_active_tool("Eraser")
+        self.panel.render(self.screen)
+        primary = pygame.Color(self.panel.theme.get_color("primary"))
+        self.assertEqual(self.screen.get_at((85, 365))[:3], tuple(primary)[:3])
+        self.assertIs(self.panel._button_surfaces[0], surfaces[0])
+        self.assertIs(self.panel._background, background)
+
+        # New tools only render their own buttons
+        self.panel.add_tool("Test Tool", object())
+        self.panel.render(self.screen)
+        self.assertEqual(len(self.panel._button_surfaces), 7)
+        self.assertIs(self.panel._button_surfaces[0], surfaces[0])
+
+        # Theme changes rebuild everything
+        self.panel.theme.set_color("button_bg", "#102030")
+        self.panel.render(self.screen)
+        self.assertIsNot(self.panel._background, background)
+        self.assertEqual(self.screen.get_at((25, 365))[:3], (16, 32, 48))
+
+
+class TestAssetsBrowserPanel(unittest.TestCase):
+    def setUp(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.temp_dir = tempfile.mkdtemp()
+        self.screen = pygame.Surface((800, 600))
+        self.cache = ThumbnailCache(os.path.join(self.temp_dir, "cache"))
+        self.panel = AssetsBrowserPanel(self.cache)
+
+    def tearDown(self):
+        """Clean up the test environment."""
+        self.panel.close()
+        pygame.quit()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_visible_range(self):
+        """Test that only the assets inside the panel are visited."""
+        self.panel.load_assets([f"asset_{i}.png" for i in range(100)])
+        # 300px wide panel with 68px pitch fits 4 columns and parts of 6 rows
+        self.assertEqual(self.panel.visible_range(), range(0, 24))
+        self.panel.scroll_offset = 68 * 10
+        self.assertEqual(self.panel.visible_range(), range(40, 64))
+
+    def test_render_thumbnails_from_sheet(self):
+        """Test that cached thumbnails are drawn from their sheet page."""
+        asset_path = os.path.join(self.temp_dir, "green.png")
+        image = pygame.Surface((32, 32))
+        image.fill((0, 255, 0))
+        pygame.image.save(image, asset_path)
+        self.cache.generate_and_cache_thumbnail(asset_path)
+        self.panel.load_assets([asset_path, "missing.png"])
+        self.panel.render(self.screen)
+        self.assertEqual(self.screen.get_at((32, 32))[:3], (0, 255, 0))
+        self.assertEqual(self.screen.get_at((100, 32))[:3], (80, 80, 80))
+
+    def test_cached_thumbnails_not_stated_every_frame(self):
+        """Test that visible, cached assets are not stat'ed on every update."""
+        paths = []
+        for name in ["grass.png", "rock.png"]:
+            paths.append(os.path.join(self.temp_dir, name))
+            pygame.image.save(pygame.Surface((8, 8)), paths[-1])
+            self.cache.generate_and_cache_thumbnail(paths[-1])
+        self.panel.load_assets(paths)
+
+        with mock.patch("os.stat", wraps=os.stat) as stat:
+            self.panel.update(0.016)
+            self.panel.update(0.016)
+        self.assertEqual(stat.call_count, 0)
+
+    def test_scan_filter_and_lazy_thumbnails(self):
+        """Test scanning a folder, filtering it and generating visible thumbnails."""
+        asset_dir = os.path.join(self.temp_dir, "assets")
+        os.makedirs(asset_dir)
+        for name in ["grass.png", "rock.png"]:
+            pygame.image.save(pygame.Surface((8, 8)), os.path.join(asset_dir, name))
+
+        self.panel.scan([asset_dir])
+        for _ in range(500):
+            self.panel.update(0.016)
+            if self.panel.scanner is None and not self.cache.pending:
+                break
+            time.sleep(0.001)
+        self.assertEqual(len(self.panel.assets), 2)
+        self.assertTrue(self.cache.is_cached(self.panel.assets[0]))
+
+        self.panel.set_filter("ROCK")
+        self.assertEqual(self.panel.assets, [os.path.join(asset_dir, "rock.png")])
+        self.panel.select_asset(os.path.join(asset_dir, "grass.png"))
+        self.assertIsNotNone(self.panel.selected_asset)
+
+
+class TestHierarchyPanel(unittest.TestCase):
+    def setUp(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.screen = pygame.Surface((1280, 720))
+        self.scene = Scene()
+        self.scene.add_layer(Layer("Background"))
+        for i in range(3):
+            self.scene.add_entity(Entity(i, f"Entity {i}", (0, 0)))
+        self.event_bus = EventBus()
+        self.panel = HierarchyPanel(self.scene, self.event_bus)
+
+    def tearDown(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def _click_row(self, row):
+        viewport = self.panel._viewport()
+        pos = (viewport.x + 5, viewport.y + row * self.panel.row_height + 5)
+        self.panel.handle_event(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+        )
+
+    def test_incremental_updates(self):
+        """Test that scene changes update the rows without a rebuild."""
+        entities = self.panel.entities
+        self.assertEqual(len(self.panel.model), 6)
+        entity = Entity(3, "Player", (0, 0))
+        self.scene.add_entity(entity)
+        self.assertIs(self.panel.entities, entities)
+        self.assertEqual(self.panel.model.row_at(6), (entities, entity))
+        # Re-adding an entity already shown leaves its single row in place
+        self.scene.add_entity(entity)
+        self.assertEqual(len(self.panel.model), 7)
+        self.panel.set_scene(self.scene)
+        self.assertEqual(len(self.panel.model), 7)
+        self.scene.entities.remove(entity)
+
+        selected = []
+        self.event_bus.subscribe("entity_selected", selected.append)
+        self._click_row(6)
+        self.assertIs(self.panel.selected_item, entity)
+        self.assertIs(selected[0].data["entity"], entity)
+        self.scene.remove_entity(entity)
+        self.assertIsNone(self.panel.selected_item)
+        self.assertEqual(len(self.panel.model), 6)
+
+        # Clicking a header collapses its group
+        self._click_row(0)
+        self.assertFalse(self.panel.layers.expanded)
+        self.assertEqual(len(self.panel.model), 5)
+
+        self.scene.clear()
+        self.assertEqual(len(self.panel.model), 2)
+        self.panel.set_scene(None)
+        self.scene.add_entity(entity)
+        self.assertEqual(len(self.panel.model), 2)
+
+    def test_large_scene_scrolls_and_filters(self):
+        """Test scrolling and filtering a scene with 100,000 entities."""
+        entities = [Entity(i, f"Entity {i}", (0, 0)) for i in range(100000)]
+        scene = Scene()
+        scene.entities.extend(entities)
+        self.panel.set_scene(scene)
+        self.panel.render(self.screen)
+        # Only the rows in view are rendered
+        visible_rows = self.panel._viewport().height // self.panel.row_height + 1
+        self.assertLessEqual(len(self.panel._labels), visible_rows)
+
+        self.panel.scroll_to(10**9)
+        self.assertEqual(self.panel.scroll_offset, self.panel.max_scroll())
+        # Scrolling up puts the item on the top row, scrolling down at the bottom
+        self.panel.scroll_to_item(self.panel.entities, entities[50000])
+        self.panel.render(self.screen)
+        first_row = self.panel.scroll_offset // self.panel.row_height
+        self.assertIs(self.panel.model.row_at(first_row)[1], entities[50000])
+        self.panel.scroll_to_item(self.panel.entities, entities[50100])
+        bottom = self.panel.scroll_offset + self.panel._viewport().height
+        self.assertEqual(bottom // self.panel.row_height, 50100 + 3)
+
+        for text in "Entity 9999":
+            self.panel.handle_event(pygame.event.Event(pygame.TEXTINPUT, text=text))
+        # Entity 9999 and Entity 99990 to Entity 99999
+        self.assertEqual(len(self.panel.model), 13)
+        self._click_row(2)
+        self.assertIs(self.panel.selected_item, entities[9999])
+        self._click_row(3)
+        self.assertIs(self.panel.selected_item, entities[99990])
+        self.panel.render(self.screen)
+
+        scene.rename_entity(entities[99995], "Hero")
+        self.assertEqual(len(self.panel.model), 12)
+        scene.add_entity(Entity(-1, "Entity 9999 copy", (0, 0)))
+        self.assertEqual(len(self.panel.model), 13)
+
+
+class TestInspectorPanel(unittest.TestCase):
+    def setUp(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.screen = pygame.Surface((1280, 720))
+        self.event_bus = EventBus()
+        self.panel = InspectorPanel(self.event_bus)
+        self.entities = [
+            Entity(i, f"Entity {i}", (0, 0), {"health": 100, "speed": i, "tag": i})
+            for i in range(3)
+        ]
+        del self.entities[2].properties["tag"]
+
+    def tearDown(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def test_aggregates_shared_and_mixed_properties(self):
+        """Test that shared keys are shown, with MIXED where values differ."""
+        self.panel.set_selection(self.entities)
+        self.assertEqual(self.panel.get_properties(), {"health": 100, "speed": MIXED})
+        self.panel.remove_from_selection(self.entities[2])
+        self.assertEqual(
+            self.panel.get_properties(), {"health": 100, "speed": MIXED, "tag": MIXED}
+        )
+        self.panel.set_selection([self.entities[1]])
+        self.assertEqual(
+            self.panel.get_properties(), {"health": 100, "speed": 1, "tag": 1}
+        )
+        # True and 1 compare equal but are different values
+        self.entities[0].properties["speed"] = True
+        self.panel.set_selection(self.entities[:2])
+        self.assertIs(self.panel.get_properties()["speed"], MIXED)
+        self.panel.render(self.screen)
+
+    def test_unrefreshed_change_keeps_counted_values(self):
+        """Test that a key deleted without a refresh does not break the aggregate."""
+        self.panel.set_selection([self.entities[0]])
+        del self.entities[0].properties["health"]
+        self.panel.add_to_selection(self.entities[1])
+        self.assertEqual(
+            self.panel.get_properties(), {"health": 100, "speed": MIXED, "tag": MIXED}
+        )
+        self.panel.refresh_entity(self.entities[0])
+        self.assertEqual(self.panel.get_properties(), {"speed": MIXED, "tag": MIXED})
+
+    def test_batched_edit(self):
+        """Test that an edit is applied to every entity as one event."""
+        events = []
+        self.event_bus.subscribe("entity_properties_changed", events.append)
+        self.panel.set_selection(self.entities)
+        edit = self.panel.set_property("speed", 5)
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0].data["edit"], edit)
+        self.assertEqual([e.properties["speed"] for e in self.entities], [5, 5, 5])
+        self.assertEqual(self.panel.get_properties(), {"health": 100, "speed": 5})
+        self.panel.set_property("tag", [1])
+        self.assertEqual(self.panel.get_properties()["tag"], [1])
+
+        # Reverting elsewhere and publishing the change updates the aggregate
+        edit.revert()
+        self.event_bus.publish(
+            Event("entity_properties_changed", {"entities": edit.entities})
+        )
+        self.assertEqual(
+            self.panel.get_properties(), {"health": 100, "speed": MIXED, "tag": [1]}
+        )
+        self.assertEqual([e.properties["speed"] for e in self.entities], [0, 1, 2])
+
+        self.panel.set_selection([])
+        self.assertEqual(self.panel.set_property("speed", 1).entities, [])
+
+    def test_list_values_are_copied_per_entity(self):
+        """Test that entities edited together do not share a mutable value."""
+        self.entities[0].properties["tags"] = ["old"]
+        self.panel.set_selection(self.entities)
+        value = ["enemy"]
+        edit = self.panel.set_property("tags", value)
+        self.entities[0].properties["tags"].append("boss")
+        self.assertEqual(self.entities[1].properties["tags"], ["enemy"])
+        self.assertEqual(value, ["enemy"])
+
+        edit.revert()
+        self.entities[0].properties["tags"].append("changed")
+        edit.revert()
+        self.assertEqual(self.entities[0].properties["tags"], ["old"])
+        self.assertNotIn("tags", self.entities[1].properties)
+
+    def test_follows_hierarchy_selection(self):
+        """Test that selecting an entity in the hierarchy inspects it."""
+        scene = Scene()
+        for entity in self.entities:
+            scene.add_entity(entity)
+        hierarchy = HierarchyPanel(scene, self.event_bus)
+        hierarchy.select(self.entities[1])
+        self.assertEqual(self.panel.entities, [self.entities[1]])
+        scene.remove_entity(self.entities[1])
+        self.assertEqual(self.panel.entities, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,92 @@
+"""
+Test cases for the sampling_profiler.py module.
+This module tests stack sampling, the output formats and the editor hook.
+"""
+
+import glob
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from src.core.app import App
+from src.core.events import Event
+from src.utils.sampling_profiler import SamplingProfiler
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_samples_main_thread(self):
+        """Test that the busy function shows up in the sampled stacks."""
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        with self.assertRaises(RuntimeError):
+            profiler.start()
+        busy_wait(0.1)
+        profiler.stop()
+        self.assertFalse(profiler.is_running)
+        self.assertGreater(profiler.sample_count, 10)
+
+        collapsed = profiler.to_collapsed()
+        busy_lines = [line for line in collapsed.splitlines() if "busy_wait" in line]
+        self.assertTrue(busy_lines)
+        stack, count = busy_lines[0].rsplit(" ", 1)
+        self.assertTrue(stack.split(";")[-1].startswith("busy_wait"))
+        self.assertGreater(int(count), 0)
+
+        speedscope = profiler.to_speedscope()
+        profile = speedscope["profiles"][0]
+        self.assertEqual(len(profile["samples"]), len(profile["weights"]))
+        self.assertAlmostEqual(sum(profile["weights"]), profiler.elapsed)
+        names = {frame["name"] for frame in speedscope["shared"]["frames"]}
+        self.assertIn("busy_wait", names)
+
+        json_path = os.path.join(self.temp_dir, "profile.speedscope.json")
+        text_path = os.path.join(self.temp_dir, "profile.txt")
+        profiler.save(json_path)
+        profiler.save(text_path)
+        with open(json_path) as f:
+            self.assertEqual(json.load(f)["profiles"][0]["type"], "sampled")
+        with open(text_path) as f:
+            self.assertEqual(f.read(), collapsed)
+
+    def test_duration_and_callback(self):
+        """Test that sampling stops by itself after the duration."""
+        finished = threading.Event()
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start(duration=0.05, on_finished=lambda p: finished.set())
+        busy_wait(0.1)
+        self.assertTrue(finished.wait(1))
+        self.assertFalse(profiler.is_running)
+        self.assertGreaterEqual(profiler.elapsed, 0.05)
+
+    def test_event_bus_toggle(self):
+        """Test that the app writes a profile to the project directory."""
+        app = App()
+        app.state["project_path"] = self.temp_dir
+        app.config.sampling_profile_interval_ms = 1
+        app.event_bus.publish(Event("toggle_sampling_profile", {"duration": 10}))
+        self.assertTrue(app.sampling_profiler.is_running)
+        busy_wait(0.05)
+        app.event_bus.publish(Event("toggle_sampling_profile", {}))
+        self.assertFalse(app.sampling_profiler.is_running)
+        profiles = glob.glob(os.path.join(self.temp_dir, "profile-*.speedscope.json"))
+        self.assertEqual(len(profiles), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from scene.entity import Entity
 from scene.layer import Layer
 from scene.scene import Scene
 from scene.tilemap import Tilemap
@@ -53,6 +54,38 @@ class TestScene(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.scene.get_layer_by_name("Nonexistent Layer")
 
+    def test_listeners(self):
+        changes = []
+
+        def listener(change, item):
+            changes.append((change, item))
+
+        self.scene.add_listener(listener)
+        layer = Layer("Test Layer")
+        entity = Entity(1, "Player", (0, 0))
+        self.scene.add_layer(layer)
+        self.scene.add_entity(entity)
+        self.scene.rename_entity(entity, "Hero")
+        self.scene.remove_entity(entity)
+        self.scene.remove_entity(entity)
+        self.scene.clear_layers()
+        self.scene.clear()
+        self.assertEqual(
+            changes,
+            [
+                ("layer_added", layer),
+                ("entity_added", entity),
+                ("entity_renamed", entity),
+                ("entity_removed", entity),
+                ("layer_removed", layer),
+                ("cleared", None),
+            ],
+        )
+        self.assertEqual(entity.name, "Hero")
+        self.scene.remove_listener(listener)
+        self.scene.add_layer(layer)
+        self.assertEqual(len(changes), 6)
+
 
 class TestLayer(unittest.TestCase):
     def setUp(self):
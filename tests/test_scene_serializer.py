@@ -89,6 +89,42 @@ class TestSceneSerializer(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             self.serializer.load_from_file(invalid_file_path)
 
+    def test_entities_and_tilemaps_round_trip(self):
+        """Test that entities and tilemaps survive JSON and binary files."""
+        self.scene.add_entity(Entity(7, "Player", {"x": 3, "y": 4}, {"hp": 10}))
+        tilemap = Tilemap(10, 5, 16, 8)
+        tilemap.tileset_paths["ground"] = "tiles/ground.png"
+        tilemap.add_tile(2, 3, 5, "ground")
+        tilemap.add_tile(9, 4, 1, "ground")
+        self.scene.add_tilemap(tilemap)
+
+        for file_name in ("scene.json", "scene.bin"):
+            temp_file = os.path.join(self.temp_dir, file_name)
+            self.serializer.save_to_file(self.scene, temp_file)
+            loaded_scene = self.serializer.load_from_file(temp_file)
+            entity = loaded_scene.entities[0]
+            self.assertEqual(
+                (entity.entity_id, entity.position, entity.properties),
+                (7, {"x": 3, "y": 4}, {"hp": 10}),
+            )
+            loaded_tilemap = loaded_scene.tilemaps[0]
+            self.assertEqual(
+                (loaded_tilemap.tile_width, loaded_tilemap.tile_height), (16, 8)
+            )
+            self.assertEqual(
+                loaded_tilemap.tileset_paths, {"ground": "tiles/ground.png"}
+            )
+            self.assertEqual(loaded_tilemap.get_tile(2, 3).tile_id, 5)
+            self.assertEqual(len(loaded_tilemap.tiles), 2)
+
+    def test_load_invalid_binary(self):
+        """Test that corrupted binary scenes raise ValueError."""
+        data = self.serializer.to_binary(self.scene)
+        with self.assertRaises(ValueError):
+            self.serializer.from_binary(data[:-4])
+        with self.assertRaises(ValueError):
+            self.serializer.from_binary(b"XXXX" + data[4:])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+"""
+Test cases for the sprite_batch.py module.
+This module tests command ordering and draw statistics of the SpriteBatch class,
+and batched scene rendering through the Renderer.
+"""
+
+import unittest
+
+import pygame
+
+from src.rendering.renderer import Renderer
+from src.rendering.sprite_batch import SpriteBatch
+from src.scene.layer import Layer
+from src.scene.scene import Scene
+from src.scene.tilemap import Tilemap
+
+
+def _solid(color, size=(8, 8)):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+
+class TestSpriteBatch(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.target = pygame.Surface((64, 64))
+        self.batch = SpriteBatch()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_layers_drawn_in_order(self):
+        """Test that lower layers are drawn first regardless of submission order."""
+        red, green = _solid((255, 0, 0)), _solid((0, 255, 0))
+        self.batch.begin()
+        self.batch.draw(green, (0, 0), layer=1)
+        self.batch.draw(red, (0, 0), layer=0)
+        self.batch.flush(self.target)
+        self.assertEqual(self.target.get_at((1, 1)), (0, 255, 0, 255))
+
+    def test_z_order_within_layer(self):
+        """Test that z order decides overlap within a layer."""
+        red, green = _solid((255, 0, 0)), _solid((0, 255, 0))
+        self.batch.begin()
+        self.batch.draw(red, (0, 0), z=2)
+        self.batch.draw(green, (0, 0), z=1)
+        self.batch.flush(self.target)
+        self.assertEqual(self.target.get_at((1, 1)), (255, 0, 0, 255))
+
+    def test_area_is_respected(self):
+        """Test that only the requested area of the source is drawn."""
+        sprite = _solid((0, 0, 255), (16, 16))
+        self.batch.begin()
+        self.batch.draw(sprite, (0, 0), pygame.Rect(0, 0, 4, 4))
+        self.batch.flush(self.target)
+        self.assertEqual(self.target.get_at((2, 2)), (0, 0, 255, 255))
+        self.assertEqual(self.target.get_at((6, 6)), (0, 0, 0, 255))
+
+    def test_stats(self):
+        """Test that draw calls, blits and texture switches are counted."""
+        red, green = _solid((255, 0, 0)), _solid((0, 255, 0))
+        self.batch.begin()
+        for i in range(4):
+            self.batch.draw(red if i % 2 else green, (i * 8, 0))
+        self.batch.draw(red, (0, 8), layer=1)
+        self.batch.flush(self.target)
+
+        stats = self.batch.stats
+        self.assertEqual(stats.draw_calls, 2)
+        self.assertEqual(stats.blits, 5)
+        # Layer 0 is grouped into two textures, then layer 1 starts with red
+        self.assertLessEqual(stats.texture_switches, 2)
+        self.assertEqual(stats.layer_blits, {0: 4, 1: 1})
+        self.assertEqual(len(self.batch), 0)
+
+        self.batch.begin()
+        self.assertEqual(self.batch.stats.blits, 0)
+
+
+class TestRendererBatching(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.Surface((128, 128))
+        self.renderer = Renderer(self.screen)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_render_scene_batches_tilemap_chunks(self):
+        """Test that a scene's tilemaps are drawn through the sprite batch."""
+        scene = Scene()
+        layer = Layer("Ground")
+        scene.add_layer(layer)
+        tilemap = Tilemap(4, 4, 8, 8)
+        tilemap.set_tileset("default", _solid((10, 20, 30)))
+        tilemap.add_tile(0, 0, 0)
+        tilemap.layers.append(layer)
+        scene.add_tilemap(tilemap)
+
+        self.renderer.render_scene(scene)
+
+        self.assertEqual(self.screen.get_at((1, 1)), (10, 20, 30, 255))
+        # The layer is opaque, so its chunk is blitted straight to the screen
+        self.assertEqual(self.renderer.frame_stats.draw_calls, 1)
+        self.assertEqual(self.renderer.frame_stats.blits, 1)
+
+    def test_draw_sprite_queued_until_end_frame(self):
+        """Test that queued sprites are only drawn when the frame ends."""
+        self.renderer.begin_frame()
+        self.renderer.draw_sprite(_solid((255, 255, 255)), (0, 0))
+        self.assertEqual(self.screen.get_at((1, 1)), (0, 0, 0, 255))
+        stats = self.renderer.end_frame()
+        self.assertEqual(self.screen.get_at((1, 1)), (255, 255, 255, 255))
+        self.assertEqual(stats.blits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
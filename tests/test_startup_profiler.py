@@ -0,0 +1,100 @@
+"""
+Test cases for the startup_profiler.py module and lazy imports.
+This module tests import timing and that heavy modules stay out of startup.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from src.utils.startup_profiler import StartupProfiler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestStartupProfiler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.temp_dir, "profiled_outer.py"), "w") as f:
+            f.write("import profiled_inner\n")
+        with open(os.path.join(self.temp_dir, "profiled_inner.py"), "w") as f:
+            f.write("import time\ntime.sleep(0.01)\n")
+        sys.path.insert(0, self.temp_dir)
+
+    def tearDown(self):
+        sys.path.remove(self.temp_dir)
+        for name in ("profiled_outer", "profiled_inner"):
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_imports_are_timed(self):
+        """Test that nested imports are timed and attributed to their parent."""
+        profiler = StartupProfiler()
+        profiler.start()
+        try:
+            import profiled_outer  # noqa: F401
+        finally:
+            profiler.stop()
+        self.assertNotIn(profiler, sys.meta_path)
+
+        timings = {timing.name: timing for timing in profiler.imports}
+        inner = timings["profiled_inner"]
+        outer = timings["profiled_outer"]
+        self.assertGreaterEqual(inner.self_time, 0.01)
+        self.assertEqual((outer.depth, inner.depth), (0, 1))
+        self.assertGreaterEqual(outer.cumulative_time, inner.cumulative_time)
+        self.assertLess(outer.self_time, inner.self_time)
+
+        report = profiler.report(time_to_first_frame=0.25, limit=1)
+        self.assertIn("profiled_inner", report)
+        self.assertNotIn("profiled_outer", report)
+        self.assertIn("Time to first frame: 250.0 ms", report)
+
+    def test_heavy_modules_load_lazily(self):
+        """Test that importing the app does not load Pillow, Tk or SQLite."""
+        code = (
+            "import sys, src.core.app\n"
+            "print(sorted({'PIL', 'tkinter', 'sqlite3'} & set(sys.modules)))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "[]")
+
+    def test_tools_load_on_first_use(self):
+        """Test that a tool's module is imported when the tool is activated."""
+        code = (
+            "import os, sys, pygame\n"
+            "os.environ['SDL_VIDEODRIVER'] = 'dummy'\n"
+            "pygame.init()\n"
+            "from src.editor.panels.toolbar import ToolbarPanel\n"
+            "toolbar = ToolbarPanel()\n"
+            "toolbar.render(pygame.Surface((800, 600)))\n"
+            "def tools():\n"
+            "    return sorted(m for m in sys.modules if m.startswith('src.tools.'))\n"
+            "print(tools())\n"
+            "toolbar.set_active_tool('Fill')\n"
+            "print(tools())\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        self.assertEqual(
+            output.strip().splitlines()[-2:],
+            ["[]", "['src.tools.base_tool', 'src.tools.fill_tool']"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Test cases for the texture_atlas.py module.
+This module tests packing, lookup and persistence of the TextureAtlas class.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from src.assets.sprite_loader import SpriteLoader
+from src.assets.texture_atlas import SkylinePacker, TextureAtlas
+from src.scene.tilemap import Tilemap
+
+
+def _solid(size, color):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+class TestSkylinePacker(unittest.TestCase):
+    def test_rectangles_do_not_overlap(self):
+        """Test that packed rectangles stay on the page and never overlap."""
+        packer = SkylinePacker(64, 64)
+        sizes = [(30, 20), (20, 30), (16, 16), (40, 10), (10, 10), (8, 24)]
+        rects = []
+        for width, height in sizes:
+            x, y = packer.insert(width, height)
+            rect = pygame.Rect(x, y, width, height)
+            self.assertTrue(pygame.Rect(0, 0, 64, 64).contains(rect))
+            self.assertEqual(rect.collidelist(rects), -1)
+            rects.append(rect)
+
+    def test_full_page(self):
+        """Test that a rectangle that does not fit returns None."""
+        packer = SkylinePacker(32, 32)
+        self.assertEqual(packer.insert(32, 32), (0, 0))
+        self.assertIsNone(packer.insert(1, 1))
+
+
+class TestTextureAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_add_and_lookup(self):
+        """Test that packed images can be looked up by name."""
+        atlas = TextureAtlas(page_size=64)
+        atlas.add_many(
+            {"red": _solid((16, 16), (255, 0, 0)), "blue": _solid((8, 24), (0, 0, 255))}
+        )
+        self.assertEqual(len(atlas.pages), 1)
+        self.assertEqual(atlas.get("red").rect.size, (16, 16))
+        self.assertEqual(atlas.get_surface("blue").get_at((4, 4)), (0, 0, 255, 255))
+        self.assertIsNone(atlas.get("missing"))
+
+    def test_new_page_when_full(self):
+        """Test that a new page is opened when the current ones are full."""
+        atlas = TextureAtlas(page_size=32, padding=0)
+        atlas.add("a", _solid((32, 32), (255, 0, 0)))
+        atlas.add("b", _solid((8, 8), (0, 255, 0)))
+        self.assertEqual(atlas.get("b").page, 1)
+        with self.assertRaises(ValueError):
+            atlas.add("huge", _solid((64, 8), (0, 0, 0)))
+
+    def test_save_load_and_incremental_add(self):
+        """Test that a saved atlas loads back and accepts new images."""
+        atlas = TextureAtlas(page_size=64)
+        atlas.add("red", _solid((16, 16), (255, 0, 0)))
+        atlas.save(self.temp_dir)
+
+        loaded = TextureAtlas.load(self.temp_dir)
+        self.assertEqual(loaded.get("red").rect, atlas.get("red").rect)
+        self.assertEqual(loaded.get_surface("red").get_at((0, 0)), (255, 0, 0, 255))
+        region = loaded.add("green", _solid((16, 16), (0, 255, 0)))
+        self.assertEqual(region.rect.collidelist([loaded.get("red").rect]), -1)
+        self.assertIsNone(TextureAtlas.load(os.path.join(self.temp_dir, "missing")))
+
+    def test_sprite_loader_uses_cached_atlas(self):
+        """Test that unchanged sprites are taken from the saved atlas."""
+        pygame.display.set_mode((1, 1))
+        sprite_path = os.path.join(self.temp_dir, "hero.png")
+        pygame.image.save(_solid((8, 8), (255, 0, 0)), sprite_path)
+        atlas_dir = os.path.join(self.temp_dir, "atlas")
+
+        loader = SpriteLoader()
+        loader.load_sprites({"hero": sprite_path}, atlas_dir)
+        self.assertTrue(os.path.exists(os.path.join(atlas_dir, "atlas.json")))
+        self.assertIsNotNone(loader.get_sprite("hero").get_parent())
+
+        reloaded = SpriteLoader()
+        reloaded.load_sprites({"hero": sprite_path}, atlas_dir)
+        self.assertEqual(reloaded.get_sprite("hero").get_at((0, 0)), (255, 0, 0, 255))
+
+        # A modified source file is repacked instead of taken from the atlas
+        pygame.image.save(_solid((8, 12), (0, 0, 255)), sprite_path)
+        self.assertTrue(reloaded.atlas.is_stale("hero", sprite_path))
+        reloaded = SpriteLoader()
+        reloaded.load_sprites({"hero": sprite_path}, atlas_dir)
+        self.assertEqual(reloaded.get_sprite("hero").get_at((0, 0)), (0, 0, 255, 255))
+
+    def test_tilesets_are_packed_as_subsurfaces(self):
+        """Test that tilesets are drawn from subsurfaces of the atlas pages."""
+        atlas = TextureAtlas(page_size=64)
+        tilemap = Tilemap(2, 1, 8, 8)
+        tilemap.set_tileset("grass", _solid((16, 8), (0, 255, 0)))
+        tilemap.pack_tilesets(atlas)
+        tilemap.set_tileset("water", _solid((16, 8), (0, 0, 255)))
+        tilemap.add_tile(0, 0, 1, "grass")
+        tilemap.add_tile(1, 0, 0, "water")
+
+        for name in ("grass", "water"):
+            self.assertIs(tilemap.tilesets[name].get_parent(), atlas.pages[0])
+        target = pygame.Surface((16, 8), pygame.SRCALPHA)
+        tilemap.render(target, {"x": 0, "y": 0})
+        self.assertEqual(target.get_at((4, 4)), (0, 255, 0, 255))
+        self.assertEqual(target.get_at((12, 4)), (0, 0, 255, 255))
+
+        # Tilesets too large for a page are kept unpacked
+        tilemap.set_tileset("huge", _solid((128, 8), (0, 0, 0)))
+        self.assertIsNone(tilemap.tilesets["huge"].get_parent())
+
+    def test_load_tileset_uses_saved_atlas(self):
+        """Test that an unchanged tileset is taken from the saved atlas."""
+        pygame.display.set_mode((1, 1))
+        tileset_path = os.path.join(self.temp_dir, "grass.png")
+        pygame.image.save(_solid((16, 8), (0, 255, 0)), tileset_path)
+        atlas_dir = os.path.join(self.temp_dir, "atlas")
+
+        class _Assets:
+            loads = 0
+
+            def load_image(self, path):
+                self.loads += 1
+                return pygame.image.load(path)
+
+        assets = _Assets()
+        tilemap = Tilemap(1, 1, 8, 8)
+        tilemap.pack_tilesets(TextureAtlas(page_size=64))
+        tilemap.load_tileset("grass", tileset_path, assets)
+        tilemap.atlas.save(atlas_dir)
+
+        reloaded = Tilemap(1, 1, 8, 8)
+        reloaded.pack_tilesets(TextureAtlas.load(atlas_dir))
+        reloaded.load_tileset("grass", tileset_path, assets)
+        self.assertEqual(assets.loads, 1)
+        self.assertEqual(reloaded.tilesets["grass"].get_at((0, 0)), (0, 255, 0, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
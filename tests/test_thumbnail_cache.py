@@ -35,6 +35,7 @@ class TestThumbnailCache(unittest.TestCase):
             self.test_asset_path
         )
         self.assertIsNotNone(thumbnail)
+        self.thumbnail_cache.flush()
         self.assertTrue(
             os.path.exists(os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0]))
         )
@@ -94,6 +95,168 @@ class TestThumbnailCache(unittest.TestCase):
         end_time = time.time()
         print(f"Time to retrieve 10 thumbnails: {end_time - start_time:.2f} seconds")
 
+    def _make_assets(self, count):
+        from PIL import Image
+
+        paths = []
+        for i in range(count):
+            path = os.path.join(self.temp_dir, f"batch_asset_{i}.png")
+            Image.new("RGB", (100, 50), color=(i * 40, 0, 0)).save(path)
+            paths.append(path)
+        return paths
+
+    def test_generate_thumbnails_batch(self):
+        """Test generating thumbnails for many assets in a thread pool."""
+        paths = self._make_assets(4)
+        missing = os.path.join(self.temp_dir, "missing.png")
+        thumbnails = self.thumbnail_cache.generate_thumbnails(
+            paths + [missing], max_workers=2, use_processes=False
+        )
+        self.assertEqual(set(thumbnails), set(paths))
+        for path in paths:
+            self.assertEqual(thumbnails[path].get_size(), (64, 64))
+            self.assertIsNotNone(self.thumbnail_cache.get_thumbnail(path))
+        self.assertEqual(thumbnails[paths[1]].get_at((32, 32))[:3], (40, 0, 0))
+
+    def test_background_requests(self):
+        """Test that requested thumbnails are installed by process_completed."""
+        paths = self._make_assets(2)
+        missing = os.path.join(self.temp_dir, "missing.png")
+        with self.assertRaises(FileNotFoundError):
+            self.thumbnail_cache.request_thumbnail(missing)
+        corrupt = os.path.join(self.temp_dir, "corrupt.png")
+        with open(corrupt, "w") as f:
+            f.write("not an image")
+        for path in paths + [corrupt]:
+            self.thumbnail_cache.request_thumbnail(path)
+        self.assertTrue(self.thumbnail_cache.is_requested(paths[0]))
+
+        finished = {}
+        deadline = time.perf_counter() + 5.0
+        while self.thumbnail_cache.pending and time.perf_counter() < deadline:
+            finished.update(self.thumbnail_cache.process_completed(time_budget=1.0))
+            time.sleep(0.001)
+        self.thumbnail_cache.shutdown()
+
+        self.assertEqual(set(finished), set(paths + [corrupt]))
+        self.assertIsNotNone(finished[corrupt])
+        thumbnail = self.thumbnail_cache.get_thumbnail(paths[1])
+        self.assertEqual(thumbnail.get_at((32, 32))[:3], (40, 0, 0))
+
+    def test_warm_cache_with_processes(self):
+        """Test warming the cache in a process pool, skipping cached assets."""
+        paths = self._make_assets(3)
+        self.thumbnail_cache.generate_and_cache_thumbnail(paths[0])
+        generated = self.thumbnail_cache.warm_cache(paths, max_workers=2)
+        self.assertEqual(generated, 2)
+        self.assertEqual(self.thumbnail_cache.warm_cache(paths, max_workers=2), 0)
+
+    def test_memory_cache_hit(self):
+        """Test that repeated lookups are served from memory."""
+        self.thumbnail_cache.generate_and_cache_thumbnail(self.test_asset_path)
+        first = self.thumbnail_cache.get_thumbnail(self.test_asset_path)
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".png"):
+                os.remove(os.path.join(self.cache_dir, filename))
+        self.assertIs(self.thumbnail_cache.get_thumbnail(self.test_asset_path), first)
+
+    def test_memory_cache_eviction(self):
+        """Test that the in-memory cache is bounded by item count."""
+        cache = ThumbnailCache(self.cache_dir, max_memory_items=2)
+        for path in self._make_assets(3):
+            cache.generate_and_cache_thumbnail(path)
+        self.assertEqual(len(cache.cache), 2)
+        self.assertEqual(cache.memory_used, 2 * 64 * 64 * 4)
+
+    def test_edited_asset_is_stale(self):
+        """Test that editing the source image invalidates its thumbnail."""
+        from PIL import Image
+
+        self.thumbnail_cache.generate_and_cache_thumbnail(self.test_asset_path)
+        self.assertTrue(self.thumbnail_cache.is_cached(self.test_asset_path))
+        Image.new("RGB", (120, 100), color="blue").save(self.test_asset_path)
+        # The file watcher invalidates the remembered key of a changed file
+        self.thumbnail_cache.invalidate(self.test_asset_path)
+        self.assertFalse(self.thumbnail_cache.is_cached(self.test_asset_path))
+        self.assertIsNone(self.thumbnail_cache.get_thumbnail(self.test_asset_path))
+
+        cell = self.thumbnail_cache.index[self.test_asset_path]["cell"]
+        thumbnail = self.thumbnail_cache.generate_and_cache_thumbnail(
+            self.test_asset_path
+        )
+        # The outdated thumbnail's cell was reused, not kept alongside
+        self.assertEqual(self.thumbnail_cache.index[self.test_asset_path]["cell"], cell)
+        self.assertEqual(thumbnail.get_at((32, 32))[:3], (0, 0, 255))
+
+    def test_lookups_reuse_key_until_invalidated(self):
+        """Test that lookups skip checking the file until its key is invalidated."""
+        from PIL import Image
+
+        thumbnail = self.thumbnail_cache.generate_and_cache_thumbnail(
+            self.test_asset_path
+        )
+        Image.new("RGB", (120, 100), color="blue").save(self.test_asset_path)
+        # Within the key TTL the remembered key is trusted
+        self.assertIs(
+            self.thumbnail_cache.get_thumbnail(self.test_asset_path), thumbnail
+        )
+        self.thumbnail_cache.invalidate(self.test_asset_path)
+        self.assertIsNone(self.thumbnail_cache.get_thumbnail(self.test_asset_path))
+
+    def test_thumbnails_share_sheet_pages(self):
+        """Test that thumbnails are packed into a few sheet page files."""
+        cache = ThumbnailCache(self.cache_dir, page_size=128)
+        paths = self._make_assets(5)
+        cache.generate_thumbnails(paths, max_workers=2, use_processes=False)
+        # 128x128 pages hold four 64x64 cells each
+        pages = [f for f in os.listdir(self.cache_dir) if f.endswith(".png")]
+        self.assertEqual(len(pages), 2)
+
+        page, rect = cache.get_thumbnail_region(paths[4])
+        self.assertEqual(rect.size, (64, 64))
+        self.assertEqual(page.get_at(rect.center)[:3], (160, 0, 0))
+        first_page, _ = cache.get_thumbnail_region(paths[0])
+        self.assertIs(cache.get_thumbnail_region(paths[1])[0], first_page)
+
+    def test_index_persisted(self):
+        """Test that a new cache instance finds thumbnails through the index."""
+        self.thumbnail_cache.generate_and_cache_thumbnail(self.test_asset_path)
+        self.thumbnail_cache.flush()
+        reopened = ThumbnailCache(self.cache_dir)
+        self.assertTrue(reopened.is_cached(self.test_asset_path))
+        self.assertIsNotNone(reopened.get_thumbnail(self.test_asset_path))
+
+    def test_generated_thumbnails_flushed_in_batches(self):
+        """Test that thumbnails generated one at a time reach the disk index."""
+        cache = ThumbnailCache(self.cache_dir, flush_every=2)
+        paths = self._make_assets(3)
+        for path in paths:
+            cache.generate_and_cache_thumbnail(path)
+
+        reopened = ThumbnailCache(self.cache_dir)
+        self.assertTrue(reopened.is_cached(paths[1]))
+        self.assertIsNotNone(reopened.get_thumbnail(paths[0]))
+        # The third thumbnail waits for the next batch or an explicit flush
+        self.assertFalse(reopened.is_cached(paths[2]))
+        cache.flush()
+        self.assertTrue(ThumbnailCache(self.cache_dir).is_cached(paths[2]))
+
+    def test_evicted_page_written_with_index(self):
+        """Test that a dirty page evicted from memory is saved with its index."""
+        paths = self._make_assets(2)
+        # 64x64 pages hold a single cell, and only one page stays loaded
+        cache = ThumbnailCache(self.cache_dir, page_size=64)
+        cache.generate_and_cache_thumbnail(paths[0])
+        cache.flush()
+        cache = ThumbnailCache(self.cache_dir, page_size=64, max_loaded_pages=1)
+        cache.generate_and_cache_thumbnail(paths[1])
+        # Loading the first page evicts the unsaved second one
+        cache.get_thumbnail_region(paths[0])
+
+        reopened = ThumbnailCache(self.cache_dir, page_size=64)
+        page, rect = reopened.get_thumbnail_region(paths[1])
+        self.assertEqual(page.get_at(rect.center)[:3], (40, 0, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+"""
+Test cases for the tilemap_renderer.py module.
+This module tests level-of-detail selection and chunk caching of the TilemapRenderer.
+"""
+
+import unittest
+
+import pygame
+
+from src.rendering.camera import Camera
+from src.rendering.tilemap_renderer import OVERVIEW_LEVEL, TilemapRenderer
+from src.scene.tilemap import Tilemap
+
+
+class TestTilemapRenderer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.tilemap = Tilemap(64, 64, 32, 32)
+        # Two-tile tileset: tile 0 is red, tile 1 is blue
+        tileset = pygame.Surface((64, 32), pygame.SRCALPHA)
+        tileset.fill((255, 0, 0, 255), pygame.Rect(0, 0, 32, 32))
+        tileset.fill((0, 0, 255, 255), pygame.Rect(32, 0, 32, 32))
+        self.tilemap.set_tileset("default", tileset)
+        self.renderer = TilemapRenderer(self.tilemap)
+        self.screen = pygame.Surface((320, 240), pygame.SRCALPHA)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_select_level(self):
+        """Test that zoom levels map to the expected mip levels."""
+        self.assertEqual(self.renderer.select_level(2.0), 0)
+        self.assertEqual(self.renderer.select_level(1.0), 0)
+        self.assertEqual(self.renderer.select_level(0.5), 1)
+        self.assertEqual(self.renderer.select_level(0.3), 1)
+        self.assertEqual(self.renderer.select_level(0.25), 2)
+        self.assertEqual(self.renderer.select_level(0.125), 3)
+        # 32px tiles at 0.1 zoom are 3.2px on screen, below the overview threshold
+        self.assertEqual(self.renderer.select_level(0.1), OVERVIEW_LEVEL)
+
+    def test_render_full_resolution(self):
+        """Test rendering tiles at zoom 1."""
+        self.tilemap.add_tile(0, 0, 0)
+        self.tilemap.add_tile(1, 0, 1)
+        self.renderer.render(self.screen, Camera())
+        self.assertEqual(self.screen.get_at((5, 5)), (255, 0, 0, 255))
+        self.assertEqual(self.screen.get_at((37, 5)), (0, 0, 255, 255))
+        self.assertEqual(self.renderer.chunks_drawn, 1)
+
+    def test_render_overview(self):
+        """Test that the overview uses the average colour of each tile."""
+        for x in range(16):
+            for y in range(16):
+                self.tilemap.add_tile(x, y, 1)
+        self.renderer.render(self.screen, Camera(zoom=0.1))
+        self.assertEqual(self.renderer.last_level, OVERVIEW_LEVEL)
+        self.assertEqual(self.screen.get_at((10, 10)), (0, 0, 255, 255))
+
+    def test_chunk_cache_reused_and_invalidated(self):
+        """Test that unchanged chunks are not rebuilt between frames."""
+        self.tilemap.add_tile(0, 0, 0)
+        camera = Camera(zoom=0.5)
+        self.renderer.render(self.screen, camera)
+        self.assertEqual(self.renderer.chunks_built, 1)
+
+        self.renderer.render(self.screen, camera)
+        self.assertEqual(self.renderer.chunks_built, 0)
+
+        self.tilemap.add_tile(1, 1, 1)
+        self.renderer.render(self.screen, camera)
+        self.assertEqual(self.renderer.chunks_built, 1)
+
+    def test_visible_chunks_clipped_to_viewport(self):
+        """Test that only chunks inside the viewport are visited."""
+        chunks = list(self.renderer.visible_chunks(Camera(), (320, 240)))
+        self.assertEqual(chunks, [(0, 0)])
+        chunks = list(self.renderer.visible_chunks(Camera(zoom=0.1), (320, 240)))
+        # 64x64 tiles = 4x4 chunks, all visible when zoomed out
+        self.assertEqual(len(chunks), 16)
+
+    def test_cache_holds_every_visible_chunk(self):
+        """Test that far zoom levels do not evict chunks drawn in the same frame."""
+        tilemap = Tilemap(800, 450, 16, 16)
+        tilemap.set_tileset("default", self.tilemap.tilesets["default"])
+        for cy in range(0, 450, 16):
+            for cx in range(0, 800, 16):
+                tilemap.add_tile(cx, cy, 1)
+        renderer = TilemapRenderer(tilemap)
+        screen = pygame.Surface((1280, 720), pygame.SRCALPHA)
+        camera = Camera(zoom=0.1)
+        renderer.render(screen, camera)
+        self.assertEqual(renderer.last_level, OVERVIEW_LEVEL)
+        self.assertGreater(renderer.chunks_drawn, renderer.max_cached_chunks)
+        self.assertEqual(renderer.chunks_built, renderer.chunks_drawn)
+
+        renderer.render(screen, camera)
+        self.assertEqual(renderer.chunks_built, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import random
+import unittest
+
+from src.editor.tree_model import IndexedList, TreeGroup, TreeModel
+
+
+class Item:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestIndexedList(unittest.TestCase):
+    def test_matches_a_list_under_random_changes(self):
+        """Test that positions and lookups match a plain list."""
+        rng = random.Random(3)
+        items = IndexedList()
+        expected = []
+        for step in range(5000):
+            if expected and rng.random() < 0.45:
+                item = rng.choice(expected)
+                expected.remove(item)
+                items.remove(item)
+            else:
+                item = Item(str(step))
+                expected.append(item)
+                items.append(item)
+        self.assertEqual(len(items), len(expected))
+        self.assertEqual(list(items), expected)
+        for position in rng.sample(range(len(expected)), 50):
+            self.assertIs(items[position], expected[position])
+            self.assertEqual(items.index(expected[position]), position)
+
+    def test_compaction_and_errors(self):
+        """Test that holes are compacted and bad calls raise."""
+        items = IndexedList([Item(str(i)) for i in range(3000)])
+        for item in list(items)[:2000]:
+            items.remove(item)
+        self.assertLess(len(items._items), 3000)
+        self.assertEqual(items[0].name, "2000")
+        extra = [Item("a"), Item("b")]
+        items.extend(extra[:1])
+        items.append(extra[1])
+        self.assertEqual(items.index(extra[1]), 1001)
+        self.assertIs(items[1000], extra[0])
+        with self.assertRaises(IndexError):
+            items[1002]
+        with self.assertRaises(ValueError):
+            items.remove(Item("x"))
+        with self.assertRaises(ValueError):
+            items.append(items[0])
+
+
+class TestTreeModel(unittest.TestCase):
+    def setUp(self):
+        self.layers = TreeGroup("Layers")
+        self.entities = TreeGroup("Entities")
+        self.model = TreeModel([self.layers, self.entities])
+        self.background = Item("Background")
+        self.layers.add(self.background, self.background.name)
+        self.items = [Item(name) for name in ["Player", "Enemy 2", "enemy 1", "Tree"]]
+        for item in self.items:
+            self.entities.add(item, item.name)
+
+    def test_rows_and_collapse(self):
+        """Test that rows follow the groups and collapsing hides items."""
+        self.assertEqual(len(self.model), 7)
+        self.assertEqual(self.model.row_at(0), (self.layers, None))
+        self.assertEqual(self.model.row_at(1), (self.layers, self.background))
+        self.assertEqual(self.model.row_at(2), (self.entities, None))
+        self.assertEqual(self.model.row_at(6), (self.entities, self.items[3]))
+        self.assertIsNone(self.model.row_at(7))
+        self.assertEqual(self.model.row_of(self.entities, self.items[1]), 4)
+
+        self.layers.expanded = False
+        self.assertEqual(len(self.model), 6)
+        self.assertEqual(self.model.row_at(1), (self.entities, None))
+        self.assertIsNone(self.model.row_of(self.layers, self.background))
+
+    def test_prefix_filter(self):
+        """Test that the filter shows prefix matches in name order."""
+        self.model.filter_text = "ENEMY"
+        self.assertEqual(len(self.model), 4)
+        self.assertEqual(self.model.row_at(2), (self.entities, self.items[2]))
+        self.assertEqual(self.model.row_at(3), (self.entities, self.items[1]))
+        self.assertIsNone(self.model.row_of(self.entities, self.items[0]))
+
+        self.entities.rename(self.items[0], "Enemy 0")
+        self.assertEqual(self.model.row_at(2), (self.entities, self.items[0]))
+        self.entities.remove(self.items[2])
+        self.assertEqual(len(self.model), 4)
+        self.assertEqual(self.model.row_of(self.entities, self.items[1]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()